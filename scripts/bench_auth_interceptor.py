@@ -0,0 +1,107 @@
+"""
+Authorization interceptor overhead per call.
+
+    poetry run python scripts/bench_auth_interceptor.py [--calls 20000]
+
+Times a no-op unary handler wrapped by AuthorizationInterceptor with a
+partner client certificate, with the peer identity cache disabled (the
+certificate parsed on every call) and enabled. The client's limits are
+set high enough that no call is rejected but the quota is still taken.
+"""
+
+import argparse
+import datetime
+import time
+from typing import Any
+
+import grpc
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from simt_emlite.mediator.grpc import auth
+from simt_emlite.mediator.grpc.client_quota import ClientLimits
+
+METHOD = "/EmliteMediatorService/readElement"
+CLIENT_ID = "company-xyz-api"
+
+
+def client_pem(client_id: str, role: str) -> bytes:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name(
+        [
+            x509.NameAttribute(NameOID.COMMON_NAME, client_id),
+            x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, role),
+        ]
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.PEM)
+
+
+class Context:
+    """The parts of grpc.ServicerContext the interceptor uses."""
+
+    def __init__(self, client_id: str, pem: bytes) -> None:
+        self.client_id = client_id.encode()
+        self.pem = pem
+
+    def auth_context(self) -> dict[str, list[bytes]]:
+        # grpc builds a new mapping for every call
+        return {
+            "x509_common_name": [self.client_id],
+            "x509_pem_cert": [self.pem],
+            "transport_security_type": [b"ssl"],
+        }
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise RuntimeError(f"{code} {details}")
+
+
+def handler() -> Any:
+    def continuation(_: Any) -> grpc.RpcMethodHandler:
+        return grpc.unary_unary_rpc_method_handler(lambda request, context: request)
+
+    details = type("HandlerCallDetails", (), {"method": METHOD})()
+    return auth.AuthorizationInterceptor().intercept_service(continuation, details)
+
+
+def measure(label: str, cache_size: int, calls: int, context: Context) -> float:
+    auth.clear_identity_cache()
+    auth._peer_cache = auth._PeerAuthorizationCache(cache_size)
+    call = handler().unary_unary
+    started = time.perf_counter()
+    for _ in range(calls):
+        call(b"", context)
+    per_call = (time.perf_counter() - started) / calls
+    print(f"{label:<10} {per_call * 1e6:7.1f} us/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    auth.CLIENT_LIMITS[CLIENT_ID] = ClientLimits(
+        requests_per_second=1e9, burst=10**9, max_in_flight=1
+    )
+    context = Context(CLIENT_ID, client_pem(CLIENT_ID, "partner"))
+    print(f"{args.calls} calls to {METHOD}")
+    uncached = measure("uncached", 0, args.calls, context)
+    cached = measure("cached", auth.IDENTITY_CACHE_SIZE, args.calls, context)
+    print(f"{uncached / cached:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Memory and build time per registered meter in the mediator registry.
+
+    poetry run python scripts/bench_meter_registry.py [--meters 20000]
+
+Reports contexts as a registry refresh creates them (nothing used yet) and
+after a request has touched each one (api, queue and cache created).
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from simt_emlite.mediator.grpc.meter_registry import (
+    AsyncMeterContext,
+    MeterContext,
+    MeterContextBase,
+    _intern,
+)
+
+
+def build(cls: type[MeterContextBase], count: int) -> dict[str, MeterContextBase]:
+    meters = {}
+    for i in range(count):
+        serial = f"EML{i:08d}"
+        meter = cls(serial, f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}")
+        meter.esco = _intern("f81a1b0c-5b4e-4d5a-9a5e-0c7d2e2b9b11")
+        meter.hardware = _intern("C1.w")
+        meters[serial] = meter
+    return meters
+
+
+def touch(meters: dict[str, MeterContextBase]) -> None:
+    for meter in meters.values():
+        meter.api  # type: ignore[attr-defined]
+        meter.queue  # type: ignore[attr-defined]
+        meter.cache
+
+
+def measure(cls: type[MeterContextBase], count: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    meters = build(cls, count)
+    seconds = time.perf_counter() - started
+    registered = tracemalloc.get_traced_memory()[0]
+    touch(meters)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{cls.__name__:<18} "
+        f"registered {registered / count:7.0f} B/meter  "
+        f"used {used / count:7.0f} B/meter  "
+        f"build {seconds / count * 1e6:5.1f} us/meter"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--meters", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{args.meters} meters")
+    for cls in (MeterContext, AsyncMeterContext):
+        measure(cls, args.meters)
+
+
+if __name__ == "__main__":
+    main()
@@ -136,6 +136,7 @@ class EMOPCLI(_Base):
             super(EMOPCLI, self).__init__(
                 mediator_address=MEDIATOR_SERVER,
                 logging_level=logging_level,
+                priority="interactive",
             )
         except Exception as e:
             get_console().print(
@@ -175,24 +176,27 @@ class EMOPCLI(_Base):
 
     def list(self, json_output: bool = False, esco: Optional[str] = None) -> None:
         """List all meters with formatted table output."""
-        # Call inherited meter_list() method
-        meters_json = self.meter_list(esco=esco)
-
+        # JSON output for scripting - every column of the meter list
+        if json_output:
+            # Call inherited meter_list() method
+            meters_json = self.meter_list(esco=esco)
+            try:
+                meters_data = json.loads(meters_json)
+            except Exception as e:
+                get_console().print(f"Failed to parse meters data: {e}")
+                raise
+            meters_data.sort(key=lambda x: x.get("name") or "")
+            print(json.dumps(meters_data, indent=2))
+            return
 
-        # Parse the JSON response
-        try:
-            meters = json.loads(meters_json)
-        except Exception as e:
-            get_console().print(f"Failed to parse meters data: {e}")
-            raise
+        # Only the table columns, as typed Meter messages
+        meters = self.meters(
+            esco=esco,
+            fields=["esco", "serial", "name", "csq", "health", "hardware", "feeder"],
+        )
 
         # Sort meters by name
-        meters.sort(key=lambda x: x.get("name") or "")
-
-        # JSON output for scripting
-        if json_output:
-            print(json.dumps(meters, indent=2))
-            return
+        meters.sort(key=lambda m: m.name)
 
         # Rich table output for human readability
         from rich import box
@@ -209,14 +213,14 @@ class EMOPCLI(_Base):
         )
 
         for meter in meters:
-            row_values = [
-                meter.get("esco", ""),
-                meter.get("serial", ""),
-                meter.get("name", ""),
-                rich_signal_circle(meter.get("csq")),
-                rich_status_circle("green" if meter.get("health") == "healthy" else "red"),
-                meter.get("hardware", ""),
-                meter.get("feeder", ""),
+            row_values: list[Any] = [
+                meter.esco,
+                meter.serial,
+                meter.name,
+                rich_signal_circle(meter.csq if meter.HasField("csq") else None),
+                rich_status_circle("green" if meter.health == "healthy" else "red"),
+                meter.hardware,
+                meter.feeder,
             ]
             table.add_row(*row_values)
 
@@ -361,6 +365,13 @@ def args_parser() -> argparse.ArgumentParser:
     def setup_env_set(p: argparse.ArgumentParser) -> None:
         p.add_argument("env")
 
+    def setup_hardware_cache_seed(p: argparse.ArgumentParser) -> None:
+        p.add_argument(
+            "--esco",
+            help="Seed meters in this ESCO only (e.g. wlce)",
+            required=False,
+        )
+
     def setup_list(p: argparse.ArgumentParser) -> None:
         p.add_argument(
             "--json",
@@ -520,6 +531,7 @@ def args_parser() -> argparse.ArgumentParser:
         ("clock_drift", "Show clock time drift for a meter", setup_serial, None),
         ("env_set", "Set CLI environment context [points ~/.simt/emlite.env at ~/.simt/emlite.<env>.env]", setup_env_set, None),
         ("env_show", "Show current environment context", setup_no_args, None),
+        ("hardware_cache_seed", "Cache hardware of all meters locally [~/.simt/meter_metadata.json]", setup_hardware_cache_seed, None),
         ("info", "metadata and shadows data for a meter", setup_serial, None),
         ("list", "List all meters with status", setup_list, None),
         ("serial_to_name", "lookup meter name from serial", setup_serial, None),
@@ -719,6 +731,8 @@ def run_command(serial: Optional[str], command: str, kwargs: Dict[str, Any]) ->
     except MediatorClientException as e:
         if e.code_str == "EMLITE_CONNECTION_FAILURE":
             logging.error("Failed to connect to meter")
+        elif e.code_str == "EMLITE_CIRCUIT_OPEN":
+            logging.error("Meter is offline (recent requests failed) - try later")
         else:
             logging.error(f"Failure [{e}]")
     except Exception as e:
@@ -794,7 +808,7 @@ def main() -> None:
     serial = arg_s or arg_serial
     try:
         # Commands that don't need a serial or can work without one
-        if command in ["env_set", "env_show", "version", "list"]:
+        if command in ["env_set", "env_show", "version", "list", "hardware_cache_seed"]:
             run_command(serial, command, kwargs)
         elif serial:
             run_command(serial, command, kwargs)
@@ -0,0 +1,76 @@
+# mypy: disable-error-code="import-untyped"
+from datetime import datetime
+
+from emop_frame_protocol.emop_data import EmopData
+
+from simt_emlite.util.logging import get_logger
+
+from .async_emlite_net import AsyncEmliteNET
+from .emlite_api import EmliteAPIBase
+from .retry_policy import RetryPolicy
+
+logger = get_logger(__name__, __file__)
+
+
+"""
+    asyncio counterpart of EmliteAPI.
+
+    Builds and parses exactly the same frames and data fields as EmliteAPI
+    (shared via EmliteAPIBase) and sends them with AsyncEmliteNET.
+"""
+
+
+class AsyncEmliteAPI(EmliteAPIBase):
+    def __init__(
+        self,
+        host: str,
+        port: int = 8080,
+        persistent: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.net = AsyncEmliteNET(
+            host, port, persistent=persistent, retry_policy=retry_policy
+        )
+        self.last_request_datetime: None | datetime = None
+
+    async def send_message(
+        self, req_data_field_bytes: bytes, deadline: float | None = None
+    ) -> bytes:
+        data_field = self._data_field_from_bytes(req_data_field_bytes)
+        return await self.send_message_with_data_instance(data_field, deadline)
+
+    async def send_message_with_data_instance(
+        self, req_data_field: EmopData, deadline: float | None = None
+    ) -> bytes:
+        req_bytes: bytes = self._build_frame_bytes(req_data_field)
+        logger.debug(
+            "send_message_with_data_instance request", req_bytes=req_bytes.hex()
+        )
+
+        rsp_bytes: bytes = await self.net.send_message(req_bytes, deadline)
+        logger.debug(
+            "send_message_with_data_instance response", rsp_bytes=rsp_bytes.hex()
+        )
+
+        message = self._parse_response_frame(rsp_bytes)
+
+        self.last_request_datetime = datetime.now()
+
+        return message
+
+    async def close(self) -> None:
+        await self.net.close()
+
+    async def read_element(
+        self, object_id: bytearray, deadline: float | None = None
+    ) -> bytes:
+        data_field = self._build_data_field(object_id)
+        payload_bytes = await self.send_message_with_data_instance(data_field, deadline)
+        return self._read_element_payload(payload_bytes)
+
+    async def write_element(
+        self, object_id: bytearray, payload: bytes, deadline: float | None = None
+    ) -> None:
+        await self.send_message(
+            self._write_element_data_field_bytes(object_id, payload), deadline
+        )
@@ -0,0 +1,244 @@
+import asyncio
+import time
+
+from python_socks import (  # type: ignore[import-untyped]
+    ProxyConnectionError,
+    ProxyError,
+    ProxyTimeoutError,
+)
+from python_socks.async_.asyncio import Proxy  # type: ignore[import-untyped]
+from tenacity import AsyncRetrying
+
+from simt_emlite.util.logging import get_logger
+
+from . import emlite_net
+from .emop_framing import (
+    FRAME_DELIMITER,
+    EmopFrameEOFError,
+    EmopFrameError,
+    frame_size,
+    validate_frame,
+)
+from .retry_policy import DEFAULT_RETRY_POLICY, ConnectTimeoutError, RetryPolicy
+
+logger = get_logger(__name__, __file__)
+
+"""
+    asyncio counterpart of EmliteNET.
+
+    Same framing, timeouts, SOCKS configuration and retry behaviour as
+    EmliteNET (settings are read from the emlite_net module) but built on
+    asyncio streams so many meter conversations can share one event loop.
+"""
+
+
+class AsyncEmliteNET:
+    def __init__(
+        self,
+        host: str,
+        port: int = 8080,
+        persistent: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.host = host
+        self.port = int(port)
+        self.persistent = persistent
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._session_last_used: float = 0.0
+        self.log = logger.bind(host=host)
+
+    async def send_message(
+        self, req_bytes: bytes, deadline: float | None = None
+    ) -> bytes:
+        """See EmliteNET.send_message."""
+        async for attempt in AsyncRetrying(
+            **self.retry_policy.tenacity_kwargs(deadline)
+        ):
+            with attempt:
+                return await self._send_message_attempt(
+                    req_bytes,
+                    attempt.retry_state.attempt_number,
+                    emlite_net.attempt_timeout_seconds(deadline),
+                )
+        raise AssertionError("unreachable - AsyncRetrying raises on exhaustion")
+
+    async def close(self) -> None:
+        """Close the persistent session if one is open."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, asyncio.CancelledError):
+                pass
+
+    async def _send_message_attempt(
+        self, req_bytes: bytes, attempt: int, timeout: float | None = None
+    ) -> bytes:
+        timeout = timeout or emlite_net.socket_timeout_seconds
+        if self.persistent and self._live_session():
+            assert self._reader is not None and self._writer is not None
+            try:
+                self.log.debug("sending on session", request_payload=req_bytes.hex())
+                rsp_bytes = await self._exchange(
+                    self._reader, self._writer, req_bytes, timeout
+                )
+                self._session_last_used = time.monotonic()
+                return rsp_bytes
+            except EmopFrameEOFError as e:
+                if e.received > 0:
+                    await self.close()
+                    raise e
+                self.log.debug("session closed by peer - reconnecting")
+            except (ConnectionResetError, BrokenPipeError) as e:
+                self.log.debug("session reset by peer - reconnecting", error=e)
+            except (OSError, EmopFrameError) as e:
+                await self.close()
+                raise e
+            await self.close()
+
+        reader, writer = await self._open_connection(attempt, timeout)
+        try:
+            self.log.debug("sending", request_payload=req_bytes.hex())
+            rsp_bytes = await self._exchange(reader, writer, req_bytes, timeout)
+        except (OSError, EOFError, EmopFrameError) as e:
+            self.log.warn("send_message failed", error=e)
+            writer.close()
+            raise e
+
+        if self.persistent:
+            self._reader, self._writer = reader, writer
+            self._session_last_used = time.monotonic()
+        else:
+            writer.close()
+        return rsp_bytes
+
+    def _live_session(self) -> bool:
+        """
+        Can the session be reused? Not if it has been idle too long or if the
+        peer has closed its side (the stream has seen EOF).
+        """
+        if self._reader is None or self._writer is None:
+            return False
+
+        idle_seconds = time.monotonic() - self._session_last_used
+        if idle_seconds > emlite_net.session_idle_timeout_seconds:
+            self.log.debug("session idle expired", idle_seconds=idle_seconds)
+            return False
+
+        if self._reader.at_eof() or self._writer.is_closing():
+            self.log.debug("session not reusable", reason="half closed")
+            return False
+
+        return True
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        req_bytes: bytes,
+        timeout: float,
+    ) -> bytes:
+        started = time.monotonic()
+        writer.write(req_bytes)
+        async with asyncio.timeout(timeout):
+            await writer.drain()
+            sent = time.monotonic()
+            emlite_net.METER_IO_SECONDS.observe(sent - started, phase="send")
+            rsp_bytes = await self._read_frame(reader)
+        emlite_net.METER_IO_SECONDS.observe(time.monotonic() - sent, phase="receive")
+        self.log.debug("received response", response_payload=rsp_bytes.hex())
+        return rsp_bytes
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        """Read exactly one EMOP frame - see EmliteNET._read_frame."""
+        skipped = 0
+        delimiter = await self._read_exactly(reader, 1, 0)
+        while delimiter[0] != FRAME_DELIMITER:
+            skipped += 1
+            delimiter = await self._read_exactly(reader, 1, 0)
+        if skipped > 0:
+            self.log.debug("skipped bytes before frame delimiter", skipped=skipped)
+
+        length = await self._read_exactly(reader, 1, 1)
+        size = frame_size(length[0])
+        rest = await self._read_exactly(reader, size - 2, 2, size)
+
+        frame = delimiter + length + rest
+        validate_frame(frame)
+        return frame
+
+    async def _read_exactly(
+        self,
+        reader: asyncio.StreamReader,
+        num_bytes: int,
+        received: int,
+        expected: int | None = None,
+    ) -> bytes:
+        try:
+            return await reader.readexactly(num_bytes)
+        except asyncio.IncompleteReadError as e:
+            raise EmopFrameEOFError(received + len(e.partial), expected) from e
+
+    async def _open_connection(
+        self, attempt: int, timeout: float
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        started = time.monotonic()
+        try:
+            connection = await self._connect(attempt, timeout)
+        except Exception as e:
+            emlite_net.METER_CONNECT_ERRORS.inc(exception=type(e).__name__)
+            raise
+        emlite_net.METER_IO_SECONDS.observe(time.monotonic() - started, phase="connect")
+        return connection
+
+    async def _connect(
+        self, attempt: int, timeout: float
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        try:
+            if emlite_net.use_socks is True:
+                proxy = Proxy.from_url(
+                    f"socks5://{emlite_net.socks_username}:{emlite_net.socks_password}"
+                    f"@{emlite_net.socks_host}:{emlite_net.socks_port}"
+                )
+                self.log.debug(
+                    "proxy.connect()",
+                    socks_host=emlite_net.socks_host,
+                    socks_port=emlite_net.socks_port,
+                    attempt=attempt,
+                )
+                sock = await proxy.connect(
+                    dest_host=self.host, dest_port=self.port, timeout=min(10, timeout)
+                )
+                return await asyncio.open_connection(sock=sock)
+
+            self.log.debug("connect()", attempt=attempt)
+            try:
+                async with asyncio.timeout(timeout):
+                    return await asyncio.open_connection(self.host, self.port)
+            except TimeoutError as e:
+                raise ConnectTimeoutError(str(e)) from e
+
+        except ProxyTimeoutError as e:
+            self.log.debug("timeout connecting to meter by proxy")
+            raise e
+        except ProxyError as e:
+            self.log.debug(f"ProxyError: {e}", attempt=attempt)
+            raise e
+        except ProxyConnectionError as e:
+            # usually the emnify-gateway restarting - see EmliteNET._open_socket
+            self.log.info(f"socks proxy connection failure [{e}]")
+            raise e
+        except TimeoutError as e:
+            self.log.info("timeout connecting to socket", error=e)
+            raise e
+        except ConnectionRefusedError as e:
+            self.log.warn("ConnectionRefused connecting to socket")
+            raise e
+        except OSError as e:
+            self.log.warn("Error connecting to socket", error=e)
+            raise e
@@ -2,7 +2,6 @@
 from datetime import datetime
 from typing import cast
 
-import crcmod.predefined
 from emop_frame_protocol.emop_data import EmopData
 from emop_frame_protocol.emop_frame import EmopFrame
 from emop_frame_protocol.generated.emop_default_request_response import (
@@ -14,67 +13,42 @@ from emop_frame_protocol.vendor.kaitaistruct import BytesIO, KaitaiStream
 from simt_emlite.util.logging import get_logger
 
 from . import emlite_net
+from .emop_framing import crc16
+from .retry_policy import RetryPolicy
 
 logger = get_logger(__name__, __file__)
 
-crc16 = crcmod.predefined.mkCrcFun("crc-ccitt-false")
-
 
 """
-    This class sends bytes to the meters using the EmliteNet module.
-
-    Bytes are packed and unpacked, to and from EMOP frames and EMOP data
-    fields.
-
-    While this class is responsible for building the frames and data fields it
-    has no knowledge of the structure of the payload embedded in the data
-    field. Caller should build those payloads and pass them into this API.
+    Frame and data field packing shared by the blocking EmliteAPI and the
+    asyncio AsyncEmliteAPI. Subclasses provide the transport.
 """
 
 
-class EmliteAPI:
-    def __init__(self, host: str, port: int = 8080) -> None:
-        self.net = emlite_net.EmliteNET(host, port)
-        self.last_request_datetime: None | datetime = None
-        global logger
-        logger.bind(host=host)
+class EmliteAPIBase:
+    def _parse_response_frame(self, rsp_bytes: bytes) -> bytes:
+        frame = EmopFrame(KaitaiStream(BytesIO(rsp_bytes)))
+        frame._read()
+        logger.debug("response frame parsed", frame=str(frame))
+        return cast(bytes, frame.data.message)
 
-    def send_message(self, req_data_field_bytes: bytes) -> bytes:
+    def _data_field_from_bytes(self, req_data_field_bytes: bytes) -> EmopData:
         data_field = EmopData(
             len(req_data_field_bytes), KaitaiStream(BytesIO(req_data_field_bytes))
         )
         data_field._read()
-        return self.send_message_with_data_instance(data_field)
-
-    def send_message_with_data_instance(self, req_data_field: EmopData) -> bytes:
-        req_bytes: bytes = self._build_frame_bytes(req_data_field)
-        logger.debug(
-            "send_message_with_data_instance request", req_bytes=req_bytes.hex()
-        )
-
-        rsp_bytes: bytes = self.net.send_message(req_bytes)
-        logger.debug(
-            "send_message_with_data_instance response", rsp_bytes=rsp_bytes.hex()
-        )
-
-        frame = EmopFrame(KaitaiStream(BytesIO(rsp_bytes)))
-        frame._read()
-        logger.debug("response frame parsed", frame=str(frame))
-
-        self.last_request_datetime = datetime.now()
-
-        return cast(bytes, frame.data.message)
+        return data_field
 
-    def read_element(self, object_id: bytearray) -> bytes:
-        data_field = self._build_data_field(object_id)
-        payload_bytes = self.send_message_with_data_instance(data_field)
+    def _read_element_payload(self, payload_bytes: bytes) -> bytes:
         rec = EmopDefaultRequestResponse(
             len(payload_bytes), KaitaiStream(BytesIO(payload_bytes))
         )
         rec._read()
         return cast(bytes, rec.payload)
 
-    def write_element(self, object_id: bytearray, payload: bytes) -> None:
+    def _write_element_data_field_bytes(
+        self, object_id: bytearray, payload: bytes
+    ) -> bytes:
         data_field = self._build_data_field(
             object_id,
             read_write_flag=EmopDefaultRequestResponse.ReadWriteFlags.write,
@@ -83,9 +57,7 @@ class EmliteAPI:
 
         kt_stream = KaitaiStream(BytesIO(bytearray(data_field.len_data + 1)))
         data_field._write(kt_stream)
-        message_bytes = kt_stream.to_byte_array()
-
-        self.send_message(message_bytes)
+        return cast(bytes, kt_stream.to_byte_array())
 
     def _build_data_field(
         self,
@@ -151,3 +123,73 @@ class EmliteAPI:
         req_frame._write(_io)
 
         return _io.to_byte_array()
+
+
+"""
+    This class sends bytes to the meters using the EmliteNet module.
+
+    Bytes are packed and unpacked, to and from EMOP frames and EMOP data
+    fields.
+
+    While this class is responsible for building the frames and data fields it
+    has no knowledge of the structure of the payload embedded in the data
+    field. Caller should build those payloads and pass them into this API.
+"""
+
+
+class EmliteAPI(EmliteAPIBase):
+    def __init__(
+        self,
+        host: str,
+        port: int = 8080,
+        persistent: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.net = emlite_net.EmliteNET(
+            host, port, persistent=persistent, retry_policy=retry_policy
+        )
+        self.last_request_datetime: None | datetime = None
+        global logger
+        logger.bind(host=host)
+
+    def send_message(
+        self, req_data_field_bytes: bytes, deadline: float | None = None
+    ) -> bytes:
+        data_field = self._data_field_from_bytes(req_data_field_bytes)
+        return self.send_message_with_data_instance(data_field, deadline)
+
+    def send_message_with_data_instance(
+        self, req_data_field: EmopData, deadline: float | None = None
+    ) -> bytes:
+        req_bytes: bytes = self._build_frame_bytes(req_data_field)
+        logger.debug(
+            "send_message_with_data_instance request", req_bytes=req_bytes.hex()
+        )
+
+        rsp_bytes: bytes = self.net.send_message(req_bytes, deadline)
+        logger.debug(
+            "send_message_with_data_instance response", rsp_bytes=rsp_bytes.hex()
+        )
+
+        message = self._parse_response_frame(rsp_bytes)
+
+        self.last_request_datetime = datetime.now()
+
+        return message
+
+    def close(self) -> None:
+        self.net.close()
+
+    def read_element(
+        self, object_id: bytearray, deadline: float | None = None
+    ) -> bytes:
+        data_field = self._build_data_field(object_id)
+        payload_bytes = self.send_message_with_data_instance(data_field, deadline)
+        return self._read_element_payload(payload_bytes)
+
+    def write_element(
+        self, object_id: bytearray, payload: bytes, deadline: float | None = None
+    ) -> None:
+        self.send_message(
+            self._write_element_data_field_bytes(object_id, payload), deadline
+        )
@@ -1,5 +1,7 @@
 import os
+import select
 import socket
+import time
 
 from python_socks import (  # type: ignore[import-untyped]
     ProxyConnectionError,
@@ -7,17 +9,46 @@ from python_socks import (  # type: ignore[import-untyped]
     ProxyTimeoutError,
 )
 from python_socks.sync import Proxy  # type: ignore[import-untyped]
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_fixed,
-)
+from tenacity import Retrying
 
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter, Histogram
+
+from .emop_framing import (
+    FRAME_DELIMITER,
+    MAX_FRAME_BYTES,
+    EmopFrameEOFError,
+    EmopFrameError,
+    frame_size,
+    validate_frame,
+)
+from .retry_policy import DEFAULT_RETRY_POLICY, ConnectTimeoutError, RetryPolicy
 
 logger = get_logger(__name__, __file__)
 
 socket_timeout_seconds: float = float(os.environ.get("EMLITE_TIMEOUT_SECONDS") or 10.0)
+# shortest socket timeout given to an attempt near the request deadline
+MIN_SOCKET_TIMEOUT_SECONDS = 0.5
+
+# persistent sessions are closed and reopened once they have been idle this long
+# as the emnify gateway and the meters drop quiet connections
+session_idle_timeout_seconds: float = float(
+    os.environ.get("EMLITE_SESSION_IDLE_TIMEOUT_SECONDS") or 60.0
+)
+
+
+# shared with AsyncEmliteNET
+METER_IO_SECONDS = Histogram(
+    "emlite_meter_io_seconds",
+    "Meter round trip time by phase: connect (incl. SOCKS handshake), send "
+    "and receive (wait for the response frame)",
+    ["phase"],
+)
+METER_CONNECT_ERRORS = Counter(
+    "emlite_meter_connect_errors_total",
+    "Failed meter connection attempts by exception class",
+    ["exception"],
+)
 
 
 socks_host: str | None = os.environ.get("SOCKS_HOST")
@@ -29,30 +60,83 @@ use_socks = all(
     v is not None for v in [socks_host, socks_port, socks_username, socks_password]
 )
 
-num_retries_send_message = 5
-
 """
     Class responsible for talking to meters via TCP/IP.
 
     This class has no knowledge of the structure of the bytes it's sending
     and receiving. Just manages raw communication of bytes.
+
+    By default a new connection is opened for every message. With
+    persistent=True a single connection (session) is kept open and reused for
+    consecutive messages. The session is checked before each use and
+    transparently reopened if the meter or gateway closed it or it sat idle
+    longer than session_idle_timeout_seconds.
+
+    Failed attempts are retried according to a RetryPolicy (see
+    retry_policy.py) within an optional per request deadline.
 """
 
 
+def attempt_timeout_seconds(deadline: float | None) -> float:
+    """
+    Socket timeout for an attempt: socket_timeout_seconds cut short so the
+    connect or read can't run on past the request deadline.
+    """
+    if deadline is None:
+        return socket_timeout_seconds
+    remaining = deadline - time.monotonic()
+    return max(MIN_SOCKET_TIMEOUT_SECONDS, min(socket_timeout_seconds, remaining))
+
+
 class EmliteNET:
-    def __init__(self, host: str, port: int = 8080) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int = 8080,
+        persistent: bool = False,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
         self.host = host
         self.port = int(port)
+        self.persistent = persistent
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self._session_sock: socket.socket | None = None
+        self._session_last_used: float = 0.0
         global logger
         logger = logger.bind(host=host)
 
-    @retry(stop=stop_after_attempt(num_retries_send_message), wait=wait_fixed(7))
-    def send_message(self, req_bytes: bytes) -> bytes:
-        sock = self._open_socket(self.send_message.statistics["attempt_number"])  # type: ignore[attr-defined]
+    def send_message(self, req_bytes: bytes, deadline: float | None = None) -> bytes:
+        """
+        Send a request frame and return the response frame.
+
+        Args:
+            req_bytes: complete request frame
+            deadline: time.monotonic() value to finish by - retries that can't
+                complete before it are not attempted
+
+        Raises:
+            tenacity.RetryError: when the retry policy gives up
+        """
+        for attempt in Retrying(**self.retry_policy.tenacity_kwargs(deadline)):
+            with attempt:
+                return self._send_message_attempt(
+                    req_bytes,
+                    attempt.retry_state.attempt_number,
+                    attempt_timeout_seconds(deadline),
+                )
+        raise AssertionError("unreachable - Retrying raises on exhaustion")
+
+    def _send_message_attempt(
+        self, req_bytes: bytes, attempt: int, timeout: float | None = None
+    ) -> bytes:
+        if self.persistent:
+            return self._send_message_on_session(req_bytes, attempt, timeout)
+
+        sock = self._open_socket(attempt, timeout)
         try:
             logger.debug("sending", request_payload=req_bytes.hex())
             self._write_bytes(sock, req_bytes)
-            rsp_bytes = self._read_bytes(sock, 512)
+            rsp_bytes = self._read_frame(sock)
             sock.close()
         except socket.timeout as e:
             logger.warn("Timeout in send_message")
@@ -62,10 +146,119 @@ class EmliteNET:
             logger.error(f"socket.error {e}")
             sock.close()
             raise e
+        except (EOFError, EmopFrameError) as e:
+            logger.warn("Bad response frame", error=e)
+            sock.close()
+            raise e
+        logger.debug("received response", response_payload=rsp_bytes.hex())
+        return rsp_bytes
+
+    def close(self) -> None:
+        """Close the persistent session if one is open."""
+        if self._session_sock is not None:
+            try:
+                self._session_sock.close()
+            except socket.error:
+                pass
+            self._session_sock = None
+
+    def _send_message_on_session(
+        self, req_bytes: bytes, attempt: int, timeout: float | None = None
+    ) -> bytes:
+        sock = self._live_session_socket()
+        if sock is not None:
+            try:
+                sock.settimeout(timeout or socket_timeout_seconds)
+                logger.debug("sending on session", request_payload=req_bytes.hex())
+                self._write_bytes(sock, req_bytes)
+                rsp_bytes = self._read_frame(sock)
+                self._session_last_used = time.monotonic()
+                logger.debug("received response", response_payload=rsp_bytes.hex())
+                return rsp_bytes
+            except EmopFrameEOFError as e:
+                if e.received > 0:
+                    self.close()
+                    raise e
+                # closed by the peer between our liveness check and the send
+                logger.debug("session closed by peer - reconnecting")
+            except (ConnectionResetError, BrokenPipeError) as e:
+                logger.debug("session reset by peer - reconnecting", error=e)
+            except (socket.error, EmopFrameError) as e:
+                # timeouts and other failures are not a stale session so
+                # leave them to the retry policy (with a new session)
+                self.close()
+                raise e
+            self.close()
+
+        sock = self._open_socket(attempt, timeout)
+        self._session_sock = sock
+        try:
+            logger.debug("sending on new session", request_payload=req_bytes.hex())
+            self._write_bytes(sock, req_bytes)
+            rsp_bytes = self._read_frame(sock)
+        except (socket.error, EOFError, EmopFrameError) as e:
+            self.close()
+            raise e
+        self._session_last_used = time.monotonic()
         logger.debug("received response", response_payload=rsp_bytes.hex())
         return rsp_bytes
 
-    def _open_socket(self, attempt: int | None = None) -> socket.socket:
+    def _live_session_socket(self) -> socket.socket | None:
+        """
+        Return the session socket if it can be reused, otherwise close it and
+        return None.
+
+        A socket is not reused if it has been idle too long or if it is
+        readable while no request is outstanding, which means either the peer
+        has half-closed it (recv returns b"") or stale bytes are waiting.
+        """
+        sock = self._session_sock
+        if sock is None:
+            return None
+
+        idle_seconds = time.monotonic() - self._session_last_used
+        if idle_seconds > session_idle_timeout_seconds:
+            logger.debug("session idle expired", idle_seconds=idle_seconds)
+            self.close()
+            return None
+
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if readable:
+                peeked = sock.recv(1, socket.MSG_PEEK)
+                logger.debug(
+                    "session not reusable",
+                    reason="half closed" if peeked == b"" else "unexpected data",
+                )
+                self.close()
+                return None
+        except (socket.error, ValueError) as e:
+            logger.debug("session check failed", error=e)
+            self.close()
+            return None
+
+        return sock
+
+    def _open_socket(
+        self, attempt: int | None = None, timeout: float | None = None
+    ) -> socket.socket:
+        """
+        Connect to the meter (via the SOCKS proxy if configured).
+
+        Args:
+            attempt: attempt number for logging
+            timeout: connect and socket timeout, socket_timeout_seconds if None
+        """
+        started = time.monotonic()
+        try:
+            sock = self._connect(attempt, timeout or socket_timeout_seconds)
+        except Exception as e:
+            METER_CONNECT_ERRORS.inc(exception=type(e).__name__)
+            raise
+        METER_IO_SECONDS.observe(time.monotonic() - started, phase="connect")
+        return sock
+
+    def _connect(self, attempt: int | None, timeout: float) -> socket.socket:
         sock: socket.socket | None = None
         try:
             if use_socks is True:
@@ -83,23 +276,23 @@ class EmliteNET:
                     attempt=attempt,
                 )
                 sock = proxy.connect(
-                    dest_host=self.host, dest_port=self.port, timeout=10
+                    dest_host=self.host, dest_port=self.port, timeout=min(10, timeout)
                 )
                 logger.debug("connected")
             else:
                 sock = socket.socket()
-                sock.settimeout(socket_timeout_seconds)
+                sock.settimeout(timeout)
                 logger.debug("connect()")
                 sock.connect((self.host, self.port))
 
-            sock.settimeout(socket_timeout_seconds)
+            sock.settimeout(timeout)
 
         except ProxyTimeoutError as e:
             # very common so log at debug level
             logger.debug("timeout connecting to meter by proxy")
             if sock:
                 sock.close()
-            # raise again will be caught by @retry
+            # raise again will be handled by the retry policy
             raise e
         except ProxyError as e:
             err_str = str(e)
@@ -107,33 +300,33 @@ class EmliteNET:
                 # very common so log at debug level
                 logger.debug(err_str)
             else:
-                attempt_num = self.send_message.statistics["attempt_number"]  # type: ignore[attr-defined]
                 log_level = (
-                    "error" if attempt_num == num_retries_send_message else "warn"
-                )
-                getattr(logger, log_level)(
-                    f"ProxyError: {err_str}", attempt=attempt_num
+                    "error"
+                    if self.retry_policy.is_final_attempt(e, attempt or 1)
+                    else "warn"
                 )
+                getattr(logger, log_level)(f"ProxyError: {err_str}", attempt=attempt)
             if sock:
                 sock.close()
-            # raise again will be caught by @retry
+            # raise again will be handled by the retry policy
             raise e
         except ProxyConnectionError as e:
-            # log as info as this occurs often and is usually handled via the @retry further up the stack
+            # log as info as this occurs often and is usually handled via the retry policy further up the stack
             #
             # generally this occurs because the emnify-gateway is being restarted which is unfortunately
             # a number of times a day
             logger.info(f"socks proxy connection failure [{e}]")
             if sock:
                 sock.close()
-            # raise again will be caught by @retry
+            # raise again will be handled by the retry policy
             raise e
         except socket.timeout as e:
             logger.info("timeout connecting to socket", error=e)
             if sock:
                 sock.close()
-            # raise again will be caught by @retry
-            raise e
+            # raise as a connect timeout so the retry policy can tell it apart
+            # from a timeout waiting for the response
+            raise ConnectTimeoutError(str(e)) from e
         except socket.error as e:
             if e.__class__.__name__ == "ConnectionRefusedError":
                 # The meter is likely not ready to accept the second of 2 requests
@@ -149,7 +342,7 @@ class EmliteNET:
                 logger.warn("Error connecting to socket", error=e)
             if sock:
                 sock.close()
-            # raise again will be caught by @retry
+            # raise again will be handled by the retry policy
             raise e
         except Exception as e:
             logger.error(
@@ -162,15 +355,56 @@ class EmliteNET:
         return sock
 
     def _write_bytes(self, sock: socket.socket, data: bytes) -> None:
+        started = time.monotonic()
         try:
-            sock.send(data)
+            sock.sendall(data)
         except socket.error as e:
             logger.error("Error writing to socket", error=e)
             raise e
+        METER_IO_SECONDS.observe(time.monotonic() - started, phase="send")
 
-    def _read_bytes(self, sock: socket.socket, num_bytes: int) -> bytes:
-        try:
-            return sock.recv(num_bytes)
-        except socket.error as e:
-            logger.warn("Error reading from socket", error=e)
-            raise e
+    def _read_frame(self, sock: socket.socket) -> bytes:
+        """
+        Read exactly one EMOP frame: skip to the delimiter, read the length
+        byte, then keep reading until the rest of the frame including the crc
+        has arrived. The frame checksum is validated before returning.
+        """
+        started = time.monotonic()
+        buf = bytearray(MAX_FRAME_BYTES)
+        view = memoryview(buf)
+
+        skipped = 0
+        self._read_exactly(sock, view[0:1], 0)
+        while buf[0] != FRAME_DELIMITER:
+            skipped += 1
+            self._read_exactly(sock, view[0:1], 0)
+        if skipped > 0:
+            logger.debug("skipped bytes before frame delimiter", skipped=skipped)
+
+        self._read_exactly(sock, view[1:2], 1)
+        size = frame_size(buf[1])
+        self._read_exactly(sock, view[2:size], 2, size)
+
+        frame = bytes(view[:size])
+        validate_frame(frame)
+        METER_IO_SECONDS.observe(time.monotonic() - started, phase="receive")
+        return frame
+
+    def _read_exactly(
+        self,
+        sock: socket.socket,
+        view: memoryview,
+        received: int,
+        expected: int | None = None,
+    ) -> None:
+        """Fill view from the socket. received is the frame bytes read so far."""
+        pos = 0
+        while pos < len(view):
+            try:
+                num_bytes = sock.recv_into(view[pos:])
+            except socket.error as e:
+                logger.warn("Error reading from socket", error=e)
+                raise e
+            if num_bytes == 0:
+                raise EmopFrameEOFError(received + pos, expected)
+            pos += num_bytes
@@ -0,0 +1,69 @@
+"""
+EMOP frame boundaries and checksums.
+
+An EMOP frame on the wire is:
+
+    delimiter (1) | length (1) | control (1) | destination (4) | source (4)
+        | data (length - 12) | crc16 (2)
+
+where length counts every byte after the delimiter. These helpers let the
+transports read exactly one frame off a stream and check it before the bytes
+are handed to the kaitai parsers.
+"""
+
+import crcmod.predefined  # type: ignore[import-untyped]
+
+FRAME_DELIMITER = 0x7E
+
+# length byte value for a frame with an empty data field
+MIN_FRAME_LENGTH = 12
+
+# delimiter plus the largest value the single length byte can hold
+MAX_FRAME_BYTES = 1 + 0xFF
+
+CRC_LEN = 2
+
+crc16 = crcmod.predefined.mkCrcFun("crc-ccitt-false")
+
+
+class EmopFrameError(Exception):
+    """Raised when a received frame has a bad length or checksum."""
+
+
+class EmopFrameEOFError(EOFError):
+    """
+    Raised when the connection closes before a whole frame was received.
+
+    received is the number of frame bytes read before the close so callers can
+    tell a connection that was already closed (0) from a truncated frame.
+    """
+
+    def __init__(self, received: int, expected: int | None = None) -> None:
+        self.received = received
+        self.expected = expected
+        super().__init__(
+            f"connection closed after {received} of {expected or 'unknown'} frame bytes"
+        )
+
+
+def frame_size(length_byte: int) -> int:
+    """Total frame size in bytes (including the delimiter) for a length byte."""
+    if length_byte < MIN_FRAME_LENGTH:
+        raise EmopFrameError(f"frame length {length_byte} below minimum")
+    return length_byte + 1
+
+
+def frame_checksum(frame: bytes | bytearray | memoryview) -> bytes:
+    """Compute the crc16 for a whole frame (delimiter and crc bytes excluded)."""
+    return int(crc16(frame[1 : len(frame) - CRC_LEN])).to_bytes(CRC_LEN)
+
+
+def validate_frame(frame: bytes | bytearray | memoryview) -> None:
+    if len(frame) < MIN_FRAME_LENGTH + 1 or frame[0] != FRAME_DELIMITER:
+        raise EmopFrameError(f"malformed frame [{bytes(frame).hex()}]")
+    received_crc = bytes(frame[len(frame) - CRC_LEN :])
+    expected_crc = frame_checksum(frame)
+    if received_crc != expected_crc:
+        raise EmopFrameError(
+            f"crc mismatch [received={received_crc.hex()}, expected={expected_crc.hex()}]"
+        )
@@ -0,0 +1,191 @@
+"""
+Retry policy for meter requests.
+
+Failures talking to a meter fall into a few classes that deserve different
+handling. A meter refusing a connection is usually busy and a quick retry
+succeeds. A connect timeout usually means the meter is offline so retrying
+much just holds the per-meter lock. The emnify gateway restarting needs a
+longer pause before it accepts connections again.
+
+RetryPolicy maps each class to a RetryRule (attempts and exponential backoff
+with jitter) and builds the tenacity arguments used by EmliteNET and
+AsyncEmliteNET. A deadline (time.monotonic() based) caps the total time spent
+on one request: no retry is started that could not finish before it.
+"""
+
+import random
+import socket
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict
+
+from python_socks import (  # type: ignore[import-untyped]
+    ProxyConnectionError,
+    ProxyError,
+    ProxyTimeoutError,
+)
+from tenacity import RetryCallState, retry_if_exception_type
+
+from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter
+
+from .emop_framing import EmopFrameError
+
+logger = get_logger(__name__, __file__)
+
+METER_RETRIES = Counter(
+    "emlite_meter_retries_total",
+    "Meter request attempts retried, by the exception class that failed",
+    ["exception"],
+)
+
+PROXY_REFUSED_MESSAGE = "Connection refused by destination host"
+
+
+class ConnectTimeoutError(socket.timeout):
+    """Timed out establishing the TCP connection (as opposed to reading)."""
+
+
+class FailureClass(Enum):
+    PROXY_REFUSED = "proxy_refused"
+    CONNECT_TIMEOUT = "connect_timeout"
+    READ_TIMEOUT = "read_timeout"
+    FRAME_ERROR = "frame_error"
+    GATEWAY_RESTART = "gateway_restart"
+    OTHER = "other"
+
+
+def classify_failure(e: BaseException) -> FailureClass:
+    if isinstance(e, ProxyTimeoutError) or isinstance(e, ConnectTimeoutError):
+        return FailureClass.CONNECT_TIMEOUT
+    if isinstance(e, ProxyConnectionError):
+        return FailureClass.GATEWAY_RESTART
+    if isinstance(e, ProxyError):
+        if str(e) == PROXY_REFUSED_MESSAGE:
+            return FailureClass.PROXY_REFUSED
+        return FailureClass.OTHER
+    if isinstance(e, ConnectionRefusedError):
+        return FailureClass.PROXY_REFUSED
+    if isinstance(e, socket.timeout):
+        return FailureClass.READ_TIMEOUT
+    if isinstance(e, (EmopFrameError, EOFError)):
+        return FailureClass.FRAME_ERROR
+    return FailureClass.OTHER
+
+
+@dataclass(frozen=True)
+class RetryRule:
+    # total attempts allowed when the latest failure is of this class
+    max_attempts: int
+    # first backoff, doubled on every following attempt up to max_delay
+    base_delay_seconds: float
+    max_delay_seconds: float
+
+    def delay(self, attempt_number: int, jitter: float) -> float:
+        backoff = min(
+            self.max_delay_seconds,
+            self.base_delay_seconds * (2 ** (attempt_number - 1)),
+        )
+        return backoff * random.uniform(1.0 - jitter, 1.0)
+
+
+DEFAULT_RETRY_RULES: Dict[FailureClass, RetryRule] = {
+    # meter not ready for another connection yet - retry quickly
+    FailureClass.PROXY_REFUSED: RetryRule(5, 1.0, 8.0),
+    # most likely offline - don't hold the meter lock retrying
+    FailureClass.CONNECT_TIMEOUT: RetryRule(2, 2.0, 5.0),
+    FailureClass.READ_TIMEOUT: RetryRule(3, 2.0, 10.0),
+    FailureClass.FRAME_ERROR: RetryRule(3, 0.5, 2.0),
+    # emnify gateway restarting - give it time to come back
+    FailureClass.GATEWAY_RESTART: RetryRule(5, 3.0, 15.0),
+    FailureClass.OTHER: RetryRule(3, 2.0, 7.0),
+}
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        rules: Dict[FailureClass, RetryRule] | None = None,
+        jitter: float = 0.5,
+        min_attempt_seconds: float = 1.0,
+        on_retry: Callable[[FailureClass, int, float], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            rules: rule per failure class, missing classes use DEFAULT_RETRY_RULES
+            jitter: fraction of each backoff that is randomised (0 = none)
+            min_attempt_seconds: least time an attempt needs, a retry is not
+                started if less than this would remain before the deadline
+            on_retry: called with (failure class, attempt number, delay) before
+                sleeping ahead of a retry
+        """
+        self.rules = {**DEFAULT_RETRY_RULES, **(rules or {})}
+        self.jitter = jitter
+        self.min_attempt_seconds = min_attempt_seconds
+        self.on_retry = on_retry
+
+    def rule_for(self, e: BaseException) -> RetryRule:
+        return self.rules[classify_failure(e)]
+
+    def is_final_attempt(self, e: BaseException, attempt_number: int) -> bool:
+        return attempt_number >= self.rule_for(e).max_attempts
+
+    def tenacity_kwargs(self, deadline: float | None = None) -> Dict[str, Any]:
+        """
+        Arguments for tenacity Retrying / AsyncRetrying.
+
+        Args:
+            deadline: time.monotonic() value after which no more attempts
+                should be started, None for no budget
+        """
+        return {
+            "retry": retry_if_exception_type(Exception),
+            "wait": self._wait,
+            "stop": lambda retry_state: self._stop(retry_state, deadline),
+            "before_sleep": self._before_sleep,
+        }
+
+    def _exception(self, retry_state: RetryCallState) -> BaseException:
+        assert retry_state.outcome is not None
+        e = retry_state.outcome.exception()
+        assert e is not None
+        return e
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        rule = self.rule_for(self._exception(retry_state))
+        return rule.delay(retry_state.attempt_number, self.jitter)
+
+    def _stop(self, retry_state: RetryCallState, deadline: float | None) -> bool:
+        e = self._exception(retry_state)
+        if self.is_final_attempt(e, retry_state.attempt_number):
+            return True
+
+        if deadline is not None:
+            next_attempt_at = time.monotonic() + (retry_state.upcoming_sleep or 0)
+            if next_attempt_at + self.min_attempt_seconds > deadline:
+                logger.debug(
+                    "retry budget exhausted",
+                    failure=classify_failure(e).value,
+                    attempt=retry_state.attempt_number,
+                )
+                return True
+
+        return False
+
+    def _before_sleep(self, retry_state: RetryCallState) -> None:
+        e = self._exception(retry_state)
+        failure = classify_failure(e)
+        METER_RETRIES.inc(exception=type(e).__name__)
+        delay = retry_state.upcoming_sleep or 0
+        logger.debug(
+            "retrying meter request",
+            failure=failure.value,
+            attempt=retry_state.attempt_number,
+            delay=round(delay, 2),
+        )
+        if self.on_retry is not None:
+            self.on_retry(failure, retry_state.attempt_number, delay)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
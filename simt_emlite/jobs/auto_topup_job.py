@@ -89,6 +89,7 @@ class AutoTopupJob:
                             emlite_client = EmlitePrepayAPI(
                                 mediator_address=mediator_address,
                                 logging_level=logging.INFO,
+                                priority="write",
                             )
 
                             latest_balance = emlite_client.prepay_balance(meter["serial"])
@@ -27,6 +27,7 @@ class FutureTariffsUpdateJob:
 
         self.emlite_client = EmlitePrepayAPI(
             mediator_address=mediator_address,
+            priority="sync",
         )
 
         global logger
@@ -65,6 +65,7 @@ class MeterSyncJob:
 
         self.emlite_client = EmlitePrepayAPI(
             mediator_address=mediator_address,
+            priority="sync",
         )
 
         global logger
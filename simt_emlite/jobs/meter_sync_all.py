@@ -7,6 +7,7 @@ from typing import Any, Callable
 
 from simt_emlite.jobs.meter_sync import MeterSyncJob
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 from simt_emlite.util.supabase import as_list, supa_client
 
 logger = get_logger(__name__, __file__)
@@ -109,6 +110,8 @@ class MeterSyncAllJob:
         )
         registry_data = as_list(registry_result)
         self.log.info(f"{len(registry_data)} meters found")
+        # saves a hardware lookup per meter in syncers and later runs
+        meter_metadata_cache().put_many(registry_data)
         if len(registry_data) == 0:
             self.log.error("no meters record found")
             sys.exit(11)
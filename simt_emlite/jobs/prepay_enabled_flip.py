@@ -35,6 +35,7 @@ class PrepayEnabledFlipJob:
 
         self.emlite_client = EmlitePrepayAPI(
             mediator_address=mediator_address,
+            priority="write",
         )
 
         global logger
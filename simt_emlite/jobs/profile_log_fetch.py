@@ -10,6 +10,7 @@ from simt_emlite.mediator.mediator_client_exception import (
 )
 from simt_emlite.util.config import load_config
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 from simt_emlite.util.meters import is_twin_element
 from simt_emlite.util.supabase import as_list, supa_client
 
@@ -56,6 +57,7 @@ class ProfileLogFetchJob:
         meter_id = meter["id"]
         hardware: str = meter.get("hardware", "")
         self.is_twin_element = is_twin_element(hardware)
+        meter_metadata_cache().put(serial, hardware, meter_id)
 
         mediator_address = config["mediator_server"]
         if not mediator_address or not isinstance(mediator_address, str):
@@ -64,6 +66,7 @@ class ProfileLogFetchJob:
         self.emlite_client = EmliteMediatorAPI(
             mediator_address=mediator_address,
             logging_level=logging.INFO,
+            priority="bulk",
         )
 
         global logger
@@ -36,6 +36,7 @@ class PushTopupTokenJob:
 
         self.emlite_client = EmlitePrepayAPI(
             mediator_address=mediator_address,
+            priority="write",
         )
 
         global logger
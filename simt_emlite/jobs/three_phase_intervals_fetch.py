@@ -72,6 +72,7 @@ class ThreePhaseIntervalsFetchJob:
         self.emlite_client = EmliteMediatorAPI(
             mediator_address=mediator_address,
             logging_level=logging.INFO,
+            priority="bulk",
         )
 
         global logger
@@ -9,6 +9,9 @@ Available clients:
 - EmlitePrepayAPI: Prepay and tariff operations (from api_prepay)
 - EmliteMeterManagementAPI: Meter management operations (from api_management)
 
+and their asyncio counterparts on grpc.aio (AsyncEmliteMediatorAPI,
+AsyncEmlitePrepayAPI, AsyncEmliteMeterManagementAPI from async_api_*).
+
 For backward compatibility, EmliteMediatorAPI is also available as the
 main import from this module.
 """
@@ -16,8 +19,14 @@ main import from this module.
 from .api_core import EmliteMediatorAPI
 from .api_management import EmliteMeterManagementAPI, MeterClockDriftInfo
 from .api_prepay import EmlitePrepayAPI, PricingTable, TariffsActive, TariffsFuture
+from .async_api_core import AsyncEmliteMediatorAPI
+from .async_api_management import AsyncEmliteMeterManagementAPI
+from .async_api_prepay import AsyncEmlitePrepayAPI
 
 __all__ = [
+    "AsyncEmliteMediatorAPI",
+    "AsyncEmliteMeterManagementAPI",
+    "AsyncEmlitePrepayAPI",
     "EmliteMediatorAPI",
     "EmliteMeterManagementAPI",
     "EmlitePrepayAPI",
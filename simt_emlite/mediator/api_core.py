@@ -8,7 +8,8 @@ api_prepay.py.
 """
 import datetime
 import logging
-from typing import Any, Dict, Tuple, cast
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, cast
 from zoneinfo import ZoneInfo
 
 import grpc
@@ -33,7 +34,6 @@ from emop_frame_protocol.emop_profile_three_phase_intervals_response_frame impor
 from emop_frame_protocol.generated.emop_event_log_request import (
     EmopEventLogRequest,
 )
-from emop_frame_protocol.generated.emop_profile_log_request import EmopProfileLogRequest
 from emop_frame_protocol.generated.emop_profile_three_phase_intervals_request import (
     EmopProfileThreePhaseIntervalsRequest,
 )
@@ -47,11 +47,13 @@ from emop_frame_protocol.util import (
 from emop_frame_protocol.vendor.kaitaistruct import BytesIO, KaitaiStream
 
 from simt_emlite.dto.three_phase_intervals import ThreePhaseIntervals
+from simt_emlite.mediator.grpc.exception.EmliteCircuitOpen import EmliteCircuitOpen
 from simt_emlite.mediator.grpc.exception.EmliteConnectionFailure import (
     EmliteConnectionFailure,
 )
 from simt_emlite.mediator.grpc.exception.EmliteEOFError import EmliteEOFError
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 from simt_emlite.util.meters import (
     is_three_phase,
     is_twin_element,
@@ -63,13 +65,336 @@ from simt_emlite.util.three_phase_intervals import (
 )
 
 from .grpc.client import EmliteMediatorGrpcClient
+from .grpc.generated.mediator_pb2 import StreamProfileLogReply
+from .grpc.profile_log_stream import profile_log_data_field
 from .mediator_client_exception import MediatorClientException
 from .validation import valid_event_log_idx
 
 logger = get_logger(__name__, __file__)
 
 
-class EmliteMediatorAPI(object):
+@contextmanager
+def mediator_client_errors() -> Iterator[None]:
+    """Raise failures from the mediator grpc client as MediatorClientException."""
+    try:
+        yield
+    except EmliteConnectionFailure as e:
+        raise MediatorClientException("EMLITE_CONNECTION_FAILURE", e.message)
+    except EmliteEOFError as e:
+        raise MediatorClientException("EMLITE_EOF_ERROR", e.message)
+    except EmliteCircuitOpen as e:
+        raise MediatorClientException("EMLITE_CIRCUIT_OPEN", e.message)
+    except grpc.RpcError as e:
+        raise MediatorClientException(e.code().name, str(e.details() or ""))
+
+
+# max hours of intervals in one three phase intervals request
+THREE_PHASE_INTERVALS_HOURS_PER_FRAME = 4
+
+
+class EmliteMediatorAPIBase(object):
+    """
+    Decoding of meter responses and building of requests shared by
+    EmliteMediatorAPI and AsyncEmliteMediatorAPI - everything but the calls
+    to the mediator.
+    """
+
+    log: Any
+
+    def _single_phase_hardware(self, data: Any) -> str | None:
+        """Hardware for a hardware_version response, None if three phase."""
+        # if blank then it's a three phase meter
+        if data.hardware == "":
+            return None
+        hardware_clean: str = data.hardware.replace("\u0000", "").strip()
+        hardware_optional: str | None = single_phase_hardware_str_to_registry_str.get(
+            hardware_clean, None
+        )
+        if hardware_optional is None:
+            return "SINGLE_PHASE_UNKNOWN"
+        return hardware_optional
+
+    def _three_phase_hardware(
+        self, config: EmopMessage.ThreePhaseHardwareConfigurationRec
+    ) -> str:
+        if config.meter_type == EmopMessage.ThreePhaseMeterType.ax_whole_current:
+            return "P1.ax"
+        elif config.meter_type == EmopMessage.ThreePhaseMeterType.cx_ct_operated:
+            return "P1.cx"
+        return "THREE_PHASE_UNKNOWN"
+
+    def _firmware_version(self, serial: str, data: Any) -> str:
+        version_bytes = bytearray(data.version_bytes)
+        if len(version_bytes) == 4:
+            # single phase meter
+            version_str = emop_format_firmware_version(version_bytes.decode("ASCII"))
+        else:
+            # three phase meter
+            version_str = version_bytes.hex()
+        self.log.info("firmware version", firmware_version=version_str, serial=serial)
+        return str(version_str)
+
+    def _clock_time(self, serial: str, data: Any) -> datetime.datetime:
+        date_obj = datetime.datetime(
+            2000 + data.year,
+            data.month,
+            data.date,
+            data.hour,
+            data.minute,
+            data.second,
+            tzinfo=datetime.timezone.utc,
+        )
+        self.log.info("received time", time=date_obj.isoformat(), serial=serial)
+        return date_obj
+
+    def _clock_time_now_bytes(self) -> bytes:
+        return cast(
+            bytes,
+            emop_encode_datetime_to_time_rec(
+                datetime.datetime.now(tz=datetime.timezone.utc)
+            ),
+        )
+
+    def _element_reads(self, data: Any) -> Dict[str, float]:
+        return {
+            "import_active": data.import_active / 1000,
+            "export_active": data.export_active / 1000,
+            "import_reactive": data.import_reactive / 1000,
+            "export_reactive": data.export_reactive / 1000,
+        }
+
+    def _three_phase_reads(
+        self, serial: str, recs: List[Any], hardware: str
+    ) -> Dict[str, float | None]:
+        (
+            active_import,
+            active_export,
+            reactive_import,
+            reactive_export,
+            apparent_import,
+            apparent_export,
+        ) = recs
+
+        reads_dict: Dict[str, float | None] = {
+            "active_import": self._scale_value(active_import, hardware),
+            "active_export": self._scale_value(active_export, hardware),
+            "reactive_import": self._scale_value(reactive_import, hardware),
+            "reactive_export": self._scale_value(reactive_export, hardware),
+            "apparent_import": self._scale_value(apparent_import, hardware),
+            "apparent_export": self._scale_value(apparent_export, hardware),
+        }
+
+        self.log.info(f"reads: {reads_dict}", serial=serial)
+
+        return reads_dict
+
+    def _three_phase_voltages(
+        self, serial: str, vl1: Any, vl2: Any | None, vl3: Any | None
+    ) -> tuple[float, float | None, float | None]:
+        voltage_3p_tuple = (
+            cast(float, vl1.voltage) / 10.0,
+            None if vl2 is None else cast(float, vl2.voltage) / 10.0,
+            None if vl3 is None else cast(float, vl3.voltage) / 10.0,
+        )
+
+        self.log.info(f"voltages [{voltage_3p_tuple}]", serial=serial)
+
+        return voltage_3p_tuple
+
+    def _three_phase_intervals_ranges(
+        self,
+        day: datetime.datetime | None,
+        start_time: datetime.datetime | None,
+        end_time: datetime.datetime | None,
+    ) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """Validated range split into one range per intervals request."""
+        #  day given then setup start and end for it
+        if day:
+            start_time = datetime.datetime.combine(
+                day, datetime.time(0, 0), tzinfo=ZoneInfo("UTC")
+            )
+            end_time = datetime.datetime.combine(
+                day, datetime.time(23, 30), tzinfo=ZoneInfo("UTC")
+            )
+
+        # otherwise check start and end times
+        else:
+            if start_time is None or end_time is None:
+                raise Exception("start_time and end_time must be provided")
+
+            if start_time >= end_time:
+                raise Exception("start_time must come before end_time")
+
+            if end_time > start_time + datetime.timedelta(hours=24):
+                raise Exception("max range between start_time and end_time is 24 hours")
+
+        ranges = []
+        current_start = start_time
+        while current_start < end_time:
+            # Calculate the end time for this chunk (max hours_per_frame hours)
+            current_end = min(
+                current_start
+                + datetime.timedelta(hours=THREE_PHASE_INTERVALS_HOURS_PER_FRAME),
+                end_time,
+            )
+            ranges.append((current_start, current_end))
+            # Move to the next chunk
+            current_start = current_end
+        return ranges
+
+    def _export_three_phase_intervals(
+        self,
+        serial: str,
+        blocks: List[EmopProfileThreePhaseIntervalsResponseBlock | None],
+        hardware: EmopMessage.ThreePhaseHardwareConfigurationRec,
+        csv: str | None,
+        include_statuses: bool,
+    ) -> ThreePhaseIntervals:
+        all_intervals: ThreePhaseIntervals = blocks_to_intervals_rec(blocks)
+
+        export_three_phase_intervals_to_csv(
+            all_intervals, csv, hardware.meter_type, include_statuses
+        )
+        if csv:
+            self.log.info(f"wrote intervals to [{csv}]", serial=serial)
+        else:
+            self.log.info("wrote intervals to stdout", serial=serial)
+
+        return all_intervals
+
+    def _three_phase_intervals_request(
+        self,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        profile: EmopProfileThreePhaseIntervalsRequest.ProfileNumber,
+    ) -> bytes:
+        message_len = 13  # profile number + 2 x 4 byte timestamp + 4 bytes fixed)
+
+        message_field = EmopProfileThreePhaseIntervalsRequest()
+        message_field.profile_number = profile
+        message_field.start_time = emop_datetime_to_epoch_seconds(start_time)
+        message_field.end_time = emop_datetime_to_epoch_seconds(end_time)
+        message_field.trailing_fixed = bytearray.fromhex("ffffffff")
+
+        _io = KaitaiStream(BytesIO(bytearray(message_len)))
+        message_field._write(_io)
+        message_field_bytes = _io.to_byte_array()
+
+        data_field = EmopData(message_len)
+        data_field.format = EmopData.RecordFormat.three_phase_profile_intervals
+        data_field.message = message_field_bytes
+
+        _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
+        data_field._write(_io)
+        return cast(bytes, _io.to_byte_array())
+
+    def _three_phase_intervals_block(
+        self, serial: str, response_bytes: bytes
+    ) -> EmopProfileThreePhaseIntervalsResponseBlock:
+        frame = EmopProfileThreePhaseIntervalsResponseFrame(
+            len(response_bytes), KaitaiStream(BytesIO(response_bytes))
+        )
+        frame._read()
+        self.log.debug(f"three phase intervals frame [{str(frame)}]", serial=serial)
+
+        block = EmopProfileThreePhaseIntervalsResponseBlock(
+            len(frame.frame_data), KaitaiStream(BytesIO(frame.frame_data))
+        )
+        block._read()
+        self.log.debug(f"three phase intervals block [{str(block)}]", serial=serial)
+
+        return block
+
+    def _event_log_request(self, log_idx: int) -> bytes:
+        valid_event_log_idx(log_idx)
+        message_len = 4  # object id (3) + log_idx (1)
+
+        message_field = EmopEventLogRequest()
+        message_field.object_id = emop_encode_object_id(
+            EmopMessage.ObjectIdType.event_log
+        )
+        message_field.log_idx = log_idx
+
+        _io = KaitaiStream(BytesIO(bytearray(message_len)))
+        message_field._write(_io)
+        message_field_bytes = _io.to_byte_array()
+
+        data_field = EmopData(message_len)
+        data_field.format = EmopData.RecordFormat.event_log
+        data_field.message = message_field_bytes
+
+        _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
+        data_field._write(_io)
+        return cast(bytes, _io.to_byte_array())
+
+    def _event_log_response(
+        self, serial: str, response_bytes: bytes
+    ) -> EmopEventLogResponse:
+        self.log.info(f"event log response [{response_bytes.hex()}]", serial=serial)
+
+        data = EmopEventLogResponse(KaitaiStream(BytesIO(response_bytes)))
+        data._read()
+        self.log.info(f"event logs [{data}]", serial=serial)
+
+        return data
+
+    def _checked_elements(self, results: List[Any]) -> List[Any]:
+        """readElements results, raising for any element that failed."""
+        for result in results:
+            if isinstance(result, EmliteEOFError):
+                raise MediatorClientException("EMLITE_EOF_ERROR", result.message)
+            if isinstance(result, Exception):
+                raise MediatorClientException("EMLITE_READ_FAILURE", str(result))
+        return results
+
+    def _safe_elements(
+        self,
+        serial: str,
+        object_ids: Sequence[ObjectIdEnum | int],
+        results: List[Any],
+    ) -> List[Any]:
+        """readElements results with None for any element that failed."""
+        values: List[Any] = []
+        for object_id, result in zip(object_ids, results):
+            if isinstance(result, Exception):
+                element_name = getattr(object_id, "name", str(object_id))
+                logger.error(
+                    f"Failed to read element {element_name}. Exception: {result}",
+                    serial=serial,
+                )
+                values.append(None)
+            else:
+                values.append(result)
+        return values
+
+    def _scale_value(
+        self, rec: EmopMessage.U4leValueRec | None, hardware: str
+    ) -> float | None:
+        return (
+            self._scale_10k_value(rec)
+            if hardware == "P1.cx"
+            else self._scale_kilo_value(rec)
+        )
+
+    def _scale_10k_value(self, rec: EmopMessage.U4leValueRec | None) -> float | None:
+        return rec.value / 10_000 if rec else None
+
+    def _scale_kilo_value(self, rec: EmopMessage.U4leValueRec | None) -> float | None:
+        return rec.value / 1_000 if rec else None
+
+
+# object ids read by three_phase_read
+THREE_PHASE_TOTALS = [
+    ObjectIdEnum.three_phase_total_active_import,
+    ObjectIdEnum.three_phase_total_active_export,
+    ObjectIdEnum.three_phase_total_reactive_import,
+    ObjectIdEnum.three_phase_total_reactive_export,
+    ObjectIdEnum.three_phase_total_apparent_import,
+    ObjectIdEnum.three_phase_total_apparent_export,
+]
+
+
+class EmliteMediatorAPI(EmliteMediatorAPIBase):
     """
     Core API client for Emlite meter operations.
 
@@ -82,9 +407,13 @@ class EmliteMediatorAPI(object):
         self,
         mediator_address: str | None = "0.0.0.0:50051",
         logging_level: str | int = logging.INFO,
+        priority: str | None = None,
+        cache_bypass: bool = False,
     ) -> None:
         self.grpc_client = EmliteMediatorGrpcClient(
             mediator_address=mediator_address,
+            priority=priority,
+            cache_bypass=cache_bypass,
         )
 
         logging.getLogger().setLevel(logging_level)
@@ -92,7 +421,7 @@ class EmliteMediatorAPI(object):
         global logger
         self.log = logger.bind(mediator_address=mediator_address)
         self.log.debug("EmliteMediatorClient init")
-        self._hardware_cache: Dict[str, str] = {}
+        self._hardware_cache = meter_metadata_cache()
 
     def serial_read(self, serial: str) -> str:
         data = self._read_element(serial, ObjectIdEnum.serial)
@@ -100,67 +429,38 @@ class EmliteMediatorAPI(object):
         self.log.info("received serial", serial=serial_resp, request_serial=serial)
         return serial_resp
 
-    def hardware(self, serial: str) -> str:
-        if serial in self._hardware_cache:
-            return self._hardware_cache[serial]
+    def hardware(self, serial: str, refresh: bool = False) -> str:
+        """
+        Hardware type, from the meter metadata cache unless refresh is set or
+        it isn't cached. Cached hardware may come from the meter_registry,
+        which is trusted over the meter (see util/meter_metadata_cache.py).
+        """
+        if not refresh:
+            cached = self._hardware_cache.hardware(serial)
+            if cached is not None:
+                return cached
 
         data = self._read_element(serial, ObjectIdEnum.hardware_version)
-
-        # if blank then it's a three phase meter
-        if data.hardware == "":
+        hardware = self._single_phase_hardware(data)
+        if hardware is None:
             config = self.three_phase_hardware_configuration(serial)
-            if config.meter_type == EmopMessage.ThreePhaseMeterType.ax_whole_current:
-                hardware = "P1.ax"
-            elif config.meter_type == EmopMessage.ThreePhaseMeterType.cx_ct_operated:
-                hardware = "P1.cx"
-            else:
-                hardware = "THREE_PHASE_UNKNOWN"
-        else:
-            hardware_clean: str = data.hardware.replace("\u0000", "").strip()
-            hardware_optional: str | None = (
-                single_phase_hardware_str_to_registry_str.get(hardware_clean, None)
-            )
-            if hardware_optional is None:
-                hardware = "SINGLE_PHASE_UNKNOWN"
-            else:
-                hardware = hardware_optional
+            hardware = self._three_phase_hardware(config)
 
         self.log.info("hardware", hardware=hardware, serial=serial)
-        self._hardware_cache[serial] = hardware
+        self._hardware_cache.put(serial, hardware)
 
         return hardware
 
     def firmware_version(self, serial: str) -> str:
         data = self._read_element(serial, ObjectIdEnum.firmware_version)
-        version_bytes = bytearray(data.version_bytes)
-        if len(version_bytes) == 4:
-            # single phase meter
-            version_str = emop_format_firmware_version(version_bytes.decode("ASCII"))
-        else:
-            # three phase meter
-            version_str = version_bytes.hex()
-        self.log.info("firmware version", firmware_version=version_str, serial=serial)
-        return str(version_str)
+        return self._firmware_version(serial, data)
 
     def clock_time_read(self, serial: str) -> datetime.datetime:
         data = self._read_element(serial, ObjectIdEnum.time)
-        date_obj = datetime.datetime(
-            2000 + data.year,
-            data.month,
-            data.date,
-            data.hour,
-            data.minute,
-            data.second,
-            tzinfo=datetime.timezone.utc,
-        )
-        self.log.info("received time", time=date_obj.isoformat(), serial=serial)
-        return date_obj
+        return self._clock_time(serial, data)
 
     def clock_time_write(self, serial: str) -> None:
-        time_bytes = emop_encode_datetime_to_time_rec(
-            datetime.datetime.now(tz=datetime.timezone.utc)
-        )
-        self._write_element(serial, ObjectIdEnum.time, time_bytes)
+        self._write_element(serial, ObjectIdEnum.time, self._clock_time_now_bytes())
 
     def csq(self, serial: str) -> int:
         data = self._read_element(serial, ObjectIdEnum.csq_net_op)
@@ -224,23 +524,13 @@ class EmliteMediatorAPI(object):
 
     def read_element_a(self, serial: str) -> Dict[str, float]:
         data = self._read_element(serial, ObjectIdEnum.read_element_a)
-        reads = {
-            "import_active": data.import_active / 1000,
-            "export_active": data.export_active / 1000,
-            "import_reactive": data.import_reactive / 1000,
-            "export_reactive": data.export_reactive / 1000,
-        }
+        reads = self._element_reads(data)
         self.log.info("received read_element_a record", reads=reads, serial=serial)
         return reads
 
     def read_element_b(self, serial: str) -> Dict[str, float]:
         data = self._read_element(serial, ObjectIdEnum.read_element_b)
-        reads = {
-            "import_active": data.import_active / 1000,
-            "export_active": data.export_active / 1000,
-            "import_reactive": data.import_reactive / 1000,
-            "export_reactive": data.export_reactive / 1000,
-        }
+        reads = self._element_reads(data)
         self.log.info("received read_element_b record", reads=reads, serial=serial)
         return reads
 
@@ -303,38 +593,8 @@ class EmliteMediatorAPI(object):
     ) -> Dict[str, float | None]:
         if not hardware:
             hardware = self.hardware(serial)
-
-        active_import: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_active_import
-        )
-        active_export: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_active_export
-        )
-        reactive_import: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_reactive_import
-        )
-        reactive_export: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_reactive_export
-        )
-        apparent_import: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_apparent_import
-        )
-        apparent_export: EmopMessage.U4leValueRec | None = self._safe_read_element(
-            serial, ObjectIdEnum.three_phase_total_apparent_export
-        )
-
-        reads_dict: Dict[str, float | None] = {
-            "active_import": self._scale_value(active_import, hardware),
-            "active_export": self._scale_value(active_export, hardware),
-            "reactive_import": self._scale_value(reactive_import, hardware),
-            "reactive_export": self._scale_value(reactive_export, hardware),
-            "apparent_import": self._scale_value(apparent_import, hardware),
-            "apparent_export": self._scale_value(apparent_export, hardware),
-        }
-
-        self.log.info(f"reads: {reads_dict}", serial=serial)
-
-        return reads_dict
+        recs = self._safe_read_elements(serial, THREE_PHASE_TOTALS)
+        return self._three_phase_reads(serial, recs, hardware)
 
     def three_phase_instantaneous_voltage(
         self, serial: str
@@ -364,15 +624,7 @@ class EmliteMediatorAPI(object):
             self.log.warn(f"3p v3 failed - setting to None (e={e})", serial=serial)
             vl3 = None
 
-        voltage_3p_tuple = (
-            cast(float, vl1.voltage) / 10.0,
-            None if vl2 is None else cast(float, vl2.voltage) / 10.0,
-            None if vl3 is None else cast(float, vl3.voltage) / 10.0,
-        )
-
-        self.log.info(f"voltages [{voltage_3p_tuple}]", serial=serial)
-
-        return voltage_3p_tuple
+        return self._three_phase_voltages(serial, vl1, vl2, vl3)
 
     def three_phase_hardware_configuration(
         self, serial: str
@@ -418,28 +670,31 @@ class EmliteMediatorAPI(object):
     def _profile_log(
         self, serial: str, timestamp: datetime.datetime, format: EmopData.RecordFormat
     ) -> bytes:
-        message_len = 4  # profile log request: timestamp (4)
-
-        message_field = EmopProfileLogRequest()
-        message_field.timestamp = emop_datetime_to_epoch_seconds(timestamp)
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len)))
-        message_field._write(_io)
-        message_field_bytes = _io.to_byte_array()
-
-        data_field = EmopData(message_len)
-        data_field.format = format
-        data_field.message = message_field_bytes
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
-        data_field._write(_io)
-        data_field_bytes = _io.to_byte_array()
+        data_field_bytes = profile_log_data_field(format, timestamp)
 
         self.log.debug(f"profile log request [{data_field_bytes.hex()}]", serial=serial)
         response_bytes = self._send_message(serial, data_field_bytes)
 
         return response_bytes
 
+    def profile_log_stream(
+        self,
+        serial: str,
+        log: int,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        is_twin_element: bool = False,
+    ) -> Iterator[StreamProfileLogReply]:
+        """
+        Stream profile log 1 or 2 records from start to end in one turn on
+        the meter. Each reply holds the records of one meter response; a
+        reply with futureTimestamp set ends the stream (unfuddle #382).
+        """
+        with mediator_client_errors():
+            yield from self.grpc_client.stream_profile_log(
+                serial, log, start, end, is_twin_element
+            )
+
     def three_phase_intervals(
         self,
         serial: str,
@@ -449,107 +704,30 @@ class EmliteMediatorAPI(object):
         csv: str | None = None,
         include_statuses: bool = False,
     ) -> ThreePhaseIntervals:
-        hours_per_frame = 4
-
-        #  day given then setup start and end for it
-        if day:
-            start_time = datetime.datetime.combine(
-                day, datetime.time(0, 0), tzinfo=ZoneInfo("UTC")
-            )
-            end_time = datetime.datetime.combine(
-                day, datetime.time(23, 30), tzinfo=ZoneInfo("UTC")
-            )
-
-        # otherwise check start and end times
-        else:
-            if start_time is None or end_time is None:
-                raise Exception("start_time and end_time must be provided")
-
-            if start_time >= end_time:
-                raise Exception("start_time must come before end_time")
-
-            if end_time > start_time + datetime.timedelta(hours=24):
-                raise Exception("max range between start_time and end_time is 24 hours")
+        ranges = self._three_phase_intervals_ranges(day, start_time, end_time)
 
         hardware = self.three_phase_hardware_configuration(serial)
         self.log.info(f"meter type = {hardware.meter_type.name}", serial=serial)
 
-        all_intervals: ThreePhaseIntervals
-
-        # If the range is 8 hours or less, make a single call
-        if end_time <= start_time + datetime.timedelta(hours=hours_per_frame):
-            block = self._three_phase_intervals_read(
+        blocks = [
+            self._three_phase_intervals_read(
                 serial,
-                start_time,
-                end_time,
+                range_start,
+                range_end,
                 EmopProfileThreePhaseIntervalsRequest.ProfileNumber.profile_0,
             )
-            all_intervals = blocks_to_intervals_rec([block])
-        else:
-            # For ranges > 4 hours, make multiple calls
-            blocks = []
-            current_start = start_time
-
-            while current_start < end_time:
-                # Calculate the end time for this chunk (max hours_per_frame hours)
-                current_end = min(
-                    current_start + datetime.timedelta(hours=hours_per_frame), end_time
-                )
-
-                block = self._three_phase_intervals_read(
-                    serial,
-                    current_start,
-                    current_end,
-                    EmopProfileThreePhaseIntervalsRequest.ProfileNumber.profile_0,
-                )
-                blocks.append(block)
-
-                # Move to the next chunk
-                current_start = current_end
+            for range_start, range_end in ranges
+        ]
 
-            all_intervals = blocks_to_intervals_rec(blocks)
-
-        export_three_phase_intervals_to_csv(
-            all_intervals, csv, hardware.meter_type, include_statuses
+        return self._export_three_phase_intervals(
+            serial, blocks, hardware, csv, include_statuses
         )
-        if csv:
-            self.log.info(f"wrote intervals to [{csv}]", serial=serial)
-        else:
-            self.log.info("wrote intervals to stdout", serial=serial)
-
-        return all_intervals
 
     def event_log(self, serial: str, log_idx: int) -> EmopEventLogResponse:
-        valid_event_log_idx(log_idx)
-        message_len = 4  # object id (3) + log_idx (1)
-
-        message_field = EmopEventLogRequest()
-        message_field.object_id = emop_encode_object_id(
-            EmopMessage.ObjectIdType.event_log
-        )
-        message_field.log_idx = log_idx
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len)))
-        message_field._write(_io)
-        message_field_bytes = _io.to_byte_array()
-
-        data_field = EmopData(message_len)
-        data_field.format = EmopData.RecordFormat.event_log
-        data_field.message = message_field_bytes
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
-        data_field._write(_io)
-        data_field_bytes = _io.to_byte_array()
-
+        data_field_bytes = self._event_log_request(log_idx)
         self.log.info(f"event log request [{data_field_bytes.hex()}]", serial=serial)
         response_bytes = self._send_message(serial, data_field_bytes)
-        self.log.info(f"event log response [{response_bytes.hex()}]", serial=serial)
-
-        data = EmopEventLogResponse(KaitaiStream(BytesIO(response_bytes)))
-        data._read()
-        self.log.info(f"event logs [{data}]", serial=serial)
-
-        return data
+        return self._event_log_response(serial, response_bytes)
 
     def obis_read(self, serial: str, obis: str) -> bytes:
         object_id = emop_obis_triplet_to_decimal(obis)
@@ -565,34 +743,29 @@ class EmliteMediatorAPI(object):
         self._write_element(serial, object_id, payload_bytes)
 
     def _read_element(self, serial: str, object_id: ObjectIdEnum | int) -> Any:
-        try:
-            data = self.grpc_client.read_element(serial, object_id)
-        except EmliteConnectionFailure as e:
-            raise MediatorClientException("EMLITE_CONNECTION_FAILURE", e.message)
-        except EmliteEOFError as e:
-            raise MediatorClientException("EMLITE_EOF_ERROR", e.message)
-        except grpc.RpcError as e:
-            raise MediatorClientException(e.code().name, str(e.details() or ""))
-        return data
+        with mediator_client_errors():
+            return self.grpc_client.read_element(serial, object_id)
+
+    def _read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """
+        Read several elements in one turn on the meter (see readElements).
+        Raises MediatorClientException if any of them fails.
+        """
+        with mediator_client_errors():
+            results = self.grpc_client.read_elements(serial, object_ids)
+        return self._checked_elements(results)
 
     def _write_element(
         self, serial: str, object_id: ObjectIdEnum | int, payload: bytes
     ) -> None:
-        try:
+        with mediator_client_errors():
             self.grpc_client.write_element(serial, object_id, payload)
-        except EmliteConnectionFailure as e:
-            raise MediatorClientException("EMLITE_CONNECTION_FAILURE", e.message)
-        except EmliteEOFError as e:
-            raise MediatorClientException("EMLITE_EOF_ERROR", e.message)
-        except grpc.RpcError as e:
-            raise MediatorClientException(e.code().name, str(e.details() or ""))
 
     def _send_message(self, serial: str, message: bytes) -> bytes:
-        try:
-            data = self.grpc_client.send_message(serial, message)
-        except grpc.RpcError as e:
-            raise MediatorClientException(e.code().name, str(e.details() or ""))
-        return data
+        with mediator_client_errors():
+            return self.grpc_client.send_message(serial, message)
 
     def _three_phase_intervals_read(
         self,
@@ -601,26 +774,9 @@ class EmliteMediatorAPI(object):
         end_time: datetime.datetime,
         profile: EmopProfileThreePhaseIntervalsRequest.ProfileNumber,
     ) -> EmopProfileThreePhaseIntervalsResponseBlock | None:
-        message_len = 13  # profile number + 2 x 4 byte timestamp + 4 bytes fixed)
-
-        message_field = EmopProfileThreePhaseIntervalsRequest()
-        message_field.profile_number = profile
-        message_field.start_time = emop_datetime_to_epoch_seconds(start_time)
-        message_field.end_time = emop_datetime_to_epoch_seconds(end_time)
-        message_field.trailing_fixed = bytearray.fromhex("ffffffff")
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len)))
-        message_field._write(_io)
-        message_field_bytes = _io.to_byte_array()
-
-        data_field = EmopData(message_len)
-        data_field.format = EmopData.RecordFormat.three_phase_profile_intervals
-        data_field.message = message_field_bytes
-
-        _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
-        data_field._write(_io)
-        data_field_bytes = _io.to_byte_array()
-
+        data_field_bytes = self._three_phase_intervals_request(
+            start_time, end_time, profile
+        )
         self.log.debug(
             f"three phase intervals frame request [{data_field_bytes.hex()}]",
             serial=serial,
@@ -634,19 +790,7 @@ class EmliteMediatorAPI(object):
         if profile == EmopProfileThreePhaseIntervalsRequest.ProfileNumber.reset:
             return None
 
-        frame = EmopProfileThreePhaseIntervalsResponseFrame(
-            len(response_bytes), KaitaiStream(BytesIO(response_bytes))
-        )
-        frame._read()
-        self.log.debug(f"three phase intervals frame [{str(frame)}]", serial=serial)
-
-        block = EmopProfileThreePhaseIntervalsResponseBlock(
-            len(frame.frame_data), KaitaiStream(BytesIO(frame.frame_data))
-        )
-        block._read()
-        self.log.debug(f"three phase intervals block [{str(block)}]", serial=serial)
-
-        return block
+        return self._three_phase_intervals_block(serial, response_bytes)
 
     def _safe_read_element(self, serial: str, element_id: ObjectIdEnum | int) -> Any:
         """Safely read an element, returning None if it fails."""
@@ -659,17 +803,13 @@ class EmliteMediatorAPI(object):
             )
             return None
 
-    def _scale_value(
-        self, rec: EmopMessage.U4leValueRec | None, hardware: str
-    ) -> float | None:
-        return (
-            self._scale_10k_value(rec)
-            if hardware == "P1.cx"
-            else self._scale_kilo_value(rec)
-        )
-
-    def _scale_10k_value(self, rec: EmopMessage.U4leValueRec | None) -> float | None:
-        return rec.value / 10_000 if rec else None
-
-    def _scale_kilo_value(self, rec: EmopMessage.U4leValueRec | None) -> float | None:
-        return rec.value / 1_000 if rec else None
+    def _safe_read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """Read several elements in one turn, None for any that fail."""
+        try:
+            results = self.grpc_client.read_elements(serial, object_ids)
+        except Exception as e:
+            logger.error(f"Failed to read elements. Exception: {e}", serial=serial)
+            return [None] * len(object_ids)
+        return self._safe_elements(serial, object_ids, results)
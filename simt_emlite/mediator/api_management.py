@@ -7,13 +7,15 @@ and querying meter clock drift status.
 """
 import datetime
 import logging
-from typing import Any, Dict, TypedDict
+from typing import Any, TypedDict
 
 import grpc
 
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 
 from .grpc.client import EmliteMediatorGrpcClient
+from .grpc.generated.mediator_pb2 import Meter, MeterInfo
 from .mediator_client_exception import MediatorClientException
 
 logger = get_logger(__name__, __file__)
@@ -28,7 +30,60 @@ class MeterClockDriftInfo(TypedDict):
     clock_time_diff_synced_at_formatted: str | None
 
 
-class EmliteMeterManagementAPI:
+# MeterInfo fields read by meter_clock_drift
+CLOCK_DRIFT_FIELDS = ["clock_time_diff_seconds", "clock_time_diff_synced_at"]
+
+# Meter fields read by hardware_cache_seed
+HARDWARE_CACHE_FIELDS = ["serial", "hardware"]
+
+
+class EmliteMeterManagementAPIBase:
+    """
+    Decoding shared by EmliteMeterManagementAPI and
+    AsyncEmliteMeterManagementAPI.
+    """
+
+    log: Any
+
+    def _cache_hardware(self, meters: list[Meter]) -> int:
+        """Keep the registry hardware of meters in the meter metadata cache."""
+        return meter_metadata_cache().put_many(
+            {"serial": meter.serial, "hardware": meter.hardware} for meter in meters
+        )
+
+    def _clock_drift_info(self, serial: str, info: MeterInfo) -> MeterClockDriftInfo:
+        drift_raw = (
+            info.clock_time_diff_seconds
+            if info.HasField("clock_time_diff_seconds")
+            else None
+        )
+        last_read_raw = info.clock_time_diff_synced_at or None
+
+        # Format the timestamp if available
+        last_read_formatted: str | None = None
+        if last_read_raw:
+            try:
+                dt = datetime.datetime.fromisoformat(
+                    last_read_raw.replace("Z", "+00:00")
+                )
+                last_read_formatted = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+            except Exception as e:
+                self.log.warning(
+                    f"Failed to parse capture timestamp '{last_read_raw}': {e}"
+                )
+
+        result: MeterClockDriftInfo = {
+            "serial": serial,
+            "clock_time_diff_seconds": drift_raw,
+            "clock_time_diff_synced_at": last_read_raw,
+            "clock_time_diff_synced_at_formatted": last_read_formatted,
+        }
+
+        self.log.info("received clock drift info", serial=serial, result=result)
+        return result
+
+
+class EmliteMeterManagementAPI(EmliteMeterManagementAPIBase):
     """
     API client for Emlite meter management operations.
 
@@ -79,6 +134,64 @@ class EmliteMeterManagementAPI:
         self.log.info("received info", serial=serial)
         return data
 
+    def meter_infos(self, serials: list[str]) -> dict[str, str]:
+        """
+        Get detailed info for many meters in one request.
+
+        Args:
+            serials: Meter serial numbers.
+
+        Returns:
+            Serial to JSON string containing meter info, for each serial
+            that is registered.
+        """
+        data = self.grpc_client.get_infos(serials)
+        self.log.info("received infos", requested=len(serials), found=len(data))
+        return data
+
+    def meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Meter]:
+        """
+        Get meters as typed Meter messages.
+
+        Args:
+            esco: Optional ESCO code to filter by (e.g. "wlce").
+            name: Optional exact meter name to filter by (e.g. "Plot-34.C").
+            serial: Optional exact serial to filter by.
+            fields: Optional Meter fields to fill (e.g. ["serial", "name"]),
+                all if not given.
+
+        Returns:
+            List of matching meters.
+        """
+        data = self.grpc_client.list_meters(
+            esco=esco, name=name, serial=serial, fields=fields
+        )
+        self.log.info("received meters", esco=esco, count=len(data))
+        self._cache_hardware(data)
+        return data
+
+    def hardware_cache_seed(self, esco: str | None = None) -> int:
+        """
+        Cache the registry hardware of all meters so later hardware lookups
+        by the CLI, jobs and downloader on this host skip the meter reads.
+
+        Args:
+            esco: Optional ESCO code to seed only (e.g. "wlce").
+
+        Returns:
+            Number of meters cached.
+        """
+        data = self.grpc_client.list_meters(esco=esco, fields=HARDWARE_CACHE_FIELDS)
+        count = self._cache_hardware(data)
+        self.log.info("seeded hardware cache", esco=esco, count=count)
+        return count
+
     def meter_clock_drift(self, serial: str) -> MeterClockDriftInfo:
         """
         Get clock drift information for a specific meter.
@@ -97,36 +210,7 @@ class EmliteMeterManagementAPI:
             - clock_time_diff_synced_at_formatted: Human-readable timestamp (None if unknown)
         """
         try:
-            import json
-
-            info_json = self.grpc_client.get_info(serial)
-            info_data: Dict[str, Any] = json.loads(info_json)
-
-            drift_raw = info_data.get("clock_time_diff_seconds")
-            last_read_raw = info_data.get("clock_time_diff_synced_at")
-
-            # Format the timestamp if available
-            last_read_formatted: str | None = None
-            if last_read_raw:
-                try:
-                    dt = datetime.datetime.fromisoformat(
-                        last_read_raw.replace("Z", "+00:00")
-                    )
-                    last_read_formatted = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-                except Exception as e:
-                    self.log.warning(
-                        f"Failed to parse capture timestamp '{last_read_raw}': {e}"
-                    )
-
-            result: MeterClockDriftInfo = {
-                "serial": serial,
-                "clock_time_diff_seconds": drift_raw,
-                "clock_time_diff_synced_at": last_read_raw,
-                "clock_time_diff_synced_at_formatted": last_read_formatted,
-            }
-
-            self.log.info("received clock drift info", serial=serial, result=result)
-            return result
-
+            info = self.grpc_client.get_meter_info(serial, fields=CLOCK_DRIFT_FIELDS)
         except grpc.RpcError as e:
             raise MediatorClientException(e.code().name, str(e.details() or ""))
+        return self._clock_drift_info(serial, info)
@@ -7,7 +7,7 @@ token handling, and tariff configuration.
 """
 import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, TypedDict, cast
+from typing import Any, Dict, List, Tuple, TypedDict, cast
 
 from emop_frame_protocol.emop_message import EmopMessage
 from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum
@@ -18,7 +18,7 @@ from emop_frame_protocol.util import (
     emop_scale_price_amount,
 )
 
-from .api_core import EmliteMediatorAPI
+from .api_core import EmliteMediatorAPI, EmliteMediatorAPIBase
 from .validation import valid_rate
 
 
@@ -81,60 +81,52 @@ class TariffsFuture(TypedDict):
     pricings: PricingTable | None
 
 
-class EmlitePrepayAPI(EmliteMediatorAPI):
+# minimum balance (GBP) to switch a meter into prepay mode
+PREPAY_ENABLE_MIN_BALANCE = 10.0
+
+# object ids read by tariffs_active_read, in the order they are unpacked
+TARIFFS_ACTIVE_OBJECT_IDS = [
+    ObjectIdEnum.tariff_active_standing_charge,
+    ObjectIdEnum.tariff_active_threshold_mask,
+    ObjectIdEnum.tariff_active_threshold_values,
+    ObjectIdEnum.tariff_active_block_8_rate_1,
+    ObjectIdEnum.tariff_active_price,
+    ObjectIdEnum.tariff_active_block_rate,
+    ObjectIdEnum.tariff_active_tou_rate,
+    ObjectIdEnum.tariff_active_element_b_price,
+    ObjectIdEnum.tariff_active_element_b_tou_rate,
+    ObjectIdEnum.tariff_active_prepayment_emergency_credit,
+    ObjectIdEnum.tariff_active_prepayment_ecredit_availability,
+    ObjectIdEnum.tariff_active_prepayment_debt_recovery_rate,
+]
+
+# object ids read by tariffs_future_read, in the order they are unpacked
+TARIFFS_FUTURE_OBJECT_IDS = [
+    ObjectIdEnum.tariff_future_standing_charge,
+    ObjectIdEnum.tariff_future_activation_datetime,
+    ObjectIdEnum.tariff_future_threshold_mask,
+    ObjectIdEnum.tariff_future_threshold_values,
+    ObjectIdEnum.tariff_future_block_8_rate_1,
+    ObjectIdEnum.tariff_future_element_b_tou_rate_1,
+    ObjectIdEnum.tariff_future_prepayment_emergency_credit,
+    ObjectIdEnum.tariff_future_prepayment_ecredit_availability,
+    ObjectIdEnum.tariff_future_prepayment_debt_recovery_rate,
+]
+
+
+class EmlitePrepayAPIBase(EmliteMediatorAPIBase):
     """
-    API client for Emlite prepay and tariff operations.
-
-    Extends EmliteMediatorAPI with prepay mode management, balance operations,
-    token handling, and tariff configuration methods.
+    Decoding and request building shared by EmlitePrepayAPI and
+    AsyncEmlitePrepayAPI.
     """
 
-    def prepay_enabled(self, serial: str) -> bool:
-        data = self._read_element(serial, ObjectIdEnum.prepay_enabled_flag)
-        enabled: bool = data.enabled_flag == 1
-        self.log.info(
-            "received prepay enabled flag", prepay_enabled_flag=enabled, serial=serial
-        )
-        return enabled
+    def _check_prepay_enable_balance(self, balance_gbp: Decimal) -> None:
+        if balance_gbp < PREPAY_ENABLE_MIN_BALANCE:
+            raise Exception(
+                f"balance {balance_gbp} too low to enable prepay mode (< 10.0). add more credit and try again."
+            )
 
-    def prepay_no_debt_recovery_when_emergency_credit_enabled(
-        self, serial: str
-    ) -> bool:
-        data = self._read_element(
-            serial, ObjectIdEnum.prepay_no_debt_recovery_when_emergency_credit_flag
-        )
-        enabled: bool = data.enabled_flag == 1
-        self.log.info(
-            "received no debt recovery when in emergency credit flag",
-            prepay_no_debt_recovery_when_emergency_credit_flag=enabled,
-            serial=serial,
-        )
-        return enabled
-
-    def prepay_no_standing_charge_when_power_fail_enabled(self, serial: str) -> bool:
-        data = self._read_element(
-            serial, ObjectIdEnum.prepay_no_standing_charge_when_power_fail_flag
-        )
-        enabled: bool = data.enabled_flag == 1
-        self.log.info(
-            "received no standing charge when power fail flag",
-            prepay_no_standing_charge_when_power_fail_flag=enabled,
-            serial=serial,
-        )
-        return enabled
-
-    def prepay_enabled_write(self, serial: str, enabled: bool) -> None:
-        if enabled:
-            balance_gbp = self.prepay_balance(serial)
-            if balance_gbp < 10.0:
-                raise Exception(
-                    f"balance {balance_gbp} too low to enable prepay mode (< 10.0). add more credit and try again."
-                )
-        flag_bytes = bytes.fromhex("01" if enabled else "00")
-        self._write_element(serial, ObjectIdEnum.prepay_enabled_flag, flag_bytes)
-
-    def prepay_balance(self, serial: str) -> Decimal:
-        data = self._read_element(serial, ObjectIdEnum.prepay_balance)
+    def _prepay_balance(self, serial: str, data: Any) -> Decimal:
         self.log.debug(
             "received prepay balance", prepay_balance_raw=data.balance, serial=serial
         )
@@ -144,102 +136,70 @@ class EmlitePrepayAPI(EmliteMediatorAPI):
         )
         return balance_gbp
 
-    def prepay_send_token(self, serial: str, token: str) -> None:
-        token_bytes = token.encode("ascii")
-        self._write_element(serial, ObjectIdEnum.prepay_token_send, token_bytes)
+    def _tariffs_active(self, serial: str, recs: List[Any]) -> TariffsActive:
+        (
+            standing_charge_rec,
+            threshold_mask_rec,
+            threshold_values_rec,
+            block_8_rate_1_price_rec,
+            active_price_rec,
+            block_rate_rec,
+            tou_rate_index_rec,
+            element_b_price_rec,
+            element_b_tou_rate_rec,
+            emergency_credit_rec,
+            ecredit_rec,
+            debt_recovery_rec,
+        ) = recs
 
-    def prepay_transaction_count(self, serial: str) -> int:
-        data = self._read_element(serial, ObjectIdEnum.monetary_info_transaction_count)
-        self.log.info(
-            "received prepay transaction count",
-            transaction_count=data.count,
-            serial=serial,
-        )
-        return cast(int, data.count)
-
-    def tariffs_active_read(self, serial: str) -> TariffsActive:
-        standing_charge_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_standing_charge
-        )
         self.log.debug(
             "standing charge", value=standing_charge_rec.value, serial=serial
         )
 
-        threshold_mask_rec: EmopMessage.TariffThresholdMaskRec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_threshold_mask
-        )
-        threshold_values_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_threshold_values
-        )
         self._log_thresholds(threshold_mask_rec, threshold_values_rec)
 
-        block_8_rate_1_price_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_block_8_rate_1
-        )
         self.log.debug(
             "block 8 rate 1 (element a activated rate)",
             value=emop_scale_price_amount(block_8_rate_1_price_rec.value),
             serial=serial,
         )
 
-        active_price_rec = self._read_element(serial, ObjectIdEnum.tariff_active_price)
         self.log.debug(
             "element a unit rate (active a price)",
             value=active_price_rec.value,
             serial=serial,
         )
 
-        block_rate_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_block_rate
-        )
         self.log.debug(
             "element a block rate index (0-7)",
             value=block_rate_rec.value,
             serial=serial,
         )
 
-        tou_rate_index_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_tou_rate
-        )
         self.log.debug(
             "element a tou rate index (0-7)",
             value=tou_rate_index_rec.value,
             serial=serial,
         )
 
-        element_b_price_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_element_b_price
-        )
         self.log.debug(
             "element b unit rate (active b price)",
             value=element_b_price_rec.value,
             serial=serial,
         )
 
-        element_b_tou_rate_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_element_b_tou_rate
-        )
         self.log.debug(
             "element b tou rate index (0-3)",
             value=element_b_tou_rate_rec.value,
             serial=serial,
         )
 
-        emergency_credit_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_prepayment_emergency_credit
-        )
         self.log.debug(
             "emergency credit", value=emergency_credit_rec.value, serial=serial
         )
 
-        ecredit_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_prepayment_ecredit_availability
-        )
         self.log.debug("ecredit", value=ecredit_rec.value, serial=serial)
 
-        debt_recovery_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_active_prepayment_debt_recovery_rate
-        )
         self.log.debug(
             "debt recovery rate", value=debt_recovery_rec.value, serial=serial
         )
@@ -278,62 +238,47 @@ class EmlitePrepayAPI(EmliteMediatorAPI):
 
         return tariffs
 
-    def tariffs_future_read(self, serial: str) -> TariffsFuture:
-        standing_charge_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_standing_charge
-        )
+    def _tariffs_future(self, serial: str, recs: List[Any]) -> TariffsFuture:
+        (
+            standing_charge_rec,
+            activation_timestamp_rec,
+            threshold_mask_rec,
+            threshold_values_rec,
+            block_8_rate_1_rec,
+            element_b_tou_rate_1_rec,
+            emergency_credit_rec,
+            ecredit_rec,
+            debt_recovery_rec,
+        ) = recs
+
         self.log.debug(
             "standing charge", value=standing_charge_rec.value, serial=serial
         )
 
-        activation_timestamp_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_activation_datetime
-        )
         self.log.debug(
             "activation timestamp", value=activation_timestamp_rec.value, serial=serial
         )
 
-        threshold_mask_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_threshold_mask
-        )
-        threshold_values_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_threshold_values
-        )
         self._log_thresholds(threshold_mask_rec, threshold_values_rec)
 
-        block_8_rate_1_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_block_8_rate_1
-        )
         self.log.debug(
             "unit_rate_element_a (set on block 8, rate 1)",
             value=block_8_rate_1_rec.value,
             serial=serial,
         )
 
-        element_b_tou_rate_1_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_element_b_tou_rate_1
-        )
         self.log.debug(
             "unit_rate_element_b (set on tou rate 1)",
             value=element_b_tou_rate_1_rec.value,
             serial=serial,
         )
 
-        emergency_credit_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_prepayment_emergency_credit
-        )
         self.log.debug(
             "emergency credit", value=emergency_credit_rec.value, serial=serial
         )
 
-        ecredit_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_prepayment_ecredit_availability
-        )
         self.log.debug("ecredit", value=ecredit_rec.value, serial=serial)
 
-        debt_recovery_rec = self._read_element(
-            serial, ObjectIdEnum.tariff_future_prepayment_debt_recovery_rate
-        )
         self.log.debug(
             "debt recovery rate", value=debt_recovery_rec.value, serial=serial
         )
@@ -369,86 +314,214 @@ class EmlitePrepayAPI(EmliteMediatorAPI):
 
         return tariffs
 
-    def tariffs_future_write(
+    def _tariffs_future_writes(
         self,
-        serial: str,
         from_ts: datetime.datetime,
         standing_charge: Decimal,
         unit_rate: Decimal,
         emergency_credit: Decimal,
         ecredit_availability: Decimal,
         debt_recovery_rate: Decimal,
-    ) -> None:
+    ) -> List[Tuple[str | None, ObjectIdEnum, bytes]]:
+        """
+        Validated writes for tariffs_future_write in the order to make them:
+        (debug log message or None, object id, payload).
+        """
         valid_rate(standing_charge)
         valid_rate(unit_rate)
 
-        # block threshold mask and values - set values to zeros and rate 1 only in mask
-        threshold_mask_bytes = bytes(1)
-        self.log.debug("zero out threshold mask")
-        self._write_element(
-            serial, ObjectIdEnum.tariff_future_threshold_mask, threshold_mask_bytes
-        )
+        unit_rate_encoded = emop_encode_amount_as_u4le_rec(unit_rate)
 
-        threshold_values_bytes = bytes(14)
-        self.log.debug("zero out threshold values")
-        self._write_element(
-            serial, ObjectIdEnum.tariff_future_threshold_values, threshold_values_bytes
-        )
+        return [
+            # block threshold mask and values - set values to zeros and rate 1
+            # only in mask
+            (
+                "zero out threshold mask",
+                ObjectIdEnum.tariff_future_threshold_mask,
+                bytes(1),
+            ),
+            (
+                "zero out threshold values",
+                ObjectIdEnum.tariff_future_threshold_values,
+                bytes(14),
+            ),
+            ("switch off tou flag", ObjectIdEnum.tariff_future_tou_flag, bytes(1)),
+            (
+                f"set element a unit rate (on block 8, rate 1) to {unit_rate}",
+                ObjectIdEnum.tariff_future_block_8_rate_1,
+                unit_rate_encoded,
+            ),
+            (
+                f"set element b unit rate (on tou rate 1) to {unit_rate}",
+                ObjectIdEnum.tariff_future_element_b_tou_rate_1,
+                unit_rate_encoded,
+            ),
+            # prepayment amounts
+            (
+                f"set prepayment amounts [emergency_credit={emergency_credit}, ecredit_availability={ecredit_availability}, debt_recovery_rate={debt_recovery_rate}]",
+                ObjectIdEnum.tariff_future_prepayment_emergency_credit,
+                emop_encode_amount_as_u4le_rec(emergency_credit),
+            ),
+            (
+                None,
+                ObjectIdEnum.tariff_future_prepayment_ecredit_availability,
+                emop_encode_amount_as_u4le_rec(ecredit_availability),
+            ),
+            (
+                None,
+                ObjectIdEnum.tariff_future_prepayment_debt_recovery_rate,
+                emop_encode_amount_as_u4le_rec(debt_recovery_rate),
+            ),
+            # gas tariff - set to zero as it doesn't apply
+            ("set gas rate to zero", ObjectIdEnum.tariff_future_gas, bytes(4)),
+            # standing charge (daily charge)
+            (
+                f"set standing charge to {standing_charge}",
+                ObjectIdEnum.tariff_future_standing_charge,
+                emop_encode_amount_as_u4le_rec(standing_charge),
+            ),
+            # datetime to activate these tariffs
+            (
+                f"set activation date to {from_ts}",
+                ObjectIdEnum.tariff_future_activation_datetime,
+                emop_encode_timestamp_as_u4le_rec(from_ts),
+            ),
+        ]
 
-        self.log.debug("switch off tou flag")
-        self._write_element(serial, ObjectIdEnum.tariff_future_tou_flag, bytes(1))
+    def _pricing_object_id_strs(self, is_active: bool) -> List[str]:
+        return [
+            f"tariff_{'active' if is_active else 'future'}_block_{block}_rate_{rate}"
+            for block in range(1, 9)
+            for rate in range(1, 9)
+        ]
 
-        unit_rate_encoded = emop_encode_amount_as_u4le_rec(unit_rate)
+    def _pricing_table(
+        self, serial: str, object_id_strs: List[str], price_recs: List[Any]
+    ) -> PricingTable:
+        # create a pricings table with all values initialised to Decimal zero
+        pricings: PricingTable = [[Decimal("0") for _ in range(8)] for _ in range(8)]
+
+        for i, price_rec in enumerate(price_recs):
+            self.log.debug(f"{object_id_strs[i]}={price_rec.value}", serial=serial)
+            pricings[i // 8][i % 8] = emop_scale_price_amount(price_rec.value)
 
-        self.log.debug(f"set element a unit rate (on block 8, rate 1) to {unit_rate}")
-        self._write_element(
-            serial, ObjectIdEnum.tariff_future_block_8_rate_1, unit_rate_encoded
+        return pricings
+
+    def _log_thresholds(
+        self,
+        threshold_mask: EmopMessage.TariffThresholdMaskRec,
+        threshold_values: EmopMessage.TariffThresholdValuesRec,
+    ) -> None:
+        self.log.info(
+            f"threshold mask [1={threshold_mask.rate1} 2={threshold_mask.rate2} 3={threshold_mask.rate3} 4={threshold_mask.rate4} 5={threshold_mask.rate5} 6={threshold_mask.rate6} 7={threshold_mask.rate7} 8={threshold_mask.rate8}]"
         )
+        self.log.info(
+            f"threshold values [1={threshold_values.th1} 2={threshold_values.th2} 3={threshold_values.th3} 4={threshold_values.th4} 5={threshold_values.th5} 6={threshold_values.th6} 7={threshold_values.th7}]"
+        )
+
+    def _pluck_keys(
+        self,
+        rec: EmopMessage.TariffThresholdMaskRec | EmopMessage.TariffThresholdValuesRec,
+        key_prefix: str,
+    ) -> Dict[str, Any]:
+        return {k: v for k, v in vars(rec).items() if k.startswith(key_prefix)}
+
 
-        self.log.debug(f"set element b unit rate (on tou rate 1) to {unit_rate}")
-        self._write_element(
-            serial, ObjectIdEnum.tariff_future_element_b_tou_rate_1, unit_rate_encoded
+class EmlitePrepayAPI(EmliteMediatorAPI, EmlitePrepayAPIBase):
+    """
+    API client for Emlite prepay and tariff operations.
+
+    Extends EmliteMediatorAPI with prepay mode management, balance operations,
+    token handling, and tariff configuration methods.
+    """
+
+    def prepay_enabled(self, serial: str) -> bool:
+        data = self._read_element(serial, ObjectIdEnum.prepay_enabled_flag)
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received prepay enabled flag", prepay_enabled_flag=enabled, serial=serial
         )
+        return enabled
 
-        # prepayment amounts
-        self.log.debug(
-            f"set prepayment amounts [emergency_credit={emergency_credit}, ecredit_availability={ecredit_availability}, debt_recovery_rate={debt_recovery_rate}]"
+    def prepay_no_debt_recovery_when_emergency_credit_enabled(
+        self, serial: str
+    ) -> bool:
+        data = self._read_element(
+            serial, ObjectIdEnum.prepay_no_debt_recovery_when_emergency_credit_flag
         )
-        self._write_element(
-            serial,
-            ObjectIdEnum.tariff_future_prepayment_emergency_credit,
-            emop_encode_amount_as_u4le_rec(emergency_credit),
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received no debt recovery when in emergency credit flag",
+            prepay_no_debt_recovery_when_emergency_credit_flag=enabled,
+            serial=serial,
         )
-        self._write_element(
-            serial,
-            ObjectIdEnum.tariff_future_prepayment_ecredit_availability,
-            emop_encode_amount_as_u4le_rec(ecredit_availability),
+        return enabled
+
+    def prepay_no_standing_charge_when_power_fail_enabled(self, serial: str) -> bool:
+        data = self._read_element(
+            serial, ObjectIdEnum.prepay_no_standing_charge_when_power_fail_flag
         )
-        self._write_element(
-            serial,
-            ObjectIdEnum.tariff_future_prepayment_debt_recovery_rate,
-            emop_encode_amount_as_u4le_rec(debt_recovery_rate),
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received no standing charge when power fail flag",
+            prepay_no_standing_charge_when_power_fail_flag=enabled,
+            serial=serial,
         )
+        return enabled
 
-        # gas tariff - set to zero as it doesn't apply
-        self.log.debug("set gas rate to zero")
-        self._write_element(serial, ObjectIdEnum.tariff_future_gas, bytes(4))
+    def prepay_enabled_write(self, serial: str, enabled: bool) -> None:
+        if enabled:
+            self._check_prepay_enable_balance(self.prepay_balance(serial))
+        flag_bytes = bytes.fromhex("01" if enabled else "00")
+        self._write_element(serial, ObjectIdEnum.prepay_enabled_flag, flag_bytes)
 
-        # standing charge (daily charge)
-        self.log.debug(f"set standing charge to {standing_charge}")
-        self._write_element(
-            serial,
-            ObjectIdEnum.tariff_future_standing_charge,
-            emop_encode_amount_as_u4le_rec(standing_charge),
-        )
+    def prepay_balance(self, serial: str) -> Decimal:
+        data = self._read_element(serial, ObjectIdEnum.prepay_balance)
+        return self._prepay_balance(serial, data)
+
+    def prepay_send_token(self, serial: str, token: str) -> None:
+        token_bytes = token.encode("ascii")
+        self._write_element(serial, ObjectIdEnum.prepay_token_send, token_bytes)
 
-        # datetime to activate these tariffs
-        self.log.debug(f"set activation date to {from_ts}")
-        self._write_element(
-            serial,
-            ObjectIdEnum.tariff_future_activation_datetime,
-            emop_encode_timestamp_as_u4le_rec(from_ts),
+    def prepay_transaction_count(self, serial: str) -> int:
+        data = self._read_element(serial, ObjectIdEnum.monetary_info_transaction_count)
+        self.log.info(
+            "received prepay transaction count",
+            transaction_count=data.count,
+            serial=serial,
         )
+        return cast(int, data.count)
+
+    def tariffs_active_read(self, serial: str) -> TariffsActive:
+        recs = self._read_elements(serial, TARIFFS_ACTIVE_OBJECT_IDS)
+        return self._tariffs_active(serial, recs)
+
+    def tariffs_future_read(self, serial: str) -> TariffsFuture:
+        recs = self._read_elements(serial, TARIFFS_FUTURE_OBJECT_IDS)
+        return self._tariffs_future(serial, recs)
+
+    def tariffs_future_write(
+        self,
+        serial: str,
+        from_ts: datetime.datetime,
+        standing_charge: Decimal,
+        unit_rate: Decimal,
+        emergency_credit: Decimal,
+        ecredit_availability: Decimal,
+        debt_recovery_rate: Decimal,
+    ) -> None:
+        writes = self._tariffs_future_writes(
+            from_ts,
+            standing_charge,
+            unit_rate,
+            emergency_credit,
+            ecredit_availability,
+            debt_recovery_rate,
+        )
+        for message, object_id, payload in writes:
+            if message is not None:
+                self.log.debug(message)
+            self._write_element(serial, object_id, payload)
 
     def tariffs_time_switches_element_a_or_single_read(self, serial: str) -> bytes:
         data = self._read_element(
@@ -485,33 +558,8 @@ class EmlitePrepayAPI(EmliteMediatorAPI):
     def _tariffs_pricing_blocks_read(
         self, serial: str, is_active: bool
     ) -> PricingTable:
-        # create a pricings table with all values initialised to Decimal zero
-        pricings: PricingTable = [[Decimal("0") for _ in range(8)] for _ in range(8)]
-
-        for block in range(1, 9):
-            for rate in range(1, 9):
-                object_id_str = f"tariff_{'active' if is_active else 'future'}_block_{block}_rate_{rate}"
-                price_rec = self._read_element(serial, ObjectIdEnum[object_id_str])
-                self.log.debug(f"{object_id_str}={price_rec.value}", serial=serial)
-                pricings[block - 1][rate - 1] = emop_scale_price_amount(price_rec.value)
-
-        return pricings
-
-    def _log_thresholds(
-        self,
-        threshold_mask: EmopMessage.TariffThresholdMaskRec,
-        threshold_values: EmopMessage.TariffThresholdValuesRec,
-    ) -> None:
-        self.log.info(
-            f"threshold mask [1={threshold_mask.rate1} 2={threshold_mask.rate2} 3={threshold_mask.rate3} 4={threshold_mask.rate4} 5={threshold_mask.rate5} 6={threshold_mask.rate6} 7={threshold_mask.rate7} 8={threshold_mask.rate8}]"
+        object_id_strs = self._pricing_object_id_strs(is_active)
+        price_recs = self._read_elements(
+            serial, [ObjectIdEnum[object_id_str] for object_id_str in object_id_strs]
         )
-        self.log.info(
-            f"threshold values [1={threshold_values.th1} 2={threshold_values.th2} 3={threshold_values.th3} 4={threshold_values.th4} 5={threshold_values.th5} 6={threshold_values.th6} 7={threshold_values.th7}]"
-        )
-
-    def _pluck_keys(
-        self,
-        rec: EmopMessage.TariffThresholdMaskRec | EmopMessage.TariffThresholdValuesRec,
-        key_prefix: str,
-    ) -> Dict[str, Any]:
-        return {k: v for k, v in vars(rec).items() if k.startswith(key_prefix)}
+        return self._pricing_table(serial, object_id_strs, price_recs)
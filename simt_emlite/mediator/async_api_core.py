@@ -0,0 +1,481 @@
+# mypy: disable-error-code="import-untyped"
+"""
+asyncio counterpart of the core API (api_core.py).
+
+AsyncEmliteMediatorAPI has the same methods, results and
+MediatorClientException codes as EmliteMediatorAPI (decoding and request
+building are shared through EmliteMediatorAPIBase) but every call to the
+mediator is a coroutine on a grpc.aio channel. A fleet job can then have
+hundreds of meters in flight from one thread, bounding concurrency with an
+asyncio.Semaphore instead of a thread pool:
+
+    async with AsyncEmliteMediatorAPI(mediator_address) as api:
+        limit = asyncio.Semaphore(100)
+
+        async def clock(serial):
+            async with limit:
+                return await api.clock_time_read(serial)
+
+        times = await asyncio.gather(*(clock(serial) for serial in serials))
+"""
+
+import asyncio
+import datetime
+import logging
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple, cast
+
+from emop_frame_protocol.emop_event_log_response import EmopEventLogResponse
+from emop_frame_protocol.emop_message import EmopMessage
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum
+from emop_frame_protocol.emop_profile_log_1_response import (
+    EmopProfileLog1Response,
+    emop_decode_profile_log_1_response,
+)
+from emop_frame_protocol.emop_profile_log_2_response import (
+    EmopProfileLog2Response,
+    emop_decode_profile_log_2_response,
+)
+from emop_frame_protocol.emop_data import EmopData
+from emop_frame_protocol.emop_profile_three_phase_intervals_response_block import (
+    EmopProfileThreePhaseIntervalsResponseBlock,
+)
+from emop_frame_protocol.generated.emop_profile_three_phase_intervals_request import (
+    EmopProfileThreePhaseIntervalsRequest,
+)
+from emop_frame_protocol.util import emop_obis_triplet_to_decimal
+
+from simt_emlite.dto.three_phase_intervals import ThreePhaseIntervals
+from simt_emlite.mediator.grpc.exception.EmliteEOFError import EmliteEOFError
+from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
+from simt_emlite.util.meters import is_three_phase, is_twin_element
+
+from .api_core import (
+    THREE_PHASE_TOTALS,
+    EmliteMediatorAPIBase,
+    mediator_client_errors,
+)
+from .grpc.async_client import AsyncEmliteMediatorGrpcClient
+from .grpc.generated.mediator_pb2 import StreamProfileLogReply
+from .grpc.profile_log_stream import profile_log_data_field
+
+logger = get_logger(__name__, __file__)
+
+
+class AsyncEmliteMediatorAPI(EmliteMediatorAPIBase):
+    """
+    asyncio API client for Emlite meter operations - see EmliteMediatorAPI.
+
+    Close with close() or use as an async context manager.
+    """
+
+    def __init__(
+        self,
+        mediator_address: str | None = "0.0.0.0:50051",
+        logging_level: str | int = logging.INFO,
+        priority: str | None = None,
+        cache_bypass: bool = False,
+    ) -> None:
+        self.grpc_client = AsyncEmliteMediatorGrpcClient(
+            mediator_address=mediator_address,
+            priority=priority,
+            cache_bypass=cache_bypass,
+        )
+
+        logging.getLogger().setLevel(logging_level)
+
+        global logger
+        self.log = logger.bind(mediator_address=mediator_address)
+        self.log.debug("AsyncEmliteMediatorAPI init")
+        self._hardware_cache = meter_metadata_cache()
+
+    async def close(self) -> None:
+        await self.grpc_client.close()
+
+    async def __aenter__(self) -> "AsyncEmliteMediatorAPI":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def serial_read(self, serial: str) -> str:
+        data = await self._read_element(serial, ObjectIdEnum.serial)
+        serial_resp: str = data.serial.strip()
+        self.log.info("received serial", serial=serial_resp, request_serial=serial)
+        return serial_resp
+
+    async def hardware(self, serial: str, refresh: bool = False) -> str:
+        """
+        Hardware type, from the meter metadata cache unless refresh is set or
+        it isn't cached. Cached hardware may come from the meter_registry,
+        which is trusted over the meter (see util/meter_metadata_cache.py).
+        """
+        if not refresh:
+            cached = self._hardware_cache.hardware(serial)
+            if cached is not None:
+                return cached
+
+        data = await self._read_element(serial, ObjectIdEnum.hardware_version)
+        hardware = self._single_phase_hardware(data)
+        if hardware is None:
+            config = await self.three_phase_hardware_configuration(serial)
+            hardware = self._three_phase_hardware(config)
+
+        self.log.info("hardware", hardware=hardware, serial=serial)
+        # writes the cache file so off the event loop
+        await asyncio.to_thread(self._hardware_cache.put, serial, hardware)
+
+        return hardware
+
+    async def firmware_version(self, serial: str) -> str:
+        data = await self._read_element(serial, ObjectIdEnum.firmware_version)
+        return self._firmware_version(serial, data)
+
+    async def clock_time_read(self, serial: str) -> datetime.datetime:
+        data = await self._read_element(serial, ObjectIdEnum.time)
+        return self._clock_time(serial, data)
+
+    async def clock_time_write(self, serial: str) -> None:
+        await self._write_element(
+            serial, ObjectIdEnum.time, self._clock_time_now_bytes()
+        )
+
+    async def csq(self, serial: str) -> int:
+        data = await self._read_element(serial, ObjectIdEnum.csq_net_op)
+        self.log.info("received csq", csq=data.csq, serial=serial)
+        return cast(int, data.csq)
+
+    async def instantaneous_voltage(self, serial: str) -> float:
+        data = await self._read_element(serial, ObjectIdEnum.instantaneous_voltage)
+        self.log.info(
+            "received instantaneous voltage", voltage=data.voltage, serial=serial
+        )
+        return float(data.voltage)
+
+    async def instantaneous_active_power(self, serial: str) -> float:
+        data = await self._read_element(serial, ObjectIdEnum.instantaneous_active_power)
+        power_kwh = data.power / 1000
+        self.log.info(
+            "received instantaneous active power", power_kwh=power_kwh, serial=serial
+        )
+        return float(power_kwh)
+
+    async def instantaneous_active_power_element_a(self, serial: str) -> float:
+        data = await self._read_element(
+            serial, ObjectIdEnum.element_a_instantaneous_active_power_import
+        )
+        power_kwh = data.power / 1000
+        self.log.info(
+            "received instantaneous active power (element a)",
+            power_kwh=power_kwh,
+            serial=serial,
+        )
+        return float(power_kwh)
+
+    async def instantaneous_active_power_element_b(self, serial: str) -> float:
+        data = await self._read_element(
+            serial, ObjectIdEnum.element_b_instantaneous_active_power_import
+        )
+        power_kwh = data.power / 1000
+        self.log.info(
+            "received instantaneous active power (element b)",
+            power_kwh=power_kwh,
+            serial=serial,
+        )
+        return float(power_kwh)
+
+    async def read(
+        self, serial: str
+    ) -> Tuple[Dict[str, float], Dict[str, float] | None] | Dict[str, float | None]:
+        hardware = await self.hardware(serial)
+        if is_three_phase(hardware):
+            return await self.three_phase_read(serial, hardware)
+
+        element_a: Dict[str, float] = await self.read_element_a(serial)
+        element_b: Dict[str, float] | None = None
+        if is_twin_element(hardware):
+            element_b = await self.read_element_b(serial)
+        single_phase_reads = (element_a, element_b)
+        self.log.info(f"single phase read [{single_phase_reads}]", serial=serial)
+        return single_phase_reads
+
+    async def read_element_a(self, serial: str) -> Dict[str, float]:
+        data = await self._read_element(serial, ObjectIdEnum.read_element_a)
+        reads = self._element_reads(data)
+        self.log.info("received read_element_a record", reads=reads, serial=serial)
+        return reads
+
+    async def read_element_b(self, serial: str) -> Dict[str, float]:
+        data = await self._read_element(serial, ObjectIdEnum.read_element_b)
+        reads = self._element_reads(data)
+        self.log.info("received read_element_b record", reads=reads, serial=serial)
+        return reads
+
+    async def daylight_savings_correction_enabled(self, serial: str) -> bool:
+        data = await self._read_element(
+            serial, ObjectIdEnum.daylight_savings_correction_flag
+        )
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received daylight savings correction flag",
+            daylight_savings_correction_flag=enabled,
+            serial=serial,
+        )
+        return enabled
+
+    async def daylight_savings_correction_enabled_write(
+        self, serial: str, enabled: bool
+    ) -> None:
+        flag_bytes = bytes.fromhex("01" if enabled else "00")
+        await self._write_element(
+            serial, ObjectIdEnum.daylight_savings_correction_flag, flag_bytes
+        )
+
+    async def backlight(self, serial: str) -> EmopMessage.BacklightSettingType:
+        data = await self._read_element(serial, ObjectIdEnum.backlight)
+        self.log.info(
+            "received backlight setting", backlight_setting=data.setting, serial=serial
+        )
+        return data.setting
+
+    async def backlight_write(
+        self, serial: str, setting: EmopMessage.BacklightSettingType
+    ) -> None:
+        setting_bytes = bytes([setting.value])
+        await self._write_element(serial, ObjectIdEnum.backlight, setting_bytes)
+
+    async def load_switch(self, serial: str) -> EmopMessage.LoadSwitchSettingType:
+        data = await self._read_element(serial, ObjectIdEnum.load_switch)
+        self.log.info(
+            "received load switch setting",
+            load_switch_setting=data.setting,
+            serial=serial,
+        )
+        return data.setting
+
+    async def load_switch_write(
+        self, serial: str, setting: EmopMessage.LoadSwitchSettingType
+    ) -> None:
+        setting_bytes = bytes([setting.value])
+        await self._write_element(serial, ObjectIdEnum.load_switch, setting_bytes)
+
+    async def three_phase_serial(self, serial: str) -> str:
+        data = await self._read_element(serial, ObjectIdEnum.three_phase_serial)
+        serial_resp = data.serial.strip()
+        self.log.info(
+            "received three phase serial", serial=serial_resp, request_serial=serial
+        )
+        return cast(str, serial_resp)
+
+    async def three_phase_read(
+        self, serial: str, hardware: str | None
+    ) -> Dict[str, float | None]:
+        if not hardware:
+            hardware = await self.hardware(serial)
+        recs = await self._safe_read_elements(serial, THREE_PHASE_TOTALS)
+        return self._three_phase_reads(serial, recs, hardware)
+
+    async def three_phase_instantaneous_voltage(
+        self, serial: str
+    ) -> tuple[float, float | None, float | None]:
+        vl1 = await self._read_element(
+            serial, ObjectIdEnum.three_phase_instantaneous_voltage_l1
+        )
+        # l2 and l3 EOFErrors are warnings - see EmliteMediatorAPI
+        try:
+            vl2 = await self._read_element(
+                serial, ObjectIdEnum.three_phase_instantaneous_voltage_l2
+            )
+        except EmliteEOFError as e:
+            self.log.warn(f"3p v2 failed - setting to None (e={e})", serial=serial)
+            vl2 = None
+        try:
+            vl3 = await self._read_element(
+                serial, ObjectIdEnum.three_phase_instantaneous_voltage_l3
+            )
+        except EmliteEOFError as e:
+            self.log.warn(f"3p v3 failed - setting to None (e={e})", serial=serial)
+            vl3 = None
+
+        return self._three_phase_voltages(serial, vl1, vl2, vl3)
+
+    async def three_phase_hardware_configuration(
+        self, serial: str
+    ) -> EmopMessage.ThreePhaseHardwareConfigurationRec:
+        data = await self._read_element(
+            serial, ObjectIdEnum.three_phase_hardware_configuration
+        )
+        self.log.info(
+            "three phase hardware configuration", value=str(data), serial=serial
+        )
+        return data
+
+    async def profile_log_1(
+        self, serial: str, timestamp: datetime.datetime
+    ) -> EmopProfileLog1Response:
+        log_rsp = await self._profile_log(
+            serial, timestamp, EmopData.RecordFormat.profile_log_1
+        )
+        log_decoded: EmopProfileLog1Response = emop_decode_profile_log_1_response(
+            log_rsp
+        )
+        self.log.debug(f"profile_log_1 response [{str(log_decoded)}]", serial=serial)
+        return log_decoded
+
+    async def profile_log_2(
+        self, serial: str, timestamp: datetime.datetime, is_twin_element: bool
+    ) -> EmopProfileLog2Response:
+        log_rsp = await self._profile_log(
+            serial, timestamp, EmopData.RecordFormat.profile_log_2
+        )
+        log_decoded: EmopProfileLog2Response = emop_decode_profile_log_2_response(
+            is_twin_element, log_rsp
+        )
+        self.log.debug(
+            f"profile_log_2 response [{str(log_decoded)}]",
+            is_twin_element=is_twin_element,
+            serial=serial,
+        )
+        return log_decoded
+
+    async def _profile_log(
+        self, serial: str, timestamp: datetime.datetime, format: EmopData.RecordFormat
+    ) -> bytes:
+        data_field_bytes = profile_log_data_field(format, timestamp)
+        self.log.debug(f"profile log request [{data_field_bytes.hex()}]", serial=serial)
+        return await self._send_message(serial, data_field_bytes)
+
+    async def profile_log_stream(
+        self,
+        serial: str,
+        log: int,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        is_twin_element: bool = False,
+    ) -> AsyncIterator[StreamProfileLogReply]:
+        """See EmliteMediatorAPI.profile_log_stream."""
+        with mediator_client_errors():
+            async for reply in self.grpc_client.stream_profile_log(
+                serial, log, start, end, is_twin_element
+            ):
+                yield reply
+
+    async def three_phase_intervals(
+        self,
+        serial: str,
+        day: datetime.datetime | None,
+        start_time: datetime.datetime | None,
+        end_time: datetime.datetime | None,
+        csv: str | None = None,
+        include_statuses: bool = False,
+    ) -> ThreePhaseIntervals:
+        ranges = self._three_phase_intervals_ranges(day, start_time, end_time)
+
+        hardware = await self.three_phase_hardware_configuration(serial)
+        self.log.info(f"meter type = {hardware.meter_type.name}", serial=serial)
+
+        # one after another - requests to a meter are served one at a time
+        blocks = []
+        for range_start, range_end in ranges:
+            blocks.append(
+                await self._three_phase_intervals_read(
+                    serial,
+                    range_start,
+                    range_end,
+                    EmopProfileThreePhaseIntervalsRequest.ProfileNumber.profile_0,
+                )
+            )
+
+        return self._export_three_phase_intervals(
+            serial, blocks, hardware, csv, include_statuses
+        )
+
+    async def event_log(self, serial: str, log_idx: int) -> EmopEventLogResponse:
+        data_field_bytes = self._event_log_request(log_idx)
+        self.log.info(f"event log request [{data_field_bytes.hex()}]", serial=serial)
+        response_bytes = await self._send_message(serial, data_field_bytes)
+        return self._event_log_response(serial, response_bytes)
+
+    async def obis_read(self, serial: str, obis: str) -> bytes:
+        object_id = emop_obis_triplet_to_decimal(obis)
+        result = await self._read_element(serial, object_id)
+        self.log.info(
+            "obis_read", obis=obis, result=result.payload.hex(), serial=serial
+        )
+        return cast(bytes, result.payload)
+
+    async def obis_write(self, serial: str, obis: str, payload_hex: str) -> None:
+        object_id = emop_obis_triplet_to_decimal(obis)
+        payload_bytes = bytes.fromhex(payload_hex)
+        await self._write_element(serial, object_id, payload_bytes)
+
+    async def _read_element(self, serial: str, object_id: ObjectIdEnum | int) -> Any:
+        with mediator_client_errors():
+            return await self.grpc_client.read_element(serial, object_id)
+
+    async def _read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """See EmliteMediatorAPI._read_elements."""
+        with mediator_client_errors():
+            results = await self.grpc_client.read_elements(serial, object_ids)
+        return self._checked_elements(results)
+
+    async def _write_element(
+        self, serial: str, object_id: ObjectIdEnum | int, payload: bytes
+    ) -> None:
+        with mediator_client_errors():
+            await self.grpc_client.write_element(serial, object_id, payload)
+
+    async def _send_message(self, serial: str, message: bytes) -> bytes:
+        with mediator_client_errors():
+            return await self.grpc_client.send_message(serial, message)
+
+    async def _three_phase_intervals_read(
+        self,
+        serial: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        profile: EmopProfileThreePhaseIntervalsRequest.ProfileNumber,
+    ) -> EmopProfileThreePhaseIntervalsResponseBlock | None:
+        data_field_bytes = self._three_phase_intervals_request(
+            start_time, end_time, profile
+        )
+        self.log.debug(
+            f"three phase intervals frame request [{data_field_bytes.hex()}]",
+            serial=serial,
+        )
+        response_bytes = await self._send_message(serial, data_field_bytes)
+        self.log.debug(
+            f"three phase intervals frame response [{response_bytes.hex()}]",
+            serial=serial,
+        )
+
+        if profile == EmopProfileThreePhaseIntervalsRequest.ProfileNumber.reset:
+            return None
+
+        return self._three_phase_intervals_block(serial, response_bytes)
+
+    async def _safe_read_element(
+        self, serial: str, element_id: ObjectIdEnum | int
+    ) -> Any:
+        """Safely read an element, returning None if it fails."""
+        try:
+            return await self._read_element(serial, element_id)
+        except Exception as e:
+            element_name = getattr(element_id, "name", str(element_id))
+            logger.error(
+                f"Failed to read element {element_name}. Exception: {e}", serial=serial
+            )
+            return None
+
+    async def _safe_read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """Read several elements in one turn, None for any that fail."""
+        try:
+            results = await self.grpc_client.read_elements(serial, object_ids)
+        except Exception as e:
+            logger.error(f"Failed to read elements. Exception: {e}", serial=serial)
+            return [None] * len(object_ids)
+        return self._safe_elements(serial, object_ids, results)
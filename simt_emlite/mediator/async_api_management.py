@@ -0,0 +1,109 @@
+"""
+asyncio counterpart of the management API (api_management.py).
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import grpc
+
+from simt_emlite.util.logging import get_logger
+
+from .api_management import (
+    CLOCK_DRIFT_FIELDS,
+    HARDWARE_CACHE_FIELDS,
+    EmliteMeterManagementAPIBase,
+    MeterClockDriftInfo,
+)
+from .grpc.async_client import AsyncEmliteMediatorGrpcClient
+from .grpc.generated.mediator_pb2 import Meter
+from .mediator_client_exception import MediatorClientException
+
+logger = get_logger(__name__, __file__)
+
+
+class AsyncEmliteMeterManagementAPI(EmliteMeterManagementAPIBase):
+    """
+    asyncio API client for Emlite meter management operations - see
+    EmliteMeterManagementAPI.
+
+    Close with close() or use as an async context manager.
+    """
+
+    def __init__(
+        self,
+        mediator_address: str | None = "0.0.0.0:50051",
+        logging_level: str | int = logging.INFO,
+    ) -> None:
+        self.grpc_client = AsyncEmliteMediatorGrpcClient(
+            mediator_address=mediator_address,
+        )
+
+        logging.getLogger().setLevel(logging_level)
+
+        global logger
+        self.log = logger.bind(mediator_address=mediator_address)
+        self.log.debug("AsyncEmliteMeterManagementAPI init")
+
+    async def close(self) -> None:
+        await self.grpc_client.close()
+
+    async def __aenter__(self) -> "AsyncEmliteMeterManagementAPI":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def meter_list(self, esco: str | None = None) -> str:
+        """JSON string containing meter list - see EmliteMeterManagementAPI."""
+        data = await self.grpc_client.get_meters(esco=esco)
+        self.log.info("received meters list", esco=esco)
+        return data
+
+    async def meter_info(self, serial: str) -> str:
+        """JSON string containing meter info - see EmliteMeterManagementAPI."""
+        data = await self.grpc_client.get_info(serial)
+        self.log.info("received info", serial=serial)
+        return data
+
+    async def meter_infos(self, serials: list[str]) -> dict[str, str]:
+        """Serial to JSON meter info - see EmliteMeterManagementAPI."""
+        data = await self.grpc_client.get_infos(serials)
+        self.log.info("received infos", requested=len(serials), found=len(data))
+        return data
+
+    async def meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Meter]:
+        """Typed Meter messages - see EmliteMeterManagementAPI."""
+        data = await self.grpc_client.list_meters(
+            esco=esco, name=name, serial=serial, fields=fields
+        )
+        self.log.info("received meters", esco=esco, count=len(data))
+        # writes the cache file so off the event loop
+        await asyncio.to_thread(self._cache_hardware, data)
+        return data
+
+    async def hardware_cache_seed(self, esco: str | None = None) -> int:
+        """Cache the registry hardware of all meters - see EmliteMeterManagementAPI."""
+        data = await self.grpc_client.list_meters(
+            esco=esco, fields=HARDWARE_CACHE_FIELDS
+        )
+        count = await asyncio.to_thread(self._cache_hardware, data)
+        self.log.info("seeded hardware cache", esco=esco, count=count)
+        return count
+
+    async def meter_clock_drift(self, serial: str) -> MeterClockDriftInfo:
+        """Clock drift information - see EmliteMeterManagementAPI."""
+        try:
+            info = await self.grpc_client.get_meter_info(
+                serial, fields=CLOCK_DRIFT_FIELDS
+            )
+        except grpc.RpcError as e:
+            raise MediatorClientException(e.code().name, str(e.details() or ""))
+        return self._clock_drift_info(serial, info)
@@ -0,0 +1,166 @@
+# mypy: disable-error-code="import-untyped"
+"""
+asyncio counterpart of the prepay and tariff API (api_prepay.py).
+"""
+
+import datetime
+from decimal import Decimal
+from typing import cast
+
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum
+
+from .api_prepay import (
+    TARIFFS_ACTIVE_OBJECT_IDS,
+    TARIFFS_FUTURE_OBJECT_IDS,
+    EmlitePrepayAPIBase,
+    PricingTable,
+    TariffsActive,
+    TariffsFuture,
+)
+from .async_api_core import AsyncEmliteMediatorAPI
+
+
+class AsyncEmlitePrepayAPI(AsyncEmliteMediatorAPI, EmlitePrepayAPIBase):
+    """
+    asyncio API client for Emlite prepay and tariff operations - see
+    EmlitePrepayAPI.
+    """
+
+    async def prepay_enabled(self, serial: str) -> bool:
+        data = await self._read_element(serial, ObjectIdEnum.prepay_enabled_flag)
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received prepay enabled flag", prepay_enabled_flag=enabled, serial=serial
+        )
+        return enabled
+
+    async def prepay_no_debt_recovery_when_emergency_credit_enabled(
+        self, serial: str
+    ) -> bool:
+        data = await self._read_element(
+            serial, ObjectIdEnum.prepay_no_debt_recovery_when_emergency_credit_flag
+        )
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received no debt recovery when in emergency credit flag",
+            prepay_no_debt_recovery_when_emergency_credit_flag=enabled,
+            serial=serial,
+        )
+        return enabled
+
+    async def prepay_no_standing_charge_when_power_fail_enabled(
+        self, serial: str
+    ) -> bool:
+        data = await self._read_element(
+            serial, ObjectIdEnum.prepay_no_standing_charge_when_power_fail_flag
+        )
+        enabled: bool = data.enabled_flag == 1
+        self.log.info(
+            "received no standing charge when power fail flag",
+            prepay_no_standing_charge_when_power_fail_flag=enabled,
+            serial=serial,
+        )
+        return enabled
+
+    async def prepay_enabled_write(self, serial: str, enabled: bool) -> None:
+        if enabled:
+            self._check_prepay_enable_balance(await self.prepay_balance(serial))
+        flag_bytes = bytes.fromhex("01" if enabled else "00")
+        await self._write_element(serial, ObjectIdEnum.prepay_enabled_flag, flag_bytes)
+
+    async def prepay_balance(self, serial: str) -> Decimal:
+        data = await self._read_element(serial, ObjectIdEnum.prepay_balance)
+        return self._prepay_balance(serial, data)
+
+    async def prepay_send_token(self, serial: str, token: str) -> None:
+        token_bytes = token.encode("ascii")
+        await self._write_element(serial, ObjectIdEnum.prepay_token_send, token_bytes)
+
+    async def prepay_transaction_count(self, serial: str) -> int:
+        data = await self._read_element(
+            serial, ObjectIdEnum.monetary_info_transaction_count
+        )
+        self.log.info(
+            "received prepay transaction count",
+            transaction_count=data.count,
+            serial=serial,
+        )
+        return cast(int, data.count)
+
+    async def tariffs_active_read(self, serial: str) -> TariffsActive:
+        recs = await self._read_elements(serial, TARIFFS_ACTIVE_OBJECT_IDS)
+        return self._tariffs_active(serial, recs)
+
+    async def tariffs_future_read(self, serial: str) -> TariffsFuture:
+        recs = await self._read_elements(serial, TARIFFS_FUTURE_OBJECT_IDS)
+        return self._tariffs_future(serial, recs)
+
+    async def tariffs_future_write(
+        self,
+        serial: str,
+        from_ts: datetime.datetime,
+        standing_charge: Decimal,
+        unit_rate: Decimal,
+        emergency_credit: Decimal,
+        ecredit_availability: Decimal,
+        debt_recovery_rate: Decimal,
+    ) -> None:
+        writes = self._tariffs_future_writes(
+            from_ts,
+            standing_charge,
+            unit_rate,
+            emergency_credit,
+            ecredit_availability,
+            debt_recovery_rate,
+        )
+        for message, object_id, payload in writes:
+            if message is not None:
+                self.log.debug(message)
+            await self._write_element(serial, object_id, payload)
+
+    async def tariffs_time_switches_element_a_or_single_read(
+        self, serial: str
+    ) -> bytes:
+        data = await self._read_element(
+            serial, ObjectIdEnum.tariff_time_switch_element_a_or_single
+        )
+        self.log.info(
+            "element A switch settings", value=data.switch_settings, serial=serial
+        )
+        return cast(bytes, data.switch_settings)
+
+    async def tariffs_time_switches_element_a_or_single_write(
+        self, serial: str
+    ) -> None:
+        await self._tariffs_time_switches_write(
+            serial, ObjectIdEnum.tariff_time_switch_element_a_or_single
+        )
+
+    async def tariffs_time_switches_element_b_read(self, serial: str) -> bytes:
+        data = await self._read_element(
+            serial, ObjectIdEnum.tariff_time_switch_element_b
+        )
+        self.log.info(
+            "element B switch settings", value=data.switch_settings, serial=serial
+        )
+        return cast(bytes, data.switch_settings)
+
+    async def tariffs_time_switches_element_b_write(self, serial: str) -> None:
+        await self._tariffs_time_switches_write(
+            serial, ObjectIdEnum.tariff_time_switch_element_b
+        )
+
+    async def _tariffs_time_switches_write(
+        self, serial: str, object_id: ObjectIdEnum
+    ) -> None:
+        payload = bytes(80)  # all switches off - all zeros
+        await self._write_element(serial, object_id, payload)
+
+    async def _tariffs_pricing_blocks_read(
+        self, serial: str, is_active: bool
+    ) -> PricingTable:
+        object_id_strs = self._pricing_object_id_strs(is_active)
+        price_recs = await self._read_elements(
+            serial, [ObjectIdEnum[object_id_str] for object_id_str in object_id_strs]
+        )
+        return self._pricing_table(serial, object_id_strs, price_recs)
@@ -0,0 +1,371 @@
+# mypy: disable-error-code="import-untyped"
+
+import asyncio
+import datetime
+from typing import Any, AsyncIterator, List, Sequence
+
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum
+
+import grpc
+from google.protobuf.field_mask_pb2 import FieldMask
+from simt_emlite.util.logging import get_logger
+
+from .channel_pool import create_aio_channel
+from .client import EmliteMediatorGrpcClientBase
+from .generated.mediator_pb2 import (
+    GetInfoRequest,
+    GetInfosRequest,
+    GetMeterInfoRequest,
+    GetMeterStatusReply,
+    GetMeterStatusRequest,
+    GetMetersRequest,
+    Meter,
+    MeterInfo,
+    ReadElementRequest,
+    ReadElementsRequest,
+    SendRawMessageRequest,
+    StreamProfileLogReply,
+    WriteElementRequest,
+)
+from .generated.mediator_pb2_grpc import EmliteMediatorServiceStub, InfoServiceStub
+from .service_config import CLIENT_HEDGES, INFO_HEDGING_DELAY_SECONDS, record_retries
+
+logger = get_logger(__name__, __file__)
+
+"""
+    grpc.aio counterpart of EmliteMediatorGrpcClient.
+
+    Same requests, service config, metadata and exceptions (shared via
+    EmliteMediatorGrpcClientBase) but every call is a coroutine, so one event
+    loop can have calls to hundreds of meters in flight at once.
+
+    The channel is opened on first use in the running event loop and closed
+    by close() (or leaving "async with").
+"""
+
+
+class AsyncEmliteMediatorGrpcClient(EmliteMediatorGrpcClientBase):
+    _aio_channel: grpc.aio.Channel | None = None
+
+    @property
+    def _channel(self) -> grpc.aio.Channel:
+        if self._aio_channel is None:
+            self._aio_channel = create_aio_channel(self._channel_key)
+        return self._aio_channel
+
+    def _mediator_stub(self) -> EmliteMediatorServiceStub:
+        return EmliteMediatorServiceStub(self._channel)  # type: ignore[no-untyped-call]
+
+    def _info_stub(self) -> InfoServiceStub:
+        return InfoServiceStub(self._channel)
+
+    async def close(self) -> None:
+        if self._aio_channel is not None:
+            await self._aio_channel.close()
+            self._aio_channel = None
+
+    async def __aenter__(self) -> "AsyncEmliteMediatorGrpcClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _record_call_retries(self, method: str, call: Any) -> None:
+        # a stream left before its end has no trailing metadata yet
+        if call.done():
+            record_retries(method, await call.trailing_metadata())
+
+    async def _call(
+        self, method: str, multi_callable: Any, request: Any, **kwargs: Any
+    ) -> Any:
+        """Unary call - the deadline and retries come from the service config."""
+        call = multi_callable(request, **kwargs)
+        try:
+            response = await call
+        except grpc.RpcError as e:
+            self._record_retries(method, e)
+            raise
+        await self._record_call_retries(method, call)
+        return response
+
+    async def _hedged_call(
+        self, method: str, multi_callable: Any, request: Any, **kwargs: Any
+    ) -> Any:
+        """See EmliteMediatorGrpcClient._hedged_call."""
+        if INFO_HEDGING_DELAY_SECONDS <= 0:
+            return await self._call(method, multi_callable, request, **kwargs)
+
+        pending = {
+            asyncio.ensure_future(self._call(method, multi_callable, request, **kwargs))
+        }
+        done, pending = await asyncio.wait(pending, timeout=INFO_HEDGING_DELAY_SECONDS)
+        if not done:
+            CLIENT_HEDGES.inc(method=method)
+            pending.add(
+                asyncio.ensure_future(
+                    self._call(method, multi_callable, request, **kwargs)
+                )
+            )
+
+        error: BaseException | None = None
+        while True:
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    for other in pending:
+                        other.cancel()
+                    return task.result()
+            if not pending:
+                assert error is not None
+                raise error
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+    async def read_element(self, serial: str, object_id: ObjectIdEnum | int) -> Any:
+        stub = self._mediator_stub()
+        try:
+            self.log.debug(
+                f"send request - reading element [{self._object_id_name(object_id)}]",
+                meter_id=serial,
+            )
+            rsp_obj = await self._call(
+                "readElement",
+                stub.readElement,
+                ReadElementRequest(
+                    serial=serial, objectId=self._object_id_int(object_id)
+                ),
+                metadata=self._metadata(),
+            )
+        except grpc.RpcError as e:
+            raise self._rpc_error(e, "readElement", serial, object_id)
+
+        payload_bytes = rsp_obj.response
+        self.log.debug(
+            "read_element response received",
+            response_payload=payload_bytes.hex(),
+            meter_id=serial,
+        )
+        return self._decode_element(object_id, payload_bytes)
+
+    async def read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """See EmliteMediatorGrpcClient.read_elements."""
+        stub = self._mediator_stub()
+        obis_list = [self._object_id_int(object_id) for object_id in object_ids]
+        results: List[Any] = []
+        try:
+            self.log.debug(
+                f"send request - reading {len(obis_list)} elements", meter_id=serial
+            )
+            replies = stub.readElements(
+                ReadElementsRequest(serial=serial, objectIds=obis_list),
+                timeout=self._read_elements_timeout(len(obis_list)),
+                metadata=self._metadata(),
+            )
+            async for reply in replies:
+                if len(results) == len(object_ids):
+                    break
+                object_id = object_ids[len(results)]
+                results.append(self._element_result(serial, object_id, reply))
+            await self._record_call_retries("readElements", replies)
+        except grpc.RpcError as e:
+            self._record_retries("readElements", e)
+            raise self._rpc_error(e, "readElements", serial)
+
+        self._check_element_count(serial, results, object_ids)
+        return results
+
+    async def write_element(
+        self, serial: str, object_id: ObjectIdEnum | int, payload: bytes
+    ) -> None:
+        stub = self._mediator_stub()
+        try:
+            self.log.debug(
+                f"send request - write element [{self._object_id_name(object_id)}]",
+                meter_id=serial,
+            )
+            await stub.writeElement(
+                WriteElementRequest(
+                    serial=serial,
+                    objectId=self._object_id_int(object_id),
+                    payload=payload,
+                ),
+                metadata=self._metadata(),
+            )
+        except grpc.RpcError as e:
+            raise self._rpc_error(e, "writeElement", serial, object_id)
+
+    async def send_message(self, serial: str, message: bytes) -> bytes:
+        stub = self._mediator_stub()
+        try:
+            self.log.debug("send request - message", meter_id=serial)
+            rsp_obj = await stub.sendRawMessage(
+                SendRawMessageRequest(serial=serial, dataField=message),
+                metadata=self._metadata(),
+            )
+        except grpc.RpcError as e:
+            raise self._rpc_error(e, "sendRawMessage", serial, eof=False)
+
+        payload_bytes: bytes = rsp_obj.response
+        self.log.debug(
+            "send_message response received",
+            response_payload=payload_bytes.hex(),
+            meter_id=serial,
+        )
+        return payload_bytes
+
+    async def stream_profile_log(
+        self,
+        serial: str,
+        log: int,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        is_twin_element: bool = False,
+    ) -> AsyncIterator[StreamProfileLogReply]:
+        """See EmliteMediatorGrpcClient.stream_profile_log."""
+        stub = self._mediator_stub()
+        request, timeout = self._stream_profile_log_request(
+            serial, log, start, end, is_twin_element
+        )
+        try:
+            self.log.debug(
+                "send request - stream profile log", log=log, meter_id=serial
+            )
+            replies = stub.streamProfileLog(
+                request, timeout=timeout, metadata=self._metadata()
+            )
+            async for reply in replies:
+                yield reply
+            await self._record_call_retries("streamProfileLog", replies)
+        except grpc.RpcError as e:
+            self._record_retries("streamProfileLog", e)
+            raise self._rpc_error(e, "streamProfileLog", serial)
+
+    async def get_meter_status(self, serial: str) -> GetMeterStatusReply:
+        stub = self._mediator_stub()
+        try:
+            self.log.debug("send request - get_meter_status", meter_id=serial)
+            rsp_obj: GetMeterStatusReply = await self._call(
+                "getMeterStatus",
+                stub.getMeterStatus,
+                GetMeterStatusRequest(serial=serial),
+            )
+            return rsp_obj
+        except grpc.RpcError as e:
+            self.log.error(
+                "getMeterStatus failed",
+                details=e.details(),
+                code=e.code(),
+                meter_id=serial,
+            )
+            raise e
+
+    async def get_info(self, serial: str) -> str:
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_info", meter_id=serial)
+            rsp_obj = await self._hedged_call(
+                "GetInfo", stub.GetInfo, GetInfoRequest(serial=serial)
+            )
+            return str(rsp_obj.json_data)
+        except grpc.RpcError as e:
+            self.log.error(
+                "GetInfo failed",
+                details=e.details(),
+                code=e.code(),
+                meter_id=serial,
+            )
+            raise e
+
+    async def get_infos(self, serials: list[str]) -> dict[str, str]:
+        """get_info for many meters in one call - unknown serials are left out."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_infos", count=len(serials))
+            rsp_obj = await self._hedged_call(
+                "GetInfos", stub.GetInfos, GetInfosRequest(serials=serials)
+            )
+            return dict(rsp_obj.json_data)
+        except grpc.RpcError as e:
+            self.log.error("GetInfos failed", details=e.details(), code=e.code())
+            raise e
+
+    async def get_meters(self, esco: str | None = None) -> str:
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_meters", esco=esco)
+            rsp_obj = await self._hedged_call(
+                "GetMeters", stub.GetMeters, GetMetersRequest(esco=esco)
+            )
+            return str(rsp_obj.json_meters)
+        except grpc.RpcError as e:
+            self.log.error("GetMeters failed", details=e.details(), code=e.code())
+            raise e
+
+    async def get_meter_info(
+        self, serial: str, fields: list[str] | None = None
+    ) -> MeterInfo:
+        """Typed get_info, with only the MeterInfo fields listed if given."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_meter_info", meter_id=serial)
+            rsp_obj: MeterInfo = await self._hedged_call(
+                "GetMeterInfo",
+                stub.GetMeterInfo,
+                GetMeterInfoRequest(serial=serial, fields=FieldMask(paths=fields)),
+            )
+            return rsp_obj
+        except grpc.RpcError as e:
+            self.log.error(
+                "GetMeterInfo failed",
+                details=e.details(),
+                code=e.code(),
+                meter_id=serial,
+            )
+            raise e
+
+    async def list_meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Meter]:
+        """See EmliteMediatorGrpcClient.list_meters."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - list_meters", esco=esco, name=name)
+            rsp_obj = await self._hedged_call(
+                "ListMeters",
+                stub.ListMeters,
+                self._list_meters_request(esco, name, serial, fields),
+            )
+            return list(rsp_obj.meters)
+        except grpc.RpcError as e:
+            self.log.error("ListMeters failed", details=e.details(), code=e.code())
+            raise e
+
+    async def stream_meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[Meter]:
+        """list_meters received in pages, for large ESCOs."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - stream_meters", esco=esco, name=name)
+            replies = stub.StreamMeters(
+                self._list_meters_request(esco, name, serial, fields)
+            )
+            async for rsp_obj in replies:
+                for meter in rsp_obj.meters:
+                    yield meter
+            await self._record_call_retries("StreamMeters", replies)
+        except grpc.RpcError as e:
+            self._record_retries("StreamMeters", e)
+            self.log.error("StreamMeters failed", details=e.details(), code=e.code())
+            raise e
@@ -0,0 +1,319 @@
+import datetime
+from typing import Awaitable
+
+import grpc
+from emop_frame_protocol.util import emop_encode_u3be  # type: ignore[import-untyped]
+from tenacity import RetryError
+
+from simt_emlite.util.logging import get_logger
+
+from .generated.mediator_pb2 import (
+    GetMeterStatusReply,
+    ReadElementReply,
+    ReadElementsReply,
+    SendRawMessageReply,
+    WriteElementReply,
+)
+from .generated.mediator_pb2_grpc import EmliteMediatorServiceServicer
+from .mediator_service import (
+    UNSERVED_ERRORS,
+    cached_responses,
+    request_deadline,
+    request_priority,
+)
+from .meter_queue import DeadlineExceeded, MeterQueueRejected, Priority
+from .meter_registry import LOCK_TIMEOUT_SECONDS, AsyncMeterContext, AsyncMeterRegistry
+from .profile_log_stream import async_walk_profile_log
+from .response_cache import is_read_data_field
+
+logger = get_logger(__name__, __file__)
+
+"""
+    EmliteMediatorService for the grpc.aio server.
+
+    Same behaviour and status codes as EmliteMediatorServicer but every wait
+    (queue turn, request spacing, meter I/O) suspends a coroutine rather than
+    holding a worker thread. Requests are serialised per meter by its
+    AsyncMeterQueue, so the number of meters served at once is not capped by
+    a thread pool.
+
+    grpc.aio cancels the handler when the client cancels or its deadline
+    passes, so unlike the threaded servicer there are no is_active() checks.
+"""
+
+
+class AsyncEmliteMediatorServicer(EmliteMediatorServiceServicer):
+    def __init__(self, registry: AsyncMeterRegistry):
+        self.registry = registry
+
+    async def _get_meter(self, context, request) -> AsyncMeterContext:
+        """Resolve meter from the request serial, aborting if unknown."""
+        serial: str = getattr(request, "serial", "")
+        if not serial:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Target meter serial not specified"
+            )
+
+        meter = self.registry.get_meter(serial)
+        if not meter:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND, f"Meter '{serial}' not known"
+            )
+        assert meter is not None
+        return meter
+
+    async def _check_breaker(self, context, meter: AsyncMeterContext) -> None:
+        """Fail fast with FAILED_PRECONDITION if the meter's breaker is open."""
+        if not meter.breaker.allow_request():
+            remaining = meter.breaker.open_seconds_remaining()
+            logger.debug(f"circuit open for {meter.serial} - rejecting request")
+            await context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                f"circuit open for meter {meter.serial}, retry in {remaining:.0f}s",
+            )
+
+    async def _abort_unserved(self, context, meter: AsyncMeterContext, e: Exception):
+        """See EmliteMediatorServicer._abort_unserved."""
+        if isinstance(e, DeadlineExceeded):
+            logger.warning(f"Deadline exceeded for meter {meter.serial}: {e}")
+            await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+        if isinstance(e, MeterQueueRejected):
+            logger.warning(f"Rejected request for meter {meter.serial}: {e}")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        logger.warning(f"Timeout waiting for turn on meter {meter.serial}")
+        await context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            f"Meter {meter.serial} is busy (timeout)",
+        )
+
+    async def _abort_failed(
+        self, context, meter: AsyncMeterContext, method: str, e: Exception
+    ):
+        if isinstance(e, RetryError):
+            logger.error(f"{method} failed for {meter.serial}: max attempts reached")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "failed to connect after retries"
+            )
+        logger.error(f"{method} failed for {meter.serial}: {e}")
+        await context.abort(grpc.StatusCode.INTERNAL, "Meter communication failed")
+
+    async def _read_element(
+        self, meter: AsyncMeterContext, object_id: int, priority, deadline
+    ) -> bytes:
+        """Read one element from the meter. Shared by coalesced callers."""
+        async with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+            await meter.space_out_requests(deadline)
+            logger.debug(f"readElement {object_id} for {meter.serial}")
+            try:
+                with meter.spaced_request():
+                    rsp_payload = await meter.api.read_element(
+                        emop_encode_u3be(object_id), deadline
+                    )
+            except Exception:
+                meter.breaker.record_failure()
+                raise
+            meter.breaker.record_success()
+            meter.cache.put(object_id, rsp_payload)
+            return rsp_payload
+
+    async def readElement(self, request, context):
+        meter = await self._get_meter(context, request)
+
+        cached = cached_responses(context, meter, [request.objectId])[0]
+        if cached is not None:
+            logger.debug(f"readElement {request.objectId} for {meter.serial} cached")
+            return ReadElementReply(response=cached)
+
+        await self._check_breaker(context, meter)
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
+
+        # identical reads already in flight share the one meter request
+        try:
+            rsp_payload = await meter.flights.do(
+                ("readElement", request.objectId),
+                lambda: self._read_element(meter, request.objectId, priority, deadline),
+            )
+        except UNSERVED_ERRORS as e:
+            await self._abort_unserved(context, meter, e)
+        except Exception as e:
+            await self._abort_failed(context, meter, "readElement", e)
+        return ReadElementReply(response=rsp_payload)
+
+    async def readElements(self, request, context):
+        """See EmliteMediatorServicer.readElements."""
+        meter = await self._get_meter(context, request)
+
+        cached = cached_responses(context, meter, request.objectIds)
+        if all(rsp is not None for rsp in cached):
+            for object_id, rsp in zip(request.objectIds, cached):
+                yield ReadElementsReply(objectId=object_id, response=rsp)
+            return
+
+        await self._check_breaker(context, meter)
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
+
+        failure: Exception | None = None
+        try:
+            async with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                logger.debug(
+                    f"readElements {len(request.objectIds)} elements for {meter.serial}"
+                )
+                for object_id, cached_rsp in zip(request.objectIds, cached):
+                    if cached_rsp is not None:
+                        yield ReadElementsReply(objectId=object_id, response=cached_rsp)
+                        continue
+                    await meter.space_out_requests(deadline)
+                    try:
+                        with meter.spaced_request():
+                            rsp_payload = await meter.api.read_element(
+                                emop_encode_u3be(object_id), deadline
+                            )
+                    except RetryError as e:
+                        meter.breaker.record_failure()
+                        failure = e
+                        break
+                    except Exception as e:
+                        meter.breaker.record_failure()
+                        logger.error(
+                            f"readElements {object_id} failed for {meter.serial}: {e}"
+                        )
+                        yield ReadElementsReply(
+                            objectId=object_id, error=f"{type(e).__name__}: {e}"
+                        )
+                        continue
+                    meter.breaker.record_success()
+                    meter.cache.put(object_id, rsp_payload)
+                    yield ReadElementsReply(objectId=object_id, response=rsp_payload)
+        except UNSERVED_ERRORS as e:
+            await self._abort_unserved(context, meter, e)
+
+        if failure is not None:
+            await self._abort_failed(context, meter, "readElements", failure)
+
+    async def streamProfileLog(self, request, context):
+        """See EmliteMediatorServicer.streamProfileLog."""
+        meter = await self._get_meter(context, request)
+        await self._check_breaker(context, meter)
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.BULK)
+
+        start = datetime.datetime.fromtimestamp(
+            request.startTime, datetime.timezone.utc
+        )
+        end = datetime.datetime.fromtimestamp(request.endTime, datetime.timezone.utc)
+
+        async def send_message(data_field: bytes) -> bytes:
+            await meter.space_out_requests(deadline)
+            with meter.spaced_request():
+                return await meter.api.send_message(data_field, deadline)
+
+        failure: Exception | None = None
+        try:
+            async with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                logger.debug(
+                    f"streamProfileLog {request.log} {start} to {end} for {meter.serial}"
+                )
+                try:
+                    async for reply in async_walk_profile_log(
+                        send_message, request.log, start, end, request.isTwinElement
+                    ):
+                        meter.breaker.record_success()
+                        yield reply
+                except Exception as e:
+                    failure = e
+        except UNSERVED_ERRORS as e:
+            await self._abort_unserved(context, meter, e)
+
+        if isinstance(failure, DeadlineExceeded):
+            await self._abort_unserved(context, meter, failure)
+        if isinstance(failure, ValueError):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(failure))
+        if failure is not None:
+            meter.breaker.record_failure()
+            await self._abort_failed(context, meter, "streamProfileLog", failure)
+
+    async def writeElement(self, request, context):
+        meter = await self._get_meter(context, request)
+        await self._check_breaker(context, meter)
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.WRITE)
+
+        failure: Exception | None = None
+        try:
+            async with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                # see EmliteMediatorServicer.writeElement
+                meter.cache.invalidate()
+                await meter.space_out_requests(deadline)
+                logger.debug(f"writeElement {request.objectId} for {meter.serial}")
+                try:
+                    with meter.spaced_request():
+                        await meter.api.write_element(
+                            emop_encode_u3be(request.objectId),
+                            request.payload,
+                            deadline,
+                        )
+                    meter.breaker.record_success()
+                    return WriteElementReply()
+                except Exception as e:
+                    meter.breaker.record_failure()
+                    failure = e
+        except UNSERVED_ERRORS as e:
+            await self._abort_unserved(context, meter, e)
+
+        assert failure is not None
+        await self._abort_failed(context, meter, "writeElement", failure)
+
+    async def _send_raw_message(
+        self, meter: AsyncMeterContext, data_field: bytes, priority, deadline
+    ) -> bytes:
+        async with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+            if not is_read_data_field(data_field):
+                meter.cache.invalidate()
+            await meter.space_out_requests(deadline)
+            logger.debug(f"sendRawMessage for {meter.serial}")
+            try:
+                with meter.spaced_request():
+                    rsp_payload = await meter.api.send_message(data_field, deadline)
+            except Exception:
+                meter.breaker.record_failure()
+                raise
+            meter.breaker.record_success()
+            return rsp_payload
+
+    async def sendRawMessage(self, request, context):
+        meter = await self._get_meter(context, request)
+        await self._check_breaker(context, meter)
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
+
+        def send() -> Awaitable[bytes]:
+            return self._send_raw_message(meter, request.dataField, priority, deadline)
+
+        try:
+            if is_read_data_field(request.dataField):
+                # no side effects - identical requests in flight can share
+                rsp_payload = await meter.flights.do(
+                    ("sendRawMessage", bytes(request.dataField)), send
+                )
+            else:
+                rsp_payload = await send()
+        except UNSERVED_ERRORS as e:
+            await self._abort_unserved(context, meter, e)
+        except Exception as e:
+            await self._abort_failed(context, meter, "sendRawMessage", e)
+        return SendRawMessageReply(response=rsp_payload)
+
+    async def getMeterStatus(self, request, context):
+        meter = await self._get_meter(context, request)
+        # not meter.cache - a status call shouldn't allocate the cache
+        cache = meter._cache
+        return GetMeterStatusReply(
+            serial=meter.serial,
+            breakerState=meter.breaker.state.value,
+            consecutiveFailures=meter.breaker.consecutive_failures,
+            openSecondsRemaining=meter.breaker.open_seconds_remaining(),
+            cacheHits=cache.hits if cache is not None else 0,
+            cacheMisses=cache.misses if cache is not None else 0,
+        )
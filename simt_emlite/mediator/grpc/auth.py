@@ -1,23 +1,49 @@
 """Authentication and authorization utilities for gRPC server.
 
 This module provides:
-- Client identity extraction from mTLS peer certificates
+- Client identity extraction from mTLS peer certificates, cached per
+  peer certificate along with the methods the client may call
 - Role-based and client-specific authorization
-- gRPC interceptor for enforcing authorization on all methods
+- Role-based and client-specific rate limits and concurrency quotas
+- gRPC interceptors (threaded and grpc.aio servers) for enforcing
+  authorization and quotas on all methods
 """
 
+import logging
+import os
+import threading
+from collections import OrderedDict
+
 import grpc
-from typing import Callable, Any, Mapping
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Mapping, NamedTuple
 from dataclasses import dataclass
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter
+
+from .client_quota import ClientLimits, ClientQuota
 
 logger = get_logger(__name__, __file__)
+# structlog renders events before the stdlib level check drops them - check
+# first on the per call path
+_log_level = logging.getLogger(__name__)
+
+# peer certificates to keep the resolved identity and permissions for
+IDENTITY_CACHE_SIZE = int(os.environ.get("AUTH_IDENTITY_CACHE_SIZE", "1024"))
+
+# trailing metadata on RESOURCE_EXHAUSTED - seconds to wait before retrying
+RETRY_AFTER_METADATA_KEY = "retry-after"
+
+QUOTA_REJECTIONS = Counter(
+    "mediator_client_quota_rejections_total",
+    "Calls rejected for exceeding the client's rate limit or in flight quota",
+    ["client_id"],
+)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ClientIdentity:
     """Represents the authenticated client from certificate."""
 
@@ -25,6 +51,62 @@ class ClientIdentity:
     role: str | None  # OU from certificate (e.g., "partner", "internal")
 
 
+@dataclass(frozen=True)
+class _PeerAuthorization:
+    """Identity from a peer certificate, the methods it may call and its quota."""
+
+    identity: ClientIdentity
+    allowed_methods: frozenset[str]
+    quota: ClientQuota
+
+
+class _PeerAuthorizationCache:
+    """
+    Bounded LRU of peer certificate (PEM) -> _PeerAuthorization.
+
+    Parsing the certificate for the OU costs far more than the call it
+    guards for cheap RPCs, and a mediator only sees a handful of client
+    certificates, so each is parsed once. Keyed by the certificate itself so
+    a reissued certificate (eg. with a new OU) is resolved afresh.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, _PeerAuthorization] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pem_cert: Any) -> _PeerAuthorization | None:
+        with self._lock:
+            entry = self._entries.get(pem_cert)
+            if entry is not None:
+                self._entries.move_to_end(pem_cert)
+            return entry
+
+    def put(self, pem_cert: Any, entry: _PeerAuthorization) -> None:
+        with self._lock:
+            self._entries[pem_cert] = entry
+            self._entries.move_to_end(pem_cert)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_peer_cache = _PeerAuthorizationCache(IDENTITY_CACHE_SIZE)
+
+
+def clear_identity_cache() -> None:
+    """
+    Forget resolved peers and quotas, eg. after changing the permission or
+    limit tables.
+    """
+    _peer_cache.clear()
+    with _quotas_lock:
+        _quotas.clear()
+
+
 def extract_client_identity(context: grpc.ServicerContext) -> ClientIdentity | None:
     """
     Extract client identity (CN and OU) from peer certificate.
@@ -34,10 +116,36 @@ def extract_client_identity(context: grpc.ServicerContext) -> ClientIdentity | N
     Returns:
         ClientIdentity with client_id and optional role, or None if no cert auth.
     """
+    peer = _peer_authorization(context)
+    return peer.identity if peer is not None else None
+
+
+def _peer_authorization(context: grpc.ServicerContext) -> _PeerAuthorization | None:
+    """Identity and allowed methods of the peer, cached per certificate."""
     auth_context = context.auth_context()
     if not auth_context:
         return None
 
+    pem_certs = auth_context.get("x509_pem_cert")
+    pem_cert = pem_certs[0] if pem_certs else None
+    if pem_cert is not None:
+        peer = _peer_cache.get(pem_cert)
+        if peer is not None:
+            return peer
+
+    identity = _parse_client_identity(auth_context)
+    if identity is None:
+        return None
+    peer = _PeerAuthorization(
+        identity, allowed_methods(identity), client_quota(identity)
+    )
+    if pem_cert is not None:
+        _peer_cache.put(pem_cert, peer)
+    return peer
+
+
+def _parse_client_identity(auth_context: Mapping[str, Any]) -> ClientIdentity | None:
+    """ClientIdentity from the auth_context, parsing the certificate for OU."""
     # Extract Common Name (client identifier)
     cn_values = auth_context.get("x509_common_name")
     if not cn_values:
@@ -99,21 +207,39 @@ ROLE_PERMISSIONS: dict[str, set[str]] = {
     "internal": {
         # Internal clients can do everything
         "/EmliteMediatorService/readElement",
+        "/EmliteMediatorService/readElements",
         "/EmliteMediatorService/writeElement",
         "/EmliteMediatorService/sendRawMessage",
+        "/EmliteMediatorService/streamProfileLog",
+        "/EmliteMediatorService/getMeterStatus",
         "/InfoService/GetInfo",
+        "/InfoService/GetInfos",
         "/InfoService/GetMeters",
+        "/InfoService/GetMeterInfo",
+        "/InfoService/ListMeters",
+        "/InfoService/StreamMeters",
     },
     "partner": {
         # Partners can read from meters and get info
         "/EmliteMediatorService/readElement",
+        "/EmliteMediatorService/readElements",
+        "/EmliteMediatorService/getMeterStatus",
         "/InfoService/GetInfo",
+        "/InfoService/GetInfos",
         "/InfoService/GetMeters",
+        "/InfoService/GetMeterInfo",
+        "/InfoService/ListMeters",
+        "/InfoService/StreamMeters",
     },
     "readonly": {
         # Read-only access for monitoring
+        "/EmliteMediatorService/getMeterStatus",
         "/InfoService/GetInfo",
+        "/InfoService/GetInfos",
         "/InfoService/GetMeters",
+        "/InfoService/GetMeterInfo",
+        "/InfoService/ListMeters",
+        "/InfoService/StreamMeters",
     },
 }
 
@@ -130,38 +256,88 @@ CLIENT_PERMISSIONS: dict[str, set[str]] = {
 }
 
 
-def check_permission(identity: ClientIdentity, method: str) -> bool:
+def allowed_methods(identity: ClientIdentity) -> frozenset[str]:
     """
-    Check if client has permission to call the method.
+    Methods the client may call.
 
     Priority:
-    1. Check client-specific permissions first (overrides role)
-    2. Fall back to role-based permissions
-    3. Deny if the client has no recognised role
-
-    Args:
-        identity: The authenticated client identity
-        method: The full gRPC method path (e.g., "/EmliteMediatorService/readElement")
-
-    Returns:
-        True if authorized, False otherwise
+    1. Client-specific permissions (overrides role)
+    2. Role-based permissions
+    3. Nothing if the client has no recognised role
     """
     # Client-specific override takes priority
     if identity.client_id in CLIENT_PERMISSIONS:
-        return method in CLIENT_PERMISSIONS[identity.client_id]
+        return frozenset(CLIENT_PERMISSIONS[identity.client_id])
 
     # Role-based permission
     if identity.role and identity.role in ROLE_PERMISSIONS:
-        return method in ROLE_PERMISSIONS[identity.role]
+        return frozenset(ROLE_PERMISSIONS[identity.role])
 
     # No recognised role — deny by default
     logger.warning(
         "access denied: client has no recognised role",
         client_id=identity.client_id,
         role=identity.role,
-        method=method,
     )
-    return False
+    return frozenset()
+
+
+# ============================================================================
+# RATE LIMITS AND QUOTAS
+# ============================================================================
+
+# Limits on calls per client for each role (see client_quota.py). Roles
+# not listed are unlimited. The threaded server has MAX_WORKERS (default
+# 30) workers - keep the in flight quotas well below that so there are
+# always workers free for internal jobs.
+ROLE_LIMITS: dict[str, ClientLimits] = {
+    "partner": ClientLimits(requests_per_second=10, burst=20, max_in_flight=8),
+    "readonly": ClientLimits(requests_per_second=5, burst=10, max_in_flight=2),
+}
+
+# Override limits for specific clients (optional)
+CLIENT_LIMITS: dict[str, ClientLimits] = {
+    # Example entries - customize as needed:
+    # "company-xyz-api": ClientLimits(
+    #     requests_per_second=50, burst=100, max_in_flight=16
+    # ),
+}
+
+# client identity -> quota shared by all its calls
+_quotas: dict[ClientIdentity, ClientQuota] = {}
+_quotas_lock = threading.Lock()
+
+
+def client_limits(identity: ClientIdentity) -> ClientLimits:
+    """Limits for the client - client-specific, then role, else unlimited."""
+    if identity.client_id in CLIENT_LIMITS:
+        return CLIENT_LIMITS[identity.client_id]
+    if identity.role and identity.role in ROLE_LIMITS:
+        return ROLE_LIMITS[identity.role]
+    return ClientLimits()
+
+
+def client_quota(identity: ClientIdentity) -> ClientQuota:
+    with _quotas_lock:
+        quota = _quotas.get(identity)
+        if quota is None:
+            quota = ClientQuota(identity.client_id, client_limits(identity))
+            _quotas[identity] = quota
+        return quota
+
+
+def check_permission(identity: ClientIdentity, method: str) -> bool:
+    """
+    Check if client has permission to call the method.
+
+    Args:
+        identity: The authenticated client identity
+        method: The full gRPC method path (e.g., "/EmliteMediatorService/readElement")
+
+    Returns:
+        True if authorized, False otherwise
+    """
+    return method in allowed_methods(identity)
 
 
 # ============================================================================
@@ -202,7 +378,13 @@ class AuthorizationInterceptor(grpc.ServerInterceptor):
                 request_deserializer=handler.request_deserializer,
                 response_serializer=handler.response_serializer,
             )
-        # Streaming RPCs are not supported; deny them unconditionally.
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._authorize_unary_stream(handler.unary_stream, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        # Client streaming RPCs are not supported; deny them unconditionally.
         logger.warning("streaming rpc not supported, method will be blocked", method=method)
         return grpc.unary_unary_rpc_method_handler(
             self._deny_unsupported(method),
@@ -216,7 +398,7 @@ class AuthorizationInterceptor(grpc.ServerInterceptor):
         def _handler(request: Any, context: grpc.ServicerContext) -> Any:
             context.abort(
                 grpc.StatusCode.UNIMPLEMENTED,
-                "Streaming RPCs are not supported on this server.",
+                "Client streaming RPCs are not supported on this server.",
             )
             return None
 
@@ -228,41 +410,224 @@ class AuthorizationInterceptor(grpc.ServerInterceptor):
         """Create an authorized version of the unary handler."""
 
         def authorized_handler(request: Any, context: grpc.ServicerContext) -> Any:
-            # Extract client identity from certificate
-            identity = extract_client_identity(context)
-
-            if identity is None:
-                # No certificate presented — deny the request.
-                logger.warning("unauthenticated request rejected", method=method)
-                context.abort(
-                    grpc.StatusCode.UNAUTHENTICATED,
-                    "Client certificate required.",
-                )
+            quota = self._admit(context, method)
+            if quota is None:
                 return None
 
-            # Check authorization
-            if not check_permission(identity, method):
-                logger.warning(
-                    "permission denied",
-                    client_id=identity.client_id,
-                    role=identity.role,
-                    method=method,
-                )
-                context.abort(
-                    grpc.StatusCode.PERMISSION_DENIED,
-                    "Permission denied.",
-                )
-                return None
+            # Call the original handler
+            try:
+                return original_handler(request, context)
+            finally:
+                quota.release()
+
+        return authorized_handler
+
+    def _authorize_unary_stream(
+        self, original_handler: Callable, method: str
+    ) -> Callable[[Any, grpc.ServicerContext], Iterator[Any]]:
+        """Create an authorized version of the server streaming handler."""
+
+        def authorized_handler(
+            request: Any, context: grpc.ServicerContext
+        ) -> Iterator[Any]:
+            quota = self._admit(context, method)
+            if quota is None:
+                return
+
+            # Stream from the original handler
+            try:
+                yield from original_handler(request, context)
+            finally:
+                quota.release()
+
+        return authorized_handler
+
+    def _admit(
+        self, context: grpc.ServicerContext, method: str
+    ) -> ClientQuota | None:
+        """
+        Check the caller may call method now and take a slot from its quota,
+        aborting the call if not.
+
+        The threaded server only passes the peer's certificate to handlers,
+        so this runs on the worker thread - but first, and holds the worker
+        for microseconds when it rejects.
+        """
+        quota, rejection = admit(context, method)
+        if rejection is not None:
+            context.set_trailing_metadata(rejection.trailing_metadata())
+            context.abort(rejection.code, rejection.details)
+            return None
+        return quota
+
+
+class AsyncAuthorizationInterceptor(grpc.aio.ServerInterceptor):
+    """
+    AuthorizationInterceptor for the grpc.aio server.
+
+    Same checks and status codes, wrapping coroutine and async generator
+    handlers.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler | None:
+        """Intercept and authorize incoming requests."""
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+
+        if handler is None:
+            return handler
+
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._authorize_unary(handler.unary_unary, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._authorize_unary_stream(handler.unary_stream, method),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        # Client streaming RPCs are not supported; deny them unconditionally.
+        logger.warning("streaming rpc not supported, method will be blocked", method=method)
+        return grpc.unary_unary_rpc_method_handler(self._deny_unsupported())
 
-            # Log successful auth at debug level
-            logger.debug(
-                "authorized",
-                client_id=identity.client_id,
-                role=identity.role,
-                method=method,
+    def _deny_unsupported(self) -> Callable[[Any, Any], Awaitable[Any]]:
+        async def _handler(request: Any, context: Any) -> Any:
+            await context.abort(
+                grpc.StatusCode.UNIMPLEMENTED,
+                "Client streaming RPCs are not supported on this server.",
             )
 
-            # Call the original handler
-            return original_handler(request, context)
+        return _handler
+
+    def _authorize_unary(
+        self, original_handler: Callable, method: str
+    ) -> Callable[[Any, Any], Awaitable[Any]]:
+        async def authorized_handler(request: Any, context: Any) -> Any:
+            quota = await self._admit(context, method)
+            try:
+                return await original_handler(request, context)
+            finally:
+                quota.release()
 
         return authorized_handler
+
+    def _authorize_unary_stream(
+        self, original_handler: Callable, method: str
+    ) -> Callable[[Any, Any], AsyncIterator[Any]]:
+        async def authorized_handler(request: Any, context: Any) -> AsyncIterator[Any]:
+            quota = await self._admit(context, method)
+            try:
+                async for response in original_handler(request, context):
+                    yield response
+            finally:
+                quota.release()
+
+        return authorized_handler
+
+    async def _admit(self, context: Any, method: str) -> ClientQuota:
+        quota, rejection = admit(context, method)
+        if rejection is not None:
+            # raises - ends the call
+            await context.abort(
+                rejection.code,
+                rejection.details,
+                trailing_metadata=rejection.trailing_metadata(),
+            )
+        assert quota is not None
+        return quota
+
+
+class Rejection(NamedTuple):
+    """Status to abort a call with."""
+
+    code: grpc.StatusCode
+    details: str
+    retry_after_seconds: float | None = None
+
+    def trailing_metadata(self) -> tuple[tuple[str, str], ...]:
+        if self.retry_after_seconds is None:
+            return ()
+        return ((RETRY_AFTER_METADATA_KEY, f"{self.retry_after_seconds:.3f}"),)
+
+
+def admit(
+    context: grpc.ServicerContext, method: str
+) -> tuple[ClientQuota | None, Rejection | None]:
+    """
+    Authorize the call and take a slot from the caller's quota.
+
+    Returns:
+        (quota, None) if the call may go ahead - call quota.release() when
+        it ends - otherwise (None, rejection)
+    """
+    peer, failure = _authorize(context, method)
+    if failure is not None:
+        return None, Rejection(*failure)
+    assert peer is not None
+
+    retry_after = peer.quota.acquire()
+    if retry_after is not None:
+        logger.warning(
+            "client over quota",
+            client_id=peer.identity.client_id,
+            method=method,
+            in_flight=peer.quota.in_flight,
+            retry_after=round(retry_after, 3),
+        )
+        QUOTA_REJECTIONS.inc(client_id=peer.identity.client_id)
+        return None, Rejection(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            f"Client quota exceeded, retry after {retry_after:.1f}s.",
+            retry_after,
+        )
+    return peer.quota, None
+
+
+def authorization_failure(
+    context: grpc.ServicerContext, method: str
+) -> tuple[grpc.StatusCode, str] | None:
+    """
+    Status code and details to abort with if the caller may not call
+    method, None if authorized.
+    """
+    return _authorize(context, method)[1]
+
+
+def _authorize(
+    context: grpc.ServicerContext, method: str
+) -> tuple[_PeerAuthorization | None, tuple[grpc.StatusCode, str] | None]:
+    # Client identity and permissions from (usually cached) certificate
+    peer = _peer_authorization(context)
+
+    if peer is None:
+        # No certificate presented — deny the request.
+        logger.warning("unauthenticated request rejected", method=method)
+        return None, (grpc.StatusCode.UNAUTHENTICATED, "Client certificate required.")
+
+    # Check authorization
+    identity = peer.identity
+    if method not in peer.allowed_methods:
+        logger.warning(
+            "permission denied",
+            client_id=identity.client_id,
+            role=identity.role,
+            method=method,
+        )
+        return peer, (grpc.StatusCode.PERMISSION_DENIED, "Permission denied.")
+
+    # Log successful auth at debug level
+    if _log_level.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "authorized",
+            client_id=identity.client_id,
+            role=identity.role,
+            method=method,
+        )
+    return peer, None
@@ -0,0 +1,144 @@
+import atexit
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+import grpc
+
+from simt_emlite.util.logging import get_logger
+
+from .service_config import service_config_json
+from .util import decode_b64_secret_to_bytes
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Process wide pool of mediator channels and stubs.
+
+    Jobs create a client (EmliteMediatorAPI, EmlitePrepayAPI, ...) per meter.
+    With a channel per client every meter paid for a new connection and TLS
+    handshake, and the channel was only closed when the garbage collector
+    got round to the client. Clients now share one channel per mediator
+    address and credentials, created on first use and kept open (with
+    keepalive pings so a dropped connection is noticed while idle) until
+    close_channels() is called or the process exits.
+
+    Stubs hold nothing but the channel so they are shared too.
+"""
+
+# seconds between keepalive pings - the mediator server permits pings this
+# often (see server.py)
+KEEPALIVE_SECONDS = int(os.environ.get("MEDIATOR_KEEPALIVE_SECONDS", "60"))
+
+# name in the mediator server certificates
+SSL_TARGET_NAME = "cepro-mediators"
+
+# (mediator address, (client cert, client key, ca cert) base64 or None for an
+# insecure channel)
+ChannelKey = Tuple[str, Optional[Tuple[str, str, str]]]
+
+S = TypeVar("S")
+
+
+def _channel_options() -> list[tuple[str, Any]]:
+    return [
+        ("grpc.keepalive_time_ms", KEEPALIVE_SECONDS * 1000),
+        ("grpc.keepalive_timeout_ms", 20000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        # per method deadlines and retries - see service_config.py
+        ("grpc.enable_retries", 1),
+        ("grpc.service_config", service_config_json()),
+    ]
+
+
+def _channel_credentials(certs: Tuple[str, str, str]) -> grpc.ChannelCredentials:
+    client_cert_b64, client_key_b64, ca_cert_b64 = certs
+    return grpc.ssl_channel_credentials(
+        root_certificates=decode_b64_secret_to_bytes(ca_cert_b64),
+        private_key=decode_b64_secret_to_bytes(client_key_b64),
+        certificate_chain=decode_b64_secret_to_bytes(client_cert_b64),
+    )
+
+
+def _create_channel(key: ChannelKey) -> grpc.Channel:
+    address, certs = key
+    if certs is None:
+        return grpc.insecure_channel(address, options=_channel_options())
+    return grpc.secure_channel(
+        address,
+        _channel_credentials(certs),
+        options=_channel_options()
+        + [("grpc.ssl_target_name_override", SSL_TARGET_NAME)],
+    )
+
+
+def create_aio_channel(key: ChannelKey) -> grpc.aio.Channel:
+    """
+    grpc.aio channel with the same options as a pooled channel. Not pooled
+    as an aio channel belongs to the event loop it was created on - the
+    caller owns and closes it.
+    """
+    address, certs = key
+    if certs is None:
+        return grpc.aio.insecure_channel(address, options=_channel_options())
+    return grpc.aio.secure_channel(
+        address,
+        _channel_credentials(certs),
+        options=_channel_options()
+        + [("grpc.ssl_target_name_override", SSL_TARGET_NAME)],
+    )
+
+
+class ChannelPool:
+    def __init__(self) -> None:
+        self._channels: Dict[ChannelKey, grpc.Channel] = {}
+        self._stubs: Dict[Tuple[ChannelKey, type], Any] = {}
+        self._lock = threading.Lock()
+
+    def channel(self, key: ChannelKey) -> grpc.Channel:
+        channel = self._channels.get(key)
+        if channel is None:
+            with self._lock:
+                channel = self._channels.get(key)
+                if channel is None:
+                    logger.debug("opening channel", mediator_address=key[0])
+                    channel = _create_channel(key)
+                    self._channels[key] = channel
+        return channel
+
+    def stub(self, key: ChannelKey, stub_type: Type[S]) -> S:
+        """Stub of stub_type on the pooled channel for key."""
+        stub = self._stubs.get((key, stub_type))
+        if stub is None:
+            stub = stub_type(self.channel(key))  # type: ignore[call-arg]
+            self._stubs[(key, stub_type)] = stub
+        return stub
+
+    def close(self) -> None:
+        """Close every channel. Later calls open new ones."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels = {}
+            self._stubs = {}
+        for channel in channels:
+            channel.close()
+
+
+_pool = ChannelPool()
+
+
+def pooled_channel(key: ChannelKey) -> grpc.Channel:
+    return _pool.channel(key)
+
+
+def pooled_stub(key: ChannelKey, stub_type: Type[S]) -> S:
+    return _pool.stub(key, stub_type)
+
+
+def close_channels() -> None:
+    """Close all pooled channels, eg. at the end of a job."""
+    _pool.close()
+
+
+atexit.register(close_channels)
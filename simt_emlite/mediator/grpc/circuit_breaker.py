@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from enum import Enum
+
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Per meter circuit breaker.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive failed requests the breaker
+    opens and requests for that meter are rejected immediately instead of
+    going through the full retry cycle and queueing on the meter lock.
+
+    Once BREAKER_OPEN_SECONDS have passed a single probe request is let
+    through (half open). Success closes the breaker, failure opens it again
+    for another BREAKER_OPEN_SECONDS. A probe that never reports back (eg.
+    it timed out waiting for the meter lock) is replaced by another after
+    the same period.
+"""
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_OPEN_SECONDS = float(os.environ.get("BREAKER_OPEN_SECONDS", "300"))
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    # one per registered meter
+    __slots__ = (
+        "serial",
+        "failure_threshold",
+        "open_seconds",
+        "consecutive_failures",
+        "_state",
+        "_opened_at",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        serial: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+    ) -> None:
+        self.serial = serial
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.consecutive_failures = 0
+        self._state = BreakerState.CLOSED
+        self._opened_at: float = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    def open_seconds_remaining(self) -> float:
+        """Seconds until a probe is allowed, 0 if closed."""
+        if self._state == BreakerState.CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def probe_due(self) -> bool:
+        return self._state != BreakerState.CLOSED and self.open_seconds_remaining() == 0
+
+    def allow_request(self) -> bool:
+        """
+        Can a request go to the meter now? When the open period has passed
+        the first caller is let through as the half open probe; everyone else
+        is rejected until that probe has recorded its outcome.
+        """
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                return True
+            if self.open_seconds_remaining() == 0:
+                self._state = BreakerState.HALF_OPEN
+                self._opened_at = time.monotonic()
+                logger.info("circuit half open - probing", serial=self.serial)
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != BreakerState.CLOSED:
+                logger.info("circuit closed", serial=self.serial)
+            self._state = BreakerState.CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if (
+                self._state == BreakerState.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self._state != BreakerState.OPEN:
+                    logger.warning(
+                        "circuit opened",
+                        serial=self.serial,
+                        consecutive_failures=self.consecutive_failures,
+                    )
+                self._state = BreakerState.OPEN
+                self._opened_at = time.monotonic()
@@ -1,13 +1,18 @@
 # mypy: disable-error-code="import-untyped"
 
+import datetime
+import math
 import os
-from typing import Any
+import queue
+from typing import Any, Iterator, List, Sequence
 
 from emop_frame_protocol.emop_message import EmopMessage
 from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum
 from emop_frame_protocol.vendor.kaitaistruct import BytesIO, KaitaiStream
 
 import grpc
+from google.protobuf.field_mask_pb2 import FieldMask
+from simt_emlite.mediator.grpc.exception.EmliteCircuitOpen import EmliteCircuitOpen
 from simt_emlite.mediator.grpc.exception.EmliteConnectionFailure import (
     EmliteConnectionFailure,
 )
@@ -16,42 +21,81 @@ from simt_emlite.util.logging import get_logger
 
 from .generated.mediator_pb2 import (
     GetInfoRequest,
+    GetInfosRequest,
+    GetMeterInfoRequest,
+    GetMeterStatusReply,
+    GetMeterStatusRequest,
     GetMetersRequest,
+    ListMetersRequest,
+    Meter,
+    MeterInfo,
     ReadElementRequest,
+    ReadElementsRequest,
     SendRawMessageRequest,
+    StreamProfileLogReply,
+    StreamProfileLogRequest,
     WriteElementRequest,
 )
+from .channel_pool import ChannelKey, pooled_channel, pooled_stub
 from .generated.mediator_pb2_grpc import EmliteMediatorServiceStub, InfoServiceStub
-from .util import decode_b64_secret_to_bytes
+from .meter_queue import PRIORITY_METADATA_KEY
+from .response_cache import CACHE_BYPASS, CACHE_METADATA_KEY
+from .service_config import (
+    CLIENT_HEDGES,
+    INFO_HEDGING_DELAY_SECONDS,
+    TIMEOUT_SECONDS,
+    record_retries,
+)
 
 logger = get_logger(__name__, __file__)
 
 
-# timeout considerations:
-# 1) a successful call should take less than 5 seconds
-# 2) emlite_net retries 3 times in case of timeouts, timeout is 10 seconds with
-# a 1 second pause between each retry
-# 3) grpc server queues requests and pauses for 4 seconds between each
-TIMEOUT_SECONDS = 75
+# readElements holds the meter for the whole list so allow for each element
+# on top of the single request timeout (2s spacing + a few seconds to read)
+READ_ELEMENTS_TIMEOUT_SECONDS_PER_ELEMENT = 5
+
+# we get a lot of UNAVAILABLE reading these for reasons unknown - they are
+# tolerated (logged as warnings) as there are still plenty of successful calls
+UNAVAILABLE_TOLERATED = (
+    ObjectIdEnum.instantaneous_voltage,
+    ObjectIdEnum.three_phase_instantaneous_voltage_l1,
+)
+
 
+class EmliteMediatorGrpcClientBase:
+    """
+    Request building, response decoding and error mapping shared by
+    EmliteMediatorGrpcClient and AsyncEmliteMediatorGrpcClient.
+    """
 
-class EmliteMediatorGrpcClient:
     def __init__(
         self,
         mediator_address: str | None = "0.0.0.0:50051",
+        priority: str | None = None,
+        cache_bypass: bool = False,
     ) -> None:
+        """
+        Args:
+            mediator_address: host:port of the mediator server
+            priority: queue lane for meter requests on the server - one of
+                "write", "interactive", "sync" or "bulk". When not given the
+                server uses "write" for writes and "sync" for everything else.
+            cache_bypass: always read from the meter, not the server's cache
+                of unchanging objects (serial, hardware, tariffs, ...)
+        """
         self.client_cert_b64 = os.environ.get("MEDIATOR_CLIENT_CERT")
         self.client_key_b64 = os.environ.get("MEDIATOR_CLIENT_KEY")
         self.ca_cert_b64 = os.environ.get("MEDIATOR_CA_CERT")
 
-        self.have_certs = (
-            self.client_cert_b64 is not None
-            and self.client_key_b64 is not None
-            and self.ca_cert_b64 is not None
-        )
-
         self.mediator_address = mediator_address or "0.0.0.0:50051"
-        self._cached_channel: grpc.Channel | None = None
+        self.priority = priority
+        self.cache_bypass = cache_bypass
+        # clients with the same address and certs share a channel
+        certs = None
+        if self.client_cert_b64 and self.client_key_b64 and self.ca_cert_b64:
+            certs = (self.client_cert_b64, self.client_key_b64, self.ca_cert_b64)
+        self._channel_key: ChannelKey = (self.mediator_address, certs)
+        self.have_certs = certs is not None
 
         global logger
         self.log = logger.bind(mediator_address=self.mediator_address)
@@ -61,26 +105,163 @@ class EmliteMediatorGrpcClient:
             have_certs=self.have_certs,
         )
 
+    def _rpc_error(
+        self,
+        e: grpc.RpcError,
+        method: str,
+        serial: str,
+        object_id: ObjectIdEnum | int | None = None,
+        eof: bool = True,
+    ) -> Exception:
+        """
+        The exception to raise for a failed call - the Emlite exception for
+        a meter failure reported by the server, otherwise e itself.
+
+        Args:
+            eof: map an EOFError from the meter to EmliteEOFError
+        """
+        code = e.code()
+        details = str(e.details() or "")
+        target = f"meter={serial}"
+        log_fields: dict[str, Any] = {"meter_id": serial}
+        if object_id is not None:
+            obis_name = self._object_id_name(object_id)
+            target = f"object_id={obis_name}, {target}"
+            log_fields["object_id"] = obis_name
+
+        if code == grpc.StatusCode.FAILED_PRECONDITION:
+            self.log.warn(details, meter_id=serial)
+            return EmliteCircuitOpen(target)
+        if code == grpc.StatusCode.INTERNAL:
+            if eof and "EOFError" in details:
+                self.log.warn("EOFError from meter", **log_fields)
+                return EmliteEOFError(target)
+            if "failed to connect after retries" in details:
+                self.log.warn(details, meter_id=serial)
+                return EmliteConnectionFailure(target)
+        if code == grpc.StatusCode.DEADLINE_EXCEEDED and object_id is not None:
+            self.log.warn("rpc timeout (deadline_exceeded)", **log_fields)
+            return e
+
+        log_level = (
+            "warning"
+            if code == grpc.StatusCode.UNAVAILABLE
+            and object_id in UNAVAILABLE_TOLERATED
+            else "error"
+        )
+        getattr(self.log, log_level)(
+            f"{method} failed", details=details, code=code, **log_fields
+        )
+        return e
+
+    def _decode_element(self, object_id: ObjectIdEnum | int, payload: bytes) -> Any:
+        emlite_rsp = EmopMessage(
+            len(payload), object_id, KaitaiStream(BytesIO(payload))
+        )
+        emlite_rsp._read()
+        return emlite_rsp.message
+
+    def _element_result(
+        self, serial: str, object_id: ObjectIdEnum | int, reply: Any
+    ) -> Any:
+        """
+        One readElements reply - the decoded message or, for an element that
+        failed, the exception describing the failure.
+        """
+        if not reply.error:
+            return self._decode_element(object_id, reply.response)
+
+        obis_name = self._object_id_name(object_id)
+        self.log.warn(
+            "readElements element failed",
+            error=reply.error,
+            object_id=obis_name,
+            meter_id=serial,
+        )
+        if "EOFError" in reply.error:
+            return EmliteEOFError(f"object_id={obis_name}, meter={serial}")
+        return Exception(f"{obis_name}: {reply.error}")
+
+    def _check_element_count(
+        self, serial: str, results: List[Any], object_ids: Sequence[Any]
+    ) -> None:
+        if len(results) != len(object_ids):
+            raise EmliteEOFError(
+                f"readElements returned {len(results)} of {len(object_ids)} "
+                f"elements, meter={serial}"
+            )
+
+    def _read_elements_timeout(self, count: int) -> float:
+        return TIMEOUT_SECONDS + READ_ELEMENTS_TIMEOUT_SECONDS_PER_ELEMENT * count
+
+    def _stream_profile_log_request(
+        self,
+        serial: str,
+        log: int,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        is_twin_element: bool,
+    ) -> tuple[StreamProfileLogRequest, float]:
+        """The request and its timeout."""
+        # at most one meter request per hour of range (twin element log 2)
+        requests = max(1, math.ceil((end - start).total_seconds() / 3600))
+        request = StreamProfileLogRequest(
+            serial=serial,
+            log=log,  # type: ignore[arg-type]
+            startTime=int(start.timestamp()),
+            endTime=int(end.timestamp()),
+            isTwinElement=is_twin_element,
+        )
+        return request, self._read_elements_timeout(requests)
+
+    def _list_meters_request(
+        self,
+        esco: str | None,
+        name: str | None,
+        serial: str | None,
+        fields: list[str] | None,
+    ) -> ListMetersRequest:
+        return ListMetersRequest(
+            esco=esco, name=name, serial=serial, fields=FieldMask(paths=fields)
+        )
+
+    def _metadata(self) -> list[tuple[str, str]]:
+        metadata = []
+        if self.priority is not None:
+            metadata.append((PRIORITY_METADATA_KEY, self.priority))
+        if self.cache_bypass:
+            metadata.append((CACHE_METADATA_KEY, CACHE_BYPASS))
+        return metadata
+
+    def _object_id_int(self, obj_id: ObjectIdEnum | int) -> int:
+        return obj_id.value if isinstance(obj_id, ObjectIdEnum) else obj_id
+
+    def _object_id_name(self, obj_id: ObjectIdEnum | int) -> str:
+        return obj_id.name if isinstance(obj_id, ObjectIdEnum) else hex(obj_id)
+
+    def _record_retries(self, method: str, call: Any) -> None:
+        """Count retries of a finished call (or the RpcError it raised)."""
+        trailing_metadata = getattr(call, "trailing_metadata", None)
+        if trailing_metadata is not None:
+            record_retries(method, trailing_metadata())
+
+
+class EmliteMediatorGrpcClient(EmliteMediatorGrpcClientBase):
     @property
     def _channel(self) -> grpc.Channel:
-        if self._cached_channel is None:
-            if self.mediator_address is None:
-                raise ValueError("mediator_address cannot be none")
-            if self.have_certs:
-                credentials = self._channel_credentials()
-                self._cached_channel = grpc.secure_channel(
-                    self.mediator_address,
-                    credentials,
-                    options=(("grpc.ssl_target_name_override", "cepro-mediators"),),
-                )
-            else:
-                self._cached_channel = grpc.insecure_channel(self.mediator_address)
-        return self._cached_channel
+        return pooled_channel(self._channel_key)
+
+    def _mediator_stub(self) -> EmliteMediatorServiceStub:
+        return pooled_stub(self._channel_key, EmliteMediatorServiceStub)
+
+    def _info_stub(self) -> InfoServiceStub:
+        return pooled_stub(self._channel_key, InfoServiceStub)
 
     def close(self) -> None:
-        if self._cached_channel is not None:
-            self._cached_channel.close()
-            self._cached_channel = None
+        """
+        The channel is shared with every other client in the process so is
+        left open - see channel_pool.close_channels().
+        """
 
     def __enter__(self) -> "EmliteMediatorGrpcClient":
         return self
@@ -88,72 +269,78 @@ class EmliteMediatorGrpcClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def __del__(self) -> None:
-        self.close()
+    def _call(
+        self, method: str, multi_callable: Any, request: Any, **kwargs: Any
+    ) -> Any:
+        """Unary call - the deadline and retries come from the service config."""
+        try:
+            response, call = multi_callable.with_call(request, **kwargs)
+        except grpc.RpcError as e:
+            self._record_retries(method, e)
+            raise
+        self._record_retries(method, call)
+        return response
+
+    def _hedged_call(
+        self, method: str, multi_callable: Any, request: Any, **kwargs: Any
+    ) -> Any:
+        """
+        _call sent again if there is no reply after INFO_HEDGING_DELAY_SECONDS
+        - the first reply wins and the other call is cancelled.
+        """
+        if INFO_HEDGING_DELAY_SECONDS <= 0:
+            return self._call(method, multi_callable, request, **kwargs)
+
+        first = multi_callable.future(request, **kwargs)
+        try:
+            response = first.result(timeout=INFO_HEDGING_DELAY_SECONDS)
+            self._record_retries(method, first)
+            return response
+        except grpc.FutureTimeoutError:
+            pass
+        except grpc.RpcError as e:
+            self._record_retries(method, e)
+            raise
+
+        CLIENT_HEDGES.inc(method=method)
+        second = multi_callable.future(request, **kwargs)
+        finished: queue.Queue[Any] = queue.Queue()
+        first.add_done_callback(finished.put)
+        second.add_done_callback(finished.put)
+
+        error: grpc.RpcError | None = None
+        for _ in range(2):
+            call = finished.get()
+            try:
+                response = call.result()
+            except grpc.RpcError as e:
+                self._record_retries(method, e)
+                error = e
+                continue
+            self._record_retries(method, call)
+            first.cancel()
+            second.cancel()
+            return response
+        assert error is not None
+        raise error
 
     def read_element(self, serial: str, object_id: ObjectIdEnum | int) -> Any:
-        obis = self._object_id_int(object_id)
-        obis_name = (
-            object_id.name if isinstance(object_id, ObjectIdEnum) else hex(object_id)
-        )
-        stub = EmliteMediatorServiceStub(self._channel)  # type: ignore[no-untyped-call]
+        stub = self._mediator_stub()
         try:
             self.log.debug(
-                f"send request - reading element [{obis_name}]", meter_id=serial
+                f"send request - reading element [{self._object_id_name(object_id)}]",
+                meter_id=serial,
             )
-            rsp_obj = stub.readElement(
-                ReadElementRequest(serial=serial, objectId=obis),
-                timeout=TIMEOUT_SECONDS,
+            rsp_obj = self._call(
+                "readElement",
+                stub.readElement,
+                ReadElementRequest(
+                    serial=serial, objectId=self._object_id_int(object_id)
+                ),
+                metadata=self._metadata(),
             )
         except grpc.RpcError as e:
-            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
-                self.log.warn(
-                    "rpc timeout (deadline_exceeded)",
-                    object_id=obis_name,
-                    meter_id=serial,
-                )
-            elif e.code() == grpc.StatusCode.INTERNAL:
-                details = str(e.details() or "")
-                if "EOFError" in details:
-                    self.log.warn(
-                        "EOFError from meter",
-                        object_id=obis_name,
-                        meter_id=serial,
-                    )
-                    raise EmliteEOFError(f"object_id={obis_name}, meter={serial}")
-                elif "failed to connect after retries" in details:
-                    self.log.warn(e.details(), meter_id=serial)
-                    raise EmliteConnectionFailure(
-                        f"object_id={obis_name}, meter={serial}"
-                    )
-                else:
-                    raise e
-            elif e.code() == grpc.StatusCode.UNAVAILABLE:
-                # we get a lot of these for instantaneous_voltage for reasons unknown
-                # they can be tolerated as we still get a number of successful calls as well
-                log_level: str = (
-                    "warning"
-                    if object_id == ObjectIdEnum.instantaneous_voltage
-                    or object_id
-                    == ObjectIdEnum.three_phase_instantaneous_voltage_l1
-                    else "error"
-                )
-                getattr(self.log, log_level)(
-                    "readElement failed",
-                    details=e.details(),
-                    code=e.code(),
-                    object_id=obis_name,
-                    meter_id=serial,
-                )
-            else:
-                self.log.error(
-                    "readElement failed",
-                    details=e.details(),
-                    code=e.code(),
-                    object_id=obis_name,
-                    meter_id=serial,
-                )
-            raise e
+            raise self._rpc_error(e, "readElement", serial, object_id)
 
         payload_bytes = rsp_obj.response
         self.log.debug(
@@ -161,86 +348,75 @@ class EmliteMediatorGrpcClient:
             response_payload=payload_bytes.hex(),
             meter_id=serial,
         )
+        return self._decode_element(object_id, payload_bytes)
 
-        emlite_rsp = EmopMessage(
-            len(payload_bytes), object_id, KaitaiStream(BytesIO(payload_bytes))
-        )
-        emlite_rsp._read()
-        return emlite_rsp.message
+    def read_elements(
+        self, serial: str, object_ids: Sequence[ObjectIdEnum | int]
+    ) -> List[Any]:
+        """
+        Read several elements in one turn on the meter.
+
+        Returns:
+            decoded message per object id in the order given, or for an
+            element that failed the exception describing the failure
+            (EmliteEOFError for an EOFError from the meter)
+
+        Raises:
+            EmliteConnectionFailure: server could not connect to the meter
+            EmliteCircuitOpen: meter circuit breaker is open
+        """
+        stub = self._mediator_stub()
+        obis_list = [self._object_id_int(object_id) for object_id in object_ids]
+        results: List[Any] = []
+        try:
+            self.log.debug(
+                f"send request - reading {len(obis_list)} elements", meter_id=serial
+            )
+            replies = stub.readElements(
+                ReadElementsRequest(serial=serial, objectIds=obis_list),
+                timeout=self._read_elements_timeout(len(obis_list)),
+                metadata=self._metadata(),
+            )
+            for object_id, reply in zip(object_ids, replies):
+                results.append(self._element_result(serial, object_id, reply))
+            self._record_retries("readElements", replies)
+        except grpc.RpcError as e:
+            self._record_retries("readElements", e)
+            raise self._rpc_error(e, "readElements", serial)
+
+        self._check_element_count(serial, results, object_ids)
+        return results
 
     def write_element(
         self, serial: str, object_id: ObjectIdEnum | int, payload: bytes
     ) -> None:
-        obis = self._object_id_int(object_id)
-        obis_name = (
-            object_id.name if isinstance(object_id, ObjectIdEnum) else hex(object_id)
-        )
-        stub = EmliteMediatorServiceStub(self._channel)  # type: ignore[no-untyped-call]
+        stub = self._mediator_stub()
         try:
             self.log.debug(
-                f"send request - write element [{obis_name}]", meter_id=serial
+                f"send request - write element [{self._object_id_name(object_id)}]",
+                meter_id=serial,
             )
             stub.writeElement(
-                WriteElementRequest(serial=serial, objectId=obis, payload=payload),
-                timeout=TIMEOUT_SECONDS,
+                WriteElementRequest(
+                    serial=serial,
+                    objectId=self._object_id_int(object_id),
+                    payload=payload,
+                ),
+                metadata=self._metadata(),
             )
         except grpc.RpcError as e:
-            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
-                self.log.warn(
-                    "rpc timeout (deadline_exceeded)",
-                    object_id=obis_name,
-                    meter_id=serial,
-                )
-            elif e.code() == grpc.StatusCode.INTERNAL:
-                details = str(e.details() or "")
-                if "EOFError" in details:
-                    self.log.warn(
-                        "EOFError from meter",
-                        object_id=obis_name,
-                        meter_id=serial,
-                    )
-                    raise EmliteEOFError(
-                        "object_id=" + obis_name + ", meter=" + serial
-                    )
-                elif "failed to connect after retries" in details:
-                    self.log.warn(e.details(), meter_id=serial)
-                    raise EmliteConnectionFailure(
-                        "object_id=" + obis_name + ", meter=" + serial
-                    )
-                else:
-                    raise e
-            else:
-                self.log.error(
-                    "writeElement failed",
-                    details=e.details(),
-                    code=e.code(),
-                    object_id=obis_name,
-                    meter_id=serial,
-                )
-            raise e
+            raise self._rpc_error(e, "writeElement", serial, object_id)
 
     def send_message(self, serial: str, message: bytes) -> bytes:
-        stub = EmliteMediatorServiceStub(self._channel)  # type: ignore[no-untyped-call]
+        stub = self._mediator_stub()
         try:
             self.log.debug("send request - message", meter_id=serial)
             rsp_obj = stub.sendRawMessage(
                 SendRawMessageRequest(serial=serial, dataField=message),
-                timeout=TIMEOUT_SECONDS,
+                metadata=self._metadata(),
             )
         except grpc.RpcError as e:
-            if (
-                e.code() == grpc.StatusCode.INTERNAL
-                and "failed to connect after retries" in (e.details() or "")
-            ):
-                self.log.warn(e.details(), meter_id=serial)
-                raise EmliteConnectionFailure(f"meter={serial}")
-            self.log.error(
-                "sendRawMessage",
-                details=e.details(),
-                code=e.code(),
-                meter_id=serial,
-            )
-            raise e
+            raise self._rpc_error(e, "sendRawMessage", serial, eof=False)
 
         payload_bytes: bytes = rsp_obj.response
         self.log.debug(
@@ -250,12 +426,65 @@ class EmliteMediatorGrpcClient:
         )
         return payload_bytes
 
+    def stream_profile_log(
+        self,
+        serial: str,
+        log: int,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        is_twin_element: bool = False,
+    ) -> Iterator[StreamProfileLogReply]:
+        """
+        Stream profile log records for a range - see streamProfileLog.
+
+        Args:
+            log: ProfileLog.PROFILE_LOG_1 or ProfileLog.PROFILE_LOG_2
+            start: first timestamp (timezone aware)
+            end: last timestamp (timezone aware)
+        """
+        stub = self._mediator_stub()
+        request, timeout = self._stream_profile_log_request(
+            serial, log, start, end, is_twin_element
+        )
+        try:
+            self.log.debug(
+                "send request - stream profile log", log=log, meter_id=serial
+            )
+            replies = stub.streamProfileLog(
+                request, timeout=timeout, metadata=self._metadata()
+            )
+            for reply in replies:
+                yield reply
+            self._record_retries("streamProfileLog", replies)
+        except grpc.RpcError as e:
+            self._record_retries("streamProfileLog", e)
+            raise self._rpc_error(e, "streamProfileLog", serial)
+
+    def get_meter_status(self, serial: str) -> GetMeterStatusReply:
+        stub = self._mediator_stub()
+        try:
+            self.log.debug("send request - get_meter_status", meter_id=serial)
+            rsp_obj: GetMeterStatusReply = self._call(
+                "getMeterStatus",
+                stub.getMeterStatus,
+                GetMeterStatusRequest(serial=serial),
+            )
+            return rsp_obj
+        except grpc.RpcError as e:
+            self.log.error(
+                "getMeterStatus failed",
+                details=e.details(),
+                code=e.code(),
+                meter_id=serial,
+            )
+            raise e
+
     def get_info(self, serial: str) -> str:
-        stub = InfoServiceStub(self._channel)
+        stub = self._info_stub()
         try:
             self.log.debug("send request - get_info", meter_id=serial)
-            rsp_obj = stub.GetInfo(
-                GetInfoRequest(serial=serial), timeout=TIMEOUT_SECONDS
+            rsp_obj = self._hedged_call(
+                "GetInfo", stub.GetInfo, GetInfoRequest(serial=serial)
             )
             return rsp_obj.json_data
         except grpc.RpcError as e:
@@ -267,31 +496,93 @@ class EmliteMediatorGrpcClient:
             )
             raise e
 
+    def get_infos(self, serials: list[str]) -> dict[str, str]:
+        """get_info for many meters in one call - unknown serials are left out."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_infos", count=len(serials))
+            rsp_obj = self._hedged_call(
+                "GetInfos", stub.GetInfos, GetInfosRequest(serials=serials)
+            )
+            return dict(rsp_obj.json_data)
+        except grpc.RpcError as e:
+            self.log.error("GetInfos failed", details=e.details(), code=e.code())
+            raise e
+
     def get_meters(self, esco: str | None = None) -> str:
-        stub = InfoServiceStub(self._channel)
+        stub = self._info_stub()
         try:
             self.log.debug("send request - get_meters", esco=esco)
-            rsp_obj = stub.GetMeters(
-                GetMetersRequest(esco=esco), timeout=TIMEOUT_SECONDS
+            rsp_obj = self._hedged_call(
+                "GetMeters", stub.GetMeters, GetMetersRequest(esco=esco)
             )
             return rsp_obj.json_meters
         except grpc.RpcError as e:
             self.log.error("GetMeters failed", details=e.details(), code=e.code())
             raise e
 
-    def _channel_credentials(self) -> grpc.ChannelCredentials:
-        if not self.have_certs:
-            raise Exception("client credentials not provided")
-
-        client_cert = decode_b64_secret_to_bytes(self.client_cert_b64)
-        client_key = decode_b64_secret_to_bytes(self.client_key_b64)
-        ca_cert = decode_b64_secret_to_bytes(self.ca_cert_b64)
+    def get_meter_info(self, serial: str, fields: list[str] | None = None) -> MeterInfo:
+        """Typed get_info, with only the MeterInfo fields listed if given."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - get_meter_info", meter_id=serial)
+            rsp_obj: MeterInfo = self._hedged_call(
+                "GetMeterInfo",
+                stub.GetMeterInfo,
+                GetMeterInfoRequest(serial=serial, fields=FieldMask(paths=fields)),
+            )
+            return rsp_obj
+        except grpc.RpcError as e:
+            self.log.error(
+                "GetMeterInfo failed",
+                details=e.details(),
+                code=e.code(),
+                meter_id=serial,
+            )
+            raise e
 
-        return grpc.ssl_channel_credentials(
-            root_certificates=ca_cert,
-            private_key=client_key,
-            certificate_chain=client_cert,
-        )
+    def list_meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Meter]:
+        """
+        Typed get_meters, filtered on the server to meters with exactly the
+        given name and / or serial, with only the Meter fields listed.
+        """
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - list_meters", esco=esco, name=name)
+            rsp_obj = self._hedged_call(
+                "ListMeters",
+                stub.ListMeters,
+                self._list_meters_request(esco, name, serial, fields),
+            )
+            return list(rsp_obj.meters)
+        except grpc.RpcError as e:
+            self.log.error("ListMeters failed", details=e.details(), code=e.code())
+            raise e
 
-    def _object_id_int(self, obj_id: ObjectIdEnum | int) -> int:
-        return obj_id.value if isinstance(obj_id, ObjectIdEnum) else obj_id
+    def stream_meters(
+        self,
+        esco: str | None = None,
+        name: str | None = None,
+        serial: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Iterator[Meter]:
+        """list_meters received in pages, for large ESCOs."""
+        stub = self._info_stub()
+        try:
+            self.log.debug("send request - stream_meters", esco=esco, name=name)
+            replies = stub.StreamMeters(
+                self._list_meters_request(esco, name, serial, fields)
+            )
+            for rsp_obj in replies:
+                yield from rsp_obj.meters
+            self._record_retries("StreamMeters", replies)
+        except grpc.RpcError as e:
+            self._record_retries("StreamMeters", e)
+            self.log.error("StreamMeters failed", details=e.details(), code=e.code())
+            raise e
@@ -0,0 +1,78 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Per client rate limits and concurrency quotas.
+
+    Each client identity has a token bucket (requests_per_second refill up
+    to burst) and a cap on calls in flight. A call takes a token and an in
+    flight slot when it starts and gives the slot back when it ends. A call
+    over either limit is rejected straight away with a hint of when to
+    retry, so one busy client can't take every server worker and starve the
+    others.
+
+    Limits are configured per role and client in auth.py next to the
+    permissions.
+"""
+
+# retry hint when rejected for calls in flight - there is no telling when
+# one will end
+IN_FLIGHT_RETRY_AFTER_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class ClientLimits:
+    # token bucket refill rate, None for no rate limit
+    requests_per_second: float | None = None
+    # bucket size - requests that may be made at once after a quiet spell
+    burst: int = 1
+    # calls in progress at once, None for no limit
+    max_in_flight: int | None = None
+
+
+class ClientQuota:
+    def __init__(self, client_id: str, limits: ClientLimits) -> None:
+        self.client_id = client_id
+        self.limits = limits
+        self.in_flight = 0
+        self._tokens = float(limits.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float | None:
+        """
+        Take a token and an in flight slot for a call. Returns None if the
+        call may go ahead (call release() when it ends), otherwise the
+        seconds to wait before retrying.
+        """
+        limits = self.limits
+        with self._lock:
+            if (
+                limits.max_in_flight is not None
+                and self.in_flight >= limits.max_in_flight
+            ):
+                return IN_FLIGHT_RETRY_AFTER_SECONDS
+
+            if limits.requests_per_second is not None:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(limits.burst),
+                    self._tokens
+                    + (now - self._updated_at) * limits.requests_per_second,
+                )
+                self._updated_at = now
+                if self._tokens < 1.0:
+                    return (1.0 - self._tokens) / limits.requests_per_second
+                self._tokens -= 1.0
+
+            self.in_flight += 1
+            return None
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
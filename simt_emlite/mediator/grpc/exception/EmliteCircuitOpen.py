@@ -0,0 +1,10 @@
+# This is raised by the client when the server rejected a request without
+# contacting the meter because the meter's circuit breaker is open (it failed
+# a number of consecutive requests and is most likely offline).
+#
+# It translates the servers FAILED_PRECONDITION error into something more
+# specific for clients.
+class EmliteCircuitOpen(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
@@ -22,37 +22,72 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0emediator.proto\x12\x19simt_emlite.mediator.grpc\":\n\x15SendRawMessageRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x11\n\tdataField\x18\x02 \x01(\x0c\"\'\n\x13SendRawMessageReply\x12\x10\n\x08response\x18\x01 \x01(\x0c\"6\n\x12ReadElementRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x10\n\x08objectId\x18\x02 \x01(\x05\"$\n\x10ReadElementReply\x12\x10\n\x08response\x18\x01 \x01(\x0c\"H\n\x13WriteElementRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x10\n\x08objectId\x18\x02 \x01(\x05\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"\x13\n\x11WriteElementReply\" \n\x0eGetInfoRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\"!\n\x0cGetInfoReply\x12\x11\n\tjson_data\x18\x01 \x01(\t\" \n\x10GetMetersRequest\x12\x0c\n\x04\x65sco\x18\x01 \x01(\t\"%\n\x0eGetMetersReply\x12\x13\n\x0bjson_meters\x18\x01 \x01(\t2\xea\x02\n\x15\x45mliteMediatorService\x12t\n\x0esendRawMessage\x12\x30.simt_emlite.mediator.grpc.SendRawMessageRequest\x1a..simt_emlite.mediator.grpc.SendRawMessageReply\"\x00\x12k\n\x0breadElement\x12-.simt_emlite.mediator.grpc.ReadElementRequest\x1a+.simt_emlite.mediator.grpc.ReadElementReply\"\x00\x12n\n\x0cwriteElement\x12..simt_emlite.mediator.grpc.WriteElementRequest\x1a,.simt_emlite.mediator.grpc.WriteElementReply\"\x00\x32\xd5\x01\n\x0bInfoService\x12_\n\x07GetInfo\x12).simt_emlite.mediator.grpc.GetInfoRequest\x1a\'.simt_emlite.mediator.grpc.GetInfoReply\"\x00\x12\x65\n\tGetMeters\x12+.simt_emlite.mediator.grpc.GetMetersRequest\x1a).simt_emlite.mediator.grpc.GetMetersReply\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0emediator.proto\x12\x19simt_emlite.mediator.grpc\x1a google/protobuf/field_mask.proto\":\n\x15SendRawMessageRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x11\n\tdataField\x18\x02 \x01(\x0c\"\'\n\x13SendRawMessageReply\x12\x10\n\x08response\x18\x01 \x01(\x0c\"6\n\x12ReadElementRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x10\n\x08objectId\x18\x02 \x01(\x05\"$\n\x10ReadElementReply\x12\x10\n\x08response\x18\x01 \x01(\x0c\"8\n\x13ReadElementsRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x11\n\tobjectIds\x18\x02 \x03(\x05\"F\n\x11ReadElementsReply\x12\x10\n\x08objectId\x18\x01 \x01(\x05\x12\x10\n\x08response\x18\x02 \x01(\x0c\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"H\n\x13WriteElementRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x10\n\x08objectId\x18\x02 \x01(\x05\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"\x13\n\x11WriteElementReply\"\x98\x01\n\x17StreamProfileLogRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x32\n\x03log\x18\x02 \x01(\x0e\x32%.simt_emlite.mediator.grpc.ProfileLog\x12\x11\n\tstartTime\x18\x03 \x01(\x03\x12\x0f\n\x07\x65ndTime\x18\x04 \x01(\x03\x12\x15\n\risTwinElement\x18\x05 \x01(\x08\"\x88\x01\n\x10ProfileLogRecord\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\x0f\n\x07importA\x18\x02 \x01(\x03\x12\x0f\n\x07importB\x18\x03 \x01(\x03\x12\x15\n\ractiveExportA\x18\x04 \x01(\x03\x12\x15\n\ractiveExportB\x18\x05 \x01(\x03\x12\x11\n\tvalidData\x18\x06 \x01(\x08\"\x83\x01\n\x15StreamProfileLogReply\x12\x13\n\x0brequestTime\x18\x01 \x01(\x03\x12<\n\x07records\x18\x02 \x03(\x0b\x32+.simt_emlite.mediator.grpc.ProfileLogRecord\x12\x17\n\x0f\x66utureTimestamp\x18\x03 \x01(\x03\"\'\n\x15GetMeterStatusRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\"\x9e\x01\n\x13GetMeterStatusReply\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x14\n\x0c\x62reakerState\x18\x02 \x01(\t\x12\x1b\n\x13\x63onsecutiveFailures\x18\x03 \x01(\x05\x12\x1c\n\x14openSecondsRemaining\x18\x04 \x01(\x02\x12\x11\n\tcacheHits\x18\x05 \x01(\x03\x12\x13\n\x0b\x63\x61\x63heMisses\x18\x06 \x01(\x03\" \n\x0eGetInfoRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\"!\n\x0cGetInfoReply\x12\x11\n\tjson_data\x18\x01 \x01(\t\"\"\n\x0fGetInfosRequest\x12\x0f\n\x07serials\x18\x01 \x03(\t\"\x8b\x01\n\rGetInfosReply\x12I\n\tjson_data\x18\x01 \x03(\x0b\x32\x36.simt_emlite.mediator.grpc.GetInfosReply.JsonDataEntry\x1a/\n\rJsonDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\" \n\x10GetMetersRequest\x12\x0c\n\x04\x65sco\x18\x01 \x01(\t\"%\n\x0eGetMetersReply\x12\x13\n\x0bjson_meters\x18\x01 \x01(\t\"\x7f\n\x05Meter\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x65sco\x18\x03 \x01(\t\x12\x10\n\x08hardware\x18\x04 \x01(\t\x12\x0e\n\x06\x66\x65\x65\x64\x65r\x18\x05 \x01(\t\x12\x0e\n\x06health\x18\x06 \x01(\t\x12\x10\n\x03\x63sq\x18\x07 \x01(\x05H\x00\x88\x01\x01\x42\x06\n\x04_csq\"k\n\x11ListMetersRequest\x12\x0c\n\x04\x65sco\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06serial\x18\x03 \x01(\t\x12*\n\x06\x66ields\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"C\n\x0fListMetersReply\x12\x30\n\x06meters\x18\x01 \x03(\x0b\x32 .simt_emlite.mediator.grpc.Meter\"Q\n\x13GetMeterInfoRequest\x12\x0e\n\x06serial\x18\x01 \x01(\t\x12*\n\x06\x66ields\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"\x9e\x02\n\tMeterInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06serial\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04\x65sco\x18\x04 \x01(\t\x12\x10\n\x08hardware\x18\x05 \x01(\t\x12\x12\n\nip_address\x18\x06 \x01(\t\x12\x0c\n\x04mode\x18\x07 \x01(\t\x12\x16\n\x0eprepay_enabled\x18\x08 \x01(\x08\x12\x0e\n\x06health\x18\t \x01(\t\x12\x10\n\x03\x63sq\x18\n \x01(\x05H\x00\x88\x01\x01\x12$\n\x17\x63lock_time_diff_seconds\x18\x0b \x01(\x03H\x01\x88\x01\x01\x12!\n\x19\x63lock_time_diff_synced_at\x18\x0c \x01(\tB\x06\n\x04_csqB\x1a\n\x18_clock_time_diff_seconds*O\n\nProfileLog\x12\x1b\n\x17PROFILE_LOG_UNSPECIFIED\x10\x00\x12\x11\n\rPROFILE_LOG_1\x10\x01\x12\x11\n\rPROFILE_LOG_2\x10\x02\x32\xd0\x05\n\x15\x45mliteMediatorService\x12t\n\x0esendRawMessage\x12\x30.simt_emlite.mediator.grpc.SendRawMessageRequest\x1a..simt_emlite.mediator.grpc.SendRawMessageReply\"\x00\x12k\n\x0breadElement\x12-.simt_emlite.mediator.grpc.ReadElementRequest\x1a+.simt_emlite.mediator.grpc.ReadElementReply\"\x00\x12p\n\x0creadElements\x12..simt_emlite.mediator.grpc.ReadElementsRequest\x1a,.simt_emlite.mediator.grpc.ReadElementsReply\"\x00\x30\x01\x12n\n\x0cwriteElement\x12..simt_emlite.mediator.grpc.WriteElementRequest\x1a,.simt_emlite.mediator.grpc.WriteElementReply\"\x00\x12|\n\x10streamProfileLog\x12\x32.simt_emlite.mediator.grpc.StreamProfileLogRequest\x1a\x30.simt_emlite.mediator.grpc.StreamProfileLogReply\"\x00\x30\x01\x12t\n\x0egetMeterStatus\x12\x30.simt_emlite.mediator.grpc.GetMeterStatusRequest\x1a..simt_emlite.mediator.grpc.GetMeterStatusReply\"\x00\x32\xf9\x04\n\x0bInfoService\x12_\n\x07GetInfo\x12).simt_emlite.mediator.grpc.GetInfoRequest\x1a\'.simt_emlite.mediator.grpc.GetInfoReply\"\x00\x12\x62\n\x08GetInfos\x12*.simt_emlite.mediator.grpc.GetInfosRequest\x1a(.simt_emlite.mediator.grpc.GetInfosReply\"\x00\x12\x65\n\tGetMeters\x12+.simt_emlite.mediator.grpc.GetMetersRequest\x1a).simt_emlite.mediator.grpc.GetMetersReply\"\x00\x12\x66\n\x0cGetMeterInfo\x12..simt_emlite.mediator.grpc.GetMeterInfoRequest\x1a$.simt_emlite.mediator.grpc.MeterInfo\"\x00\x12h\n\nListMeters\x12,.simt_emlite.mediator.grpc.ListMetersRequest\x1a*.simt_emlite.mediator.grpc.ListMetersReply\"\x00\x12l\n\x0cStreamMeters\x12,.simt_emlite.mediator.grpc.ListMetersRequest\x1a*.simt_emlite.mediator.grpc.ListMetersReply\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mediator_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_SENDRAWMESSAGEREQUEST']._serialized_start=45
-  _globals['_SENDRAWMESSAGEREQUEST']._serialized_end=103
-  _globals['_SENDRAWMESSAGEREPLY']._serialized_start=105
-  _globals['_SENDRAWMESSAGEREPLY']._serialized_end=144
-  _globals['_READELEMENTREQUEST']._serialized_start=146
-  _globals['_READELEMENTREQUEST']._serialized_end=200
-  _globals['_READELEMENTREPLY']._serialized_start=202
-  _globals['_READELEMENTREPLY']._serialized_end=238
-  _globals['_WRITEELEMENTREQUEST']._serialized_start=240
-  _globals['_WRITEELEMENTREQUEST']._serialized_end=312
-  _globals['_WRITEELEMENTREPLY']._serialized_start=314
-  _globals['_WRITEELEMENTREPLY']._serialized_end=333
-  _globals['_GETINFOREQUEST']._serialized_start=335
-  _globals['_GETINFOREQUEST']._serialized_end=367
-  _globals['_GETINFOREPLY']._serialized_start=369
-  _globals['_GETINFOREPLY']._serialized_end=402
-  _globals['_GETMETERSREQUEST']._serialized_start=404
-  _globals['_GETMETERSREQUEST']._serialized_end=436
-  _globals['_GETMETERSREPLY']._serialized_start=438
-  _globals['_GETMETERSREPLY']._serialized_end=475
-  _globals['_EMLITEMEDIATORSERVICE']._serialized_start=478
-  _globals['_EMLITEMEDIATORSERVICE']._serialized_end=840
-  _globals['_INFOSERVICE']._serialized_start=843
-  _globals['_INFOSERVICE']._serialized_end=1056
+  _globals['_GETINFOSREPLY_JSONDATAENTRY']._loaded_options = None
+  _globals['_GETINFOSREPLY_JSONDATAENTRY']._serialized_options = b'8\001'
+  _globals['_PROFILELOG']._serialized_start=2128
+  _globals['_PROFILELOG']._serialized_end=2207
+  _globals['_SENDRAWMESSAGEREQUEST']._serialized_start=79
+  _globals['_SENDRAWMESSAGEREQUEST']._serialized_end=137
+  _globals['_SENDRAWMESSAGEREPLY']._serialized_start=139
+  _globals['_SENDRAWMESSAGEREPLY']._serialized_end=178
+  _globals['_READELEMENTREQUEST']._serialized_start=180
+  _globals['_READELEMENTREQUEST']._serialized_end=234
+  _globals['_READELEMENTREPLY']._serialized_start=236
+  _globals['_READELEMENTREPLY']._serialized_end=272
+  _globals['_READELEMENTSREQUEST']._serialized_start=274
+  _globals['_READELEMENTSREQUEST']._serialized_end=330
+  _globals['_READELEMENTSREPLY']._serialized_start=332
+  _globals['_READELEMENTSREPLY']._serialized_end=402
+  _globals['_WRITEELEMENTREQUEST']._serialized_start=404
+  _globals['_WRITEELEMENTREQUEST']._serialized_end=476
+  _globals['_WRITEELEMENTREPLY']._serialized_start=478
+  _globals['_WRITEELEMENTREPLY']._serialized_end=497
+  _globals['_STREAMPROFILELOGREQUEST']._serialized_start=500
+  _globals['_STREAMPROFILELOGREQUEST']._serialized_end=652
+  _globals['_PROFILELOGRECORD']._serialized_start=655
+  _globals['_PROFILELOGRECORD']._serialized_end=791
+  _globals['_STREAMPROFILELOGREPLY']._serialized_start=794
+  _globals['_STREAMPROFILELOGREPLY']._serialized_end=925
+  _globals['_GETMETERSTATUSREQUEST']._serialized_start=927
+  _globals['_GETMETERSTATUSREQUEST']._serialized_end=966
+  _globals['_GETMETERSTATUSREPLY']._serialized_start=969
+  _globals['_GETMETERSTATUSREPLY']._serialized_end=1127
+  _globals['_GETINFOREQUEST']._serialized_start=1129
+  _globals['_GETINFOREQUEST']._serialized_end=1161
+  _globals['_GETINFOREPLY']._serialized_start=1163
+  _globals['_GETINFOREPLY']._serialized_end=1196
+  _globals['_GETINFOSREQUEST']._serialized_start=1198
+  _globals['_GETINFOSREQUEST']._serialized_end=1232
+  _globals['_GETINFOSREPLY']._serialized_start=1235
+  _globals['_GETINFOSREPLY']._serialized_end=1374
+  _globals['_GETINFOSREPLY_JSONDATAENTRY']._serialized_start=1327
+  _globals['_GETINFOSREPLY_JSONDATAENTRY']._serialized_end=1374
+  _globals['_GETMETERSREQUEST']._serialized_start=1376
+  _globals['_GETMETERSREQUEST']._serialized_end=1408
+  _globals['_GETMETERSREPLY']._serialized_start=1410
+  _globals['_GETMETERSREPLY']._serialized_end=1447
+  _globals['_METER']._serialized_start=1449
+  _globals['_METER']._serialized_end=1576
+  _globals['_LISTMETERSREQUEST']._serialized_start=1578
+  _globals['_LISTMETERSREQUEST']._serialized_end=1685
+  _globals['_LISTMETERSREPLY']._serialized_start=1687
+  _globals['_LISTMETERSREPLY']._serialized_end=1754
+  _globals['_GETMETERINFOREQUEST']._serialized_start=1756
+  _globals['_GETMETERINFOREQUEST']._serialized_end=1837
+  _globals['_METERINFO']._serialized_start=1840
+  _globals['_METERINFO']._serialized_end=2126
+  _globals['_EMLITEMEDIATORSERVICE']._serialized_start=2210
+  _globals['_EMLITEMEDIATORSERVICE']._serialized_end=2930
+  _globals['_INFOSERVICE']._serialized_start=2933
+  _globals['_INFOSERVICE']._serialized_end=3566
 # @@protoc_insertion_point(module_scope)
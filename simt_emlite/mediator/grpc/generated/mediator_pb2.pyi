@@ -1,9 +1,22 @@
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class ProfileLog(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    PROFILE_LOG_UNSPECIFIED: _ClassVar[ProfileLog]
+    PROFILE_LOG_1: _ClassVar[ProfileLog]
+    PROFILE_LOG_2: _ClassVar[ProfileLog]
+PROFILE_LOG_UNSPECIFIED: ProfileLog
+PROFILE_LOG_1: ProfileLog
+PROFILE_LOG_2: ProfileLog
+
 class SendRawMessageRequest(_message.Message):
     __slots__ = ("serial", "dataField")
     SERIAL_FIELD_NUMBER: _ClassVar[int]
@@ -32,6 +45,24 @@ class ReadElementReply(_message.Message):
     response: bytes
     def __init__(self, response: _Optional[bytes] = ...) -> None: ...
 
+class ReadElementsRequest(_message.Message):
+    __slots__ = ("serial", "objectIds")
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    OBJECTIDS_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    objectIds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, serial: _Optional[str] = ..., objectIds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class ReadElementsReply(_message.Message):
+    __slots__ = ("objectId", "response", "error")
+    OBJECTID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    objectId: int
+    response: bytes
+    error: str
+    def __init__(self, objectId: _Optional[int] = ..., response: _Optional[bytes] = ..., error: _Optional[str] = ...) -> None: ...
+
 class WriteElementRequest(_message.Message):
     __slots__ = ("serial", "objectId", "payload")
     SERIAL_FIELD_NUMBER: _ClassVar[int]
@@ -46,6 +77,68 @@ class WriteElementReply(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class StreamProfileLogRequest(_message.Message):
+    __slots__ = ("serial", "log", "startTime", "endTime", "isTwinElement")
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    LOG_FIELD_NUMBER: _ClassVar[int]
+    STARTTIME_FIELD_NUMBER: _ClassVar[int]
+    ENDTIME_FIELD_NUMBER: _ClassVar[int]
+    ISTWINELEMENT_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    log: ProfileLog
+    startTime: int
+    endTime: int
+    isTwinElement: bool
+    def __init__(self, serial: _Optional[str] = ..., log: _Optional[_Union[ProfileLog, str]] = ..., startTime: _Optional[int] = ..., endTime: _Optional[int] = ..., isTwinElement: bool = ...) -> None: ...
+
+class ProfileLogRecord(_message.Message):
+    __slots__ = ("timestamp", "importA", "importB", "activeExportA", "activeExportB", "validData")
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    IMPORTA_FIELD_NUMBER: _ClassVar[int]
+    IMPORTB_FIELD_NUMBER: _ClassVar[int]
+    ACTIVEEXPORTA_FIELD_NUMBER: _ClassVar[int]
+    ACTIVEEXPORTB_FIELD_NUMBER: _ClassVar[int]
+    VALIDDATA_FIELD_NUMBER: _ClassVar[int]
+    timestamp: int
+    importA: int
+    importB: int
+    activeExportA: int
+    activeExportB: int
+    validData: bool
+    def __init__(self, timestamp: _Optional[int] = ..., importA: _Optional[int] = ..., importB: _Optional[int] = ..., activeExportA: _Optional[int] = ..., activeExportB: _Optional[int] = ..., validData: bool = ...) -> None: ...
+
+class StreamProfileLogReply(_message.Message):
+    __slots__ = ("requestTime", "records", "futureTimestamp")
+    REQUESTTIME_FIELD_NUMBER: _ClassVar[int]
+    RECORDS_FIELD_NUMBER: _ClassVar[int]
+    FUTURETIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    requestTime: int
+    records: _containers.RepeatedCompositeFieldContainer[ProfileLogRecord]
+    futureTimestamp: int
+    def __init__(self, requestTime: _Optional[int] = ..., records: _Optional[_Iterable[_Union[ProfileLogRecord, _Mapping]]] = ..., futureTimestamp: _Optional[int] = ...) -> None: ...
+
+class GetMeterStatusRequest(_message.Message):
+    __slots__ = ("serial",)
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    def __init__(self, serial: _Optional[str] = ...) -> None: ...
+
+class GetMeterStatusReply(_message.Message):
+    __slots__ = ("serial", "breakerState", "consecutiveFailures", "openSecondsRemaining", "cacheHits", "cacheMisses")
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    BREAKERSTATE_FIELD_NUMBER: _ClassVar[int]
+    CONSECUTIVEFAILURES_FIELD_NUMBER: _ClassVar[int]
+    OPENSECONDSREMAINING_FIELD_NUMBER: _ClassVar[int]
+    CACHEHITS_FIELD_NUMBER: _ClassVar[int]
+    CACHEMISSES_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    breakerState: str
+    consecutiveFailures: int
+    openSecondsRemaining: float
+    cacheHits: int
+    cacheMisses: int
+    def __init__(self, serial: _Optional[str] = ..., breakerState: _Optional[str] = ..., consecutiveFailures: _Optional[int] = ..., openSecondsRemaining: _Optional[float] = ..., cacheHits: _Optional[int] = ..., cacheMisses: _Optional[int] = ...) -> None: ...
+
 class GetInfoRequest(_message.Message):
     __slots__ = ("serial",)
     SERIAL_FIELD_NUMBER: _ClassVar[int]
@@ -58,6 +151,25 @@ class GetInfoReply(_message.Message):
     json_data: str
     def __init__(self, json_data: _Optional[str] = ...) -> None: ...
 
+class GetInfosRequest(_message.Message):
+    __slots__ = ("serials",)
+    SERIALS_FIELD_NUMBER: _ClassVar[int]
+    serials: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, serials: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetInfosReply(_message.Message):
+    __slots__ = ("json_data",)
+    class JsonDataEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    JSON_DATA_FIELD_NUMBER: _ClassVar[int]
+    json_data: _containers.ScalarMap[str, str]
+    def __init__(self, json_data: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
 class GetMetersRequest(_message.Message):
     __slots__ = ("esco",)
     ESCO_FIELD_NUMBER: _ClassVar[int]
@@ -69,3 +181,75 @@ class GetMetersReply(_message.Message):
     JSON_METERS_FIELD_NUMBER: _ClassVar[int]
     json_meters: str
     def __init__(self, json_meters: _Optional[str] = ...) -> None: ...
+
+class Meter(_message.Message):
+    __slots__ = ("serial", "name", "esco", "hardware", "feeder", "health", "csq")
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ESCO_FIELD_NUMBER: _ClassVar[int]
+    HARDWARE_FIELD_NUMBER: _ClassVar[int]
+    FEEDER_FIELD_NUMBER: _ClassVar[int]
+    HEALTH_FIELD_NUMBER: _ClassVar[int]
+    CSQ_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    name: str
+    esco: str
+    hardware: str
+    feeder: str
+    health: str
+    csq: int
+    def __init__(self, serial: _Optional[str] = ..., name: _Optional[str] = ..., esco: _Optional[str] = ..., hardware: _Optional[str] = ..., feeder: _Optional[str] = ..., health: _Optional[str] = ..., csq: _Optional[int] = ...) -> None: ...
+
+class ListMetersRequest(_message.Message):
+    __slots__ = ("esco", "name", "serial", "fields")
+    ESCO_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    esco: str
+    name: str
+    serial: str
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, esco: _Optional[str] = ..., name: _Optional[str] = ..., serial: _Optional[str] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class ListMetersReply(_message.Message):
+    __slots__ = ("meters",)
+    METERS_FIELD_NUMBER: _ClassVar[int]
+    meters: _containers.RepeatedCompositeFieldContainer[Meter]
+    def __init__(self, meters: _Optional[_Iterable[_Union[Meter, _Mapping]]] = ...) -> None: ...
+
+class GetMeterInfoRequest(_message.Message):
+    __slots__ = ("serial", "fields")
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    serial: str
+    fields: _field_mask_pb2.FieldMask
+    def __init__(self, serial: _Optional[str] = ..., fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class MeterInfo(_message.Message):
+    __slots__ = ("id", "serial", "name", "esco", "hardware", "ip_address", "mode", "prepay_enabled", "health", "csq", "clock_time_diff_seconds", "clock_time_diff_synced_at")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SERIAL_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    ESCO_FIELD_NUMBER: _ClassVar[int]
+    HARDWARE_FIELD_NUMBER: _ClassVar[int]
+    IP_ADDRESS_FIELD_NUMBER: _ClassVar[int]
+    MODE_FIELD_NUMBER: _ClassVar[int]
+    PREPAY_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    HEALTH_FIELD_NUMBER: _ClassVar[int]
+    CSQ_FIELD_NUMBER: _ClassVar[int]
+    CLOCK_TIME_DIFF_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    CLOCK_TIME_DIFF_SYNCED_AT_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    serial: str
+    name: str
+    esco: str
+    hardware: str
+    ip_address: str
+    mode: str
+    prepay_enabled: bool
+    health: str
+    csq: int
+    clock_time_diff_seconds: int
+    clock_time_diff_synced_at: str
+    def __init__(self, id: _Optional[str] = ..., serial: _Optional[str] = ..., name: _Optional[str] = ..., esco: _Optional[str] = ..., hardware: _Optional[str] = ..., ip_address: _Optional[str] = ..., mode: _Optional[str] = ..., prepay_enabled: bool = ..., health: _Optional[str] = ..., csq: _Optional[int] = ..., clock_time_diff_seconds: _Optional[int] = ..., clock_time_diff_synced_at: _Optional[str] = ...) -> None: ...
@@ -44,11 +44,26 @@ class EmliteMediatorServiceStub(object):
                 request_serializer=mediator__pb2.ReadElementRequest.SerializeToString,
                 response_deserializer=mediator__pb2.ReadElementReply.FromString,
                 _registered_method=True)
+        self.readElements = channel.unary_stream(
+                '/simt_emlite.mediator.grpc.EmliteMediatorService/readElements',
+                request_serializer=mediator__pb2.ReadElementsRequest.SerializeToString,
+                response_deserializer=mediator__pb2.ReadElementsReply.FromString,
+                _registered_method=True)
         self.writeElement = channel.unary_unary(
                 '/simt_emlite.mediator.grpc.EmliteMediatorService/writeElement',
                 request_serializer=mediator__pb2.WriteElementRequest.SerializeToString,
                 response_deserializer=mediator__pb2.WriteElementReply.FromString,
                 _registered_method=True)
+        self.streamProfileLog = channel.unary_stream(
+                '/simt_emlite.mediator.grpc.EmliteMediatorService/streamProfileLog',
+                request_serializer=mediator__pb2.StreamProfileLogRequest.SerializeToString,
+                response_deserializer=mediator__pb2.StreamProfileLogReply.FromString,
+                _registered_method=True)
+        self.getMeterStatus = channel.unary_unary(
+                '/simt_emlite.mediator.grpc.EmliteMediatorService/getMeterStatus',
+                request_serializer=mediator__pb2.GetMeterStatusRequest.SerializeToString,
+                response_deserializer=mediator__pb2.GetMeterStatusReply.FromString,
+                _registered_method=True)
 
 
 class EmliteMediatorServiceServicer(object):
@@ -66,12 +81,30 @@ class EmliteMediatorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def readElements(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def writeElement(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def streamProfileLog(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def getMeterStatus(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EmliteMediatorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -85,11 +118,26 @@ def add_EmliteMediatorServiceServicer_to_server(servicer, server):
                     request_deserializer=mediator__pb2.ReadElementRequest.FromString,
                     response_serializer=mediator__pb2.ReadElementReply.SerializeToString,
             ),
+            'readElements': grpc.unary_stream_rpc_method_handler(
+                    servicer.readElements,
+                    request_deserializer=mediator__pb2.ReadElementsRequest.FromString,
+                    response_serializer=mediator__pb2.ReadElementsReply.SerializeToString,
+            ),
             'writeElement': grpc.unary_unary_rpc_method_handler(
                     servicer.writeElement,
                     request_deserializer=mediator__pb2.WriteElementRequest.FromString,
                     response_serializer=mediator__pb2.WriteElementReply.SerializeToString,
             ),
+            'streamProfileLog': grpc.unary_stream_rpc_method_handler(
+                    servicer.streamProfileLog,
+                    request_deserializer=mediator__pb2.StreamProfileLogRequest.FromString,
+                    response_serializer=mediator__pb2.StreamProfileLogReply.SerializeToString,
+            ),
+            'getMeterStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.getMeterStatus,
+                    request_deserializer=mediator__pb2.GetMeterStatusRequest.FromString,
+                    response_serializer=mediator__pb2.GetMeterStatusReply.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'simt_emlite.mediator.grpc.EmliteMediatorService', rpc_method_handlers)
@@ -155,6 +203,33 @@ class EmliteMediatorService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def readElements(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.EmliteMediatorService/readElements',
+            mediator__pb2.ReadElementsRequest.SerializeToString,
+            mediator__pb2.ReadElementsReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def writeElement(request,
             target,
@@ -182,6 +257,60 @@ class EmliteMediatorService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def streamProfileLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.EmliteMediatorService/streamProfileLog',
+            mediator__pb2.StreamProfileLogRequest.SerializeToString,
+            mediator__pb2.StreamProfileLogReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def getMeterStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.EmliteMediatorService/getMeterStatus',
+            mediator__pb2.GetMeterStatusRequest.SerializeToString,
+            mediator__pb2.GetMeterStatusReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class InfoServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -197,11 +326,31 @@ class InfoServiceStub(object):
                 request_serializer=mediator__pb2.GetInfoRequest.SerializeToString,
                 response_deserializer=mediator__pb2.GetInfoReply.FromString,
                 _registered_method=True)
+        self.GetInfos = channel.unary_unary(
+                '/simt_emlite.mediator.grpc.InfoService/GetInfos',
+                request_serializer=mediator__pb2.GetInfosRequest.SerializeToString,
+                response_deserializer=mediator__pb2.GetInfosReply.FromString,
+                _registered_method=True)
         self.GetMeters = channel.unary_unary(
                 '/simt_emlite.mediator.grpc.InfoService/GetMeters',
                 request_serializer=mediator__pb2.GetMetersRequest.SerializeToString,
                 response_deserializer=mediator__pb2.GetMetersReply.FromString,
                 _registered_method=True)
+        self.GetMeterInfo = channel.unary_unary(
+                '/simt_emlite.mediator.grpc.InfoService/GetMeterInfo',
+                request_serializer=mediator__pb2.GetMeterInfoRequest.SerializeToString,
+                response_deserializer=mediator__pb2.MeterInfo.FromString,
+                _registered_method=True)
+        self.ListMeters = channel.unary_unary(
+                '/simt_emlite.mediator.grpc.InfoService/ListMeters',
+                request_serializer=mediator__pb2.ListMetersRequest.SerializeToString,
+                response_deserializer=mediator__pb2.ListMetersReply.FromString,
+                _registered_method=True)
+        self.StreamMeters = channel.unary_stream(
+                '/simt_emlite.mediator.grpc.InfoService/StreamMeters',
+                request_serializer=mediator__pb2.ListMetersRequest.SerializeToString,
+                response_deserializer=mediator__pb2.ListMetersReply.FromString,
+                _registered_method=True)
 
 
 class InfoServiceServicer(object):
@@ -213,12 +362,37 @@ class InfoServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetInfos(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetMeters(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMeterInfo(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListMeters(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamMeters(self, request, context):
+        """ListMeters in pages of up to 500 meters, for large ESCOs
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_InfoServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -227,11 +401,31 @@ def add_InfoServiceServicer_to_server(servicer, server):
                     request_deserializer=mediator__pb2.GetInfoRequest.FromString,
                     response_serializer=mediator__pb2.GetInfoReply.SerializeToString,
             ),
+            'GetInfos': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetInfos,
+                    request_deserializer=mediator__pb2.GetInfosRequest.FromString,
+                    response_serializer=mediator__pb2.GetInfosReply.SerializeToString,
+            ),
             'GetMeters': grpc.unary_unary_rpc_method_handler(
                     servicer.GetMeters,
                     request_deserializer=mediator__pb2.GetMetersRequest.FromString,
                     response_serializer=mediator__pb2.GetMetersReply.SerializeToString,
             ),
+            'GetMeterInfo': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMeterInfo,
+                    request_deserializer=mediator__pb2.GetMeterInfoRequest.FromString,
+                    response_serializer=mediator__pb2.MeterInfo.SerializeToString,
+            ),
+            'ListMeters': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListMeters,
+                    request_deserializer=mediator__pb2.ListMetersRequest.FromString,
+                    response_serializer=mediator__pb2.ListMetersReply.SerializeToString,
+            ),
+            'StreamMeters': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMeters,
+                    request_deserializer=mediator__pb2.ListMetersRequest.FromString,
+                    response_serializer=mediator__pb2.ListMetersReply.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'simt_emlite.mediator.grpc.InfoService', rpc_method_handlers)
@@ -270,6 +464,33 @@ class InfoService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetInfos(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.InfoService/GetInfos',
+            mediator__pb2.GetInfosRequest.SerializeToString,
+            mediator__pb2.GetInfosReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetMeters(request,
             target,
@@ -296,3 +517,84 @@ class InfoService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetMeterInfo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.InfoService/GetMeterInfo',
+            mediator__pb2.GetMeterInfoRequest.SerializeToString,
+            mediator__pb2.MeterInfo.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListMeters(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.InfoService/ListMeters',
+            mediator__pb2.ListMetersRequest.SerializeToString,
+            mediator__pb2.ListMetersReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamMeters(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/simt_emlite.mediator.grpc.InfoService/StreamMeters',
+            mediator__pb2.ListMetersRequest.SerializeToString,
+            mediator__pb2.ListMetersReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,12 +1,16 @@
 """Runs protoc with the gRPC plugin to generate messages and gRPC stubs."""
 
 # mypy: disable-error-code="import-untyped"
+from importlib.resources import files
+
 from grpc_tools import protoc
 
 protoc.main(
     (
         "",
         "-I.",
+        # well known types (google/protobuf/*.proto) bundled with grpc_tools
+        f"-I{files('grpc_tools') / '_proto'}",
         "--pyi_out=./generated",
         "--python_out=./generated",
         "--grpc_python_out=./generated",
@@ -21,8 +25,8 @@ def fix_imports():
         content = f.read()
 
     content = content.replace(
-        "import mediator_pb2 as mediator__pb2",
-        "from . import mediator_pb2 as mediator__pb2",
+        "\nimport mediator_pb2 as mediator__pb2",
+        "\nfrom . import mediator_pb2 as mediator__pb2",
     )
 
     with open("generated/mediator_pb2_grpc.py", "w") as f:
@@ -1,17 +1,167 @@
 
+import asyncio
 import json
+import os
+import threading
+import time
 
 import traceback
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterable, List, NamedTuple, Tuple, TypeVar
+
 import grpc
+from google.protobuf.field_mask_pb2 import FieldMask  # type: ignore[import-untyped]
+from google.protobuf.message import Message  # type: ignore[import-untyped]
 from simt_emlite.util.config import load_config
-from simt_emlite.util.supabase import as_first_item, as_list, supa_client
-from .generated.mediator_pb2 import GetInfoReply, GetMetersReply
+from simt_emlite.util.supabase import as_list, supa_client
+from .generated.mediator_pb2 import (
+    GetInfoReply,
+    GetInfosReply,
+    GetMetersReply,
+    ListMetersReply,
+    Meter,
+    MeterInfo,
+)
 from .generated.mediator_pb2_grpc import InfoServiceServicer
 
 from simt_emlite.util.logging import get_logger
 
 logger = get_logger(__name__, __file__)
 
+"""
+    Meter registry info for the CLI, profile downloader and management API.
+
+    These callers ask for the same few records over and over (eg. resolving
+    the name of every meter in a download group), so replies are cached for
+    INFO_CACHE_TTL_SECONDS. A meter's registry and shadow records are read
+    in one joined query and GetInfos reads many meters in a few. JSON is
+    compact - clients that show it pretty print it themselves.
+
+    ListMeters / StreamMeters and GetMeterInfo return the same records as
+    typed Meter / MeterInfo messages, filtered and cut down to the fields
+    asked for on the server so eg. resolving a meter name moves one small
+    message rather than the whole fleet as JSON.
+"""
+
+# seconds a GetInfo / GetMeters reply may be served from the cache
+INFO_CACHE_TTL_SECONDS = float(os.environ.get("INFO_CACHE_TTL_SECONDS", "30"))
+# cached replies, the oldest are dropped beyond this
+INFO_CACHE_MAX_ENTRIES = 10000
+# serials in a GetInfos request
+MAX_INFOS_SERIALS = 1000
+# serials per registry query - keeps the query string a sensible length
+INFOS_QUERY_CHUNK = 100
+# meters per StreamMeters reply
+METERS_PAGE_SIZE = 500
+
+# record column -> conversion to the message field of the same name
+METER_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "serial": str,
+    "name": str,
+    "esco": str,
+    "hardware": str,
+    "feeder": str,
+    "health": str,
+    "csq": int,
+}
+METER_INFO_REGISTRY_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "id": str,
+    "serial": str,
+    "name": str,
+    "esco": str,
+    "hardware": str,
+    "ip_address": str,
+    "mode": str,
+    "prepay_enabled": bool,
+}
+METER_INFO_SHADOW_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "health": str,
+    "csq": int,
+    "clock_time_diff_seconds": int,
+    "clock_time_diff_synced_at": str,
+}
+
+T = TypeVar("T")
+M = TypeVar("M", bound=Message)
+
+
+class InvalidFieldMask(ValueError):
+    pass
+
+
+def _to_json(data: Any) -> str:
+    # default=str handles dates/decimals
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _set_fields(
+    message: M, record: Dict[str, Any] | None, fields: Dict[str, Callable[[Any], Any]]
+) -> M:
+    """Set message fields from the record columns that are not null."""
+    for name, convert in fields.items():
+        value = record.get(name) if record else None
+        if value is not None:
+            setattr(message, name, convert(value))
+    return message
+
+
+def apply_field_mask(messages: List[M], mask: FieldMask) -> List[M]:
+    """Copies of messages with only the fields in mask, all if it is empty."""
+    if not mask.paths or not messages:
+        return messages
+    descriptor = messages[0].DESCRIPTOR
+    if not mask.IsValidForDescriptor(descriptor):
+        raise InvalidFieldMask(
+            f"unknown {descriptor.name} field in {list(mask.paths)}"
+        )
+    masked = []
+    for message in messages:
+        copy = type(message)()
+        mask.MergeMessage(message, copy)
+        masked.append(copy)
+    return masked
+
+
+class _Info(NamedTuple):
+    json_data: str
+    info: MeterInfo
+
+
+class _Meters(NamedTuple):
+    json_meters: str
+    meters: List[Meter]
+
+
+class _TtlCache(Generic[T]):
+    def __init__(
+        self, ttl_seconds: float, maxsize: int = INFO_CACHE_MAX_ENTRIES
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        # key -> (expires at time.monotonic(), reply), oldest first
+        self._entries: OrderedDict[str, Tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> T | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def put(self, key: str, value: T) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# cached for a serial that isn't in the registry so repeated lookups of it
+# don't each query the database
+_UNKNOWN_INFO = _Info("", MeterInfo())
+
+
 class EmliteInfoServiceServicer(InfoServiceServicer):
     def __init__(self):
         self.config = load_config()
@@ -30,6 +180,106 @@ class EmliteInfoServiceServicer(InfoServiceServicer):
                 str(self.supabase_access_token)
             )
 
+        self._info_cache: _TtlCache[_Info] = _TtlCache(INFO_CACHE_TTL_SECONDS)
+        self._meters_cache: _TtlCache[_Meters] = _TtlCache(INFO_CACHE_TTL_SECONDS)
+
+    def _info_json(self, serial: str) -> str | None:
+        """Registry and shadow records for serial as JSON, None if unknown."""
+        return self._infos_json([serial]).get(serial)
+
+    def _infos_json(self, serials: Iterable[str]) -> Dict[str, str]:
+        return {
+            serial: info.json_data for serial, info in self._infos(serials).items()
+        }
+
+    def _meter_info(self, serial: str, fields: FieldMask) -> MeterInfo | None:
+        info = self._infos([serial]).get(serial)
+        if info is None:
+            return None
+        return apply_field_mask([info.info], fields)[0]
+
+    def _infos(self, serials: Iterable[str]) -> Dict[str, _Info]:
+        """
+        Registry and shadow records for each registered serial.
+        Serials not in the cache are read in INFOS_QUERY_CHUNK sized queries.
+        Unregistered serials are cached too (as _UNKNOWN_INFO).
+        """
+        infos: Dict[str, _Info] = {}
+        missing: List[str] = []
+        for serial in dict.fromkeys(serials):
+            cached = self._info_cache.get(serial)
+            if cached is None:
+                missing.append(serial)
+            elif cached is not _UNKNOWN_INFO:
+                infos[serial] = cached
+
+        for i in range(0, len(missing), INFOS_QUERY_CHUNK):
+            for registry_rec in self._query_infos(missing[i : i + INFOS_QUERY_CHUNK]):
+                # embedded by the join - one to one but may come as a list
+                shadow_rec = registry_rec.pop("meter_shadows", None)
+                if isinstance(shadow_rec, list):
+                    shadow_rec = shadow_rec[0] if shadow_rec else None
+
+                info = _set_fields(
+                    MeterInfo(), registry_rec, METER_INFO_REGISTRY_FIELDS
+                )
+                _set_fields(info, shadow_rec, METER_INFO_SHADOW_FIELDS)
+                entry = _Info(
+                    _to_json({"registry": registry_rec, "shadow": shadow_rec}), info
+                )
+                self._info_cache.put(info.serial, entry)
+                infos[info.serial] = entry
+
+        for serial in missing:
+            if serial not in infos:
+                self._info_cache.put(serial, _UNKNOWN_INFO)
+        return infos
+
+    def _query_infos(self, serials: List[str]) -> List[Dict[str, Any]]:
+        """Registry records for serials with their shadow record joined."""
+        assert self.supabase is not None
+        result = (
+            self.supabase.table("meter_registry")
+            .select("*, meter_shadows(*)")
+            .in_("serial", serials)
+            .execute()
+        )
+        return as_list(result)
+
+    def _meters_json(self, esco: str) -> str:
+        return self._meters(esco).json_meters
+
+    def _meters(self, esco: str) -> _Meters:
+        assert self.supabase is not None
+
+        # Treat empty string as None for filter; ensure lowercase
+        esco_filter = esco.lower() if esco else None
+
+        cache_key = esco_filter or ""
+        cached = self._meters_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self.supabase.rpc(
+            "get_meters_for_cli", {"esco_filter": esco_filter, "feeder_filter": None}
+        ).execute()
+
+        rows = as_list(result)
+        meters = _Meters(
+            _to_json(rows), [_set_fields(Meter(), row, METER_FIELDS) for row in rows]
+        )
+        self._meters_cache.put(cache_key, meters)
+        return meters
+
+    def _list_meters(self, request) -> List[Meter]:
+        """Meters matching a ListMetersRequest with its field mask applied."""
+        meters = self._meters(request.esco).meters
+        if request.name:
+            meters = [m for m in meters if m.name == request.name]
+        if request.serial:
+            meters = [m for m in meters if m.serial == request.serial]
+        return apply_field_mask(meters, request.fields)
+
     def GetInfo(self, request, context):
         if not self.supabase:
              context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
@@ -37,59 +287,233 @@ class EmliteInfoServiceServicer(InfoServiceServicer):
 
         serial = request.serial
         try:
-            # Registry Lookup
-            result = (
-                self.supabase.table("meter_registry")
-                .select("*")
-                .eq("serial", serial)
-                .execute()
-            )
-            if len(as_list(result)) == 0:
-                msg = f"meter {serial} not found"
-                # Emulate emop.py behavior: print to console (server logs) and raise/abort
-                logger.info(msg)
-                context.abort(grpc.StatusCode.NOT_FOUND, msg)
-                return GetInfoReply()
-
-            registry_rec = as_first_item(result)
-
-            # Shadow Lookup
-            result = (
-                self.supabase.table("meter_shadows")
-                .select("*")
-                .eq("id", registry_rec["id"])
-                .execute()
-            )
-            shadow_rec = as_first_item(result)
-
-            data = {"registry": registry_rec, "shadow": shadow_rec}
-            # Using default=str to handle dates/decimals if any
-            return GetInfoReply(json_data=json.dumps(data, indent=2, default=str))
-
+            json_data = self._info_json(serial)
         except Exception as e:
             logger.error(f"GetInfo failed for {serial}: {e}")
             logger.error(traceback.format_exception(e))
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return GetInfoReply()
 
+        if json_data is None:
+            msg = f"meter {serial} not found"
+            # Emulate emop.py behavior: print to console (server logs) and raise/abort
+            logger.info(msg)
+            context.abort(grpc.StatusCode.NOT_FOUND, msg)
+            return GetInfoReply()
+
+        return GetInfoReply(json_data=json_data)
+
+    def GetInfos(self, request, context):
+        if not self.supabase:
+            context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
+            return GetInfosReply()
+        if len(request.serials) > MAX_INFOS_SERIALS:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"at most {MAX_INFOS_SERIALS} serials per request",
+            )
+            return GetInfosReply()
+
+        try:
+            return GetInfosReply(json_data=self._infos_json(request.serials))
+        except Exception as e:
+            logger.error(f"GetInfos failed: {e}")
+            logger.error(traceback.format_exception(e))
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return GetInfosReply()
+
     def GetMeters(self, request, context):
         if not self.supabase:
              context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
              return GetMetersReply()
 
         try:
-            # Treat empty string as None for filter; ensure lowercase
-            esco_filter = request.esco.lower() if request.esco else None
-
-            result = self.supabase.rpc(
-                "get_meters_for_cli", {"esco_filter": esco_filter, "feeder_filter": None}
-            ).execute()
-
-            meters = as_list(result)
-            return GetMetersReply(json_meters=json.dumps(meters, indent=2, default=str))
+            return GetMetersReply(json_meters=self._meters_json(request.esco))
 
         except Exception as e:
             logger.error(f"GetMeters failed: {e}")
             logger.error(traceback.format_exception(e))
             context.abort(grpc.StatusCode.INTERNAL, str(e))
             return GetMetersReply()
+
+    def GetMeterInfo(self, request, context):
+        if not self.supabase:
+            context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
+            return MeterInfo()
+
+        serial = request.serial
+        try:
+            info = self._meter_info(serial, request.fields)
+        except InvalidFieldMask as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return MeterInfo()
+        except Exception as e:
+            logger.error(f"GetMeterInfo failed for {serial}: {e}")
+            logger.error(traceback.format_exception(e))
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return MeterInfo()
+
+        if info is None:
+            msg = f"meter {serial} not found"
+            logger.info(msg)
+            context.abort(grpc.StatusCode.NOT_FOUND, msg)
+            return MeterInfo()
+
+        return info
+
+    def ListMeters(self, request, context):
+        if not self.supabase:
+            context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
+            return ListMetersReply()
+
+        try:
+            return ListMetersReply(meters=self._list_meters(request))
+        except InvalidFieldMask as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return ListMetersReply()
+        except Exception as e:
+            logger.error(f"ListMeters failed: {e}")
+            logger.error(traceback.format_exception(e))
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return ListMetersReply()
+
+    def StreamMeters(self, request, context):
+        if not self.supabase:
+            context.abort(grpc.StatusCode.INTERNAL, "Supabase client not initialized")
+            return
+
+        try:
+            meters = self._list_meters(request)
+        except InvalidFieldMask as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return
+        except Exception as e:
+            logger.error(f"StreamMeters failed: {e}")
+            logger.error(traceback.format_exception(e))
+            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            return
+
+        for i in range(0, len(meters), METERS_PAGE_SIZE):
+            yield ListMetersReply(meters=meters[i : i + METERS_PAGE_SIZE])
+
+
+class AsyncEmliteInfoServiceServicer(EmliteInfoServiceServicer):
+    """
+    InfoService for the asyncio server. The supabase client is blocking so
+    queries run in worker threads, keeping the event loop free for meter
+    requests.
+    """
+
+    async def GetInfo(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+
+        serial = request.serial
+        try:
+            json_data = await asyncio.to_thread(self._info_json, serial)
+        except Exception as e:
+            logger.error(f"GetInfo failed for {serial}: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        if json_data is None:
+            msg = f"meter {serial} not found"
+            logger.info(msg)
+            await context.abort(grpc.StatusCode.NOT_FOUND, msg)
+
+        return GetInfoReply(json_data=json_data)
+
+    async def GetInfos(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+        if len(request.serials) > MAX_INFOS_SERIALS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"at most {MAX_INFOS_SERIALS} serials per request",
+            )
+
+        try:
+            json_data = await asyncio.to_thread(self._infos_json, request.serials)
+        except Exception as e:
+            logger.error(f"GetInfos failed: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        return GetInfosReply(json_data=json_data)
+
+    async def GetMeters(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+
+        try:
+            json_meters = await asyncio.to_thread(self._meters_json, request.esco)
+        except Exception as e:
+            logger.error(f"GetMeters failed: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        return GetMetersReply(json_meters=json_meters)
+
+    async def GetMeterInfo(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+
+        serial = request.serial
+        try:
+            info = await asyncio.to_thread(self._meter_info, serial, request.fields)
+        except InvalidFieldMask as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            logger.error(f"GetMeterInfo failed for {serial}: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        if info is None:
+            msg = f"meter {serial} not found"
+            logger.info(msg)
+            await context.abort(grpc.StatusCode.NOT_FOUND, msg)
+
+        return info
+
+    async def ListMeters(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+
+        try:
+            meters = await asyncio.to_thread(self._list_meters, request)
+        except InvalidFieldMask as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            logger.error(f"ListMeters failed: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        return ListMetersReply(meters=meters)
+
+    async def StreamMeters(self, request, context):
+        if not self.supabase:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Supabase client not initialized"
+            )
+
+        try:
+            meters = await asyncio.to_thread(self._list_meters, request)
+        except InvalidFieldMask as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except Exception as e:
+            logger.error(f"StreamMeters failed: {e}")
+            logger.error(traceback.format_exception(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        for i in range(0, len(meters), METERS_PAGE_SIZE):
+            yield ListMetersReply(meters=meters[i : i + METERS_PAGE_SIZE])
@@ -1,21 +1,74 @@
-
+import datetime
+import time
 
 import grpc
 from emop_frame_protocol.util import emop_encode_u3be  # type: ignore[import-untyped]
 
 from .generated.mediator_pb2 import (
+    GetMeterStatusReply,
     ReadElementReply,
+    ReadElementsReply,
     SendRawMessageReply,
     WriteElementReply,
 )
 from .generated.mediator_pb2_grpc import EmliteMediatorServiceServicer
-from .meter_registry import MeterRegistry, acquire_timeout, LOCK_TIMEOUT_SECONDS
+from .meter_queue import (
+    DeadlineExceeded,
+    MeterQueueRejected,
+    MeterQueueTimeout,
+    Priority,
+    RequestCancelled,
+    priority_from_metadata,
+)
+from .meter_registry import MeterRegistry, LOCK_TIMEOUT_SECONDS
+from .profile_log_stream import walk_profile_log
+from .response_cache import cache_bypassed, is_read_data_field
 from tenacity import RetryError
 
 from simt_emlite.util.logging import get_logger
 
 logger = get_logger(__name__, __file__)
 
+# a request that ended before anything was sent to the meter
+UNSERVED_ERRORS = (MeterQueueRejected, MeterQueueTimeout, RequestCancelled)
+
+
+def request_priority(context, default: Priority) -> Priority:
+    return priority_from_metadata(context.invocation_metadata(), default)
+
+
+def request_deadline(context) -> float | None:
+    """time.monotonic() deadline of the client call, None if it has none.
+
+    Passed to the meter api so retries stop once the client has given up.
+    """
+    remaining = context.time_remaining()
+    if remaining is None:
+        return None
+    return time.monotonic() + remaining
+
+
+def ensure_active(context) -> None:
+    """Raise DeadlineExceeded if the client's deadline passed or
+    RequestCancelled if it cancelled.
+
+    Checked before each request to the meter so work nobody is waiting for
+    is not started.
+    """
+    remaining = context.time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("deadline passed before the request was sent")
+    if not context.is_active():
+        raise RequestCancelled()
+
+
+def cached_responses(context, meter, object_ids) -> list[bytes | None]:
+    """Cached response per object id, all None if the call bypasses the cache."""
+    if cache_bypassed(context.invocation_metadata()):
+        return [None for _ in object_ids]
+    return [meter.cache.get(object_id) for object_id in object_ids]
+
+
 class EmliteMediatorServicer(EmliteMediatorServiceServicer):
     def __init__(self, registry: MeterRegistry):
         self.registry = registry
@@ -35,6 +88,67 @@ class EmliteMediatorServicer(EmliteMediatorServiceServicer):
 
         return meter
 
+    def _check_breaker(self, context, meter) -> bool:
+        """Fail fast with FAILED_PRECONDITION if the meter's breaker is open."""
+        if meter.breaker.allow_request():
+            return True
+        remaining = meter.breaker.open_seconds_remaining()
+        logger.debug(f"circuit open for {meter.serial} - rejecting request")
+        context.abort(
+            grpc.StatusCode.FAILED_PRECONDITION,
+            f"circuit open for meter {meter.serial}, retry in {remaining:.0f}s",
+        )
+        return False
+
+    def _abort_unserved(self, context, meter, e: Exception) -> None:
+        """Abort a request that ended before reaching the meter."""
+        if isinstance(e, RequestCancelled):
+            logger.info(f"Request for meter {meter.serial} cancelled by the client")
+            context.abort(grpc.StatusCode.CANCELLED, "Request cancelled")
+        elif isinstance(e, DeadlineExceeded):
+            logger.warning(f"Deadline exceeded for meter {meter.serial}: {e}")
+            context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+        elif isinstance(e, MeterQueueRejected):
+            logger.warning(f"Rejected request for meter {meter.serial}: {e}")
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        else:
+            logger.warning(f"Timeout waiting for turn on meter {meter.serial}")
+            context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f"Meter {meter.serial} is busy (timeout)",
+            )
+
+    def _abort_failed(self, context, meter, method: str, e: Exception) -> None:
+        if isinstance(e, RetryError):
+            logger.error(f"{method} failed for {meter.serial}: max attempts reached")
+            context.abort(grpc.StatusCode.INTERNAL, "failed to connect after retries")
+        else:
+            logger.error(f"{method} failed for {meter.serial}: {e}")
+            context.abort(grpc.StatusCode.INTERNAL, "Meter communication failed")
+
+    def _read_element(
+        self, context, meter, object_id: int, priority, deadline
+    ) -> bytes:
+        """Read one element from the meter. Shared by coalesced callers."""
+        # Wait for our turn on the meter
+        with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+            # still wanted by any callers that joined if ours has gone
+            if meter.flights.shared(("readElement", object_id)) == 0:
+                ensure_active(context)
+            meter.space_out_requests(deadline)
+            logger.debug(f"readElement {object_id} for {meter.serial}")
+            try:
+                with meter.spaced_request():
+                    rsp_payload = meter.api.read_element(
+                        emop_encode_u3be(object_id), deadline
+                    )
+            except Exception:
+                meter.breaker.record_failure()
+                raise
+            meter.breaker.record_success()
+            meter.cache.put(object_id, rsp_payload)
+            return rsp_payload
+
     def readElement(self, request, context):
         try:
              meter = self._get_target_meter(context, request)
@@ -42,35 +156,157 @@ class EmliteMediatorServicer(EmliteMediatorServiceServicer):
              # _get_target_meter already calls context.abort
              return ReadElementReply()
 
-        # Acquire per-meter lock
+        cached = cached_responses(context, meter, [request.objectId])[0]
+        if cached is not None:
+            logger.debug(f"readElement {request.objectId} for {meter.serial} cached")
+            return ReadElementReply(response=cached)
+
+        if not self._check_breaker(context, meter):
+            return ReadElementReply()
+
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
+
+        # identical reads already in flight share the one meter request
         try:
-            with acquire_timeout(meter.lock, timeout=LOCK_TIMEOUT_SECONDS):
-                meter.space_out_requests()
+            rsp_payload = meter.flights.do(
+                ("readElement", request.objectId),
+                lambda: self._read_element(
+                    context, meter, request.objectId, priority, deadline
+                ),
+            )
+            return ReadElementReply(response=rsp_payload)
+        except UNSERVED_ERRORS as e:
+            self._abort_unserved(context, meter, e)
+        except Exception as e:
+            self._abort_failed(context, meter, "readElement", e)
+        return ReadElementReply()
 
-                object_id_bytes = emop_encode_u3be(request.objectId)
-                logger.debug(f"readElement {request.objectId} for {meter.serial}")
+    def readElements(self, request, context):
+        """
+        Read a list of elements in one turn on the meter, streaming a reply
+        per element. A failed element is reported in its reply and counted
+        against the meter's breaker like a failed readElement, and the rest
+        are still read - except after a RetryError (no connection after all
+        retries) which aborts the stream.
+        """
+        try:
+             meter = self._get_target_meter(context, request)
+        except Exception:
+             return
+
+        cached = cached_responses(context, meter, request.objectIds)
+        if all(rsp is not None for rsp in cached):
+            for object_id, rsp in zip(request.objectIds, cached):
+                yield ReadElementsReply(objectId=object_id, response=rsp)
+            return
+
+        if not self._check_breaker(context, meter):
+            return
+
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
 
+        try:
+            with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                logger.debug(
+                    f"readElements {len(request.objectIds)} elements for {meter.serial}"
+                )
+                for object_id, cached_rsp in zip(request.objectIds, cached):
+                    if cached_rsp is not None:
+                        yield ReadElementsReply(objectId=object_id, response=cached_rsp)
+                        continue
+                    ensure_active(context)
+                    meter.space_out_requests(deadline)
+                    try:
+                        with meter.spaced_request():
+                            rsp_payload = meter.api.read_element(
+                                emop_encode_u3be(object_id), deadline
+                            )
+                        meter.breaker.record_success()
+                        meter.cache.put(object_id, rsp_payload)
+                        yield ReadElementsReply(objectId=object_id, response=rsp_payload)
+                    except RetryError:
+                        meter.breaker.record_failure()
+                        logger.error(
+                            f"readElements failed for {meter.serial}: max attempts reached"
+                        )
+                        context.abort(
+                            grpc.StatusCode.INTERNAL, "failed to connect after retries"
+                        )
+                        return
+                    except Exception as e:
+                        meter.breaker.record_failure()
+                        logger.error(
+                            f"readElements {object_id} failed for {meter.serial}: {e}"
+                        )
+                        yield ReadElementsReply(
+                            objectId=object_id, error=f"{type(e).__name__}: {e}"
+                        )
+
+        except UNSERVED_ERRORS as e:
+            self._abort_unserved(context, meter, e)
+
+    def streamProfileLog(self, request, context):
+        """
+        Read a profile log range in one turn on the meter, streaming the
+        decoded records of each meter response as it arrives.
+        """
+        try:
+             meter = self._get_target_meter(context, request)
+        except Exception:
+             return
+
+        if not self._check_breaker(context, meter):
+            return
+
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.BULK)
+
+        start = datetime.datetime.fromtimestamp(request.startTime, datetime.timezone.utc)
+        end = datetime.datetime.fromtimestamp(request.endTime, datetime.timezone.utc)
+
+        def send_message(data_field: bytes) -> bytes:
+            ensure_active(context)
+            meter.space_out_requests(deadline)
+            with meter.spaced_request():
+                return meter.api.send_message(data_field, deadline)
+
+        try:
+            with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                logger.debug(
+                    f"streamProfileLog {request.log} {start} to {end} for {meter.serial}"
+                )
                 try:
-                    rsp_payload = meter.api.read_element(object_id_bytes)
-                    meter.mark_used()
-                    return ReadElementReply(response=rsp_payload)
+                    for reply in walk_profile_log(
+                        send_message, request.log, start, end, request.isTwinElement
+                    ):
+                        meter.breaker.record_success()
+                        yield reply
+                except UNSERVED_ERRORS:
+                    raise
+                except ValueError as e:
+                    context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+                    return
                 except RetryError:
+                    meter.breaker.record_failure()
                     logger.error(
-                        f"readElement failed for {meter.serial}: max attempts reached"
+                        f"streamProfileLog failed for {meter.serial}: max attempts reached"
                     )
                     context.abort(
                         grpc.StatusCode.INTERNAL, "failed to connect after retries"
                     )
-                    return ReadElementReply()
+                    return
                 except Exception as e:
-                    logger.error(f"readElement failed for {meter.serial}: {e}")
-                    context.abort(grpc.StatusCode.INTERNAL, "Meter communication failed")
-                    return ReadElementReply()
+                    meter.breaker.record_failure()
+                    logger.error(f"streamProfileLog failed for {meter.serial}: {e}")
+                    context.abort(
+                        grpc.StatusCode.INTERNAL, f"Meter communication failed: {e!r}"
+                    )
+                    return
 
-        except TimeoutError:
-             logger.warning(f"Timeout waiting for lock on meter {meter.serial}")
-             context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"Meter {meter.serial} is busy (timeout)")
-             return ReadElementReply()
+        except UNSERVED_ERRORS as e:
+            self._abort_unserved(context, meter, e)
 
     def writeElement(self, request, context):
         try:
@@ -78,18 +314,32 @@ class EmliteMediatorServicer(EmliteMediatorServiceServicer):
         except Exception:
              return WriteElementReply()
 
+        if not self._check_breaker(context, meter):
+            return WriteElementReply()
+
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.WRITE)
+
         try:
-            with acquire_timeout(meter.lock, timeout=LOCK_TIMEOUT_SECONDS):
-                meter.space_out_requests()
+            with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+                ensure_active(context)
+                # cleared at the start of our turn so requests queued behind
+                # the write miss and read the new value
+                meter.cache.invalidate()
+                meter.space_out_requests(deadline)
 
                 object_id_bytes = emop_encode_u3be(request.objectId)
                 logger.debug(f"writeElement {request.objectId} for {meter.serial}")
 
                 try:
-                    meter.api.write_element(object_id_bytes, request.payload)
-                    meter.mark_used()
+                    with meter.spaced_request():
+                        meter.api.write_element(
+                            object_id_bytes, request.payload, deadline
+                        )
+                    meter.breaker.record_success()
                     return WriteElementReply()
                 except RetryError:
+                    meter.breaker.record_failure()
                     logger.error(
                         f"writeElement failed for {meter.serial}: max attempts reached"
                     )
@@ -98,13 +348,33 @@ class EmliteMediatorServicer(EmliteMediatorServiceServicer):
                     )
                     return WriteElementReply()
                 except Exception as e:
+                    meter.breaker.record_failure()
                     logger.error(f"writeElement failed for {meter.serial}: {e}")
                     context.abort(grpc.StatusCode.INTERNAL, "Meter communication failed")
                     return WriteElementReply()
 
-        except TimeoutError:
-             context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"Meter {meter.serial} is busy (timeout)")
-             return WriteElementReply()
+        except UNSERVED_ERRORS as e:
+            self._abort_unserved(context, meter, e)
+            return WriteElementReply()
+
+    def _send_raw_message(
+        self, context, meter, data_field: bytes, priority, deadline
+    ) -> bytes:
+        with meter.queue.acquire(priority, LOCK_TIMEOUT_SECONDS, deadline):
+            if meter.flights.shared(("sendRawMessage", data_field)) == 0:
+                ensure_active(context)
+            if not is_read_data_field(data_field):
+                meter.cache.invalidate()
+            meter.space_out_requests(deadline)
+            logger.debug(f"sendRawMessage for {meter.serial}")
+            try:
+                with meter.spaced_request():
+                    rsp_payload = meter.api.send_message(data_field, deadline)
+            except Exception:
+                meter.breaker.record_failure()
+                raise
+            meter.breaker.record_success()
+            return rsp_payload
 
     def sendRawMessage(self, request, context):
         try:
@@ -112,28 +382,45 @@ class EmliteMediatorServicer(EmliteMediatorServiceServicer):
         except Exception:
              return SendRawMessageReply()
 
+        if not self._check_breaker(context, meter):
+            return SendRawMessageReply()
+
+        deadline = request_deadline(context)
+        priority = request_priority(context, Priority.SYNC)
+
+        def send() -> bytes:
+            return self._send_raw_message(
+                context, meter, bytes(request.dataField), priority, deadline
+            )
+
         try:
-            with acquire_timeout(meter.lock, timeout=LOCK_TIMEOUT_SECONDS):
-                meter.space_out_requests()
+            if is_read_data_field(request.dataField):
+                # no side effects - identical requests in flight can share
+                rsp_payload = meter.flights.do(
+                    ("sendRawMessage", bytes(request.dataField)), send
+                )
+            else:
+                rsp_payload = send()
+            return SendRawMessageReply(response=rsp_payload)
+        except UNSERVED_ERRORS as e:
+            self._abort_unserved(context, meter, e)
+        except Exception as e:
+            self._abort_failed(context, meter, "sendRawMessage", e)
+        return SendRawMessageReply()
 
-                logger.debug(f"sendRawMessage for {meter.serial}")
-                try:
-                    rsp_payload = meter.api.send_message(request.dataField)
-                    meter.mark_used()
-                    return SendRawMessageReply(response=rsp_payload)
-                except RetryError:
-                    logger.error(
-                        f"sendRawMessage failed for {meter.serial}: max attempts reached"
-                    )
-                    context.abort(
-                        grpc.StatusCode.INTERNAL, "failed to connect after retries"
-                    )
-                    return SendRawMessageReply()
-                except Exception as e:
-                    logger.error(f"sendRawMessage failed for {meter.serial}: {e}")
-                    context.abort(grpc.StatusCode.INTERNAL, "Meter communication failed")
-                    return SendRawMessageReply()
+    def getMeterStatus(self, request, context):
+        try:
+             meter = self._get_target_meter(context, request)
+        except Exception:
+             return GetMeterStatusReply()
 
-        except TimeoutError:
-             context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"Meter {meter.serial} is busy (timeout)")
-             return SendRawMessageReply()
+        # not meter.cache - a status call shouldn't allocate the cache
+        cache = meter._cache
+        return GetMeterStatusReply(
+            serial=meter.serial,
+            breakerState=meter.breaker.state.value,
+            consecutiveFailures=meter.breaker.consecutive_failures,
+            openSecondsRemaining=meter.breaker.open_seconds_remaining(),
+            cacheHits=cache.hits if cache is not None else 0,
+            cacheMisses=cache.misses if cache is not None else 0,
+        )
@@ -0,0 +1,324 @@
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Iterator, List, Tuple
+
+from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter, Histogram
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Per meter request queue.
+
+    Only one request may talk to a meter at a time. Waiting requests are
+    served by priority lane and first come first served within a lane, so an
+    interactive token push is not stuck behind a backlog of scheduled sync
+    reads.
+
+    Clients choose a lane with the PRIORITY_METADATA_KEY gRPC metadata
+    header. Requests are rejected up front when the queue is full or when
+    the estimated wait (queue position x average time per request) would
+    run past the caller's deadline.
+"""
+
+# gRPC metadata header a client sets to one of the Priority names (lowercase)
+PRIORITY_METADATA_KEY = "x-emlite-priority"
+
+MAX_QUEUE_DEPTH = int(os.environ.get("METER_MAX_QUEUE_DEPTH", "50"))
+
+# initial estimate of how long a request holds the meter, refined with an
+# exponentially weighted moving average of observed hold times
+INITIAL_SERVICE_SECONDS = 5.0
+SERVICE_TIME_EWMA_WEIGHT = 0.2
+
+QUEUE_WAIT_SECONDS = Histogram(
+    "mediator_queue_wait_seconds",
+    "Time requests waited for their turn on a meter, by priority lane",
+    ["priority"],
+)
+# per meter as counters - a histogram per meter is too many series
+METER_QUEUE_WAIT_SECONDS = Counter(
+    "mediator_meter_queue_wait_seconds_total",
+    "Total time requests waited for their turn on each meter",
+    ["serial"],
+)
+METER_QUEUE_TURNS = Counter(
+    "mediator_meter_queue_turns_total",
+    "Requests served by each meter queue",
+    ["serial"],
+)
+
+
+class Priority(IntEnum):
+    # lower value is served first
+    WRITE = 0
+    INTERACTIVE = 1
+    SYNC = 2
+    BULK = 3
+
+
+def priority_from_metadata(metadata, default: Priority) -> Priority:
+    """Priority named in the request metadata, default if absent or unknown."""
+    for key, value in metadata or ():
+        if key == PRIORITY_METADATA_KEY:
+            try:
+                return Priority[str(value).upper()]
+            except KeyError:
+                logger.warning(f"unknown request priority '{value}'")
+    return default
+
+
+class MeterQueueRejected(Exception):
+    """Request refused without waiting (queue full or deadline unreachable)."""
+
+
+class MeterQueueTimeout(TimeoutError):
+    """Not served within the acquire timeout."""
+
+
+class DeadlineExceeded(MeterQueueRejected):
+    """The request can't be served before the caller's deadline."""
+
+
+class RequestCancelled(Exception):
+    """The caller went away before the request reached the meter."""
+
+
+class MeterQueueBase:
+    """
+    Waiting list and service time estimate shared by MeterQueue and
+    AsyncMeterQueue. Subclasses supply the locking and waiting.
+    """
+
+    def __init__(
+        self,
+        serial: str,
+        max_depth: int = MAX_QUEUE_DEPTH,
+    ) -> None:
+        self.serial = serial
+        self.max_depth = max_depth
+        self.avg_service_seconds = INITIAL_SERVICE_SECONDS
+        self._busy = False
+        self._waiting: List[Tuple[int, int]] = []  # heap of (priority, ticket)
+        self._tickets = itertools.count()
+
+    @property
+    def depth(self) -> int:
+        return len(self._waiting)
+
+    def estimated_wait_seconds(self, priority: Priority) -> float:
+        """Estimate for a new request of this priority. Call holding the lock."""
+        ahead = sum(1 for p, _ in self._waiting if p <= priority)
+        if self._busy:
+            ahead += 1
+        return ahead * self.avg_service_seconds
+
+    def _enqueue(
+        self, priority: Priority, now: float, deadline: float | None
+    ) -> Tuple[int, int]:
+        """Admit a request to the waiting list or raise MeterQueueRejected."""
+        if len(self._waiting) >= self.max_depth:
+            raise MeterQueueRejected(
+                f"queue full ({len(self._waiting)} waiting) for meter {self.serial}"
+            )
+        estimate = self.estimated_wait_seconds(priority)
+        if deadline is not None and now + estimate > deadline:
+            raise DeadlineExceeded(
+                f"estimated wait {estimate:.0f}s for meter {self.serial} "
+                "exceeds the request deadline"
+            )
+
+        entry = (int(priority), next(self._tickets))
+        heapq.heappush(self._waiting, entry)
+        return entry
+
+    def _wait_expired(self, deadline: float | None) -> Exception:
+        """Error for a request whose wait ran out, by which limit it hit."""
+        if deadline is not None and time.monotonic() >= deadline:
+            return DeadlineExceeded(f"deadline passed waiting for meter {self.serial}")
+        return MeterQueueTimeout(f"timed out waiting for meter {self.serial}")
+
+    def _is_turn(self, entry: Tuple[int, int]) -> bool:
+        return not self._busy and self._waiting[0] == entry
+
+    def _take_turn(self) -> None:
+        heapq.heappop(self._waiting)
+        self._busy = True
+
+    def _abandon(self, entry: Tuple[int, int]) -> None:
+        self._waiting.remove(entry)
+        heapq.heapify(self._waiting)
+
+    def _record_wait(self, priority: Priority, waited_seconds: float) -> None:
+        QUEUE_WAIT_SECONDS.observe(waited_seconds, priority=priority.name.lower())
+        METER_QUEUE_WAIT_SECONDS.inc(waited_seconds, serial=self.serial)
+        METER_QUEUE_TURNS.inc(serial=self.serial)
+
+    def _record_service(self, held_seconds: float) -> None:
+        self.avg_service_seconds += SERVICE_TIME_EWMA_WEIGHT * (
+            held_seconds - self.avg_service_seconds
+        )
+        self._busy = False
+
+
+class MeterQueue(MeterQueueBase):
+    def __init__(
+        self,
+        serial: str,
+        max_depth: int = MAX_QUEUE_DEPTH,
+    ) -> None:
+        super().__init__(serial, max_depth)
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def acquire(
+        self,
+        priority: Priority,
+        timeout: float,
+        deadline: float | None = None,
+    ) -> Iterator[None]:
+        """
+        Wait for exclusive use of the meter.
+
+        Args:
+            priority: lane to queue in
+            timeout: maximum seconds to wait, TimeoutError after this
+            deadline: time.monotonic() by which the caller needs a result,
+                DeadlineExceeded if the estimated wait would pass it
+
+        Raises:
+            MeterQueueRejected: queue full
+            DeadlineExceeded: deadline passed or can't be met
+            MeterQueueTimeout: not served within timeout
+        """
+        queued = time.monotonic()
+        self._wait_turn(priority, timeout, deadline)
+        started = time.monotonic()
+        self._record_wait(priority, started - queued)
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    def try_acquire(self) -> bool:
+        """Take the meter only if idle with nobody waiting. Pair with release()."""
+        with self._cond:
+            if self._busy or self._waiting:
+                return False
+            self._busy = True
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._busy = False
+            self._cond.notify_all()
+
+    def _wait_turn(
+        self, priority: Priority, timeout: float, deadline: float | None
+    ) -> None:
+        now = time.monotonic()
+        with self._cond:
+            entry = self._enqueue(priority, now, deadline)
+            wait_until = now + timeout
+            if deadline is not None:
+                wait_until = min(wait_until, deadline)
+
+            while not self._is_turn(entry):
+                remaining = wait_until - time.monotonic()
+                if remaining <= 0:
+                    self._abandon(entry)
+                    # the head may have changed, let the new head check
+                    self._cond.notify_all()
+                    raise self._wait_expired(deadline)
+                self._cond.wait(remaining)
+
+            self._take_turn()
+
+    def _release(self, held_seconds: float) -> None:
+        with self._cond:
+            self._record_service(held_seconds)
+            self._cond.notify_all()
+
+
+class AsyncMeterQueue(MeterQueueBase):
+    """
+    MeterQueue for the asyncio server. Same lanes, limits and estimates but
+    waiting requests are suspended coroutines rather than blocked threads.
+    Use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        serial: str,
+        max_depth: int = MAX_QUEUE_DEPTH,
+    ) -> None:
+        super().__init__(serial, max_depth)
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        priority: Priority,
+        timeout: float,
+        deadline: float | None = None,
+    ) -> AsyncIterator[None]:
+        """See MeterQueue.acquire."""
+        queued = time.monotonic()
+        await self._wait_turn(priority, timeout, deadline)
+        started = time.monotonic()
+        self._record_wait(priority, started - queued)
+        try:
+            yield
+        finally:
+            await self._release(time.monotonic() - started)
+
+    def try_acquire(self) -> bool:
+        """Take the meter only if idle with nobody waiting. Pair with release()."""
+        if self._busy or self._waiting:
+            return False
+        self._busy = True
+        return True
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._busy = False
+            self._cond.notify_all()
+
+    async def _wait_turn(
+        self, priority: Priority, timeout: float, deadline: float | None
+    ) -> None:
+        now = time.monotonic()
+        async with self._cond:
+            entry = self._enqueue(priority, now, deadline)
+            wait_until = now + timeout
+            if deadline is not None:
+                wait_until = min(wait_until, deadline)
+
+            try:
+                while not self._is_turn(entry):
+                    remaining = wait_until - time.monotonic()
+                    if remaining <= 0:
+                        raise self._wait_expired(deadline)
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), remaining)
+                    except TimeoutError:
+                        pass  # remaining is now <= 0, raised above
+            except BaseException:
+                # timed out or cancelled - give up our place and let the new
+                # head check
+                self._abandon(entry)
+                self._cond.notify_all()
+                raise
+
+            self._take_turn()
+
+    async def _release(self, held_seconds: float) -> None:
+        async with self._cond:
+            self._record_service(held_seconds)
+            self._cond.notify_all()
@@ -1,78 +1,492 @@
+import asyncio
+import json
+import os
+import sys
 import threading
 import time
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Generic, Iterator, Mapping, Optional, TypeVar
 
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum  # type: ignore[import-untyped]
+from emop_frame_protocol.util import emop_encode_u3be  # type: ignore[import-untyped]
+
+from simt_emlite.emlite.async_emlite_api import AsyncEmliteAPI
 from simt_emlite.emlite.emlite_api import EmliteAPI
-from simt_emlite.util.config import load_config
+from simt_emlite.emlite.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from simt_emlite.util.config import CONFIG_DIR, load_config
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Gauge, Histogram
 from simt_emlite.util.supabase import as_list, supa_client
 
+from .circuit_breaker import CircuitBreaker
+from .meter_queue import AsyncMeterQueue, DeadlineExceeded, MeterQueue
+from .request_spacing import RequestSpacing
+from .response_cache import ResponseCache
+from .single_flight import AsyncSingleFlight, SingleFlight
+
 logger = get_logger(__name__, __file__)
 
 # Constants
-MINIMUM_TIME_BETWEEN_REQUESTS_SECONDS = 2
-REGISTRY_REFRESH_INTERVAL_SECONDS = 300
+# background refresh reads rows changed since the previous refresh, with a
+# full read every REGISTRY_FULL_REFRESH_INTERVAL_SECONDS
+REGISTRY_REFRESH_INTERVAL_SECONDS = float(
+    os.environ.get("REGISTRY_REFRESH_INTERVAL_SECONDS", "60")
+)
+REGISTRY_FULL_REFRESH_INTERVAL_SECONDS = float(
+    os.environ.get("REGISTRY_FULL_REFRESH_INTERVAL_SECONDS", "3600")
+)
+# meters saved after each refresh and loaded at startup
+REGISTRY_SNAPSHOT_FILE = os.environ.get(
+    "REGISTRY_SNAPSHOT_FILE", os.path.join(CONFIG_DIR, "mediator-registry.json")
+)
+SNAPSHOT_VERSION = 1
 LOCK_TIMEOUT_SECONDS = 60.0
+# how often open circuit breakers are checked for a due half open probe
+BREAKER_PROBE_INTERVAL_SECONDS = float(
+    os.environ.get("BREAKER_PROBE_INTERVAL_SECONDS", "30")
+)
+# most time a probe may hold the meter (and the probe loop) - a dead meter
+# otherwise takes the whole retry policy
+BREAKER_PROBE_TIMEOUT_SECONDS = float(
+    os.environ.get("BREAKER_PROBE_TIMEOUT_SECONDS", "15")
+)
+
+# keep one long lived connection per meter and reuse it for consecutive
+# requests instead of connecting (and doing the SOCKS handshake) every time
+PERSISTENT_METER_SESSIONS = (
+    os.environ.get("PERSISTENT_METER_SESSIONS", "true").lower() == "true"
+)
+# meter apis (and their sessions) unused this long are closed and dropped
+METER_SESSION_EVICT_SECONDS = float(
+    os.environ.get("METER_SESSION_EVICT_SECONDS", "300")
+)
 
+REGISTRY_REFRESH_SECONDS = Histogram(
+    "mediator_registry_refresh_seconds",
+    "Time to refresh the meter registry from the database",
+    ["full"],
+)
+REGISTRY_METERS = Gauge("mediator_registry_meters", "Meters in the registry")
+METER_QUEUE_DEPTH = Gauge(
+    "mediator_meter_queue_depth",
+    "Requests waiting for each meter (meters used since startup)",
+    ["serial"],
+)
+METER_REQUEST_SPACING = Gauge(
+    "mediator_meter_request_spacing_seconds",
+    "Learned gap between requests to each meter (meters used since startup)",
+    ["serial"],
+)
 
-@contextmanager
-def acquire_timeout(lock, timeout):
-    result = lock.acquire(timeout=timeout)
-    if not result:
-        raise TimeoutError("Could not acquire lock")
-    try:
-        yield
-    finally:
-        lock.release()
+# guards lazy creation of per meter state shared between threads - two
+# queues for one meter would let two requests at it at once
+_lazy_init_lock = threading.Lock()
 
 
-class MeterContext:
+class MeterContextBase:
     """
-    Holds the state for a specific physical meter.
+    State for a specific physical meter shared by the threaded and asyncio
+    servers. Subclasses add the meter api and request queue.
+
+    A registry holds a context for every meter in the fleet though most are
+    rarely talked to, so contexts are slotted and the api, queue, in flight
+    calls and response cache are only created on first use.
     """
 
+    __slots__ = (
+        "serial",
+        "host",
+        "port",
+        "last_request_datetime",
+        "breaker",
+        "esco",
+        "hardware",
+        "_api",
+        "_pending_host",
+        "_queue",
+        "_flights",
+        "_cache",
+        "_spacing",
+    )
+
     def __init__(self, serial: str, host: str, port: int = 8080):
         self.serial = serial
         self.host = host
         self.port = port
-        self.api = EmliteAPI(host, port)
-        # THE KEY COMPONENT: A lock restricted to this specific meter instance
-        self.lock = threading.Lock()
         self.last_request_datetime: Optional[datetime] = None
+        self.breaker = CircuitBreaker(serial)
+        # from the registry row, None until known
+        self.esco: Optional[str] = None
+        self.hardware: Optional[str] = None
+        self._api: Any = None
+        # new address from the registry waiting for the meter to be free
+        self._pending_host: Optional[str] = None
+        self._queue: Any = None
+        self._flights: Any = None
+        self._cache: Optional[ResponseCache] = None
+        self._spacing: Optional[RequestSpacing] = None
+
+    @property
+    def cache(self) -> ResponseCache:
+        if self._cache is None:
+            with _lazy_init_lock:
+                if self._cache is None:
+                    self._cache = ResponseCache(self.serial)
+        return self._cache
+
+    @property
+    def spacing(self) -> RequestSpacing:
+        if self._spacing is None:
+            with _lazy_init_lock:
+                if self._spacing is None:
+                    self._spacing = RequestSpacing()
+        return self._spacing
 
-    def space_out_requests(self) -> None:
+    def _retry_policy(self) -> RetryPolicy:
+        # refusals seen while retrying widen this meter's request spacing
+        return RetryPolicy(on_retry=self.spacing.on_retry)
+
+    def set_host(self, host: str) -> None:
         """
-        Ensure we don't spam the specific meter faster than allowed.
-        Must be called while holding self.lock.
+        Meter has a new address. A request may be using the session to the
+        old one so the change is made by apply_host_change() once the meter
+        is free.
         """
-        if self.last_request_datetime is None:
-            return
+        self._pending_host = None if host == self.host else host
+
+    @property
+    def next_host(self) -> str:
+        """Address the next session will connect to."""
+        return self._pending_host or self.host
+
+    def host_change_pending(self) -> bool:
+        return self._pending_host is not None
 
-        next_allowed = self.last_request_datetime + timedelta(
-            seconds=MINIMUM_TIME_BETWEEN_REQUESTS_SECONDS
+    def _take_host_change(self) -> Any:
+        """
+        Switch to the pending address, returning the api of the old session
+        for the caller to close (None if there wasn't one). Must be called
+        while holding the meter via self.queue.
+        """
+        if self._pending_host is None:
+            return None
+        logger.info(
+            "meter address changed",
+            serial=self.serial,
+            old_host=self.host,
+            new_host=self._pending_host,
         )
-        if datetime.now() < next_allowed:
-            wait_time = (next_allowed - datetime.now()).total_seconds()
-            if wait_time > 0:
-                time.sleep(wait_time)
+        api = self._api
+        self.host = self._pending_host
+        self._pending_host = None
+        self._api = None
+        return api
+
+    def session_idle(self) -> bool:
+        """Has an open api not been used for METER_SESSION_EVICT_SECONDS?"""
+        return (
+            self._api is not None
+            and self.last_request_datetime is not None
+            and datetime.now() - self.last_request_datetime
+            > timedelta(seconds=METER_SESSION_EVICT_SECONDS)
+        )
+
+    def _seconds_until_next_request(self, deadline: Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next request may go to the meter.
+
+        Raises:
+            DeadlineExceeded: if after waiting there would not be time left
+                before deadline (time.monotonic()) for a request attempt
+        """
+        wait_time = 0.0
+        if self.last_request_datetime is not None:
+            next_allowed = self.last_request_datetime + timedelta(
+                seconds=self.spacing.gap_seconds
+            )
+            wait_time = max(0.0, (next_allowed - datetime.now()).total_seconds())
+
+        if deadline is not None and (
+            time.monotonic() + wait_time + DEFAULT_RETRY_POLICY.min_attempt_seconds
+            > deadline
+        ):
+            raise DeadlineExceeded(
+                f"no time left before the deadline for a request to meter {self.serial}"
+            )
+        return wait_time
 
     def mark_used(self) -> None:
+        """A request went to the meter - the next one is spaced from now."""
         self.last_request_datetime = datetime.now()
 
+    @contextmanager
+    def spaced_request(self) -> Iterator[None]:
+        """
+        Wrap one request to the meter. The next request is spaced from the
+        end of this one whatever its outcome, so a gap widened by refusals
+        applies straight away. Only a success narrows the gap.
+        """
+        try:
+            yield
+        except BaseException:
+            self.spacing.record_failed()
+            raise
+        else:
+            self.spacing.record_done()
+        finally:
+            self.mark_used()
+
+
+class MeterContext(MeterContextBase):
+    """
+    Holds the state for a specific physical meter.
+    """
+
+    __slots__ = ()
+
+    @property
+    def api(self) -> EmliteAPI:
+        # only used while holding the queue so no lock needed
+        if self._api is None:
+            self._api = EmliteAPI(
+                self.host,
+                self.port,
+                persistent=PERSISTENT_METER_SESSIONS,
+                retry_policy=self._retry_policy(),
+            )
+        return self._api
+
+    @api.setter
+    def api(self, api: EmliteAPI) -> None:
+        self._api = api
+
+    @property
+    def queue(self) -> MeterQueue:
+        # THE KEY COMPONENT: one request at a time for this specific meter,
+        # waiting requests served by priority lane then arrival order
+        if self._queue is None:
+            with _lazy_init_lock:
+                if self._queue is None:
+                    self._queue = MeterQueue(self.serial)
+        return self._queue
+
+    @property
+    def flights(self) -> SingleFlight:
+        # identical reads in flight share one meter request
+        if self._flights is None:
+            with _lazy_init_lock:
+                if self._flights is None:
+                    self._flights = SingleFlight()
+        return self._flights
+
+    def space_out_requests(self, deadline: Optional[float] = None) -> None:
+        """
+        Ensure we don't spam the specific meter faster than allowed.
+        Must be called while holding the meter via self.queue.
+
+        Raises:
+            DeadlineExceeded: the request could not be made before deadline
+        """
+        wait_time = self._seconds_until_next_request(deadline)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def probe(self) -> None:
+        """
+        Half open probe of an open breaker: read the meter serial, within
+        BREAKER_PROBE_TIMEOUT_SECONDS, and record the outcome. Skipped if the
+        meter is busy or has requests waiting (they will record their own
+        outcome) or the breaker is not due.
+        """
+        if not self.queue.try_acquire():
+            return
+        try:
+            if not self.breaker.allow_request():
+                return
+            deadline = time.monotonic() + BREAKER_PROBE_TIMEOUT_SECONDS
+            self.space_out_requests(deadline)
+            try:
+                with self.spaced_request():
+                    self.api.read_element(
+                        emop_encode_u3be(ObjectIdEnum.serial.value), deadline
+                    )
+                self.breaker.record_success()
+            except Exception as e:
+                logger.info("breaker probe failed", serial=self.serial, error=str(e))
+                self.breaker.record_failure()
+        finally:
+            self.queue.release()
+
+    def set_host(self, host: str) -> None:
+        """See MeterContextBase.set_host - applied now if the meter is free."""
+        super().set_host(host)
+        self.apply_host_change()
+
+    def apply_host_change(self) -> None:
+        """
+        Close the session to the old address and connect to the new one
+        from now on. Skipped if the meter is in use, the probe loop tries
+        again.
+        """
+        if not self.host_change_pending() or not self.queue.try_acquire():
+            return
+        try:
+            api = self._take_host_change()
+            if api is not None:
+                api.close()
+        finally:
+            self.queue.release()
+
+    def evict_session(self) -> None:
+        """
+        Close and drop an idle api, it is recreated on the next request.
+        Skipped if the meter is in use.
+        """
+        if not self.session_idle() or not self.queue.try_acquire():
+            return
+        try:
+            if self.session_idle():
+                self._api.close()
+                self._api = None
+        finally:
+            self.queue.release()
+
+
+class AsyncMeterContext(MeterContextBase):
+    """
+    MeterContext for the asyncio server: AsyncEmliteAPI and AsyncMeterQueue
+    so waiting on the meter suspends a coroutine instead of blocking a thread.
+    """
+
+    __slots__ = ()
+
+    @property
+    def api(self) -> AsyncEmliteAPI:
+        if self._api is None:
+            self._api = AsyncEmliteAPI(
+                self.host,
+                self.port,
+                persistent=PERSISTENT_METER_SESSIONS,
+                retry_policy=self._retry_policy(),
+            )
+        return self._api
+
+    @api.setter
+    def api(self, api: AsyncEmliteAPI) -> None:
+        self._api = api
+
+    @property
+    def queue(self) -> AsyncMeterQueue:
+        # created on the event loop thread only, no lock needed
+        if self._queue is None:
+            self._queue = AsyncMeterQueue(self.serial)
+        return self._queue
+
+    @property
+    def flights(self) -> AsyncSingleFlight:
+        if self._flights is None:
+            self._flights = AsyncSingleFlight()
+        return self._flights
+
+    async def space_out_requests(self, deadline: Optional[float] = None) -> None:
+        """See MeterContext.space_out_requests."""
+        wait_time = self._seconds_until_next_request(deadline)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    async def probe(self) -> None:
+        """See MeterContext.probe."""
+        if not self.queue.try_acquire():
+            return
+        try:
+            if not self.breaker.allow_request():
+                return
+            deadline = time.monotonic() + BREAKER_PROBE_TIMEOUT_SECONDS
+            await self.space_out_requests(deadline)
+            try:
+                with self.spaced_request():
+                    await self.api.read_element(
+                        emop_encode_u3be(ObjectIdEnum.serial.value), deadline
+                    )
+                self.breaker.record_success()
+            except Exception as e:
+                logger.info("breaker probe failed", serial=self.serial, error=str(e))
+                self.breaker.record_failure()
+        finally:
+            await self.queue.release()
+
+    async def apply_host_change(self) -> None:
+        """See MeterContext.apply_host_change."""
+        if not self.host_change_pending() or not self.queue.try_acquire():
+            return
+        try:
+            api = self._take_host_change()
+            if api is not None:
+                await api.close()
+        finally:
+            await self.queue.release()
+
+    async def evict_session(self) -> None:
+        """See MeterContext.evict_session."""
+        if not self.session_idle() or not self.queue.try_acquire():
+            return
+        try:
+            if self.session_idle():
+                await self._api.close()
+                self._api = None
+        finally:
+            await self.queue.release()
+
 
-class MeterRegistry:
+def _intern(value: Optional[str]) -> Optional[str]:
+    # esco ids and hardware names repeat across the fleet - share one copy
+    return sys.intern(value) if value is not None else None
+
+
+MeterContextT = TypeVar("MeterContextT", bound=MeterContextBase)
+
+
+@dataclass
+class RegistryRefreshStats:
+    """Outcome of the most recent refresh plus running totals."""
+
+    last_refresh_seconds: float = 0.0
+    last_refresh_rows: int = 0
+    last_refresh_full: bool = False
+    meter_count: int = 0
+    refreshes: int = 0
+    failures: int = 0
+
+
+class MeterRegistryBase(Generic[MeterContextT]):
     """
-    Thread-safe registry of known meters.
+    Registry of known meters.
     Backed by database.
+
+    Lookups read an immutable snapshot of the serial -> context map without
+    locking. Refreshes build a new map from the current one and swap it in,
+    so a lookup never waits on the database.
+
+    Each refresh also saves the meters to a local file. A restarted mediator
+    loads that first and can serve straight away, even if the database is
+    unavailable, while the background refresh catches up.
     """
 
-    def __init__(self, esco_code: Optional[str] = None):
-        self._meters: Dict[str, MeterContext] = {}
+    def __init__(
+        self, esco_code: Optional[str] = None, snapshot_file: Optional[str] = None
+    ):
+        self._meters: Mapping[str, MeterContextT] = {}
+        # serialises refreshes, lookups don't take it
         self._lock = threading.RLock()
-        self._last_refresh_time: float = 0.0
+        self._esco_id: Optional[str] = None
+        # latest updated_at seen, rows changed since are read incrementally
+        self._changed_since: Optional[str] = None
+        self._last_full_refresh_time: float = 0.0
         self.esco_code = esco_code
+        self.snapshot_file = snapshot_file or REGISTRY_SNAPSHOT_FILE
+        self.refresh_stats = RegistryRefreshStats()
 
         # Setup DB client
         self.config = load_config()
@@ -89,80 +503,324 @@ class MeterRegistry:
         else:
             raise Exception("No database credentials - no meters served")
 
-    def get_meter(self, serial: str) -> Optional[MeterContext]:
+    def _new_context(self, serial: str, host: str, port: int = 8080) -> MeterContextT:
+        raise NotImplementedError()
+
+    def load_snapshot(self) -> bool:
         """
-        Get a meter context, refreshing from DB if necessary/scheduled.
+        Serve the meters saved by the last refresh (possibly by a previous
+        process) until the database has been read. Returns False if there is
+        no usable snapshot.
         """
-        # Lazy refresh
-        if time.time() - self._last_refresh_time > REGISTRY_REFRESH_INTERVAL_SECONDS:
-            self.refresh_from_db()
+        try:
+            with open(self.snapshot_file) as f:
+                snapshot = json.load(f)
+            if (
+                snapshot.get("version") != SNAPSHOT_VERSION
+                or snapshot.get("esco_code") != self.esco_code
+            ):
+                logger.info("ignoring registry snapshot for a different setup")
+                return False
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"failed to load registry snapshot: {e}")
+            return False
+
+        meters: Dict[str, MeterContextT] = {}
+        for serial, entry in snapshot["meters"].items():
+            # learned request spacing was added later - may be missing
+            host, port, esco, hardware, *spacing = entry
+            meter = self._new_context(serial, host, port)
+            meter.esco = _intern(esco)
+            meter.hardware = _intern(hardware)
+            if spacing and spacing[0] is not None:
+                meter._spacing = RequestSpacing(spacing[0])
+            meters[serial] = meter
 
         with self._lock:
-            return self._meters.get(serial)
+            # a refresh may have got in first - the database wins
+            if not self._meters:
+                self._meters = meters
+        logger.info(
+            f"Registry loaded {len(meters)} meters from snapshot "
+            f"saved {snapshot.get('saved_at')}"
+        )
+        return True
+
+    def save_snapshot(self) -> None:
+        """Write the current meters to snapshot_file (atomic replace)."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "esco_code": self.esco_code,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "meters": {
+                m.serial: [
+                    m.next_host,
+                    m.port,
+                    m.esco,
+                    m.hardware,
+                    m._spacing.learned_seconds if m._spacing else None,
+                ]
+                for m in self._meters.values()
+            },
+        }
+        tmp_file = f"{self.snapshot_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(tmp_file, self.snapshot_file)
+        except OSError as e:
+            logger.warning(f"failed to save registry snapshot: {e}")
+
+    def get_meter(self, serial: str) -> Optional[MeterContextT]:
+        """Get a meter context from the current snapshot."""
+        return self._meters.get(serial)
+
+    def meters(self) -> list[MeterContextT]:
+        return list(self._meters.values())
+
+    def collect_metrics(self) -> None:
+        """Set the registry gauges. Add as a metrics collector."""
+        meters = self._meters
+        REGISTRY_METERS.set(len(meters))
+        METER_QUEUE_DEPTH.clear()
+        METER_REQUEST_SPACING.clear()
+        for meter in meters.values():
+            if meter._queue is not None:
+                METER_QUEUE_DEPTH.set(meter._queue.depth, serial=meter.serial)
+            if meter._spacing is not None:
+                METER_REQUEST_SPACING.set(
+                    meter._spacing.gap_seconds, serial=meter.serial
+                )
+
+    def _full_refresh_due(self) -> bool:
+        return (
+            time.time() - self._last_full_refresh_time
+            > REGISTRY_FULL_REFRESH_INTERVAL_SECONDS
+        )
 
-    def refresh_from_db(self):
+    def scheduled_refresh(self) -> None:
+        """
+        Periodic refresh: rows changed since the last refresh, or every row
+        once REGISTRY_FULL_REFRESH_INTERVAL_SECONDS have passed (catches
+        anything an incremental read can miss). Errors are logged, the
+        current snapshot stays in use.
+        """
+        try:
+            self.refresh_from_db(full=self._full_refresh_due())
+        except Exception as e:
+            logger.error(str(e))
+
+    def _lookup_esco_id(self) -> Optional[str]:
+        assert self.supabase is not None
+        if self._esco_id is None and self.esco_code:
+            escos = (
+                self.supabase.table("escos")
+                .select("id")
+                .ilike("code", self.esco_code)
+                .execute()
+            )
+            escos_data = as_list(escos)
+            if len(escos_data) > 0:
+                self._esco_id = escos_data[0]["id"]
+        return self._esco_id
+
+    def refresh_from_db(self, full: bool = True):
         """
         Reload/Sync meter definitions from the database.
+
+        Args:
+            full: read every row, otherwise only rows updated since the last
+                refresh
         """
         if not self.supabase:
             logger.warning("No database connection for registry refresh")
             return
 
-        logger.info("Refreshing meter registry from database...")
-        try:
-            esco_id = None
-
-            # If esco_code filter is specified, look up the esco_id
-            if self.esco_code:
-                escos = (
-                    self.supabase.table("escos")
-                    .select("id")
-                    .ilike("code", self.esco_code)
-                    .execute()
-                )
-                escos_data = as_list(escos)
-                if len(escos_data) == 0:
+        with self._lock:
+            started = time.monotonic()
+            since = None if full else self._changed_since
+            logger.debug("Refreshing meter registry from database...", since=since)
+            try:
+                # If esco_code filter is specified, look up the esco_id
+                esco_id = self._lookup_esco_id()
+                if self.esco_code and esco_id is None:
                     logger.error(f"no esco found for {self.esco_code}")
                     return
-                esco_id = escos_data[0]["id"]
 
-            # Fetch meters with IP addresses
-            query = self.supabase.table("meter_registry").select("serial, ip_address")
+                # Fetch meters with IP addresses
+                query = self.supabase.table("meter_registry").select(
+                    "serial, ip_address, esco, hardware, updated_at"
+                )
 
-            if esco_id is not None:
-                query = query.eq("esco", esco_id)
+                if esco_id is not None:
+                    query = query.eq("esco", esco_id)
+                if since is not None:
+                    # gte not gt: rows sharing the last timestamp may not all
+                    # have been committed when it was read
+                    query = query.gte("updated_at", since)
 
-            result = query.execute()
+                rows = as_list(query.execute())
 
-            rows = as_list(result)
-            added_count = 0
-            updated_count = 0
-            with self._lock:
+                meters = dict(self._meters)
+                added_count = 0
+                updated_count = 0
                 for row in rows:
                     serial = row.get("serial")
                     ip = row.get("ip_address")
                     # Only register if we have a serial and an IP
                     if serial and ip:
-                        if serial not in self._meters:
-                            # logger.info(f"Adding meter {serial} at {ip}")
-                            self._meters[serial] = MeterContext(serial, ip)
+                        if serial not in meters:
+                            meters[serial] = self._new_context(serial, ip)
                             added_count += 1
-                        else:
+                        elif meters[serial].next_host != ip:
                             # Update IP if changed
-                            if self._meters[serial].host != ip:
-                                # logger.info(f"Updating meter {serial} IP to {ip}")
-                                self._meters[serial].host = ip
-                                self._meters[serial].api = EmliteAPI(
-                                    ip, self._meters[serial].port
-                                )
-                                updated_count += 1
-
-                if added_count > 0 or updated_count > 0:
-                    logger.info(
-                        f"Registry refreshed: {added_count} added, {updated_count} updated. Total meters: {len(self._meters)}"
-                    )
+                            meters[serial].set_host(ip)
+                            updated_count += 1
+                        meters[serial].esco = _intern(row.get("esco"))
+                        meters[serial].hardware = _intern(row.get("hardware"))
 
-            self._last_refresh_time = time.time()
+                    updated_at = row.get("updated_at")
+                    if updated_at and (
+                        self._changed_since is None or updated_at > self._changed_since
+                    ):
+                        self._changed_since = updated_at
 
-        except Exception as e:
-            raise Exception(f"Failed to refresh registry: {e}")
+                # publish the new snapshot
+                self._meters = meters
+                if full:
+                    self._last_full_refresh_time = time.time()
+
+            except Exception as e:
+                self.refresh_stats.failures += 1
+                raise Exception(f"Failed to refresh registry: {e}")
+
+            stats = self.refresh_stats
+            stats.last_refresh_seconds = time.monotonic() - started
+            stats.last_refresh_rows = len(rows)
+            stats.last_refresh_full = full
+            stats.meter_count = len(meters)
+            stats.refreshes += 1
+            REGISTRY_REFRESH_SECONDS.observe(
+                stats.last_refresh_seconds, full=str(full).lower()
+            )
+
+            if added_count > 0 or updated_count > 0:
+                logger.info(
+                    f"Registry refreshed: {added_count} added, {updated_count} updated. Total meters: {len(meters)}"
+                )
+            if full or len(rows) > 0:
+                self.save_snapshot()
+            logger.debug(
+                "registry refresh",
+                full=full,
+                rows=stats.last_refresh_rows,
+                seconds=round(stats.last_refresh_seconds, 3),
+            )
+
+
+class MeterRegistry(MeterRegistryBase[MeterContext]):
+    def _new_context(self, serial: str, host: str, port: int = 8080) -> MeterContext:
+        return MeterContext(serial, host, port)
+
+    def start_refresher(self, refresh_now: bool = False) -> threading.Thread:
+        """
+        Start a daemon thread refreshing the registry in the background.
+
+        Args:
+            refresh_now: refresh straight away instead of after the first
+                interval (eg. when serving from a snapshot)
+        """
+        thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(refresh_now,),
+            name="registry-refresh",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _refresh_loop(self, refresh_now: bool) -> None:
+        if refresh_now:
+            self.scheduled_refresh()
+        while True:
+            time.sleep(REGISTRY_REFRESH_INTERVAL_SECONDS)
+            self.scheduled_refresh()
+
+    def start_breaker_probes(self) -> threading.Thread:
+        """
+        Start a daemon thread probing meters with open circuit breakers,
+        closing idle meter sessions and applying address changes that found
+        the meter busy.
+        """
+        thread = threading.Thread(
+            target=self._probe_loop, name="breaker-probes", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _probe_loop(self) -> None:
+        while True:
+            time.sleep(BREAKER_PROBE_INTERVAL_SECONDS)
+            for meter in self.meters():
+                if meter.breaker.probe_due():
+                    try:
+                        meter.probe()
+                    except Exception as e:
+                        logger.error(f"breaker probe error for {meter.serial}: {e}")
+                if meter.host_change_pending():
+                    try:
+                        meter.apply_host_change()
+                    except Exception as e:
+                        logger.warning(f"session close error for {meter.serial}: {e}")
+                if meter.session_idle():
+                    try:
+                        meter.evict_session()
+                    except Exception as e:
+                        logger.warning(f"session close error for {meter.serial}: {e}")
+
+
+class AsyncMeterRegistry(MeterRegistryBase[AsyncMeterContext]):
+    """
+    Registry for the asyncio server. The database refresh is a blocking call
+    so it runs in a worker thread.
+    """
+
+    def _new_context(
+        self, serial: str, host: str, port: int = 8080
+    ) -> AsyncMeterContext:
+        return AsyncMeterContext(serial, host, port)
+
+    async def run_refresher(self, refresh_now: bool = False) -> None:
+        """Refresh the registry in the background. Run as a task."""
+        if refresh_now:
+            await asyncio.to_thread(self.scheduled_refresh)
+        while True:
+            await asyncio.sleep(REGISTRY_REFRESH_INTERVAL_SECONDS)
+            await asyncio.to_thread(self.scheduled_refresh)
+
+    async def run_breaker_probes(self) -> None:
+        """
+        Probe meters with open circuit breakers, close idle meter sessions
+        and apply address changes from the registry. Run as a task.
+        """
+        while True:
+            await asyncio.sleep(BREAKER_PROBE_INTERVAL_SECONDS)
+            for meter in self.meters():
+                if meter.breaker.probe_due():
+                    try:
+                        await meter.probe()
+                    except Exception as e:
+                        logger.error(f"breaker probe error for {meter.serial}: {e}")
+                if meter.host_change_pending():
+                    try:
+                        await meter.apply_host_change()
+                    except Exception as e:
+                        logger.warning(f"session close error for {meter.serial}: {e}")
+                if meter.session_idle():
+                    try:
+                        await meter.evict_session()
+                    except Exception as e:
+                        logger.warning(f"session close error for {meter.serial}: {e}")
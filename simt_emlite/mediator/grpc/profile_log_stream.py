@@ -0,0 +1,173 @@
+# mypy: disable-error-code="import-untyped"
+import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Tuple
+
+from emop_frame_protocol.emop_data import EmopData
+from emop_frame_protocol.emop_profile_log_1_response import (
+    emop_decode_profile_log_1_response,
+)
+from emop_frame_protocol.emop_profile_log_2_response import (
+    emop_decode_profile_log_2_response,
+)
+from emop_frame_protocol.generated.emop_profile_log_request import EmopProfileLogRequest
+from emop_frame_protocol.util import emop_datetime_to_epoch_seconds
+from emop_frame_protocol.vendor.kaitaistruct import BytesIO, KaitaiStream
+
+from simt_emlite.util.logging import get_logger
+
+from .generated.mediator_pb2 import (
+    ProfileLog,
+    ProfileLogRecord,
+    StreamProfileLogReply,
+)
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Walks a profile log range on the meter for the streamProfileLog RPC.
+
+    Each profile log request returns a handful of half hourly records from
+    the requested timestamp. The next request starts half an hour after the
+    last record actually returned, so gaps and short responses are handled
+    without the client doing its own chunk arithmetic.
+"""
+
+INTERVAL = datetime.timedelta(minutes=30)
+
+
+def profile_log_data_field(
+    format: EmopData.RecordFormat, timestamp: datetime.datetime
+) -> bytes:
+    """EMOP data field bytes requesting a profile log from timestamp."""
+    message_len = 4  # profile log request: timestamp (4)
+
+    message_field = EmopProfileLogRequest()
+    message_field.timestamp = emop_datetime_to_epoch_seconds(timestamp)
+
+    _io = KaitaiStream(BytesIO(bytearray(message_len)))
+    message_field._write(_io)
+    message_field_bytes = _io.to_byte_array()
+
+    data_field = EmopData(message_len)
+    data_field.format = format
+    data_field.message = message_field_bytes
+
+    _io = KaitaiStream(BytesIO(bytearray(message_len + 1)))
+    data_field._write(_io)
+    return bytes(_io.to_byte_array())
+
+
+def records_per_response(log: int, is_twin_element: bool) -> int:
+    if log == ProfileLog.PROFILE_LOG_1:
+        return 4
+    return 2 if is_twin_element else 3
+
+
+def _decode(log: int, is_twin_element: bool, payload: bytes) -> List[Any]:
+    if log == ProfileLog.PROFILE_LOG_1:
+        return list(emop_decode_profile_log_1_response(payload).records)
+    return list(emop_decode_profile_log_2_response(is_twin_element, payload).records)
+
+
+def _to_proto(log: int, is_twin_element: bool, record: Any) -> ProfileLogRecord:
+    proto = ProfileLogRecord(
+        timestamp=int(record.timestamp_datetime.timestamp()),
+        validData=record.status.valid_data,
+    )
+    if log == ProfileLog.PROFILE_LOG_1:
+        proto.importA = record.import_a
+        proto.importB = record.import_b
+    else:
+        proto.activeExportA = record.active_export_a
+        if is_twin_element:
+            proto.activeExportB = record.active_export_b
+    return proto
+
+
+def _walk_format(log: int) -> EmopData.RecordFormat:
+    if log == ProfileLog.PROFILE_LOG_1:
+        return EmopData.RecordFormat.profile_log_1
+    elif log == ProfileLog.PROFILE_LOG_2:
+        return EmopData.RecordFormat.profile_log_2
+    raise ValueError(f"unsupported profile log [{log}]")
+
+
+def _walk_step(
+    log: int,
+    is_twin_element: bool,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    current: datetime.datetime,
+    payload: bytes,
+) -> Tuple[StreamProfileLogReply, datetime.datetime | None]:
+    """Reply for the response to a request at current and the next request
+    time, None when the walk should stop."""
+    records = _decode(log, is_twin_element, payload)
+    reply = StreamProfileLogReply(requestTime=int(current.timestamp()))
+
+    if len(records) > 0:
+        first_datetime = records[0].timestamp_datetime
+        # future time out of range - see unfuddle #382 - meters will return
+        # the next available data even if that is months ahead
+        if first_datetime > end:
+            logger.warning(
+                "Future date returned - stopping profile log walk",
+                date=first_datetime,
+            )
+            reply.futureTimestamp = int(first_datetime.timestamp())
+            return reply, None
+
+        in_range = [r for r in records if start <= r.timestamp_datetime <= end]
+        reply.records.extend(_to_proto(log, is_twin_element, r) for r in in_range)
+
+    # continue after the latest record returned for this request (empty
+    # slots in a response come back with a zero / year 2000 timestamp)
+    returned = [
+        r.timestamp_datetime for r in records if r.timestamp_datetime >= current
+    ]
+    if len(returned) > 0:
+        return reply, max(returned) + INTERVAL
+    # no usable records, move on by a full response worth
+    return reply, current + INTERVAL * records_per_response(log, is_twin_element)
+
+
+def walk_profile_log(
+    send_message: Callable[[bytes], bytes],
+    log: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    is_twin_element: bool,
+) -> Iterator[StreamProfileLogReply]:
+    """
+    Request profile log records from start to end, one reply per request.
+
+    Args:
+        send_message: sends an EMOP data field to the meter, returns the
+            response payload
+        log: ProfileLog.PROFILE_LOG_1 or ProfileLog.PROFILE_LOG_2
+        start: first timestamp to request (timezone aware)
+        end: last timestamp wanted (timezone aware)
+        is_twin_element: profile log 2 layout selector
+    """
+    format = _walk_format(log)
+    current: datetime.datetime | None = start
+    while current is not None and current < end:
+        payload = send_message(profile_log_data_field(format, current))
+        reply, current = _walk_step(log, is_twin_element, start, end, current, payload)
+        yield reply
+
+
+async def async_walk_profile_log(
+    send_message: Callable[[bytes], Awaitable[bytes]],
+    log: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    is_twin_element: bool,
+) -> AsyncIterator[StreamProfileLogReply]:
+    """walk_profile_log with a coroutine send_message."""
+    format = _walk_format(log)
+    current: datetime.datetime | None = start
+    while current is not None and current < end:
+        payload = await send_message(profile_log_data_field(format, current))
+        reply, current = _walk_step(log, is_twin_element, start, end, current, payload)
+        yield reply
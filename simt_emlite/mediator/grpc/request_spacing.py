@@ -0,0 +1,72 @@
+import os
+
+from simt_emlite.emlite.retry_policy import FailureClass
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Adaptive gap between requests to a meter.
+
+    Meters refuse a connection that comes too soon after the previous one,
+    but how soon is too soon depends on the meter's hardware and link. A
+    fixed gap for every meter is either too long for most or too short for
+    some, so each meter learns its own (AIMD):
+
+    - every request that succeeds without a refusal shortens the gap by
+      SPACING_DECREASE_SECONDS, down to MIN_SPACING_SECONDS. A failed
+      request leaves it as is
+    - a refused connection multiplies the gap by SPACING_INCREASE_FACTOR,
+      up to MAX_SPACING_SECONDS
+
+    Until a meter has learned a gap it uses INITIAL_SPACING_SECONDS. Learned
+    gaps are saved with the registry snapshot so a restart keeps them.
+"""
+
+INITIAL_SPACING_SECONDS = float(os.environ.get("REQUEST_SPACING_INITIAL_SECONDS", "2"))
+MIN_SPACING_SECONDS = float(os.environ.get("REQUEST_SPACING_MIN_SECONDS", "0.5"))
+MAX_SPACING_SECONDS = float(os.environ.get("REQUEST_SPACING_MAX_SECONDS", "10"))
+SPACING_DECREASE_SECONDS = float(
+    os.environ.get("REQUEST_SPACING_DECREASE_SECONDS", "0.1")
+)
+SPACING_INCREASE_FACTOR = 2.0
+
+
+class RequestSpacing:
+    # one per meter that has been used
+    __slots__ = ("learned_seconds", "_refused")
+
+    def __init__(self, learned_seconds: float | None = None) -> None:
+        # None until the first request outcome
+        self.learned_seconds = learned_seconds
+        self._refused = False
+
+    @property
+    def gap_seconds(self) -> float:
+        if self.learned_seconds is None:
+            return INITIAL_SPACING_SECONDS
+        return self.learned_seconds
+
+    def on_retry(self, failure: FailureClass, attempt: int, delay: float) -> None:
+        """RetryPolicy on_retry hook - widen the gap on a refused connection."""
+        if failure == FailureClass.PROXY_REFUSED:
+            self.record_refused()
+
+    def record_refused(self) -> None:
+        gap = max(self.gap_seconds, MIN_SPACING_SECONDS) * SPACING_INCREASE_FACTOR
+        self.learned_seconds = min(MAX_SPACING_SECONDS, gap)
+        self._refused = True
+        logger.debug("request spacing increased", gap=self.learned_seconds)
+
+    def record_failed(self) -> None:
+        """A request failed - leave the gap (widened if it was refused) as is."""
+        # a refusal during this request mustn't stop the next success narrowing
+        self._refused = False
+
+    def record_done(self) -> None:
+        """A request completed - narrow the gap unless it was refused."""
+        if not self._refused:
+            self.learned_seconds = max(
+                MIN_SPACING_SECONDS, self.gap_seconds - SPACING_DECREASE_SECONDS
+            )
+        self._refused = False
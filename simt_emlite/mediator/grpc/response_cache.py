@@ -0,0 +1,133 @@
+import os
+import threading
+import time
+from typing import Dict, Tuple
+
+from emop_frame_protocol.emop_data import EmopData  # type: ignore[import-untyped]
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum  # type: ignore[import-untyped]
+
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Per meter cache of readElement responses.
+
+    Some objects never change (serial, hardware version) and some change only
+    when written (future tariffs, time switches) yet every sync run and CLI call
+    reads them again, paying a meter round trip plus request spacing each
+    time. Responses for those objects are kept for a TTL that depends on the
+    object. Objects without a TTL are never cached.
+
+    Any write to the meter clears its cache. A client can skip the cache for
+    a call (the response is still stored) by setting the CACHE_METADATA_KEY
+    gRPC metadata header to CACHE_BYPASS.
+"""
+
+# gRPC metadata header to control cache use for a call
+CACHE_METADATA_KEY = "x-emlite-cache"
+CACHE_BYPASS = "bypass"
+
+# objects fixed at manufacture (firmware is only changed by an upgrade)
+IMMUTABLE_TTL_SECONDS = float(os.environ.get("CACHE_IMMUTABLE_TTL_SECONDS", "86400"))
+# objects that only change when written - future tariffs and time switches
+SLOW_CHANGING_TTL_SECONDS = float(
+    os.environ.get("CACHE_SLOW_CHANGING_TTL_SECONDS", "3600")
+)
+
+IMMUTABLE_OBJECTS = [
+    ObjectIdEnum.serial,
+    ObjectIdEnum.hardware_version,
+    ObjectIdEnum.firmware_version,
+    ObjectIdEnum.three_phase_hardware_configuration,
+    ObjectIdEnum.three_phase_serial,
+]
+
+# tariff objects that move with time of day or consumption block
+TARIFF_CURRENT_OBJECTS = [
+    ObjectIdEnum.tariff_active_price,
+    ObjectIdEnum.tariff_active_price_index_current,
+    ObjectIdEnum.tariff_active_element_b_price,
+    ObjectIdEnum.tariff_active_element_b_price_index_current,
+    ObjectIdEnum.tariff_active_tou_rate,
+    ObjectIdEnum.tariff_active_block_rate,
+    ObjectIdEnum.tariff_active_element_b_tou_rate,
+]
+
+# the meter copies the future tariff over the active one by itself at
+# tariff_future_activation_datetime - no write goes through the mediator to
+# clear the cache so active tariff objects are never cached
+TARIFF_ACTIVE_PREFIX = "tariff_active_"
+
+
+def _ttl_policy() -> Dict[int, float]:
+    ttls: Dict[int, float] = {}
+    for object_id in ObjectIdEnum:
+        if (
+            object_id.name.startswith("tariff_")
+            and not object_id.name.startswith(TARIFF_ACTIVE_PREFIX)
+            and object_id not in TARIFF_CURRENT_OBJECTS
+        ):
+            ttls[object_id.value] = SLOW_CHANGING_TTL_SECONDS
+    for object_id in IMMUTABLE_OBJECTS:
+        ttls[object_id.value] = IMMUTABLE_TTL_SECONDS
+    return ttls
+
+
+# object id -> seconds a response may be served from the cache
+CACHE_TTL_SECONDS: Dict[int, float] = _ttl_policy()
+
+
+def cache_bypassed(metadata) -> bool:
+    for key, value in metadata or ():
+        if key == CACHE_METADATA_KEY and str(value).lower() == CACHE_BYPASS:
+            return True
+    return False
+
+
+def is_read_data_field(data_field: bytes) -> bool:
+    """
+    Is a raw EMOP data field a plain element read? Used to decide if a
+    sendRawMessage may have changed meter state.
+    """
+    # format (1) | object id (3) | read/write flag (1) | payload
+    return (
+        len(data_field) >= 5
+        and data_field[0] == EmopData.RecordFormat.default.value
+        and data_field[4] == 0
+    )
+
+
+class ResponseCache:
+    def __init__(self, serial: str) -> None:
+        self.serial = serial
+        self.hits = 0
+        self.misses = 0
+        # object id -> (expires at time.monotonic(), response payload)
+        self._entries: Dict[int, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, object_id: int) -> bytes | None:
+        """Cached response for object_id, None if not cacheable or expired."""
+        if object_id not in CACHE_TTL_SECONDS:
+            return None
+        with self._lock:
+            entry = self._entries.get(object_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, object_id: int, payload: bytes) -> None:
+        ttl = CACHE_TTL_SECONDS.get(object_id)
+        if ttl is None:
+            return
+        with self._lock:
+            self._entries[object_id] = (time.monotonic() + ttl, payload)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            if self._entries:
+                logger.debug("response cache cleared", serial=self.serial)
+            self._entries.clear()
@@ -0,0 +1,194 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+import grpc
+
+from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter, Histogram
+
+from .service_config import ATTEMPTS_METADATA_KEY, PREVIOUS_ATTEMPTS_METADATA_KEY
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Per RPC latency metrics.
+
+    Interceptors for the threaded and grpc.aio servers time every call from
+    the handler starting to its reply (or the end of its stream) and record
+    it by method and status code. Install before any other interceptor so
+    rejected calls are timed too.
+
+    Attempts a client channel retried (see service_config.py) are counted
+    and the attempt number echoed back in trailing metadata, as the client
+    has no other way to learn its call was retried.
+"""
+
+RPC_SECONDS = Histogram(
+    "mediator_rpc_duration_seconds",
+    "Time to handle each RPC, by method and status code",
+    ["method", "code"],
+)
+RPC_RETRIED = Counter(
+    "mediator_rpc_retried_total",
+    "Retried attempts of an RPC received from client channels, by method",
+    ["method"],
+)
+
+
+def _previous_attempts(handler_call_details: grpc.HandlerCallDetails) -> str | None:
+    """Attempts before this one if the client channel retried the call."""
+    for key, value in handler_call_details.invocation_metadata or ():
+        if key == PREVIOUS_ATTEMPTS_METADATA_KEY:
+            RPC_RETRIED.inc(method=handler_call_details.method)
+            return str(value)
+    return None
+
+
+def _echo_attempts(context: Any, previous_attempts: str | None) -> None:
+    if previous_attempts is not None:
+        context.set_trailing_metadata(((ATTEMPTS_METADATA_KEY, previous_attempts),))
+
+
+def _context_code(context: Any) -> grpc.StatusCode | None:
+    try:
+        code = context.code()
+    except Exception:
+        return None
+    return code if isinstance(code, grpc.StatusCode) else None
+
+
+def _status_name(context: Any, e: BaseException | None = None) -> str:
+    """
+    Status the call ended with. A handler that returns normally may still
+    have set a code on the context (set_code without abort), otherwise it
+    is OK. UNKNOWN for an unhandled error.
+    """
+    if isinstance(e, (GeneratorExit, asyncio.CancelledError)):
+        # client went away or the call was cancelled
+        return "CANCELLED"
+    code = _context_code(context)
+    if code is not None:
+        return code.name
+    return "OK" if e is None else "UNKNOWN"
+
+
+def _observe(method: str, started: float, code: str) -> None:
+    RPC_SECONDS.observe(time.monotonic() - started, method=method, code=code)
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+    def intercept_service(
+        self, continuation: Callable, handler_call_details: grpc.HandlerCallDetails
+    ) -> grpc.RpcMethodHandler | None:
+        method = handler_call_details.method
+        attempts = _previous_attempts(handler_call_details)
+        handler = continuation(handler_call_details)
+
+        if handler is None:
+            return handler
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._time_unary(handler.unary_unary, method, attempts),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._time_unary_stream(handler.unary_stream, method, attempts),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    def _time_unary(
+        self, original_handler: Callable, method: str, attempts: str | None
+    ) -> Callable[[Any, grpc.ServicerContext], Any]:
+        def timed_handler(request: Any, context: grpc.ServicerContext) -> Any:
+            started = time.monotonic()
+            _echo_attempts(context, attempts)
+            try:
+                response = original_handler(request, context)
+            except BaseException as e:
+                _observe(method, started, _status_name(context, e))
+                raise
+            _observe(method, started, _status_name(context))
+            return response
+
+        return timed_handler
+
+    def _time_unary_stream(
+        self, original_handler: Callable, method: str, attempts: str | None
+    ) -> Callable[[Any, grpc.ServicerContext], Iterator[Any]]:
+        def timed_handler(request: Any, context: grpc.ServicerContext) -> Iterator[Any]:
+            started = time.monotonic()
+            _echo_attempts(context, attempts)
+            try:
+                yield from original_handler(request, context)
+            except BaseException as e:
+                _observe(method, started, _status_name(context, e))
+                raise
+            _observe(method, started, _status_name(context))
+
+        return timed_handler
+
+
+class AsyncMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """MetricsInterceptor for the grpc.aio server."""
+
+    async def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler | None:
+        method = handler_call_details.method
+        attempts = _previous_attempts(handler_call_details)
+        handler = await continuation(handler_call_details)
+
+        if handler is None:
+            return handler
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._time_unary(handler.unary_unary, method, attempts),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._time_unary_stream(handler.unary_stream, method, attempts),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    def _time_unary(
+        self, original_handler: Callable, method: str, attempts: str | None
+    ) -> Callable[[Any, Any], Awaitable[Any]]:
+        async def timed_handler(request: Any, context: Any) -> Any:
+            started = time.monotonic()
+            _echo_attempts(context, attempts)
+            try:
+                response = await original_handler(request, context)
+            except BaseException as e:
+                _observe(method, started, _status_name(context, e))
+                raise
+            _observe(method, started, _status_name(context))
+            return response
+
+        return timed_handler
+
+    def _time_unary_stream(
+        self, original_handler: Callable, method: str, attempts: str | None
+    ) -> Callable[[Any, Any], AsyncIterator[Any]]:
+        async def timed_handler(request: Any, context: Any) -> AsyncIterator[Any]:
+            started = time.monotonic()
+            _echo_attempts(context, attempts)
+            try:
+                async for response in original_handler(request, context):
+                    yield response
+            except BaseException as e:
+                _observe(method, started, _status_name(context, e))
+                raise
+            _observe(method, started, _status_name(context))
+
+        return timed_handler
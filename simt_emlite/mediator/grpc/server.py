@@ -1,26 +1,42 @@
+import asyncio
 import os
 import signal
 import sys
 from concurrent import futures
 
 import grpc
+from simt_emlite.util import metrics
 from simt_emlite.util.logging import get_logger
 
 from .generated.mediator_pb2_grpc import (
     add_EmliteMediatorServiceServicer_to_server,
     add_InfoServiceServicer_to_server,
 )
-from .info_service import EmliteInfoServiceServicer
+from .async_mediator_service import AsyncEmliteMediatorServicer
+from .info_service import AsyncEmliteInfoServiceServicer, EmliteInfoServiceServicer
 from .mediator_service import EmliteMediatorServicer
-from .meter_registry import MeterRegistry
+from .meter_registry import AsyncMeterRegistry, MeterRegistry
+from .rpc_metrics import AsyncMetricsInterceptor, MetricsInterceptor
 from .util import decode_b64_secret_to_bytes
-from .auth import AuthorizationInterceptor
+from .auth import AsyncAuthorizationInterceptor, AuthorizationInterceptor
 
 logger = get_logger(__name__, __file__)
 
 LISTEN_PORT = os.environ.get("LISTEN_PORT", "50051")
 MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "30"))
+# "threads" - grpc.server on a pool of MAX_WORKERS threads
+# "aio" - grpc.aio server, no worker limit, concurrency bounded per meter
+SERVER_MODE = os.environ.get("SERVER_MODE", "threads").lower()
 DISABLE_CERT_AUTH = os.environ.get("DISABLE_CERT_AUTH", "").lower() == "true"
+# Prometheus metrics served on http://0.0.0.0:METRICS_PORT/metrics, empty to disable
+METRICS_PORT = os.environ.get("METRICS_PORT", "9090")
+
+# clients keep pooled channels open with keepalive pings (see
+# channel_pool.py) - accept them, including on idle connections
+SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 30000),
+]
 
 # Auth Certificates and Keys
 server_cert_b64 = os.environ.get("MEDIATOR_SERVER_CERT")
@@ -41,29 +57,7 @@ def shutdown_handler(signal_num, frame):
     sys.exit(0)
 
 
-def serve():
-    try:
-        registry = MeterRegistry(esco_code=esco_code)
-        registry.refresh_from_db()
-    except Exception as e:
-        logger.error(f"Failed to initialize MeterRegistry: {e}")
-        sys.exit(1)
-
-    interceptors: list[grpc.ServerInterceptor] = []
-    if not DISABLE_CERT_AUTH:
-        interceptors.append(AuthorizationInterceptor())
-
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=MAX_WORKERS),
-        interceptors=interceptors,
-    )
-
-    # Register Services
-    add_EmliteMediatorServiceServicer_to_server(
-        EmliteMediatorServicer(registry), server
-    )
-    add_InfoServiceServicer_to_server(EmliteInfoServiceServicer(), server)
-
+def _add_listen_port(server) -> None:
     listen_address = f"0.0.0.0:{LISTEN_PORT}"
 
     if use_cert_auth:
@@ -87,12 +81,99 @@ def serve():
         logger.debug(f"add_insecure_port [{listen_address}]")
         server.add_insecure_port(listen_address)
 
+
+def _start_metrics(registry) -> None:
+    if not METRICS_PORT:
+        return
+    metrics.REGISTRY.add_collector(registry.collect_metrics)
+    metrics.start_http_server(int(METRICS_PORT))
+
+
+def serve():
+    try:
+        registry = MeterRegistry(esco_code=esco_code)
+        # with a snapshot serve straight away and reconcile in the background
+        loaded = registry.load_snapshot()
+        if not loaded:
+            registry.refresh_from_db()
+        registry.start_refresher(refresh_now=loaded)
+        registry.start_breaker_probes()
+    except Exception as e:
+        logger.error(f"Failed to initialize MeterRegistry: {e}")
+        sys.exit(1)
+
+    _start_metrics(registry)
+
+    # metrics first so calls rejected by auth are counted
+    interceptors: list[grpc.ServerInterceptor] = [MetricsInterceptor()]
+    if not DISABLE_CERT_AUTH:
+        interceptors.append(AuthorizationInterceptor())
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=MAX_WORKERS),
+        interceptors=interceptors,
+        options=SERVER_OPTIONS,
+    )
+
+    # Register Services
+    add_EmliteMediatorServiceServicer_to_server(
+        EmliteMediatorServicer(registry), server
+    )
+    add_InfoServiceServicer_to_server(EmliteInfoServiceServicer(), server)
+
+    _add_listen_port(server)
+
     logger.info(f"Server starting with {MAX_WORKERS} workers")
 
     server.start()
     server.wait_for_termination()
 
 
+async def serve_aio():
+    """
+    asyncio server: meter requests are coroutines serialised per meter by
+    the meter queues, so a fleet wide job no longer ties up a fixed pool of
+    worker threads that other callers (and InfoService) then wait behind.
+    """
+    try:
+        registry = AsyncMeterRegistry(esco_code=esco_code)
+        loaded = registry.load_snapshot()
+        if not loaded:
+            registry.refresh_from_db()
+    except Exception as e:
+        logger.error(f"Failed to initialize MeterRegistry: {e}")
+        sys.exit(1)
+
+    _start_metrics(registry)
+
+    interceptors: list[grpc.aio.ServerInterceptor] = [AsyncMetricsInterceptor()]
+    if not DISABLE_CERT_AUTH:
+        interceptors.append(AsyncAuthorizationInterceptor())
+
+    server = grpc.aio.server(interceptors=interceptors, options=SERVER_OPTIONS)
+
+    # Register Services
+    add_EmliteMediatorServiceServicer_to_server(
+        AsyncEmliteMediatorServicer(registry), server
+    )
+    add_InfoServiceServicer_to_server(AsyncEmliteInfoServiceServicer(), server)
+
+    _add_listen_port(server)
+
+    logger.info("Server starting (asyncio)")
+
+    tasks = [
+        asyncio.create_task(registry.run_refresher(refresh_now=loaded)),
+        asyncio.create_task(registry.run_breaker_probes()),
+    ]
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 if __name__ == "__main__":
     import argparse
     import logging
@@ -108,4 +189,7 @@ if __name__ == "__main__":
         logger.debug("Verbose logging enabled")
 
     signal.signal(signal.SIGINT, shutdown_handler)
-    serve()
+    if SERVER_MODE == "aio":
+        asyncio.run(serve_aio())
+    else:
+        serve()
@@ -0,0 +1,147 @@
+import json
+import os
+from typing import Any, Dict, List, Sequence, Tuple
+
+from simt_emlite.util.logging import get_logger
+from simt_emlite.util.metrics import Counter
+
+logger = get_logger(__name__, __file__)
+
+"""
+    gRPC service config for mediator client channels.
+
+    Per method deadlines and transparent retries of idempotent calls are
+    applied by the gRPC channel itself:
+
+    - reads (readElement, readElements, streamProfileLog, getMeterStatus and
+      every InfoService call) are retried on UNAVAILABLE - the mediator
+      restarting or a dropped connection - with exponential backoff, up to
+      RETRY_MAX_ATTEMPTS attempts in all. A stream is only retried until its
+      first reply arrives.
+    - writes (writeElement) and raw messages (sendRawMessage, which may
+      write) are never retried.
+    - retry throttling stops retries when most calls on a channel are
+      failing so a mediator outage doesn't become a retry storm.
+
+    Retries happen inside the channel so the client can't see them. The
+    mediator server echoes the attempt number back in
+    ATTEMPTS_METADATA_KEY (see rpc_metrics.py) and the client counts it in
+    CLIENT_RETRIES.
+
+    gRPC Python (C-core) accepts but does not act on a hedgingPolicy, so
+    hedging of InfoService calls is done by the clients: with
+    INFO_HEDGING_DELAY_SECONDS set, a call that has no reply after that
+    long is sent again and the first reply wins.
+"""
+
+SERVICE = "simt_emlite.mediator.grpc.EmliteMediatorService"
+INFO_SERVICE = "simt_emlite.mediator.grpc.InfoService"
+
+# deadline for calls to a meter. The mediator passes what remains of it down
+# as the budget for the call (see request_deadline in mediator_service.py):
+# 1) a successful call should take less than 5 seconds
+# 2) failed attempts are retried by the meter's RetryPolicy
+# (emlite/retry_policy.py) with exponential backoff, up to 5 attempts for a
+# refused connection or gateway restart. No retry is started that could not
+# finish before the deadline so the budget caps retries, not the other way
+# round
+# 3) calls to a meter queue and are spaced by the gap learned for that meter
+# (request_spacing.py, at most MAX_SPACING_SECONDS)
+# 75 seconds leaves room for a wait behind a few queued calls plus a retry or
+# two of this one
+TIMEOUT_SECONDS = 75
+
+# InfoService calls are answered from the registry and database (cached)
+INFO_TIMEOUT_SECONDS = 10
+
+# getMeterStatus is answered from the registry without touching the meter
+STATUS_TIMEOUT_SECONDS = 10
+
+# attempts in all (first call and retries) for a retried method
+RETRY_MAX_ATTEMPTS = int(os.environ.get("MEDIATOR_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_INITIAL_BACKOFF_SECONDS = 0.5
+RETRY_MAX_BACKOFF_SECONDS = 5
+
+# seconds before an InfoService call with no reply is sent again, 0 or empty
+# for no hedging
+INFO_HEDGING_DELAY_SECONDS = float(
+    os.environ.get("MEDIATOR_INFO_HEDGING_DELAY_SECONDS") or "0"
+)
+
+# request metadata gRPC adds to a retried attempt
+PREVIOUS_ATTEMPTS_METADATA_KEY = "grpc-previous-rpc-attempts"
+# trailing metadata the mediator echoes PREVIOUS_ATTEMPTS_METADATA_KEY in
+ATTEMPTS_METADATA_KEY = "x-emlite-previous-attempts"
+
+CLIENT_RETRIES = Counter(
+    "mediator_client_retries_total",
+    "Mediator calls retried by the client channel, by method",
+    ["method"],
+)
+CLIENT_HEDGES = Counter(
+    "mediator_client_hedged_total",
+    "Mediator calls sent a second time after the hedging delay, by method",
+    ["method"],
+)
+
+# (service, method or None for the whole service, timeout seconds or None
+# when set per call, retried)
+_METHODS: List[Tuple[str, str | None, float | None, bool]] = [
+    (SERVICE, "readElement", TIMEOUT_SECONDS, True),
+    # readElements and streamProfileLog timeouts depend on the request
+    (SERVICE, "readElements", None, True),
+    (SERVICE, "streamProfileLog", None, True),
+    (SERVICE, "writeElement", TIMEOUT_SECONDS, False),
+    (SERVICE, "sendRawMessage", TIMEOUT_SECONDS, False),
+    (SERVICE, "getMeterStatus", STATUS_TIMEOUT_SECONDS, True),
+    (INFO_SERVICE, None, INFO_TIMEOUT_SECONDS, True),
+    # pages of a large ESCO can take a while
+    (INFO_SERVICE, "StreamMeters", TIMEOUT_SECONDS, True),
+]
+
+
+def _duration(seconds: float) -> str:
+    return f"{seconds:g}s"
+
+
+def service_config() -> Dict[str, Any]:
+    method_configs = []
+    for service, method, timeout, retried in _METHODS:
+        name = {"service": service}
+        if method is not None:
+            name["method"] = method
+        config: Dict[str, Any] = {"name": [name]}
+        if timeout is not None:
+            config["timeout"] = _duration(timeout)
+        if retried and RETRY_MAX_ATTEMPTS > 1:
+            config["retryPolicy"] = {
+                "maxAttempts": RETRY_MAX_ATTEMPTS,
+                "initialBackoff": _duration(RETRY_INITIAL_BACKOFF_SECONDS),
+                "maxBackoff": _duration(RETRY_MAX_BACKOFF_SECONDS),
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            }
+        method_configs.append(config)
+
+    return {
+        "methodConfig": method_configs,
+        "retryThrottling": {"maxTokens": 10, "tokenRatio": 0.1},
+    }
+
+
+def service_config_json() -> str:
+    return json.dumps(service_config())
+
+
+def record_retries(method: str, trailing_metadata: Sequence[Any] | None) -> None:
+    """Count the retries the mediator reported for a finished call."""
+    for key, value in trailing_metadata or ():
+        if key == ATTEMPTS_METADATA_KEY:
+            try:
+                retries = int(value)
+            except ValueError:
+                return
+            if retries > 0:
+                CLIENT_RETRIES.inc(retries, method=method)
+                logger.debug("call retried", method=method, retries=retries)
+            return
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Request coalescing for identical concurrent meter reads.
+
+    When a second caller asks for something already in flight for the same
+    meter (eg. a sync job and a CLI user both reading the serial) it waits
+    for the first call and shares its result or error instead of queueing
+    another meter round trip.
+
+    Only use for requests without side effects.
+"""
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.shared = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def shared(self, key: Hashable) -> int:
+        """Callers that have joined the call in flight for key."""
+        call = self._calls.get(key)
+        return call.shared if call is not None else 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Call fn, or if a call for key is already in flight wait for it and
+        return its result (or raise its error).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.shared += 1
+
+        if not leader:
+            logger.debug("joined in flight request", key=key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines. The shared call runs as its own task so a
+    caller giving up (cancelled) does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """See SingleFlight.do."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            logger.debug("joined in flight request", key=key)
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark the error retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -3,22 +3,25 @@
 Simple Profile Download Script
 
 This script provides a basic implementation of profile log 1 downloading for a single day.
-It takes CLI arguments for serial and date, and downloads profile log 1 data
-in chunks for one day via the Emlite mediator.
+It takes CLI arguments for serial and date, and streams profile log 1 data
+for one day from the Emlite mediator.
 
 Usage:
     python -m simt_emlite.cli.profile_download --serial EML1234567890 --date 2024-08-21
 """
 
 import datetime
-import json
 import logging
 from pathlib import Path
+from dataclasses import asdict
 from typing import Any, Callable, Dict, Optional, cast
 
 
 from simt_emlite.mediator.api_core import EmliteMediatorAPI
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import ProfileLog
 from simt_emlite.profile_logs.download_cache import (
+    CachedLog1Record,
+    CachedLog2Record,
     DownloadCache,
 )
 
@@ -28,6 +31,7 @@ from simt_emlite.smip.smip_file_finder_result import SMIPFileFinderResult
 from simt_emlite.smip.smip_filename import ElementMarker
 from simt_emlite.util.config import load_config
 from simt_emlite.util.logging import get_logger
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 from simt_emlite.util.meters import (
     is_three_phase,
     is_twin_element,
@@ -118,6 +122,7 @@ class ProfileDownloader:
         self.client = EmliteMediatorAPI(
             mediator_address=self.mediator_server,
             logging_level=self.logging_level,
+            priority="bulk",
         )
 
         logger.info(f"Connected to mediator at {self.mediator_server}")
@@ -138,32 +143,20 @@ class ProfileDownloader:
             search_name = parts[1]
             logger.debug(f"Searching for meter with ESCO [{esco_code}] and Name [{search_name}]")
 
-        # Get meters list from mediator
+        # Ask the mediator for meters with the name, filtering on the server
         # If we have an ESCO code, use it to filter the list
-        meters_json = self.client.grpc_client.get_meters(esco=esco_code)
-        try:
-            meters = json.loads(meters_json)
-        except Exception as e:
-            logger.error(f"Failed to parse meters JSON from mediator: {e}")
-            raise Exception(f"Could not parse meter list from mediator: {e}")
-
-        # Try to find match by name
-        for meter in meters:
-            # Match against the name segment (e.g. Plot-34.C)
-            if meter.get("name") == search_name:
-                serial = meter.get("serial")
-                if serial:
-                    logger.info(f"Resolved name [{name}] to serial [{serial}]")
-                    # Update name to the one from the registry if needed,
-                    # but keeping original for now.
-                    return str(serial)
-
-            # Also try matching against the full name if search_name didn't work
-            if meter.get("name") == name:
-                serial = meter.get("serial")
-                if serial:
-                    logger.info(f"Resolved full name [{name}] to serial [{serial}]")
-                    return str(serial)
+        for candidate in dict.fromkeys([search_name, name]):
+            # Match against the name segment (e.g. Plot-34.C), then the full
+            # name if search_name didn't work
+            meters = self.client.grpc_client.list_meters(
+                esco=esco_code, name=candidate, fields=["serial", "hardware"]
+            )
+            for meter in meters:
+                if meter.serial:
+                    # saves reading the hardware from the meter next
+                    meter_metadata_cache().put(meter.serial, meter.hardware)
+                    logger.info(f"Resolved name [{name}] to serial [{meter.serial}]")
+                    return meter.serial
 
         raise Exception(f"Meter with name [{name}] not found in mediator registry.")
 
@@ -185,109 +178,25 @@ class ProfileDownloader:
         progress_callback: Optional[Callable[[str], None]] = None,
         cache: Optional[DownloadCache] = None,
     ) -> Dict[datetime.datetime, Any]:
-        """Download profile log 1 data for a single day in chunks
+        """Download profile log 1 data for a single day
 
         Args:
             progress_callback: Optional callback for progress updates
             cache: Optional DownloadCache for resumable downloads
 
         Returns:
-            Dict of timestamp to profile log 1 record (EmopProfileLog1Record or CachedLog1Record)
+            Dict of timestamp to profile log 1 record (CachedLog1Record)
         """
-
-        # Convert date to datetime for the day (ensure timezone-aware)
-        start_datetime = datetime.datetime.combine(
-            self.date, datetime.time.min
-        ).replace(tzinfo=datetime.timezone.utc)
-        end_datetime = datetime.datetime.combine(self.date, datetime.time.max).replace(
-            tzinfo=datetime.timezone.utc
+        return self._download_profile_log_day(
+            ProfileLog.PROFILE_LOG_1, progress_callback, cache
         )
 
-        logger.info(
-            f"Downloading profile_log_1 data for {self.date}",
-            name=self.name,
-            serial=self.serial,
-        )
-
-        # Download in 2-hour chunks (4 x 30-minute intervals per chunk)
-        current_time = start_datetime
-        chunk_size = datetime.timedelta(hours=2)
-        profile_records: Dict[datetime.datetime, Any] = {}
-
-        while current_time < end_datetime:
-            chunk_end = min(current_time + chunk_size, end_datetime)
-            chunk_key = current_time.isoformat()
-
-            # Check cache for this chunk
-            if cache and cache.has_log1_chunk(chunk_key):
-                msg = f"profile_log_1 chunk {current_time.strftime('%H:%M')} loaded from cache"
-                logger.info(msg, name=self.name, serial=self.serial)
-                if progress_callback:
-                    progress_callback(msg)
-                for ts, record in cache.get_log1_records().items():
-                    if current_time <= ts < chunk_end:
-                        profile_records[ts] = record
-                current_time = chunk_end
-                continue
-
-            msg = f"Reading profile_log_1 chunk: {current_time.strftime('%H:%M')} to {chunk_end.strftime('%H:%M')}"
-            logger.debug(
-                msg,
-                name=self.name,
-                serial=self.serial,
-            )
-            if progress_callback:
-                progress_callback(msg)
-
-            # Download profile log for this chunk
-            assert self.client is not None
-            assert self.serial is not None
-            response = self.client.profile_log_1(self.serial, current_time)
-            if response and response.records:
-                logger.debug(
-                    f"Received {len(response.records)} records for {current_time}",
-                    name=self.name,
-                    serial=self.serial,
-                )
-                # future time out of range - see unfuddle #382 - meters will return the next
-                # available data even if that is months ahead
-                response_datetime = response.records[0].timestamp_datetime
-                if response_datetime > end_datetime:
-                    logger.warning(
-                        "Future date returned - skipping remainder for this period",
-                        name=self.name,
-                        date=response_datetime,
-                    )
-                    self.future_date_detected = response_datetime.date()
-                    return profile_records
-
-                for record in response.records:
-                    profile_records[record.timestamp_datetime] = record
-
-                # Save chunk to cache
-                if cache:
-                    chunk_records = {
-                        r.timestamp_datetime.isoformat(): {
-                            "import_a": r.import_a,
-                            "import_b": r.import_b,
-                        }
-                        for r in response.records
-                    }
-                    cache.save_log1_chunk(chunk_key, chunk_records)
-
-            # Move to next chunk
-            current_time = chunk_end
-
-        logger.info("profile_log_1 download completed")
-
-        return profile_records
-
     def download_profile_log_2_day(
         self,
         progress_callback: Optional[Callable[[str], None]] = None,
         cache: Optional[DownloadCache] = None,
     ) -> Dict[datetime.datetime, Any]:
-        """Download profile log 2 data for a single day in chunks.
+        """Download profile log 2 data for a single day.
 
         Profile log 2 returns different numbers of records depending on meter type:
         - Twin element meters (hardware C1.w): 2 records per call (2 x 30 min = 1 hour)
@@ -298,8 +207,28 @@ class ProfileDownloader:
             cache: Optional DownloadCache for resumable downloads
 
         Returns:
-            Dict of timestamp to profile log 2 record (EmopProfileLog2Record or CachedLog2Record)
+            Dict of timestamp to profile log 2 record (CachedLog2Record)
+        """
+        return self._download_profile_log_day(
+            ProfileLog.PROFILE_LOG_2, progress_callback, cache
+        )
+
+    def _download_profile_log_day(
+        self,
+        log: int,
+        progress_callback: Optional[Callable[[str], None]],
+        cache: Optional[DownloadCache],
+    ) -> Dict[datetime.datetime, Any]:
+        """Stream a day of profile log 1 or 2 records from the mediator.
+
+        The mediator walks the day on the meter in a single streamProfileLog
+        call. Each streamed reply is saved to the cache so an interrupted
+        download resumes after the last record received.
         """
+        assert self.client is not None
+        assert self.serial is not None
+
+        log_name = "profile_log_1" if log == ProfileLog.PROFILE_LOG_1 else "profile_log_2"
 
         # Convert date to datetime for the day (ensure timezone-aware)
         start_datetime = datetime.datetime.combine(
@@ -309,82 +238,83 @@ class ProfileDownloader:
             tzinfo=datetime.timezone.utc
         )
 
-        # Chunk size depends on meter type:
-        # - Twin element: 2 records per call = 1 hour (2 x 30 min intervals)
-        # - Single element: 3 records per call = 1.5 hours (3 x 30 min intervals)
-        if self.is_twin_element:
-            chunk_size = datetime.timedelta(hours=1)
-            records_per_chunk = 2
-        else:
-            chunk_size = datetime.timedelta(hours=1, minutes=30)
-            records_per_chunk = 3
-
         logger.info(
-            f"Downloading profile_log_2 data for {self.date} "
-            f"(is_twin_element={self.is_twin_element}, records_per_chunk={records_per_chunk})"
+            f"Downloading {log_name} data for {self.date} "
+            f"(is_twin_element={self.is_twin_element})",
+            name=self.name,
+            serial=self.serial,
         )
 
-        current_time = start_datetime
         profile_records: Dict[datetime.datetime, Any] = {}
+        current_time = start_datetime
 
-        while current_time < end_datetime:
-            chunk_end = min(current_time + chunk_size, end_datetime)
-            chunk_key = current_time.isoformat()
-
-            # Check cache for this chunk
-            if cache and cache.has_log2_chunk(chunk_key):
-                msg = f"profile_log_2 chunk {current_time.strftime('%H:%M')} loaded from cache"
-                logger.debug(msg)
+        if cache:
+            cached = (
+                cache.get_log1_records()
+                if log == ProfileLog.PROFILE_LOG_1
+                else cache.get_log2_records()
+            )
+            for ts, cached_record in cached.items():
+                if start_datetime <= ts <= end_datetime:
+                    profile_records[ts] = cached_record
+            if profile_records:
+                current_time = max(profile_records) + datetime.timedelta(minutes=30)
+                msg = f"{log_name} loaded from cache up to {max(profile_records).strftime('%H:%M')}"
+                logger.info(msg, name=self.name, serial=self.serial)
                 if progress_callback:
                     progress_callback(msg)
-                for ts, record in cache.get_log2_records().items():
-                    if current_time <= ts < chunk_end:
-                        profile_records[ts] = record
-                current_time = chunk_end
-                continue
-
-            msg = f"Reading profile_log_2 chunk: {current_time.strftime('%H:%M')} to {chunk_end.strftime('%H:%M')}"
-            logger.debug(msg)
+
+        if current_time >= end_datetime:
+            logger.info(f"{log_name} download completed (from cache)")
+            return profile_records
+
+        for reply in self.client.profile_log_stream(
+            self.serial, log, current_time, end_datetime, self.is_twin_element
+        ):
+            request_time = datetime.datetime.fromtimestamp(
+                reply.requestTime, datetime.timezone.utc
+            )
+
+            if reply.futureTimestamp:
+                future_datetime = datetime.datetime.fromtimestamp(
+                    reply.futureTimestamp, datetime.timezone.utc
+                )
+                logger.warning(
+                    "Future date returned - skipping remainder for this period",
+                    name=self.name,
+                    date=future_datetime,
+                )
+                self.future_date_detected = future_datetime.date()
+                return profile_records
+
+            msg = f"Received {log_name} {request_time.strftime('%H:%M')} ({len(reply.records)} records)"
+            logger.debug(msg, name=self.name, serial=self.serial)
             if progress_callback:
                 progress_callback(msg)
 
-            assert self.client is not None
-            assert self.serial is not None
-            response = self.client.profile_log_2(self.serial, current_time, self.is_twin_element)
-            if response and response.records:
-                logger.debug(
-                    f"Received {len(response.records)} records for {current_time}"
+            chunk_records: Dict[str, Dict[str, int]] = {}
+            for r in reply.records:
+                timestamp = datetime.datetime.fromtimestamp(
+                    r.timestamp, datetime.timezone.utc
                 )
-                # future time out of range - see unfuddle #382 - meters will return the next
-                # available data even if that is months ahead
-                response_datetime = response.records[0].timestamp_datetime
-                if response_datetime > end_datetime:
-                    logger.warning(
-                        "Future date returned - skipping remainder for this period",
-                        name=self.name,
-                        date=response_datetime,
+                record: CachedLog1Record | CachedLog2Record
+                if log == ProfileLog.PROFILE_LOG_1:
+                    record = CachedLog1Record(import_a=r.importA, import_b=r.importB)
+                else:
+                    record = CachedLog2Record(
+                        active_export_a=r.activeExportA,
+                        active_export_b=r.activeExportB,
                     )
-                    self.future_date_detected = response_datetime.date()
-                    return profile_records
-
-                for record in response.records:
-                    profile_records[record.timestamp_datetime] = record
-
-                # Save chunk to cache
-                if cache:
-                    chunk_records = {}
-                    for r in response.records:
-                        record_data: Dict[str, int] = {
-                            "active_export_a": r.active_export_a,
-                        }
-                        if self.is_twin_element:
-                            record_data["active_export_b"] = r.active_export_b
-                        chunk_records[r.timestamp_datetime.isoformat()] = record_data
-                    cache.save_log2_chunk(chunk_key, chunk_records)
-
-            # Move to next chunk
-            current_time = chunk_end
-
-        logger.info("profile_log_2 download completed")
+                profile_records[timestamp] = record
+                chunk_records[timestamp.isoformat()] = asdict(record)
+
+            # Save chunk to cache
+            if cache:
+                if log == ProfileLog.PROFILE_LOG_1:
+                    cache.save_log1_chunk(request_time.isoformat(), chunk_records)
+                else:
+                    cache.save_log2_chunk(request_time.isoformat(), chunk_records)
+
+        logger.info(f"{log_name} download completed")
 
         return profile_records
@@ -0,0 +1,237 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping
+
+from simt_emlite.util.config import CONFIG_DIR
+from simt_emlite.util.logging import get_logger
+
+logger = get_logger(__name__, __file__)
+
+"""
+    Meter hardware cache shared by everything running on a host.
+
+    Hardware is fixed for a meter but costs one or two meter reads (or a
+    meter_registry query) to find out, and the twin element and three phase
+    flags most callers need follow from it (see util/meters.py). Entries
+    are seeded from the meter_registry hardware column (meter_sync_all,
+    get_hardware, the management API meters() and hardware_cache_seed) or
+    from a read of the meter, and held for TTL_SECONDS. The registry is
+    authoritative: EmliteMediatorAPI.hardware() returns a registry seeded
+    entry without reading the meter, as is_three_phase_lookup and the jobs
+    filtering on the hardware column already trust it. Pass refresh=True
+    to read the meter instead.
+
+    The cache is kept in CACHE_FILE so the CLI, jobs and the profile
+    downloader share it between runs. Writes merge with entries other
+    processes saved since it was read and replace the file atomically.
+    The file is rewritten at most every SAVE_INTERVAL_SECONDS, entries
+    cached in between are saved by the next write, flush() or at exit.
+"""
+
+# JSON file the cache is kept in, empty for a cache in memory only
+CACHE_FILE = os.environ.get(
+    "SIMT_METER_METADATA_CACHE_FILE", os.path.join(CONFIG_DIR, "meter_metadata.json")
+)
+
+# seconds an entry is used before the hardware is looked up again
+TTL_SECONDS = float(os.environ.get("SIMT_METER_METADATA_TTL_SECONDS") or "86400")
+
+# minimum seconds between rewrites of the file
+SAVE_INTERVAL_SECONDS = float(
+    os.environ.get("SIMT_METER_METADATA_SAVE_INTERVAL_SECONDS") or "30"
+)
+
+
+@dataclass(frozen=True)
+class MeterMetadata:
+    serial: str
+    hardware: str
+    meter_id: str | None
+    updated_at: float
+
+
+class MeterMetadataCache:
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float = TTL_SECONDS,
+        save_interval_seconds: float = SAVE_INTERVAL_SECONDS,
+    ):
+        self.path = path or None
+        self.ttl_seconds = ttl_seconds
+        self.save_interval_seconds = save_interval_seconds
+        self._entries: Dict[str, MeterMetadata] = {}
+        self._serials_by_meter_id: Dict[str, str] = {}
+        # mtime of the file when last read, None before the first read
+        self._file_mtime: int | None = None
+        # entries cached since the file was last written
+        self._dirty = False
+        # time.monotonic() of the last write, None before the first
+        self._last_save: float | None = None
+        self._lock = threading.Lock()
+
+    def get(self, serial: str) -> MeterMetadata | None:
+        """Entry for serial if cached and not expired."""
+        with self._lock:
+            entry = self._entries.get(serial)
+            if entry is None or self._expired(entry):
+                # another process may have cached it since the file was read
+                self._load()
+                entry = self._entries.get(serial)
+        return None if entry is None or self._expired(entry) else entry
+
+    def get_by_meter_id(self, meter_id: str) -> MeterMetadata | None:
+        """get() for the meter_registry id of a meter."""
+        with self._lock:
+            serial = self._serials_by_meter_id.get(meter_id)
+            if serial is None:
+                self._load()
+                serial = self._serials_by_meter_id.get(meter_id)
+        return None if serial is None else self.get(serial)
+
+    def hardware(self, serial: str) -> str | None:
+        entry = self.get(serial)
+        return None if entry is None else entry.hardware
+
+    def put(self, serial: str, hardware: str, meter_id: str | None = None) -> None:
+        self.put_many([{"serial": serial, "hardware": hardware, "id": meter_id}])
+
+    def put_many(self, meters: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Cache the hardware of meter_registry style records (serial, hardware
+        and optional id), skipping records without a serial or hardware. The
+        file is written if SAVE_INTERVAL_SECONDS passed since the last write.
+
+        Returns:
+            number of meters cached
+        """
+        now = time.time()
+        count = 0
+        with self._lock:
+            for meter in meters:
+                serial = meter.get("serial")
+                hardware = meter.get("hardware")
+                if not serial or not hardware:
+                    continue
+                meter_id = meter.get("id")
+                if meter_id is None and serial in self._entries:
+                    meter_id = self._entries[serial].meter_id
+                self._set(MeterMetadata(serial, hardware, meter_id, now))
+                count += 1
+            if count > 0:
+                self._dirty = True
+                if self._save_due():
+                    self._save()
+        return count
+
+    def flush(self) -> None:
+        """Write entries cached since the last write to the file."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _save_due(self) -> bool:
+        return (
+            self._last_save is None
+            or time.monotonic() - self._last_save >= self.save_interval_seconds
+        )
+
+    def _expired(self, entry: MeterMetadata) -> bool:
+        return time.time() - entry.updated_at > self.ttl_seconds
+
+    def _set(self, entry: MeterMetadata) -> None:
+        current = self._entries.get(entry.serial)
+        if current is not None and current.updated_at > entry.updated_at:
+            return
+        self._entries[entry.serial] = entry
+        if entry.meter_id is not None:
+            self._serials_by_meter_id[entry.meter_id] = entry.serial
+
+    def _load(self) -> None:
+        """Merge in the file if it changed since last read."""
+        if self.path is None:
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._file_mtime:
+                return
+            # not read again until changed, even if it can't be parsed
+            self._file_mtime = mtime
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "failed to read meter metadata cache", path=self.path, error=e
+            )
+            return
+
+        for serial, record in data.get("meters", {}).items():
+            try:
+                self._set(
+                    MeterMetadata(
+                        serial,
+                        record["hardware"],
+                        record.get("meter_id"),
+                        float(record["updated_at"]),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        if self.path is None:
+            self._dirty = False
+            return
+        self._last_save = time.monotonic()
+        self._load()
+        data = {
+            "meters": {
+                entry.serial: {
+                    "hardware": entry.hardware,
+                    "meter_id": entry.meter_id,
+                    "updated_at": entry.updated_at,
+                }
+                for entry in self._entries.values()
+                if not self._expired(entry)
+            }
+        }
+        try:
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._file_mtime = os.stat(self.path).st_mtime_ns
+            self._dirty = False
+        except OSError as e:
+            # read only home directory in some containers - carry on in memory
+            logger.warning(
+                "failed to save meter metadata cache", path=self.path, error=e
+            )
+
+
+_cache: MeterMetadataCache | None = None
+_cache_lock = threading.Lock()
+
+
+def meter_metadata_cache() -> MeterMetadataCache:
+    """The process wide cache, kept in CACHE_FILE."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MeterMetadataCache(CACHE_FILE)
+                atexit.register(_cache.flush)
+    return _cache
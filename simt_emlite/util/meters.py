@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from supabase import Client
 
+from simt_emlite.util.meter_metadata_cache import meter_metadata_cache
 from simt_emlite.util.supabase import as_first_item
 
 single_phase_hardware_str_to_registry_str = {
@@ -27,7 +28,16 @@ def is_three_phase_lookup(supabase: "Client", meter_id: str) -> bool:
 
 
 def get_hardware(supabase: "Client", meter_id: str) -> str:
+    cached = meter_metadata_cache().get_by_meter_id(meter_id)
+    if cached is not None:
+        return cached.hardware
+
     result = (
-        supabase.table("meter_registry").select("hardware").eq("id", meter_id).execute()
+        supabase.table("meter_registry")
+        .select("id,serial,hardware")
+        .eq("id", meter_id)
+        .execute()
     )
-    return as_first_item(result)["hardware"]
+    meter = as_first_item(result)
+    meter_metadata_cache().put_many([meter])
+    return meter["hardware"]
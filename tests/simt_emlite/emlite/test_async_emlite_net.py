@@ -0,0 +1,98 @@
+"""
+Unit tests for AsyncEmliteNET against a local asyncio server standing in for
+the meter.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from simt_emlite.emlite import emlite_net
+from simt_emlite.emlite.async_emlite_net import AsyncEmliteNET
+from simt_emlite.emlite.emlite_api import EmliteAPI
+
+
+def build_frame(object_id: int) -> bytes:
+    api = EmliteAPI("127.0.0.1")
+    data_field = api._build_data_field(bytearray(object_id.to_bytes(3)))
+    return api._build_frame_bytes(data_field)
+
+
+class FakeMeter:
+    """Echo server that counts connections, optionally replying byte by byte."""
+
+    def __init__(self, in_pieces: bool = False, close_after_reply: bool = False):
+        self.in_pieces = in_pieces
+        self.close_after_reply = close_after_reply
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        while True:
+            data = await reader.read(512)
+            if not data:
+                break
+            if self.in_pieces:
+                for i in range(len(data)):
+                    writer.write(data[i : i + 1])
+                    await writer.drain()
+                    await asyncio.sleep(0.001)
+            else:
+                writer.write(data)
+                await writer.drain()
+            if self.close_after_reply:
+                break
+        writer.close()
+
+    async def stop(self) -> None:
+        assert self.server is not None
+        self.server.close()
+
+
+class TestAsyncEmliteNET(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.use_socks_patch = patch.object(emlite_net, "use_socks", False)
+        self.use_socks_patch.start()
+
+    async def asyncTearDown(self) -> None:
+        self.use_socks_patch.stop()
+
+    async def test_session_reused(self) -> None:
+        meter = FakeMeter()
+        await meter.start()
+        net = AsyncEmliteNET("127.0.0.1", meter.port, persistent=True)
+        for i in range(3):
+            self.assertEqual(await net.send_message(build_frame(i)), build_frame(i))
+        self.assertEqual(meter.connections, 1)
+        await net.close()
+        await meter.stop()
+
+    async def test_reconnects_when_peer_closed_session(self) -> None:
+        meter = FakeMeter(close_after_reply=True)
+        await meter.start()
+        net = AsyncEmliteNET("127.0.0.1", meter.port, persistent=True)
+        self.assertEqual(await net.send_message(build_frame(1)), build_frame(1))
+        await asyncio.sleep(0.01)
+        self.assertEqual(await net.send_message(build_frame(2)), build_frame(2))
+        self.assertEqual(meter.connections, 2)
+        await net.close()
+        await meter.stop()
+
+    async def test_frame_reassembled_from_short_reads(self) -> None:
+        meter = FakeMeter(in_pieces=True)
+        await meter.start()
+        net = AsyncEmliteNET("127.0.0.1", meter.port)
+        self.assertEqual(await net.send_message(build_frame(9)), build_frame(9))
+        await meter.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Unit tests for EmliteNET persistent sessions and frame reading.
+
+A local TCP server stands in for the meter so the tests exercise real sockets.
+"""
+
+import socket
+import threading
+import time
+import unittest
+from typing import Callable
+from unittest.mock import patch
+
+from tenacity import RetryError
+
+from simt_emlite.emlite import emlite_net
+from simt_emlite.emlite.emlite_api import EmliteAPI
+from simt_emlite.emlite.emlite_net import EmliteNET
+from simt_emlite.emlite.emop_framing import EmopFrameError
+from simt_emlite.emlite.retry_policy import FailureClass, RetryPolicy, RetryRule
+
+
+def build_frame(object_id: int) -> bytes:
+    api = EmliteAPI("127.0.0.1")
+    data_field = api._build_data_field(bytearray(object_id.to_bytes(3)))
+    return api._build_frame_bytes(data_field)
+
+
+def send_in_pieces(conn: socket.socket, data: bytes) -> None:
+    for i in range(len(data)):
+        conn.sendall(data[i : i + 1])
+        time.sleep(0.001)
+
+
+class FakeMeter:
+    """Echo server that counts accepted connections.
+
+    If close_after_reply is set each connection is closed after one reply.
+    """
+
+    def __init__(
+        self,
+        close_after_reply: bool = False,
+        reply: Callable[[socket.socket, bytes], None] | None = None,
+    ) -> None:
+        self.close_after_reply = close_after_reply
+        self.reply = reply or (lambda conn, data: conn.sendall(data))
+        self.connections = 0
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket) -> None:
+        with conn:
+            while True:
+                data = conn.recv(512)
+                if not data:
+                    return
+                self.reply(conn, data)
+                if self.close_after_reply:
+                    return
+
+    def stop(self) -> None:
+        self.server.close()
+
+
+class TestPersistentSession(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_socks_patch = patch.object(emlite_net, "use_socks", False)
+        self.use_socks_patch.start()
+
+    def tearDown(self) -> None:
+        self.use_socks_patch.stop()
+
+    def test_non_persistent_connects_per_message(self) -> None:
+        meter = FakeMeter()
+        try:
+            net = EmliteNET("127.0.0.1", meter.port)
+            self.assertEqual(net.send_message(build_frame(1)), build_frame(1))
+            self.assertEqual(net.send_message(build_frame(2)), build_frame(2))
+            self.assertEqual(meter.connections, 2)
+        finally:
+            meter.stop()
+
+    def test_session_reused_for_consecutive_messages(self) -> None:
+        meter = FakeMeter()
+        try:
+            net = EmliteNET("127.0.0.1", meter.port, persistent=True)
+            for i in range(5):
+                self.assertEqual(net.send_message(build_frame(i)), build_frame(i))
+            self.assertEqual(meter.connections, 1)
+            net.close()
+        finally:
+            meter.stop()
+
+    def test_reconnects_when_peer_closed_session(self) -> None:
+        meter = FakeMeter(close_after_reply=True)
+        try:
+            net = EmliteNET("127.0.0.1", meter.port, persistent=True)
+            self.assertEqual(net.send_message(build_frame(1)), build_frame(1))
+            self.assertEqual(net.send_message(build_frame(2)), build_frame(2))
+            self.assertEqual(meter.connections, 2)
+            net.close()
+        finally:
+            meter.stop()
+
+    def test_reconnects_when_session_idle_expired(self) -> None:
+        meter = FakeMeter()
+        try:
+            net = EmliteNET("127.0.0.1", meter.port, persistent=True)
+            self.assertEqual(net.send_message(build_frame(1)), build_frame(1))
+            with patch.object(emlite_net, "session_idle_timeout_seconds", -1.0):
+                self.assertEqual(net.send_message(build_frame(2)), build_frame(2))
+            self.assertEqual(meter.connections, 2)
+            net.close()
+        finally:
+            meter.stop()
+
+
+class TestReadFrame(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_socks_patch = patch.object(emlite_net, "use_socks", False)
+        self.use_socks_patch.start()
+
+    def tearDown(self) -> None:
+        self.use_socks_patch.stop()
+
+    def test_frame_reassembled_from_short_reads(self) -> None:
+        meter = FakeMeter(reply=send_in_pieces)
+        try:
+            net = EmliteNET("127.0.0.1", meter.port)
+            self.assertEqual(net.send_message(build_frame(7)), build_frame(7))
+        finally:
+            meter.stop()
+
+    def test_bytes_before_delimiter_are_skipped(self) -> None:
+        meter = FakeMeter(reply=lambda conn, data: conn.sendall(b"\x00\x00" + data))
+        try:
+            net = EmliteNET("127.0.0.1", meter.port)
+            self.assertEqual(net.send_message(build_frame(7)), build_frame(7))
+        finally:
+            meter.stop()
+
+    def test_crc_mismatch_raises(self) -> None:
+        meter = FakeMeter()
+        try:
+            policy = RetryPolicy(rules={FailureClass.FRAME_ERROR: RetryRule(2, 0, 0)})
+            net = EmliteNET("127.0.0.1", meter.port, retry_policy=policy)
+            corrupt = bytearray(build_frame(7))
+            corrupt[-1] ^= 0xFF
+            with self.assertRaises(RetryError) as cm:
+                net.send_message(bytes(corrupt))
+            self.assertIsInstance(cm.exception.last_attempt.exception(), EmopFrameError)
+            self.assertEqual(meter.connections, 2)
+        finally:
+            meter.stop()
+
+
+class TestAttemptTimeout(unittest.TestCase):
+    def test_capped_by_deadline(self) -> None:
+        self.assertEqual(
+            emlite_net.attempt_timeout_seconds(None), emlite_net.socket_timeout_seconds
+        )
+        timeout = emlite_net.attempt_timeout_seconds(time.monotonic() + 3)
+        self.assertTrue(2 < timeout <= 3)
+        self.assertEqual(
+            emlite_net.attempt_timeout_seconds(time.monotonic() - 1),
+            emlite_net.MIN_SOCKET_TIMEOUT_SECONDS,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for RetryPolicy failure classification, per class attempt limits
+and the per request retry budget.
+"""
+
+import socket
+import time
+import unittest
+
+from python_socks import ProxyConnectionError, ProxyError  # type: ignore[import-untyped]
+from tenacity import RetryError, Retrying
+
+from simt_emlite.emlite.emop_framing import EmopFrameError
+from simt_emlite.emlite.retry_policy import (
+    PROXY_REFUSED_MESSAGE,
+    ConnectTimeoutError,
+    FailureClass,
+    RetryPolicy,
+    RetryRule,
+    classify_failure,
+)
+
+NO_WAIT_RULES = {
+    failure: RetryRule(attempts, 0, 0)
+    for failure, attempts in [
+        (FailureClass.PROXY_REFUSED, 5),
+        (FailureClass.CONNECT_TIMEOUT, 2),
+        (FailureClass.FRAME_ERROR, 3),
+    ]
+}
+
+
+def run(policy: RetryPolicy, error: Exception, deadline: float | None = None) -> int:
+    """Run a call that always fails with error, return the attempts made."""
+    attempts = 0
+    try:
+        for attempt in Retrying(**policy.tenacity_kwargs(deadline)):
+            with attempt:
+                attempts += 1
+                raise error
+    except RetryError:
+        pass
+    return attempts
+
+
+class TestClassifyFailure(unittest.TestCase):
+    def test_classes(self) -> None:
+        self.assertEqual(
+            classify_failure(ProxyError(PROXY_REFUSED_MESSAGE)),
+            FailureClass.PROXY_REFUSED,
+        )
+        self.assertEqual(classify_failure(ProxyError("other")), FailureClass.OTHER)
+        self.assertEqual(
+            classify_failure(ProxyConnectionError("gateway down")),
+            FailureClass.GATEWAY_RESTART,
+        )
+        self.assertEqual(
+            classify_failure(ConnectTimeoutError()), FailureClass.CONNECT_TIMEOUT
+        )
+        self.assertEqual(classify_failure(socket.timeout()), FailureClass.READ_TIMEOUT)
+        self.assertEqual(classify_failure(EmopFrameError()), FailureClass.FRAME_ERROR)
+        self.assertEqual(classify_failure(EOFError()), FailureClass.FRAME_ERROR)
+        self.assertEqual(classify_failure(ValueError()), FailureClass.OTHER)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_attempts_limited_per_class(self) -> None:
+        policy = RetryPolicy(rules=NO_WAIT_RULES)
+        self.assertEqual(run(policy, ProxyError(PROXY_REFUSED_MESSAGE)), 5)
+        self.assertEqual(run(policy, ConnectTimeoutError()), 2)
+        self.assertEqual(run(policy, EmopFrameError()), 3)
+
+    def test_budget_stops_retries_before_deadline(self) -> None:
+        policy = RetryPolicy(rules=NO_WAIT_RULES, min_attempt_seconds=1.0)
+        deadline = time.monotonic() + 0.5
+        self.assertEqual(run(policy, ProxyError(PROXY_REFUSED_MESSAGE), deadline), 1)
+
+    def test_backoff_capped_and_jittered(self) -> None:
+        rule = RetryRule(10, 1.0, 4.0)
+        self.assertEqual(rule.delay(1, 0), 1.0)
+        self.assertEqual(rule.delay(3, 0), 4.0)
+        self.assertEqual(rule.delay(8, 0), 4.0)
+        for _ in range(20):
+            self.assertTrue(2.0 <= rule.delay(3, 0.5) <= 4.0)
+
+    def test_on_retry_called(self) -> None:
+        calls = []
+        policy = RetryPolicy(
+            rules=NO_WAIT_RULES,
+            on_retry=lambda failure, attempt, delay: calls.append((failure, attempt)),
+        )
+        run(policy, ConnectTimeoutError())
+        self.assertEqual(calls, [(FailureClass.CONNECT_TIMEOUT, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
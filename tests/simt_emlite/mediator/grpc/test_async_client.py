@@ -0,0 +1,94 @@
+"""
+AsyncEmliteMediatorGrpcClient against an in-process grpc.aio server.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import grpc
+
+from simt_emlite.mediator.grpc.async_client import AsyncEmliteMediatorGrpcClient
+from simt_emlite.mediator.grpc.exception.EmliteCircuitOpen import EmliteCircuitOpen
+from simt_emlite.mediator.grpc.exception.EmliteConnectionFailure import (
+    EmliteConnectionFailure,
+)
+from simt_emlite.mediator.grpc.exception.EmliteEOFError import EmliteEOFError
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    ReadElementsReply,
+    SendRawMessageReply,
+)
+from simt_emlite.mediator.grpc.generated.mediator_pb2_grpc import (
+    EmliteMediatorServiceServicer,
+    add_EmliteMediatorServiceServicer_to_server,
+)
+from simt_emlite.mediator.grpc.meter_queue import PRIORITY_METADATA_KEY
+
+
+class FakeServicer(EmliteMediatorServiceServicer):
+    def __init__(self) -> None:
+        self.metadata: dict[str, str] = {}
+
+    async def sendRawMessage(self, request, context):
+        self.metadata = dict(context.invocation_metadata())
+        if request.serial == "OPEN":
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION, "circuit open")
+        if request.serial == "DOWN":
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "failed to connect after retries"
+            )
+        return SendRawMessageReply(response=request.dataField[::-1])
+
+    async def readElements(self, request, context):
+        for object_id in request.objectIds:
+            yield ReadElementsReply(objectId=object_id, error="EOFError: eof")
+
+    async def readElement(self, request, context):
+        await context.abort(grpc.StatusCode.INTERNAL, "EOFError: eof")
+
+
+class TestAsyncEmliteMediatorGrpcClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.servicer = FakeServicer()
+        self.server = grpc.aio.server()
+        add_EmliteMediatorServiceServicer_to_server(self.servicer, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        await self.server.start()
+
+        # insecure channel
+        patcher = patch.dict("os.environ", {"MEDIATOR_CLIENT_CERT": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = AsyncEmliteMediatorGrpcClient(
+            f"127.0.0.1:{port}", priority="bulk"
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.stop(None)
+
+    async def test_send_message(self) -> None:
+        self.assertEqual(
+            await self.client.send_message("EML1", b"\x01\x02"), b"\x02\x01"
+        )
+        self.assertEqual(self.servicer.metadata[PRIORITY_METADATA_KEY], "bulk")
+
+    async def test_server_failures_mapped(self) -> None:
+        with self.assertRaises(EmliteCircuitOpen):
+            await self.client.send_message("OPEN", b"\x01")
+        with self.assertRaises(EmliteConnectionFailure):
+            await self.client.send_message("DOWN", b"\x01")
+        with self.assertRaises(EmliteEOFError):
+            await self.client.read_element("EML1", 1)
+
+    async def test_read_elements_failed_elements(self) -> None:
+        results = await self.client.read_elements("EML1", [1, 2])
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(isinstance(r, EmliteEOFError) for r in results))
+
+    async def test_close_then_reopen(self) -> None:
+        await self.client.close()
+        self.assertEqual(await self.client.send_message("EML1", b"\x01"), b"\x01")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Unit tests for AsyncEmliteMediatorServicer with the meter api mocked.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import grpc
+from tenacity import RetryError
+
+from simt_emlite.mediator.grpc.async_mediator_service import (
+    AsyncEmliteMediatorServicer,
+)
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    GetMeterStatusRequest,
+    ReadElementRequest,
+    ReadElementsRequest,
+)
+from simt_emlite.mediator.grpc.meter_registry import AsyncMeterContext
+
+
+class Aborted(Exception):
+    pass
+
+
+@patch("simt_emlite.mediator.grpc.request_spacing.INITIAL_SPACING_SECONDS", 0)
+@patch("simt_emlite.mediator.grpc.request_spacing.MIN_SPACING_SECONDS", 0)
+class TestAsyncMediatorServicer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.meters = {
+            serial: AsyncMeterContext(serial, "127.0.0.1")
+            for serial in ["EML1", "EML2"]
+        }
+        for meter in self.meters.values():
+            meter.api = AsyncMock()
+        registry = MagicMock()
+        registry.get_meter.side_effect = lambda s: self.meters.get(s)
+        self.servicer = AsyncEmliteMediatorServicer(registry)
+        self.context = MagicMock()
+        self.context.time_remaining.return_value = None
+        self.context.invocation_metadata.return_value = []
+        self.context.abort = AsyncMock(side_effect=Aborted)
+
+    async def test_meters_served_concurrently(self) -> None:
+        both_reading = asyncio.Event()
+        reading = 0
+
+        async def read_element(object_id: bytes, deadline: float | None) -> bytes:
+            nonlocal reading
+            reading += 1
+            if reading == 2:
+                both_reading.set()
+            await asyncio.wait_for(both_reading.wait(), 1)
+            return b"\x01"
+
+        for meter in self.meters.values():
+            meter.api.read_element.side_effect = read_element
+
+        replies = await asyncio.gather(
+            self.servicer.readElement(
+                ReadElementRequest(serial="EML1", objectId=1), self.context
+            ),
+            self.servicer.readElement(
+                ReadElementRequest(serial="EML2", objectId=1), self.context
+            ),
+        )
+        self.assertEqual([r.response for r in replies], [b"\x01", b"\x01"])
+
+    async def test_identical_reads_coalesced(self) -> None:
+        meter = self.meters["EML1"]
+
+        async def read_element(object_id: bytes, deadline: float | None) -> bytes:
+            await asyncio.sleep(0.01)
+            return b"\x01"
+
+        meter.api.read_element.side_effect = read_element
+        request = ReadElementRequest(serial="EML1", objectId=1)
+        replies = await asyncio.gather(
+            self.servicer.readElement(request, self.context),
+            self.servicer.readElement(request, self.context),
+        )
+        self.assertEqual([r.response for r in replies], [b"\x01", b"\x01"])
+        self.assertEqual(meter.api.read_element.call_count, 1)
+
+    async def test_read_elements_streams_reply_per_element(self) -> None:
+        meter = self.meters["EML1"]
+        meter.api.read_element.side_effect = [b"\x01", EOFError("eof"), b"\x03"]
+        replies = [
+            r
+            async for r in self.servicer.readElements(
+                ReadElementsRequest(serial="EML1", objectIds=[1, 2, 3]), self.context
+            )
+        ]
+        self.assertEqual([r.objectId for r in replies], [1, 2, 3])
+        self.assertTrue(replies[1].error.startswith("EOFError"))
+        self.assertTrue(meter.queue.try_acquire())
+
+    async def test_read_elements_failures_count_against_breaker(self) -> None:
+        meter = self.meters["EML1"]
+        meter.api.read_element.side_effect = EOFError("eof")
+        replies = [
+            r
+            async for r in self.servicer.readElements(
+                ReadElementsRequest(serial="EML1", objectIds=[1, 2]), self.context
+            )
+        ]
+        self.assertTrue(all(r.error for r in replies))
+        self.assertEqual(meter.breaker.consecutive_failures, 2)
+
+    async def test_connection_failure_aborts_and_releases_meter(self) -> None:
+        meter = self.meters["EML1"]
+        meter.api.read_element.side_effect = RetryError(MagicMock())
+        with self.assertRaises(Aborted):
+            await self.servicer.readElement(
+                ReadElementRequest(serial="EML1", objectId=1), self.context
+            )
+        self.context.abort.assert_called_with(
+            grpc.StatusCode.INTERNAL, "failed to connect after retries"
+        )
+        self.assertEqual(meter.breaker.consecutive_failures, 1)
+        self.assertTrue(meter.queue.try_acquire())
+
+    async def test_status_does_not_allocate_cache(self) -> None:
+        reply = await self.servicer.getMeterStatus(
+            GetMeterStatusRequest(serial="EML1"), self.context
+        )
+        self.assertEqual((reply.cacheHits, reply.cacheMisses), (0, 0))
+        self.assertIsNone(self.meters["EML1"]._cache)
+
+    async def test_unknown_meter_not_found(self) -> None:
+        with self.assertRaises(Aborted):
+            await self.servicer.readElement(
+                ReadElementRequest(serial="EML9", objectId=1), self.context
+            )
+        self.context.abort.assert_called_with(
+            grpc.StatusCode.NOT_FOUND, "Meter 'EML9' not known"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
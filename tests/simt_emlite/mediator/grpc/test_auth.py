@@ -0,0 +1,206 @@
+"""
+Unit tests for client identity resolution and the authorization decision.
+"""
+
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+
+import grpc
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from simt_emlite.mediator.grpc import auth
+from simt_emlite.mediator.grpc.client_quota import ClientLimits, ClientQuota
+from simt_emlite.mediator.grpc.auth import (
+    RETRY_AFTER_METADATA_KEY,
+    AuthorizationInterceptor,
+    ClientIdentity,
+    admit,
+    authorization_failure,
+    clear_identity_cache,
+    extract_client_identity,
+)
+
+READ = "/EmliteMediatorService/readElement"
+WRITE = "/EmliteMediatorService/writeElement"
+
+
+def _client_pem(client_id: str, role: str) -> bytes:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name(
+        [
+            x509.NameAttribute(NameOID.COMMON_NAME, client_id),
+            x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, role),
+        ]
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.PEM)
+
+
+class Aborted(Exception):
+    pass
+
+
+class _Context:
+    def __init__(self, client_id: str | None, pem: bytes | None = None) -> None:
+        self.client_id = client_id
+        self.pem = pem
+        self.trailing_metadata: tuple = ()
+
+    def set_trailing_metadata(self, metadata: tuple) -> None:
+        self.trailing_metadata = metadata
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise Aborted(code)
+
+    def auth_context(self) -> dict[str, list[bytes]]:
+        if self.client_id is None:
+            return {}
+        auth_context = {"x509_common_name": [self.client_id.encode()]}
+        if self.pem is not None:
+            auth_context["x509_pem_cert"] = [self.pem]
+        return auth_context
+
+
+class TestAuthorization(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_identity_cache()
+        self.addCleanup(clear_identity_cache)
+
+    def test_identity_from_certificate(self) -> None:
+        context = _Context("company-xyz-api", _client_pem("company-xyz-api", "partner"))
+        self.assertEqual(
+            extract_client_identity(context),
+            ClientIdentity(client_id="company-xyz-api", role="partner"),
+        )
+
+    def test_certificate_parsed_once(self) -> None:
+        context = _Context("company-xyz-api", _client_pem("company-xyz-api", "partner"))
+        with patch(
+            "simt_emlite.mediator.grpc.auth.x509.load_pem_x509_certificate",
+            wraps=x509.load_pem_x509_certificate,
+        ) as load:
+            for _ in range(3):
+                self.assertIsNone(authorization_failure(context, READ))
+            load.assert_called_once()
+
+    def test_permission_decisions(self) -> None:
+        partner = _Context("partner-api", _client_pem("partner-api", "partner"))
+        internal = _Context("internal-api", _client_pem("internal-api", "internal"))
+        unknown = _Context("other-api", _client_pem("other-api", "other"))
+
+        self.assertIsNone(authorization_failure(partner, READ))
+        self.assertEqual(
+            authorization_failure(partner, WRITE)[0],  # type: ignore[index]
+            grpc.StatusCode.PERMISSION_DENIED,
+        )
+        self.assertIsNone(authorization_failure(internal, WRITE))
+        self.assertEqual(
+            authorization_failure(unknown, READ)[0],  # type: ignore[index]
+            grpc.StatusCode.PERMISSION_DENIED,
+        )
+
+    def test_no_certificate_unauthenticated(self) -> None:
+        self.assertEqual(
+            authorization_failure(_Context(None), READ),
+            (grpc.StatusCode.UNAUTHENTICATED, "Client certificate required."),
+        )
+
+    def test_least_recently_used_peer_evicted(self) -> None:
+        cache = auth._PeerAuthorizationCache(2)
+        peers = {
+            key: auth._PeerAuthorization(
+                ClientIdentity(key, None),
+                frozenset(),
+                ClientQuota(key, ClientLimits()),
+            )
+            for key in ["a", "b", "c"]
+        }
+        cache.put("a", peers["a"])
+        cache.put("b", peers["b"])
+        cache.get("a")
+        cache.put("c", peers["c"])
+
+        self.assertIs(cache.get("a"), peers["a"])
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(cache.get("c"), peers["c"])
+
+
+@patch.dict(
+    "simt_emlite.mediator.grpc.auth.ROLE_LIMITS",
+    {"partner": ClientLimits(requests_per_second=1, burst=2, max_in_flight=1)},
+)
+class TestClientQuotas(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_identity_cache()
+        self.addCleanup(clear_identity_cache)
+        self.partner = _Context("partner-api", _client_pem("partner-api", "partner"))
+
+    def _handler(self, handler) -> object:
+        details = MagicMock(method=READ)
+        return (
+            AuthorizationInterceptor()
+            .intercept_service(
+                lambda _: grpc.unary_unary_rpc_method_handler(handler), details
+            )
+            .unary_unary
+        )
+
+    def test_in_flight_quota(self) -> None:
+        quota, rejection = admit(self.partner, READ)
+        assert quota is not None
+        self.assertIsNone(rejection)
+
+        _, rejection = admit(self.partner, READ)
+        assert rejection is not None
+        self.assertEqual(rejection.code, grpc.StatusCode.RESOURCE_EXHAUSTED)
+        self.assertEqual(
+            rejection.trailing_metadata(), ((RETRY_AFTER_METADATA_KEY, "1.000"),)
+        )
+
+        quota.release()
+        self.assertIsNotNone(admit(self.partner, READ)[0])
+
+    def test_other_roles_unlimited(self) -> None:
+        internal = _Context("internal-api", _client_pem("internal-api", "internal"))
+        for _ in range(10):
+            self.assertIsNone(admit(internal, READ)[1])
+
+    def test_interceptor_releases_quota_and_rejects_over_rate(self) -> None:
+        handler = self._handler(lambda request, context: request)
+        self.assertEqual(handler(b"1", self.partner), b"1")
+        self.assertEqual(handler(b"2", self.partner), b"2")
+
+        with self.assertRaises(Aborted) as raised:
+            handler(b"3", self.partner)
+        self.assertEqual(raised.exception.args[0], grpc.StatusCode.RESOURCE_EXHAUSTED)
+        key, value = self.partner.trailing_metadata[0]
+        self.assertEqual(key, RETRY_AFTER_METADATA_KEY)
+        self.assertGreater(float(value), 0.9)
+
+    def test_interceptor_releases_quota_on_error(self) -> None:
+        def failing(request, context):
+            raise RuntimeError("meter unreachable")
+
+        with self.assertRaises(RuntimeError):
+            self._handler(failing)(b"", self.partner)
+        self.assertEqual(
+            auth.client_quota(ClientIdentity("partner-api", "partner")).in_flight, 0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+
+from simt_emlite.mediator.grpc import channel_pool
+from simt_emlite.mediator.grpc.channel_pool import ChannelPool
+from simt_emlite.mediator.grpc.client import EmliteMediatorGrpcClient
+from simt_emlite.mediator.grpc.generated.mediator_pb2_grpc import (
+    EmliteMediatorServiceStub,
+    InfoServiceStub,
+)
+
+
+class TestChannelPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ChannelPool()
+        self.addCleanup(self.pool.close)
+
+    def test_same_key_shares_channel_and_stub(self) -> None:
+        key = ("127.0.0.1:50051", None)
+        self.assertIs(self.pool.channel(key), self.pool.channel(key))
+        stub = self.pool.stub(key, EmliteMediatorServiceStub)
+        self.assertIs(stub, self.pool.stub(key, EmliteMediatorServiceStub))
+        self.assertIsNot(stub, self.pool.stub(key, InfoServiceStub))
+
+    def test_different_keys_get_different_channels(self) -> None:
+        self.assertIsNot(
+            self.pool.channel(("127.0.0.1:50051", None)),
+            self.pool.channel(("127.0.0.1:50052", None)),
+        )
+
+    def test_close_closes_channels_and_later_calls_reopen(self) -> None:
+        key = ("127.0.0.1:50051", None)
+        channel = self.pool.channel(key)
+        with patch.object(channel, "close") as close:
+            self.pool.close()
+        close.assert_called_once()
+        self.assertIsNot(channel, self.pool.channel(key))
+
+
+class TestClientChannels(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(channel_pool.close_channels)
+        # insecure channels
+        patcher = patch.dict("os.environ", {"MEDIATOR_CLIENT_CERT": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clients_share_a_channel(self) -> None:
+        first = EmliteMediatorGrpcClient("127.0.0.1:50051")
+        second = EmliteMediatorGrpcClient("127.0.0.1:50051")
+        self.assertIs(first._channel, second._channel)
+        self.assertIs(first._mediator_stub(), second._mediator_stub())
+
+        # closing a client leaves the shared channel open for the others
+        first.close()
+        self.assertIs(first._channel, second._channel)
+
+
+if __name__ == "__main__":
+    unittest.main()
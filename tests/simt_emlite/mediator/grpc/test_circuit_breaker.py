@@ -0,0 +1,108 @@
+"""
+Unit tests for the per meter CircuitBreaker and its use in
+EmliteMediatorServicer.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import grpc
+from tenacity import RetryError
+
+from simt_emlite.mediator.grpc.circuit_breaker import BreakerState, CircuitBreaker
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    GetMeterStatusRequest,
+    ReadElementRequest,
+)
+from simt_emlite.mediator.grpc.mediator_service import EmliteMediatorServicer
+from simt_emlite.mediator.grpc.meter_registry import MeterContext
+
+
+class Aborted(Exception):
+    pass
+
+
+def abort_context() -> MagicMock:
+    context = MagicMock()
+    context.time_remaining.return_value = None
+    context.abort.side_effect = Aborted
+    return context
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self) -> None:
+        breaker = CircuitBreaker("EML1", failure_threshold=3, open_seconds=60)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, BreakerState.OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertGreater(breaker.open_seconds_remaining(), 0)
+
+    def test_success_resets_failures(self) -> None:
+        breaker = CircuitBreaker("EML1", failure_threshold=2, open_seconds=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, BreakerState.CLOSED)
+
+    def test_single_half_open_probe(self) -> None:
+        breaker = CircuitBreaker("EML1", failure_threshold=1, open_seconds=0)
+        breaker.record_failure()
+        self.assertTrue(breaker.probe_due())
+
+        breaker.open_seconds = 60
+        breaker._opened_at -= 60
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, BreakerState.HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, BreakerState.OPEN)
+
+        breaker._opened_at -= 60
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, BreakerState.CLOSED)
+        self.assertEqual(breaker.consecutive_failures, 0)
+
+
+class TestServicerBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meter = MeterContext("EML1", "127.0.0.1")
+        self.meter.api = MagicMock()
+        self.meter.api.read_element.side_effect = RetryError(MagicMock())
+        self.meter.breaker = CircuitBreaker("EML1", failure_threshold=2)
+        registry = MagicMock()
+        registry.get_meter.return_value = self.meter
+        self.servicer = EmliteMediatorServicer(registry)
+
+    @patch("simt_emlite.mediator.grpc.meter_registry.time.sleep")
+    def test_open_breaker_fails_fast(self, _sleep: MagicMock) -> None:
+        request = ReadElementRequest(serial="EML1", objectId=1)
+        for _ in range(2):
+            context = abort_context()
+            with self.assertRaises(Aborted):
+                self.servicer.readElement(request, context)
+            context.abort.assert_called_with(
+                grpc.StatusCode.INTERNAL, "failed to connect after retries"
+            )
+
+        context = abort_context()
+        with self.assertRaises(Aborted):
+            self.servicer.readElement(request, context)
+        self.assertEqual(
+            context.abort.call_args[0][0], grpc.StatusCode.FAILED_PRECONDITION
+        )
+        self.assertEqual(self.meter.api.read_element.call_count, 2)
+
+        status = self.servicer.getMeterStatus(
+            GetMeterStatusRequest(serial="EML1"), abort_context()
+        )
+        self.assertEqual(status.breakerState, "open")
+        self.assertEqual(status.consecutiveFailures, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
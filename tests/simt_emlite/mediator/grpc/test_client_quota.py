@@ -0,0 +1,61 @@
+"""
+Unit tests for the per client token bucket and in flight quota.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from simt_emlite.mediator.grpc.client_quota import (
+    IN_FLIGHT_RETRY_AFTER_SECONDS,
+    ClientLimits,
+    ClientQuota,
+)
+
+
+@patch("simt_emlite.mediator.grpc.client_quota.time.monotonic")
+class TestClientQuota(unittest.TestCase):
+    def test_burst_then_refill(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        quota = ClientQuota("partner-api", ClientLimits(requests_per_second=2, burst=3))
+
+        for _ in range(3):
+            self.assertIsNone(quota.acquire())
+        self.assertAlmostEqual(quota.acquire(), 0.5)  # type: ignore[arg-type]
+
+        monotonic.return_value = 100.5
+        self.assertIsNone(quota.acquire())
+        self.assertIsNotNone(quota.acquire())
+
+    def test_in_flight_limit(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        quota = ClientQuota("partner-api", ClientLimits(max_in_flight=2))
+
+        self.assertIsNone(quota.acquire())
+        self.assertIsNone(quota.acquire())
+        self.assertEqual(quota.acquire(), IN_FLIGHT_RETRY_AFTER_SECONDS)
+
+        quota.release()
+        self.assertIsNone(quota.acquire())
+        self.assertEqual(quota.in_flight, 2)
+
+    def test_rejected_call_takes_no_token(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        quota = ClientQuota(
+            "partner-api", ClientLimits(requests_per_second=1, burst=1, max_in_flight=1)
+        )
+        self.assertIsNone(quota.acquire())
+        self.assertIsNotNone(quota.acquire())
+
+        monotonic.return_value = 101.0
+        quota.release()
+        self.assertIsNone(quota.acquire())
+
+    def test_unlimited(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        quota = ClientQuota("internal-api", ClientLimits())
+        for _ in range(100):
+            self.assertIsNone(quota.acquire())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Unit tests for InfoService caching and batching with the database mocked.
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import grpc
+from google.protobuf.field_mask_pb2 import FieldMask
+
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    GetInfoRequest,
+    GetInfosRequest,
+    GetMeterInfoRequest,
+    GetMetersRequest,
+    ListMetersRequest,
+    Meter,
+)
+from simt_emlite.mediator.grpc.info_service import EmliteInfoServiceServicer, _TtlCache
+
+
+def _registry_rec(serial: str) -> dict:
+    return {
+        "id": f"id-{serial}",
+        "serial": serial,
+        "mode": "active",
+        "meter_shadows": [
+            {
+                "id": f"id-{serial}",
+                "health": "healthy",
+                "csq": None,
+                "clock_time_diff_seconds": 12,
+            }
+        ],
+    }
+
+
+class TestInfoService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.supabase = MagicMock()
+        self.query = self.supabase.table.return_value.select.return_value.in_
+        self.query.side_effect = lambda column, serials: MagicMock(
+            execute=MagicMock(
+                return_value=MagicMock(
+                    data=[_registry_rec(s) for s in serials if s.startswith("EML")]
+                )
+            )
+        )
+        config = {
+            "supabase_url": "http://localhost",
+            "supabase_anon_key": "anon",
+            "supabase_access_token": "token",
+        }
+        with (
+            patch(
+                "simt_emlite.mediator.grpc.info_service.load_config",
+                return_value=config,
+            ),
+            patch(
+                "simt_emlite.mediator.grpc.info_service.supa_client",
+                return_value=self.supabase,
+            ),
+        ):
+            self.servicer = EmliteInfoServiceServicer()
+        self.context = MagicMock()
+
+    def test_get_info_joined_and_cached(self) -> None:
+        for _ in range(3):
+            reply = self.servicer.GetInfo(GetInfoRequest(serial="EML1"), self.context)
+
+        self.query.assert_called_once_with("serial", ["EML1"])
+        self.supabase.table.return_value.select.assert_called_with(
+            "*, meter_shadows(*)"
+        )
+        self.assertNotIn("\n", reply.json_data)
+        self.assertEqual(
+            json.loads(reply.json_data),
+            {
+                "registry": {"id": "id-EML1", "serial": "EML1", "mode": "active"},
+                "shadow": {
+                    "id": "id-EML1",
+                    "health": "healthy",
+                    "csq": None,
+                    "clock_time_diff_seconds": 12,
+                },
+            },
+        )
+
+    def test_get_infos_batches_queries(self) -> None:
+        self.servicer.GetInfo(GetInfoRequest(serial="EML0"), self.context)
+        serials = [f"EML{i}" for i in range(150)] + ["UNKNOWN"]
+
+        reply = self.servicer.GetInfos(GetInfosRequest(serials=serials), self.context)
+
+        self.assertEqual(set(reply.json_data), {f"EML{i}" for i in range(150)})
+        # EML0 was cached, 150 left to read in chunks of 100
+        self.assertEqual(
+            [len(call.args[1]) for call in self.query.call_args_list], [1, 100, 50]
+        )
+
+    def test_unknown_serial_cached(self) -> None:
+        for _ in range(3):
+            self.servicer.GetInfo(GetInfoRequest(serial="UNKNOWN"), self.context)
+            reply = self.servicer.GetInfos(
+                GetInfosRequest(serials=["UNKNOWN"]), self.context
+            )
+            self.assertEqual(dict(reply.json_data), {})
+
+        self.query.assert_called_once_with("serial", ["UNKNOWN"])
+        self.assertEqual(
+            self.context.abort.call_args.args[0], grpc.StatusCode.NOT_FOUND
+        )
+
+    def test_cache_drops_oldest_when_full(self) -> None:
+        cache: _TtlCache[str] = _TtlCache(60, maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.put("a", "3")
+        cache.put("c", "4")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "3")
+        self.assertEqual(cache.get("c"), "4")
+
+    def test_get_meters_cached_per_esco(self) -> None:
+        rpc = self.supabase.rpc
+        rpc.return_value.execute.return_value = MagicMock(
+            data=[{"serial": "EML1", "name": "Plot-1"}]
+        )
+
+        for esco in ["wlce", "WLCE", "hmce"]:
+            reply = self.servicer.GetMeters(GetMetersRequest(esco=esco), self.context)
+
+        self.assertEqual(rpc.call_count, 2)
+        self.assertEqual(reply.json_meters, '[{"serial":"EML1","name":"Plot-1"}]')
+
+    def test_get_meter_info_typed(self) -> None:
+        info = self.servicer.GetMeterInfo(
+            GetMeterInfoRequest(serial="EML1"), self.context
+        )
+        self.assertEqual(
+            (info.serial, info.mode, info.health), ("EML1", "active", "healthy")
+        )
+        self.assertEqual(info.clock_time_diff_seconds, 12)
+        self.assertFalse(info.HasField("csq"))
+
+        masked = self.servicer.GetMeterInfo(
+            GetMeterInfoRequest(serial="EML1", fields=FieldMask(paths=["health"])),
+            self.context,
+        )
+        self.assertEqual(masked.serial, "")
+        self.assertEqual(masked.health, "healthy")
+
+    def _meter_rows(self, rows: list[dict]) -> None:
+        self.supabase.rpc.return_value.execute.return_value = MagicMock(data=rows)
+
+    def test_list_meters_filtered_and_masked(self) -> None:
+        self._meter_rows(
+            [
+                {"serial": "EML1", "name": "Plot-1", "hardware": "C1.w", "csq": 20},
+                {"serial": "EML2", "name": "Plot-2", "hardware": "C1.w", "csq": None},
+            ]
+        )
+        reply = self.servicer.ListMeters(
+            ListMetersRequest(
+                esco="wlce", name="Plot-2", fields=FieldMask(paths=["serial"])
+            ),
+            self.context,
+        )
+        self.assertEqual(list(reply.meters), [Meter(serial="EML2")])
+
+        reply = self.servicer.ListMeters(ListMetersRequest(esco="wlce"), self.context)
+        self.assertEqual(reply.meters[0].csq, 20)
+        self.assertFalse(reply.meters[1].HasField("csq"))
+
+    def test_list_meters_unknown_field(self) -> None:
+        self._meter_rows([{"serial": "EML1"}])
+        self.servicer.ListMeters(
+            ListMetersRequest(fields=FieldMask(paths=["serial", "ip"])), self.context
+        )
+        self.context.abort.assert_called_once()
+        self.assertEqual(
+            self.context.abort.call_args.args[0], grpc.StatusCode.INVALID_ARGUMENT
+        )
+
+    @patch("simt_emlite.mediator.grpc.info_service.METERS_PAGE_SIZE", 2)
+    def test_stream_meters_in_pages(self) -> None:
+        self._meter_rows([{"serial": f"EML{i}"} for i in range(5)])
+        pages = list(self.servicer.StreamMeters(ListMetersRequest(), self.context))
+        self.assertEqual([len(page.meters) for page in pages], [2, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
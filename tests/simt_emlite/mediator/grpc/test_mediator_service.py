@@ -0,0 +1,220 @@
+"""
+Unit tests for EmliteMediatorServicer with the meter api mocked.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import grpc
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum  # type: ignore[import-untyped]
+from tenacity import RetryError
+
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    GetMeterStatusRequest,
+    ReadElementRequest,
+    ReadElementsRequest,
+    WriteElementRequest,
+)
+from simt_emlite.mediator.grpc.mediator_service import EmliteMediatorServicer
+from simt_emlite.emlite.retry_policy import FailureClass
+from simt_emlite.mediator.grpc.meter_registry import MeterContext
+from simt_emlite.mediator.grpc.response_cache import CACHE_BYPASS, CACHE_METADATA_KEY
+
+
+class Aborted(Exception):
+    pass
+
+
+@patch("simt_emlite.mediator.grpc.meter_registry.time.sleep")
+class TestReadElements(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meter = MeterContext("EML1", "127.0.0.1")
+        self.meter.api = MagicMock()
+        registry = MagicMock()
+        registry.get_meter.return_value = self.meter
+        self.servicer = EmliteMediatorServicer(registry)
+        self.context = MagicMock()
+        self.context.time_remaining.return_value = None
+        self.context.invocation_metadata.return_value = []
+        self.context.abort.side_effect = Aborted
+
+    def test_streams_reply_per_element(self, _sleep: MagicMock) -> None:
+        self.meter.api.read_element.side_effect = [b"\x01", EOFError("eof"), b"\x03"]
+        replies = list(
+            self.servicer.readElements(
+                ReadElementsRequest(serial="EML1", objectIds=[1, 2, 3]), self.context
+            )
+        )
+        self.assertEqual([r.objectId for r in replies], [1, 2, 3])
+        self.assertEqual(replies[0].response, b"\x01")
+        self.assertTrue(replies[1].error.startswith("EOFError"))
+        self.assertEqual(replies[2].response, b"\x03")
+        # one turn on the meter for the whole list
+        self.assertTrue(self.meter.queue.try_acquire())
+
+    def test_failed_elements_count_against_breaker(self, _sleep: MagicMock) -> None:
+        self.meter.api.read_element.side_effect = EOFError("eof")
+        replies = list(
+            self.servicer.readElements(
+                ReadElementsRequest(serial="EML1", objectIds=[1, 2]), self.context
+            )
+        )
+        self.assertTrue(all(r.error for r in replies))
+        self.assertEqual(self.meter.breaker.consecutive_failures, 2)
+
+    def test_connection_failure_aborts_stream(self, _sleep: MagicMock) -> None:
+        self.meter.api.read_element.side_effect = RetryError(MagicMock())
+        with self.assertRaises(Aborted):
+            list(
+                self.servicer.readElements(
+                    ReadElementsRequest(serial="EML1", objectIds=[1, 2]), self.context
+                )
+            )
+        self.context.abort.assert_called_with(
+            grpc.StatusCode.INTERNAL, "failed to connect after retries"
+        )
+        self.assertEqual(self.meter.api.read_element.call_count, 1)
+
+
+@patch("simt_emlite.mediator.grpc.meter_registry.time.sleep")
+class TestResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meter = MeterContext("EML1", "127.0.0.1")
+        self.meter.api = MagicMock()
+        self.meter.api.read_element.return_value = b"EML1"
+        registry = MagicMock()
+        registry.get_meter.return_value = self.meter
+        self.servicer = EmliteMediatorServicer(registry)
+        self.context = MagicMock()
+        self.context.time_remaining.return_value = None
+        self.context.invocation_metadata.return_value = []
+        self.context.abort.side_effect = Aborted
+        self.request = ReadElementRequest(
+            serial="EML1", objectId=ObjectIdEnum.serial.value
+        )
+
+    def test_second_read_served_from_cache(self, _sleep: MagicMock) -> None:
+        for _ in range(2):
+            reply = self.servicer.readElement(self.request, self.context)
+            self.assertEqual(reply.response, b"EML1")
+        self.assertEqual(self.meter.api.read_element.call_count, 1)
+        self.assertEqual((self.meter.cache.hits, self.meter.cache.misses), (1, 1))
+
+    def test_status_does_not_allocate_cache(self, _sleep: MagicMock) -> None:
+        reply = self.servicer.getMeterStatus(
+            GetMeterStatusRequest(serial="EML1"), self.context
+        )
+        self.assertEqual((reply.cacheHits, reply.cacheMisses), (0, 0))
+        self.assertIsNone(self.meter._cache)
+
+        self.servicer.readElement(self.request, self.context)
+        reply = self.servicer.getMeterStatus(
+            GetMeterStatusRequest(serial="EML1"), self.context
+        )
+        self.assertEqual((reply.cacheHits, reply.cacheMisses), (0, 1))
+
+    def test_bypass_header_reads_meter(self, _sleep: MagicMock) -> None:
+        self.servicer.readElement(self.request, self.context)
+        self.context.invocation_metadata.return_value = [
+            (CACHE_METADATA_KEY, CACHE_BYPASS)
+        ]
+        self.servicer.readElement(self.request, self.context)
+        self.assertEqual(self.meter.api.read_element.call_count, 2)
+
+    def test_write_invalidates(self, _sleep: MagicMock) -> None:
+        self.servicer.readElement(self.request, self.context)
+        self.servicer.writeElement(
+            WriteElementRequest(serial="EML1", objectId=1, payload=b"\x01"),
+            self.context,
+        )
+        self.servicer.readElement(self.request, self.context)
+        self.assertEqual(self.meter.api.read_element.call_count, 2)
+
+
+@patch("simt_emlite.mediator.grpc.meter_registry.time.sleep")
+class TestDeadlines(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meter = MeterContext("EML1", "127.0.0.1")
+        self.meter.api = MagicMock()
+        registry = MagicMock()
+        registry.get_meter.return_value = self.meter
+        self.servicer = EmliteMediatorServicer(registry)
+        self.context = MagicMock()
+        self.context.time_remaining.return_value = None
+        self.context.invocation_metadata.return_value = []
+        self.context.abort.side_effect = Aborted
+        self.request = ReadElementRequest(serial="EML1", objectId=1)
+
+    def test_cancelled_request_not_sent(self, _sleep: MagicMock) -> None:
+        self.context.is_active.return_value = False
+        with self.assertRaises(Aborted):
+            self.servicer.readElement(self.request, self.context)
+        self.context.abort.assert_called_with(
+            grpc.StatusCode.CANCELLED, "Request cancelled"
+        )
+        self.meter.api.read_element.assert_not_called()
+        self.assertTrue(self.meter.queue.try_acquire())
+
+    def test_expired_deadline_not_sent(self, _sleep: MagicMock) -> None:
+        self.context.is_active.return_value = False
+        # time left when the call arrives, none once it reaches the meter
+        self.context.time_remaining.side_effect = [10.0, 0.0]
+        with self.assertRaises(Aborted):
+            self.servicer.readElement(self.request, self.context)
+        self.context.abort.assert_called_with(
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            "deadline passed before the request was sent",
+        )
+        self.meter.api.read_element.assert_not_called()
+        self.assertTrue(self.meter.queue.try_acquire())
+
+    def test_no_time_left_after_spacing(self, _sleep: MagicMock) -> None:
+        self.meter.mark_used()
+        self.context.time_remaining.return_value = 0.5
+        with self.assertRaises(Aborted):
+            self.servicer.readElement(self.request, self.context)
+        self.assertEqual(
+            self.context.abort.call_args.args[0], grpc.StatusCode.DEADLINE_EXCEEDED
+        )
+        self.meter.api.read_element.assert_not_called()
+        _sleep.assert_not_called()
+
+
+@patch("simt_emlite.mediator.grpc.meter_registry.time.sleep")
+class TestRequestSpacing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meter = MeterContext("EML1", "127.0.0.1")
+        self.meter.api = MagicMock()
+        self.meter.spacing.learned_seconds = 1.0
+        registry = MagicMock()
+        registry.get_meter.return_value = self.meter
+        self.servicer = EmliteMediatorServicer(registry)
+        self.context = MagicMock()
+        self.context.time_remaining.return_value = None
+        self.context.invocation_metadata.return_value = []
+        self.context.abort.side_effect = Aborted
+        self.request = ReadElementRequest(serial="EML1", objectId=1)
+
+    def test_refused_read_spaces_next_request(self, _sleep: MagicMock) -> None:
+        def refused(*args):
+            self.meter.spacing.on_retry(FailureClass.PROXY_REFUSED, 1, 0.5)
+            raise RetryError(MagicMock())
+
+        self.meter.api.read_element.side_effect = refused
+        with self.assertRaises(Aborted):
+            self.servicer.readElement(self.request, self.context)
+        self.assertEqual(self.meter.spacing.gap_seconds, 2.0)
+
+        # spaced from the failed read by the widened gap
+        self.meter.space_out_requests()
+        self.assertAlmostEqual(_sleep.call_args.args[0], 2.0, delta=0.5)
+
+    def test_success_narrows_gap(self, _sleep: MagicMock) -> None:
+        self.meter.api.read_element.return_value = b"\x01"
+        self.servicer.readElement(self.request, self.context)
+        self.assertAlmostEqual(self.meter.spacing.gap_seconds, 0.9)
+        self.assertIsNotNone(self.meter.last_request_datetime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for MeterQueue priority lanes, FIFO order within a lane and
+early rejection, threaded and asyncio.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from simt_emlite.mediator.grpc.meter_queue import (
+    PRIORITY_METADATA_KEY,
+    AsyncMeterQueue,
+    MeterQueue,
+    MeterQueueRejected,
+    Priority,
+    priority_from_metadata,
+)
+
+
+class TestMeterQueue(unittest.TestCase):
+    def _queue_behind_holder(
+        self, queue: MeterQueue, requests: list[tuple[str, Priority]]
+    ) -> list[str]:
+        """Hold the meter while requests queue up, then return service order."""
+        served: list[str] = []
+        release = threading.Event()
+
+        def holder() -> None:
+            with queue.acquire(Priority.SYNC, timeout=5):
+                release.wait()
+
+        def waiter(name: str, priority: Priority) -> None:
+            with queue.acquire(priority, timeout=5):
+                served.append(name)
+
+        threads = [threading.Thread(target=holder)]
+        threads[0].start()
+        while not queue._busy:
+            time.sleep(0.001)
+        for name, priority in requests:
+            t = threading.Thread(target=waiter, args=(name, priority))
+            t.start()
+            threads.append(t)
+            while queue.depth < len(threads) - 1:
+                time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        return served
+
+    def test_served_by_priority_then_arrival(self) -> None:
+        served = self._queue_behind_holder(
+            MeterQueue("EML1"),
+            [
+                ("bulk", Priority.BULK),
+                ("sync1", Priority.SYNC),
+                ("sync2", Priority.SYNC),
+                ("interactive", Priority.INTERACTIVE),
+                ("write", Priority.WRITE),
+            ],
+        )
+        self.assertEqual(served, ["write", "interactive", "sync1", "sync2", "bulk"])
+
+    def test_rejects_when_full(self) -> None:
+        queue = MeterQueue("EML1", max_depth=0)
+        with self.assertRaises(MeterQueueRejected):
+            with queue.acquire(Priority.SYNC, timeout=1):
+                pass
+
+    def test_rejects_when_estimated_wait_exceeds_deadline(self) -> None:
+        queue = MeterQueue("EML1")
+        queue.avg_service_seconds = 10
+        with queue.acquire(Priority.SYNC, timeout=1):
+            with self.assertRaises(MeterQueueRejected):
+                with queue.acquire(Priority.SYNC, 1, time.monotonic() + 5):
+                    pass
+
+    def test_times_out(self) -> None:
+        queue = MeterQueue("EML1")
+        with queue.acquire(Priority.SYNC, timeout=1):
+            with self.assertRaises(TimeoutError):
+                with queue.acquire(Priority.WRITE, timeout=0.05):
+                    pass
+            self.assertEqual(queue.depth, 0)
+        self.assertTrue(queue.try_acquire())
+        queue.release()
+
+    def test_priority_from_metadata(self) -> None:
+        self.assertEqual(
+            priority_from_metadata([(PRIORITY_METADATA_KEY, "bulk")], Priority.SYNC),
+            Priority.BULK,
+        )
+        self.assertEqual(
+            priority_from_metadata([(PRIORITY_METADATA_KEY, "x")], Priority.SYNC),
+            Priority.SYNC,
+        )
+        self.assertEqual(priority_from_metadata(None, Priority.WRITE), Priority.WRITE)
+
+
+class TestAsyncMeterQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_served_by_priority_then_arrival(self) -> None:
+        queue = AsyncMeterQueue("EML1")
+        served: list[str] = []
+
+        async def waiter(name: str, priority: Priority) -> None:
+            async with queue.acquire(priority, timeout=5):
+                served.append(name)
+
+        async with queue.acquire(Priority.SYNC, timeout=5):
+            tasks = []
+            for name, priority in [
+                ("bulk", Priority.BULK),
+                ("sync", Priority.SYNC),
+                ("write", Priority.WRITE),
+            ]:
+                tasks.append(asyncio.create_task(waiter(name, priority)))
+                while queue.depth < len(tasks):
+                    await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(served, ["write", "sync", "bulk"])
+
+    async def test_times_out_and_leaves_queue(self) -> None:
+        queue = AsyncMeterQueue("EML1")
+        async with queue.acquire(Priority.SYNC, timeout=1):
+            with self.assertRaises(TimeoutError):
+                async with queue.acquire(Priority.WRITE, timeout=0.05):
+                    pass
+            self.assertEqual(queue.depth, 0)
+        self.assertTrue(queue.try_acquire())
+        await queue.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
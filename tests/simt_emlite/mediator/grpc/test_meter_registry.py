@@ -0,0 +1,258 @@
+"""
+Unit tests for MeterRegistry snapshot refreshes with the database mocked.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from simt_emlite.mediator.grpc.meter_registry import (
+    BREAKER_PROBE_TIMEOUT_SECONDS,
+    MeterContext,
+    MeterRegistry,
+)
+
+
+class TestMeterRegistryRefresh(unittest.TestCase):
+    def setUp(self) -> None:
+        self.supabase = MagicMock()
+        self.query = self.supabase.table.return_value.select.return_value
+        self.query.gte.return_value = self.query
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.snapshot_file = os.path.join(self.tmp_dir.name, "registry.json")
+        self.registry = self._registry()
+
+    def _registry(self, esco_code: str | None = None) -> MeterRegistry:
+        config = {
+            "supabase_url": "http://localhost",
+            "supabase_anon_key": "anon",
+            "supabase_access_token": "token",
+        }
+        with (
+            patch(
+                "simt_emlite.mediator.grpc.meter_registry.load_config",
+                return_value=config,
+            ),
+            patch(
+                "simt_emlite.mediator.grpc.meter_registry.supa_client",
+                return_value=self.supabase,
+            ),
+        ):
+            return MeterRegistry(esco_code=esco_code, snapshot_file=self.snapshot_file)
+
+    def _rows(self, rows: list[dict]) -> None:
+        self.query.execute.return_value = MagicMock(data=rows)
+
+    def test_incremental_refresh_reads_changed_rows(self) -> None:
+        self._rows(
+            [
+                {
+                    "serial": "EML1",
+                    "ip_address": "10.0.0.1",
+                    "updated_at": "2024-01-02",
+                },
+                {
+                    "serial": "EML2",
+                    "ip_address": "10.0.0.2",
+                    "updated_at": "2024-01-03",
+                },
+            ]
+        )
+        self.registry.refresh_from_db()
+        self.query.gte.assert_not_called()
+        snapshot = self.registry._meters
+        eml1 = self.registry.get_meter("EML1")
+
+        self._rows(
+            [
+                {
+                    "serial": "EML1",
+                    "ip_address": "10.0.0.9",
+                    "updated_at": "2024-01-04",
+                },
+                {
+                    "serial": "EML3",
+                    "ip_address": "10.0.0.3",
+                    "updated_at": "2024-01-04",
+                },
+            ]
+        )
+        self.registry.refresh_from_db(full=False)
+        self.query.gte.assert_called_once_with("updated_at", "2024-01-03")
+
+        # new snapshot swapped in, the old one left as it was
+        self.assertIsNot(self.registry._meters, snapshot)
+        self.assertNotIn("EML3", snapshot)
+        self.assertEqual(len(self.registry.meters()), 3)
+        # existing context kept (queue, breaker, cache) with the new address
+        self.assertIs(self.registry.get_meter("EML1"), eml1)
+        assert eml1 is not None
+        self.assertEqual(eml1.host, "10.0.0.9")
+
+        stats = self.registry.refresh_stats
+        self.assertEqual(stats.refreshes, 2)
+        self.assertEqual(stats.last_refresh_rows, 2)
+        self.assertFalse(stats.last_refresh_full)
+        self.assertEqual(stats.meter_count, 3)
+
+    def test_failed_refresh_keeps_snapshot(self) -> None:
+        self._rows([{"serial": "EML1", "ip_address": "10.0.0.1"}])
+        self.registry.refresh_from_db()
+        self.query.execute.side_effect = Exception("db down")
+
+        self.registry.scheduled_refresh()
+
+        self.assertIsNotNone(self.registry.get_meter("EML1"))
+        self.assertEqual(self.registry.refresh_stats.failures, 1)
+
+    def test_snapshot_loaded_by_new_registry(self) -> None:
+        self._rows(
+            [
+                {
+                    "serial": "EML1",
+                    "ip_address": "10.0.0.1",
+                    "esco": "esco-1",
+                    "hardware": "C1.w",
+                    "updated_at": "2024-01-02",
+                }
+            ]
+        )
+        self.registry.refresh_from_db()
+
+        # restarted with the database down
+        self.query.execute.side_effect = Exception("db down")
+        restarted = self._registry()
+        self.assertTrue(restarted.load_snapshot())
+
+        meter = restarted.get_meter("EML1")
+        assert meter is not None
+        self.assertEqual(meter.host, "10.0.0.1")
+        self.assertEqual(meter.port, 8080)
+        self.assertEqual(meter.esco, "esco-1")
+        self.assertEqual(meter.hardware, "C1.w")
+
+    def test_snapshot_keeps_learned_spacing(self) -> None:
+        self._rows([{"serial": "EML1", "ip_address": "10.0.0.1"}])
+        self.registry.refresh_from_db()
+        meter = self.registry.get_meter("EML1")
+        assert meter is not None
+        meter.spacing.record_refused()
+        self.registry.save_snapshot()
+
+        restarted = self._registry()
+        self.assertTrue(restarted.load_snapshot())
+        loaded = restarted.get_meter("EML1")
+        assert loaded is not None
+        self.assertEqual(loaded.spacing.gap_seconds, meter.spacing.gap_seconds)
+
+    def test_snapshot_without_spacing_loaded(self) -> None:
+        with open(self.snapshot_file, "w") as f:
+            json.dump(
+                {
+                    "version": 1,
+                    "esco_code": None,
+                    "meters": {"EML1": ["10.0.0.1", 8080, None, None]},
+                },
+                f,
+            )
+        self.assertTrue(self.registry.load_snapshot())
+        meter = self.registry.get_meter("EML1")
+        assert meter is not None
+        self.assertIsNone(meter._spacing)
+
+    def test_snapshot_for_other_esco_ignored(self) -> None:
+        self._rows([{"serial": "EML1", "ip_address": "10.0.0.1"}])
+        self.registry.refresh_from_db()
+        with open(self.snapshot_file) as f:
+            self.assertEqual(json.load(f)["esco_code"], None)
+
+        self.assertFalse(self._registry(esco_code="other").load_snapshot())
+
+    def test_missing_snapshot(self) -> None:
+        self.assertFalse(self.registry.load_snapshot())
+        self.assertEqual(self.registry.meters(), [])
+
+
+class TestMeterContext(unittest.TestCase):
+    def test_api_and_queue_created_on_first_use(self) -> None:
+        meter = MeterContext("EML1", "10.0.0.1")
+        self.assertIsNone(meter._api)
+        self.assertIsNone(meter._queue)
+        self.assertIs(meter.queue, meter.queue)
+        self.assertEqual(meter.api.net.host, "10.0.0.1")
+
+        meter.set_host("10.0.0.2")
+        self.assertEqual(meter.api.net.host, "10.0.0.2")
+
+    def test_host_change_closes_old_session(self) -> None:
+        meter = MeterContext("EML1", "10.0.0.1")
+        api = MagicMock()
+        meter.api = api
+        meter.set_host("10.0.0.2")
+        api.close.assert_called_once()
+        self.assertEqual(meter.host, "10.0.0.2")
+        self.assertIsNone(meter._api)
+
+    def test_host_change_waits_for_busy_meter(self) -> None:
+        meter = MeterContext("EML1", "10.0.0.1")
+        api = MagicMock()
+        meter.api = api
+        self.assertTrue(meter.queue.try_acquire())
+
+        meter.set_host("10.0.0.2")
+        # request in progress keeps its session
+        api.close.assert_not_called()
+        self.assertIs(meter.api, api)
+        self.assertEqual(meter.next_host, "10.0.0.2")
+
+        meter.queue.release()
+        meter.apply_host_change()
+        api.close.assert_called_once()
+        self.assertFalse(meter.host_change_pending())
+        self.assertEqual(meter.api.net.host, "10.0.0.2")
+
+    def test_idle_session_evicted(self) -> None:
+        meter = MeterContext("EML1", "10.0.0.1")
+        api = MagicMock()
+        meter.api = api
+        meter.mark_used()
+        meter.evict_session()
+        self.assertIs(meter._api, api)
+
+        meter.last_request_datetime = datetime.now() - timedelta(hours=1)
+        meter.evict_session()
+        api.close.assert_called_once()
+        self.assertIsNone(meter._api)
+        self.assertTrue(meter.queue.try_acquire())
+
+    @patch("simt_emlite.mediator.grpc.meter_registry.time.monotonic")
+    def test_probe_has_a_deadline(self, monotonic: MagicMock) -> None:
+        monotonic.return_value = 1000.0
+        meter = MeterContext("EML1", "10.0.0.1")
+        meter.api = MagicMock()
+        meter.api.read_element.side_effect = TimeoutError("meter offline")
+        meter.breaker = MagicMock()
+        meter.breaker.allow_request.return_value = True
+
+        meter.probe()
+
+        deadline = meter.api.read_element.call_args.args[1]
+        self.assertEqual(deadline, 1000.0 + BREAKER_PROBE_TIMEOUT_SECONDS)
+        meter.breaker.record_failure.assert_called_once()
+        self.assertTrue(meter.queue.try_acquire())
+
+    def test_busy_meter_not_evicted(self) -> None:
+        meter = MeterContext("EML1", "10.0.0.1")
+        meter.api = MagicMock()
+        meter.last_request_datetime = datetime.now() - timedelta(hours=1)
+        self.assertTrue(meter.queue.try_acquire())
+        meter.evict_session()
+        self.assertIsNotNone(meter._api)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Unit tests for walk_profile_log, the range walk behind streamProfileLog.
+"""
+
+import datetime
+import struct
+import unittest
+from typing import List, Tuple
+
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import ProfileLog
+from simt_emlite.mediator.grpc.profile_log_stream import walk_profile_log
+
+UTC = datetime.timezone.utc
+EMOP_EPOCH = datetime.datetime(2000, 1, 1, tzinfo=UTC)
+DAY_START = datetime.datetime(2024, 8, 21, tzinfo=UTC)
+DAY_END = datetime.datetime.combine(DAY_START.date(), datetime.time.max, UTC)
+
+
+def log_1_payload(records: List[Tuple[datetime.datetime, int]]) -> bytes:
+    """Profile log 1 response with 4 records of (timestamp, import_a)."""
+    payload = bytearray(4)
+    for timestamp, import_a in records:
+        seconds = int((timestamp - EMOP_EPOCH).total_seconds())
+        payload += struct.pack("<IHII", seconds, 0, import_a, 0)
+    return bytes(payload + bytes(4))
+
+
+def meter(step_records: int = 4):
+    """Fake meter returning records from the requested time onwards."""
+    requests: List[datetime.datetime] = []
+
+    def send_message(data_field: bytes) -> bytes:
+        seconds = struct.unpack(">I", data_field[1:5])[0]
+        requested = EMOP_EPOCH + datetime.timedelta(seconds=seconds)
+        requests.append(requested)
+        records = [
+            (requested + datetime.timedelta(minutes=30 * i), i)
+            for i in range(step_records)
+        ]
+        # pad to the fixed 4 records of a log 1 response
+        records += [(EMOP_EPOCH, 0)] * (4 - step_records)
+        return log_1_payload(records)
+
+    return send_message, requests
+
+
+class TestWalkProfileLog(unittest.TestCase):
+    def test_day_walked_by_returned_timestamps(self) -> None:
+        send_message, requests = meter()
+        replies = list(
+            walk_profile_log(
+                send_message, ProfileLog.PROFILE_LOG_1, DAY_START, DAY_END, False
+            )
+        )
+        self.assertEqual(len(replies), 12)
+        self.assertEqual(requests[1], DAY_START + datetime.timedelta(hours=2))
+        timestamps = [r.timestamp for reply in replies for r in reply.records]
+        self.assertEqual(len(timestamps), 48)
+        self.assertEqual(timestamps[0], int(DAY_START.timestamp()))
+
+    def test_short_responses_advance_by_last_record(self) -> None:
+        send_message, requests = meter(step_records=3)
+        replies = list(
+            walk_profile_log(
+                send_message, ProfileLog.PROFILE_LOG_1, DAY_START, DAY_END, False
+            )
+        )
+        self.assertEqual(requests[1], DAY_START + datetime.timedelta(minutes=90))
+        self.assertEqual(len(replies), 16)
+        # padding records dated 2000-01-01 are outside the range and dropped
+        self.assertEqual(sum(len(reply.records) for reply in replies), 48)
+
+    def test_future_date_stops_walk(self) -> None:
+        future = DAY_START + datetime.timedelta(days=60)
+
+        def send_message(data_field: bytes) -> bytes:
+            return log_1_payload([(future, 1)] * 4)
+
+        replies = list(
+            walk_profile_log(
+                send_message, ProfileLog.PROFILE_LOG_1, DAY_START, DAY_END, False
+            )
+        )
+        self.assertEqual(len(replies), 1)
+        self.assertEqual(replies[0].futureTimestamp, int(future.timestamp()))
+        self.assertEqual(len(replies[0].records), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from simt_emlite.emlite.retry_policy import FailureClass
+from simt_emlite.mediator.grpc.request_spacing import (
+    INITIAL_SPACING_SECONDS,
+    MAX_SPACING_SECONDS,
+    MIN_SPACING_SECONDS,
+    SPACING_DECREASE_SECONDS,
+    RequestSpacing,
+)
+
+
+class TestRequestSpacing(unittest.TestCase):
+    def test_initial_gap_until_learned(self) -> None:
+        spacing = RequestSpacing()
+        self.assertIsNone(spacing.learned_seconds)
+        self.assertEqual(spacing.gap_seconds, INITIAL_SPACING_SECONDS)
+
+    def test_completed_requests_narrow_gap_to_minimum(self) -> None:
+        spacing = RequestSpacing()
+        spacing.record_done()
+        self.assertAlmostEqual(
+            spacing.gap_seconds, INITIAL_SPACING_SECONDS - SPACING_DECREASE_SECONDS
+        )
+        for _ in range(1000):
+            spacing.record_done()
+        self.assertEqual(spacing.gap_seconds, MIN_SPACING_SECONDS)
+
+    def test_refusal_doubles_gap_to_maximum(self) -> None:
+        spacing = RequestSpacing(1.0)
+        spacing.record_refused()
+        self.assertEqual(spacing.gap_seconds, 2.0)
+        for _ in range(20):
+            spacing.record_refused()
+        self.assertEqual(spacing.gap_seconds, MAX_SPACING_SECONDS)
+
+    def test_refused_request_does_not_narrow_gap(self) -> None:
+        spacing = RequestSpacing(1.0)
+        spacing.on_retry(FailureClass.PROXY_REFUSED, 1, 0.5)
+        spacing.record_done()
+        self.assertEqual(spacing.gap_seconds, 2.0)
+
+        # the next request went through first time
+        spacing.record_done()
+        self.assertAlmostEqual(spacing.gap_seconds, 2.0 - SPACING_DECREASE_SECONDS)
+
+    def test_failed_request_keeps_gap(self) -> None:
+        spacing = RequestSpacing(1.0)
+        spacing.on_retry(FailureClass.PROXY_REFUSED, 1, 0.5)
+        spacing.record_failed()
+        self.assertEqual(spacing.gap_seconds, 2.0)
+
+        # the refusal doesn't carry over to the next request
+        spacing.record_done()
+        self.assertAlmostEqual(spacing.gap_seconds, 2.0 - SPACING_DECREASE_SECONDS)
+
+    def test_other_failures_ignored(self) -> None:
+        spacing = RequestSpacing(1.0)
+        spacing.on_retry(FailureClass.READ_TIMEOUT, 1, 0.5)
+        self.assertEqual(spacing.gap_seconds, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the mediator readElement ResponseCache and its TTL policy.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from emop_frame_protocol.emop_object_id_enum import ObjectIdEnum  # type: ignore[import-untyped]
+from emop_frame_protocol.util import emop_encode_u3be  # type: ignore[import-untyped]
+
+from simt_emlite.emlite.emlite_api import EmliteAPI
+from simt_emlite.mediator.grpc.response_cache import (
+    CACHE_BYPASS,
+    CACHE_METADATA_KEY,
+    CACHE_TTL_SECONDS,
+    IMMUTABLE_TTL_SECONDS,
+    SLOW_CHANGING_TTL_SECONDS,
+    ResponseCache,
+    cache_bypassed,
+    is_read_data_field,
+)
+
+SERIAL = ObjectIdEnum.serial.value
+
+
+@patch("simt_emlite.mediator.grpc.response_cache.time.monotonic")
+class TestResponseCache(unittest.TestCase):
+    def test_hit_until_ttl_expires(self, monotonic) -> None:
+        cache = ResponseCache("EML1")
+        monotonic.return_value = 100.0
+        self.assertIsNone(cache.get(SERIAL))
+        cache.put(SERIAL, b"EML1")
+        self.assertEqual(cache.get(SERIAL), b"EML1")
+
+        monotonic.return_value = 100.0 + IMMUTABLE_TTL_SECONDS + 1
+        self.assertIsNone(cache.get(SERIAL))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_uncacheable_objects_not_stored(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        cache = ResponseCache("EML1")
+        cache.put(ObjectIdEnum.prepay_balance.value, b"\x01")
+        self.assertIsNone(cache.get(ObjectIdEnum.prepay_balance.value))
+        # not counted as a miss - never cacheable
+        self.assertEqual(cache.misses, 0)
+
+    def test_invalidate(self, monotonic) -> None:
+        monotonic.return_value = 100.0
+        cache = ResponseCache("EML1")
+        cache.put(SERIAL, b"EML1")
+        cache.invalidate()
+        self.assertIsNone(cache.get(SERIAL))
+
+
+class TestPolicy(unittest.TestCase):
+    def test_ttls(self) -> None:
+        self.assertEqual(
+            CACHE_TTL_SECONDS[ObjectIdEnum.hardware_version.value],
+            IMMUTABLE_TTL_SECONDS,
+        )
+        self.assertEqual(
+            CACHE_TTL_SECONDS[ObjectIdEnum.tariff_future_standing_charge.value],
+            SLOW_CHANGING_TTL_SECONDS,
+        )
+        self.assertNotIn(ObjectIdEnum.tariff_active_price.value, CACHE_TTL_SECONDS)
+        self.assertNotIn(ObjectIdEnum.time.value, CACHE_TTL_SECONDS)
+
+    def test_current_rate_indexes_not_cached(self) -> None:
+        for object_id in [
+            ObjectIdEnum.tariff_active_tou_rate,
+            ObjectIdEnum.tariff_active_block_rate,
+            ObjectIdEnum.tariff_active_element_b_tou_rate,
+        ]:
+            self.assertNotIn(object_id.value, CACHE_TTL_SECONDS, object_id.name)
+
+    def test_active_tariff_not_cached(self) -> None:
+        # replaced by the future tariff on the meter at activation time
+        # without a write through the mediator
+        for object_id in ObjectIdEnum:
+            if object_id.name.startswith("tariff_active_"):
+                self.assertNotIn(object_id.value, CACHE_TTL_SECONDS, object_id.name)
+        self.assertIn(
+            ObjectIdEnum.tariff_future_activation_datetime.value, CACHE_TTL_SECONDS
+        )
+
+    def test_cache_bypassed(self) -> None:
+        self.assertTrue(cache_bypassed([(CACHE_METADATA_KEY, CACHE_BYPASS)]))
+        self.assertFalse(cache_bypassed([]))
+        self.assertFalse(cache_bypassed(None))
+
+    def test_is_read_data_field(self) -> None:
+        api = EmliteAPI("127.0.0.1")
+        object_id = emop_encode_u3be(SERIAL)
+        # format default | object id | read flag
+        self.assertTrue(is_read_data_field(b"\x01" + bytes(object_id) + b"\x00"))
+        self.assertFalse(
+            is_read_data_field(
+                api._write_element_data_field_bytes(object_id, b"\x01\x02")
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the status codes RPC latency is recorded under.
+"""
+
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+
+import grpc
+
+from simt_emlite.mediator.grpc.rpc_metrics import (
+    RPC_SECONDS,
+    AsyncMetricsInterceptor,
+    MetricsInterceptor,
+)
+
+
+def _details(method: str) -> Any:
+    return MagicMock(method=method, invocation_metadata=())
+
+
+def _context(code: grpc.StatusCode | None) -> MagicMock:
+    context = MagicMock()
+    context.code.return_value = code
+    return context
+
+
+def _unary(request: Any, context: Any) -> str:
+    return "reply"
+
+
+def _stream(request: Any, context: Any):
+    yield "reply"
+
+
+class TestMetricsInterceptor(unittest.TestCase):
+    def _handler(self, method: str, handler: grpc.RpcMethodHandler) -> Any:
+        return MetricsInterceptor().intercept_service(
+            lambda _: handler, _details(method)
+        )
+
+    def test_normal_return_is_ok(self) -> None:
+        method = "/test/UnaryOk"
+        handler = self._handler(method, grpc.unary_unary_rpc_method_handler(_unary))
+        handler.unary_unary(None, _context(None))
+        self.assertEqual(RPC_SECONDS.count(method=method, code="OK"), 1)
+
+    def test_code_set_without_abort_is_recorded(self) -> None:
+        method = "/test/UnaryNotFound"
+        handler = self._handler(method, grpc.unary_unary_rpc_method_handler(_unary))
+        handler.unary_unary(None, _context(grpc.StatusCode.NOT_FOUND))
+        self.assertEqual(RPC_SECONDS.count(method=method, code="NOT_FOUND"), 1)
+        self.assertEqual(RPC_SECONDS.count(method=method, code="OK"), 0)
+
+    def test_stream_code_set_without_abort_is_recorded(self) -> None:
+        method = "/test/StreamUnavailable"
+        handler = self._handler(method, grpc.unary_stream_rpc_method_handler(_stream))
+        list(handler.unary_stream(None, _context(grpc.StatusCode.UNAVAILABLE)))
+        self.assertEqual(RPC_SECONDS.count(method=method, code="UNAVAILABLE"), 1)
+
+
+class TestAsyncMetricsInterceptor(unittest.IsolatedAsyncioTestCase):
+    async def _handler(self, method: str, handler: grpc.RpcMethodHandler) -> Any:
+        async def continuation(_: Any) -> grpc.RpcMethodHandler:
+            return handler
+
+        return await AsyncMetricsInterceptor().intercept_service(
+            continuation, _details(method)
+        )
+
+    async def test_code_set_without_abort_is_recorded(self) -> None:
+        async def unary(request: Any, context: Any) -> str:
+            return "reply"
+
+        method = "/test/AsyncUnaryNotFound"
+        handler = await self._handler(
+            method, grpc.unary_unary_rpc_method_handler(unary)
+        )
+        await handler.unary_unary(None, _context(grpc.StatusCode.NOT_FOUND))
+        await handler.unary_unary(None, _context(None))
+        self.assertEqual(RPC_SECONDS.count(method=method, code="NOT_FOUND"), 1)
+        self.assertEqual(RPC_SECONDS.count(method=method, code="OK"), 1)
+
+    async def test_stream_code_set_without_abort_is_recorded(self) -> None:
+        async def stream(request: Any, context: Any):
+            yield "reply"
+
+        method = "/test/AsyncStreamUnavailable"
+        handler = await self._handler(
+            method, grpc.unary_stream_rpc_method_handler(stream)
+        )
+        async for _ in handler.unary_stream(
+            None, _context(grpc.StatusCode.UNAVAILABLE)
+        ):
+            pass
+        self.assertEqual(RPC_SECONDS.count(method=method, code="UNAVAILABLE"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
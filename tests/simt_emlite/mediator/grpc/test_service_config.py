@@ -0,0 +1,132 @@
+"""
+Client channel service config against an in-process server.
+"""
+
+import json
+import threading
+import time
+import unittest
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+
+from simt_emlite.mediator.grpc import channel_pool
+from simt_emlite.mediator.grpc.client import EmliteMediatorGrpcClient
+from simt_emlite.mediator.grpc.generated.mediator_pb2 import (
+    GetInfoReply,
+    WriteElementReply,
+)
+from simt_emlite.mediator.grpc.generated.mediator_pb2_grpc import (
+    EmliteMediatorServiceServicer,
+    InfoServiceServicer,
+    add_EmliteMediatorServiceServicer_to_server,
+    add_InfoServiceServicer_to_server,
+)
+from simt_emlite.mediator.grpc.rpc_metrics import RPC_RETRIED, MetricsInterceptor
+from simt_emlite.mediator.grpc.service_config import (
+    CLIENT_HEDGES,
+    CLIENT_RETRIES,
+    INFO_SERVICE,
+    SERVICE,
+    service_config_json,
+)
+
+
+class FakeInfoServicer(InfoServiceServicer):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def GetInfo(self, request, context):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if request.serial == "FLAKY" and call == 1:
+            context.abort(grpc.StatusCode.UNAVAILABLE, "restarting")
+        if request.serial == "SLOW" and call == 1:
+            time.sleep(2)
+            return GetInfoReply(json_data="slow")
+        return GetInfoReply(json_data=f"attempt {call}")
+
+
+class FakeMediatorServicer(EmliteMediatorServiceServicer):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def writeElement(self, request, context):
+        self.calls += 1
+        if self.calls == 1:
+            context.abort(grpc.StatusCode.UNAVAILABLE, "restarting")
+        return WriteElementReply()
+
+
+class TestServiceConfig(unittest.TestCase):
+    def test_only_idempotent_methods_are_retried(self) -> None:
+        configs = json.loads(service_config_json())["methodConfig"]
+        retried = {
+            (name["service"], name.get("method"))
+            for config in configs
+            if "retryPolicy" in config
+            for name in config["name"]
+        }
+        self.assertIn((SERVICE, "readElement"), retried)
+        self.assertIn((INFO_SERVICE, None), retried)
+        self.assertNotIn((SERVICE, "writeElement"), retried)
+        self.assertNotIn((SERVICE, "sendRawMessage"), retried)
+
+
+class TestClientRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self.info = FakeInfoServicer()
+        self.mediator = FakeMediatorServicer()
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=4),
+            interceptors=[MetricsInterceptor()],
+        )
+        add_InfoServiceServicer_to_server(self.info, self.server)
+        add_EmliteMediatorServiceServicer_to_server(self.mediator, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.server.start()
+        self.addCleanup(self.server.stop, None)
+        self.addCleanup(channel_pool.close_channels)
+
+        # insecure channel
+        patcher = patch.dict("os.environ", {"MEDIATOR_CLIENT_CERT": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = EmliteMediatorGrpcClient(f"127.0.0.1:{port}")
+
+    def test_unavailable_read_is_retried_and_counted(self) -> None:
+        retries = CLIENT_RETRIES.value(method="GetInfo")
+        retried = RPC_RETRIED.value(method=f"/{INFO_SERVICE}/GetInfo")
+
+        self.assertEqual(self.client.get_info("FLAKY"), "attempt 2")
+        self.assertEqual(self.info.calls, 2)
+        self.assertEqual(CLIENT_RETRIES.value(method="GetInfo"), retries + 1)
+        self.assertEqual(
+            RPC_RETRIED.value(method=f"/{INFO_SERVICE}/GetInfo"), retried + 1
+        )
+
+    def test_unavailable_write_is_not_retried(self) -> None:
+        with self.assertRaises(Exception):
+            self.client.write_element("EML1", 0x0001, b"\x01")
+        self.assertEqual(self.mediator.calls, 1)
+
+    def test_slow_info_call_is_hedged(self) -> None:
+        hedges = CLIENT_HEDGES.value(method="GetInfo")
+        with patch("simt_emlite.mediator.grpc.client.INFO_HEDGING_DELAY_SECONDS", 0.1):
+            self.assertEqual(self.client.get_info("SLOW"), "attempt 2")
+        self.assertEqual(CLIENT_HEDGES.value(method="GetInfo"), hedges + 1)
+
+    def test_no_hedge_for_a_quick_reply(self) -> None:
+        hedges = CLIENT_HEDGES.value(method="GetInfo")
+        with patch("simt_emlite.mediator.grpc.client.INFO_HEDGING_DELAY_SECONDS", 1):
+            self.assertEqual(self.client.get_info("EML1"), "attempt 1")
+        self.assertEqual(self.info.calls, 1)
+        self.assertEqual(CLIENT_HEDGES.value(method="GetInfo"), hedges)
+
+
+if __name__ == "__main__":
+    unittest.main()
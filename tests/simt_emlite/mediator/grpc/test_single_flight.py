@@ -0,0 +1,96 @@
+"""
+Unit tests for SingleFlight / AsyncSingleFlight request coalescing.
+"""
+
+import asyncio
+import threading
+import unittest
+
+from simt_emlite.mediator.grpc.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def _concurrent(self, flights: SingleFlight, fn) -> list:
+        """Run fn through flights from two threads while the first is in it."""
+        started = threading.Event()
+        release = threading.Event()
+        outcomes: list = []
+
+        def leader_fn():
+            started.set()
+            release.wait(5)
+            return fn()
+
+        def call(f) -> None:
+            try:
+                outcomes.append(flights.do("key", f))
+            except Exception as e:
+                outcomes.append(e)
+
+        leader = threading.Thread(target=call, args=(leader_fn,))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call, args=(fn,))
+        follower.start()
+        while flights._calls["key"].shared == 0:
+            pass
+        release.set()
+        leader.join()
+        follower.join()
+        return outcomes
+
+    def test_result_shared(self) -> None:
+        calls = []
+
+        def fn() -> bytes:
+            calls.append(1)
+            return b"\x01"
+
+        self.assertEqual(self._concurrent(SingleFlight(), fn), [b"\x01", b"\x01"])
+        self.assertEqual(len(calls), 1)
+
+    def test_error_shared(self) -> None:
+        def fn() -> bytes:
+            raise EOFError("eof")
+
+        outcomes = self._concurrent(SingleFlight(), fn)
+        self.assertEqual([type(o) for o in outcomes], [EOFError, EOFError])
+
+    def test_sequential_calls_not_shared(self) -> None:
+        flights = SingleFlight()
+        self.assertEqual(flights.do("key", lambda: 1), 1)
+        self.assertEqual(flights.do("key", lambda: 2), 2)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_result_shared(self) -> None:
+        flights = AsyncSingleFlight()
+        calls = 0
+
+        async def fn() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"\x01"
+
+        results = await asyncio.gather(flights.do("key", fn), flights.do("key", fn))
+        self.assertEqual(results, [b"\x01", b"\x01"])
+        self.assertEqual(calls, 1)
+        self.assertEqual(flights._calls, {})
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        flights = AsyncSingleFlight()
+
+        async def fn() -> bytes:
+            await asyncio.sleep(0.01)
+            return b"\x01"
+
+        first = asyncio.create_task(flights.do("key", fn))
+        second = asyncio.create_task(flights.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, b"\x01")
+
+
+if __name__ == "__main__":
+    unittest.main()
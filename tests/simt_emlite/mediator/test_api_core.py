@@ -165,5 +165,74 @@ class TestCsq(unittest.TestCase):
         self.assertEqual(result, 22)
 
 
+class TestThreePhaseRead(unittest.TestCase):
+    """Test three_phase_read batches its reads and tolerates element failures."""
+
+    @patch("simt_emlite.mediator.api_core.EmliteMediatorGrpcClient")
+    def test_failed_element_is_none(self, mock_grpc_client_class: MagicMock) -> None:
+        from simt_emlite.mediator.api_core import EmliteMediatorAPI
+        from simt_emlite.mediator.grpc.exception.EmliteEOFError import EmliteEOFError
+
+        mock_grpc_instance = MagicMock()
+        mock_grpc_instance.read_elements.return_value = [
+            MagicMock(value=1000),
+            EmliteEOFError("eof"),
+            MagicMock(value=3000),
+            MagicMock(value=4000),
+            MagicMock(value=5000),
+            MagicMock(value=6000),
+        ]
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = EmliteMediatorAPI(mediator_address="test:50051")
+        result = client.three_phase_read("EML123456789", "P1.ax")
+
+        mock_grpc_instance.read_elements.assert_called_once()
+        self.assertEqual(len(result), 6)
+        self.assertIsNone(result["active_export"])
+        self.assertIsNotNone(result["active_import"])
+
+
+
+class TestSendMessageErrors(unittest.TestCase):
+    """Test raw message failures are raised as MediatorClientException codes."""
+
+    @patch("simt_emlite.mediator.api_core.EmliteMediatorGrpcClient")
+    def test_send_message_error_codes(self, mock_grpc_client_class: MagicMock) -> None:
+        import grpc
+
+        from simt_emlite.mediator.api_core import EmliteMediatorAPI
+        from simt_emlite.mediator.grpc.exception.EmliteCircuitOpen import (
+            EmliteCircuitOpen,
+        )
+        from simt_emlite.mediator.grpc.exception.EmliteConnectionFailure import (
+            EmliteConnectionFailure,
+        )
+        from simt_emlite.mediator.mediator_client_exception import (
+            MediatorClientException,
+        )
+
+        class DeadlineExceeded(grpc.RpcError):
+            def code(self) -> grpc.StatusCode:
+                return grpc.StatusCode.DEADLINE_EXCEEDED
+
+            def details(self) -> str:
+                return "deadline"
+
+        mock_grpc_instance = MagicMock()
+        mock_grpc_client_class.return_value = mock_grpc_instance
+        client = EmliteMediatorAPI(mediator_address="test:50051")
+
+        for error, code in [
+            (EmliteConnectionFailure("no connection"), "EMLITE_CONNECTION_FAILURE"),
+            (EmliteCircuitOpen("circuit open"), "EMLITE_CIRCUIT_OPEN"),
+            (DeadlineExceeded(), "DEADLINE_EXCEEDED"),
+        ]:
+            mock_grpc_instance.send_message.side_effect = error
+            with self.assertRaises(MediatorClientException) as raised:
+                client.event_log("EML123456789", 0)
+            self.assertEqual(raised.exception.code_str, code)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -36,5 +36,34 @@ class TestPrepayBalance(unittest.TestCase):
         self.assertEqual(result, Decimal("15.00000"))
 
 
+class TestTariffsPricingBlocksRead(unittest.TestCase):
+    """Test the 8x8 pricing table is read with a single readElements call."""
+
+    @patch("simt_emlite.mediator.api_core.EmliteMediatorGrpcClient")
+    def test_pricing_table_from_one_batch(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.api_prepay import EmlitePrepayAPI
+
+        def read_elements(serial: str, object_ids: list) -> list:
+            return [MagicMock(value=i * 100000) for i in range(len(object_ids))]
+
+        mock_grpc_instance = MagicMock()
+        mock_grpc_instance.read_elements.side_effect = read_elements
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = EmlitePrepayAPI(mediator_address="test:50051")
+        pricings = client._tariffs_pricing_blocks_read("EML123456789", True)
+
+        mock_grpc_instance.read_elements.assert_called_once()
+        mock_grpc_instance.read_element.assert_not_called()
+        object_ids = mock_grpc_instance.read_elements.call_args[0][1]
+        self.assertEqual(object_ids[0].name, "tariff_active_block_1_rate_1")
+        self.assertEqual(object_ids[9].name, "tariff_active_block_2_rate_2")
+        self.assertEqual(pricings[0][0], Decimal("0"))
+        self.assertEqual(pricings[1][1], Decimal("9"))
+        self.assertEqual(pricings[7][7], Decimal("63"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the asyncio API clients (async_api_*).
+
+The grpc client is mocked as in test_api_core - these check the async
+methods decode like the sync ones and raise the same exceptions.
+"""
+
+import asyncio
+import datetime
+import unittest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from simt_emlite.mediator.grpc.exception.EmliteCircuitOpen import EmliteCircuitOpen
+from simt_emlite.mediator.mediator_client_exception import MediatorClientException
+
+
+@patch("simt_emlite.mediator.async_api_core.AsyncEmliteMediatorGrpcClient")
+class TestAsyncEmliteMediatorAPI(unittest.IsolatedAsyncioTestCase):
+    async def test_clock_time_read(self, mock_grpc_client_class: MagicMock) -> None:
+        from simt_emlite.mediator.async_api_core import AsyncEmliteMediatorAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_element.return_value = MagicMock(
+            year=25, month=1, date=26, hour=14, minute=30, second=45
+        )
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        async with AsyncEmliteMediatorAPI(mediator_address="test:50051") as client:
+            result = await client.clock_time_read("EML123456789")
+
+        self.assertEqual(
+            result, datetime.datetime(2025, 1, 26, 14, 30, 45, tzinfo=datetime.UTC)
+        )
+        mock_grpc_instance.close.assert_awaited_once()
+
+    async def test_client_errors_mapped(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.async_api_core import AsyncEmliteMediatorAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_element.side_effect = EmliteCircuitOpen("meter=EML1")
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmliteMediatorAPI(mediator_address="test:50051")
+        with self.assertRaises(MediatorClientException) as cm:
+            await client.csq("EML1")
+        self.assertEqual(cm.exception.code_str, "EMLITE_CIRCUIT_OPEN")
+
+    async def test_meters_read_concurrently(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.async_api_core import AsyncEmliteMediatorAPI
+
+        all_reading = asyncio.Event()
+        reading = 0
+
+        async def read_element(serial: str, object_id: object) -> MagicMock:
+            nonlocal reading
+            reading += 1
+            if reading == 3:
+                all_reading.set()
+            await asyncio.wait_for(all_reading.wait(), 1)
+            return MagicMock(csq=int(serial[-1]))
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_element.side_effect = read_element
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmliteMediatorAPI(mediator_address="test:50051")
+        results = await asyncio.gather(
+            *(client.csq(serial) for serial in ["EML1", "EML2", "EML3"])
+        )
+        self.assertEqual(results, [1, 2, 3])
+
+    async def test_three_phase_read_failed_element_is_none(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.async_api_core import AsyncEmliteMediatorAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_elements.return_value = [
+            MagicMock(value=10_000),
+            Exception("failed"),
+        ] + [MagicMock(value=0)] * 4
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmliteMediatorAPI(mediator_address="test:50051")
+        reads = await client.three_phase_read("EML1", "P1.cx")
+        self.assertEqual(reads["active_import"], 1.0)
+        self.assertIsNone(reads["active_export"])
+
+
+@patch("simt_emlite.mediator.async_api_core.AsyncEmliteMediatorGrpcClient")
+class TestAsyncEmlitePrepayAPI(unittest.IsolatedAsyncioTestCase):
+    async def test_prepay_balance(self, mock_grpc_client_class: MagicMock) -> None:
+        from simt_emlite.mediator.async_api_prepay import AsyncEmlitePrepayAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_element.return_value = MagicMock(balance=1500000)
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmlitePrepayAPI(mediator_address="test:50051")
+        self.assertEqual(await client.prepay_balance("EML1"), Decimal("15.00000"))
+
+    async def test_prepay_enable_refused_on_low_balance(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.async_api_prepay import AsyncEmlitePrepayAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_instance.read_element.return_value = MagicMock(balance=100000)
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmlitePrepayAPI(mediator_address="test:50051")
+        with self.assertRaises(Exception):
+            await client.prepay_enabled_write("EML1", True)
+        mock_grpc_instance.write_element.assert_not_called()
+
+    async def test_tariffs_future_write_order(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.async_api_prepay import AsyncEmlitePrepayAPI
+
+        mock_grpc_instance = AsyncMock()
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        client = AsyncEmlitePrepayAPI(mediator_address="test:50051")
+        await client.tariffs_future_write(
+            "EML1",
+            datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+            Decimal("0.5"),
+            Decimal("0.25"),
+            Decimal("15"),
+            Decimal("5"),
+            Decimal("0"),
+        )
+        object_ids = [
+            c.args[1].name for c in mock_grpc_instance.write_element.call_args_list
+        ]
+        self.assertEqual(len(object_ids), 11)
+        self.assertEqual(object_ids[0], "tariff_future_threshold_mask")
+        self.assertEqual(object_ids[-1], "tariff_future_activation_datetime")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from simt_emlite.util.meter_metadata_cache import MeterMetadataCache
+
+
+class TestMeterMetadataCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "simt", "meter_metadata.json")
+
+    def test_put_is_shared_through_the_file(self) -> None:
+        MeterMetadataCache(self.path).put("EML1", "C1.w", "id-1")
+
+        other = MeterMetadataCache(self.path)
+        self.assertEqual(other.hardware("EML1"), "C1.w")
+        entry = other.get_by_meter_id("id-1")
+        assert entry is not None
+        self.assertEqual(entry.serial, "EML1")
+        self.assertIsNone(other.hardware("EML2"))
+
+    def test_writes_merge_with_other_processes(self) -> None:
+        first = MeterMetadataCache(self.path)
+        second = MeterMetadataCache(self.path)
+        self.assertIsNone(second.hardware("EML1"))
+
+        first.put("EML1", "C1.w")
+        second.put("EML2", "P1.ax")
+
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML1"), "C1.w")
+        # second picks up the entry first saved after second read the file
+        self.assertEqual(second.hardware("EML1"), "C1.w")
+        self.assertEqual(first.hardware("EML2"), "P1.ax")
+
+    def test_put_many_skips_meters_without_hardware(self) -> None:
+        cache = MeterMetadataCache(self.path)
+        count = cache.put_many(
+            [
+                {"id": "id-1", "serial": "EML1", "hardware": "C1.w"},
+                {"id": "id-2", "serial": "EML2", "hardware": None},
+                {"id": "id-3", "serial": None, "hardware": "C1.w"},
+            ]
+        )
+        self.assertEqual(count, 1)
+        self.assertIsNone(cache.get_by_meter_id("id-2"))
+
+        # later puts by serial keep the meter id
+        cache.put("EML1", "B1.w")
+        entry = cache.get_by_meter_id("id-1")
+        assert entry is not None
+        self.assertEqual(entry.hardware, "B1.w")
+
+    def test_entries_expire(self) -> None:
+        cache = MeterMetadataCache(self.path, ttl_seconds=60)
+        with patch("simt_emlite.util.meter_metadata_cache.time.time", return_value=0):
+            cache.put("EML1", "C1.w")
+        with patch("simt_emlite.util.meter_metadata_cache.time.time", return_value=59):
+            self.assertEqual(cache.hardware("EML1"), "C1.w")
+        with patch("simt_emlite.util.meter_metadata_cache.time.time", return_value=61):
+            self.assertIsNone(cache.hardware("EML1"))
+
+    def test_unreadable_file_is_ignored(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{not json")
+
+        cache = MeterMetadataCache(self.path)
+        self.assertIsNone(cache.hardware("EML1"))
+        cache.put("EML1", "C1.w")
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML1"), "C1.w")
+
+    def test_writes_are_debounced(self) -> None:
+        cache = MeterMetadataCache(self.path, save_interval_seconds=60)
+        with patch(
+            "simt_emlite.util.meter_metadata_cache.time.monotonic", return_value=0
+        ):
+            cache.put("EML1", "C1.w")
+            cache.put("EML2", "P1.ax")
+        # first put written straight away, the second waits for the interval
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML1"), "C1.w")
+        self.assertIsNone(MeterMetadataCache(self.path).hardware("EML2"))
+
+        with patch(
+            "simt_emlite.util.meter_metadata_cache.time.monotonic", return_value=60
+        ):
+            cache.put("EML3", "C1.w")
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML2"), "P1.ax")
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML3"), "C1.w")
+
+    def test_flush_writes_pending_entries(self) -> None:
+        cache = MeterMetadataCache(self.path, save_interval_seconds=60)
+        cache.put("EML1", "C1.w")
+        cache.put("EML2", "P1.ax")
+        cache.flush()
+        self.assertEqual(MeterMetadataCache(self.path).hardware("EML2"), "P1.ax")
+
+    def test_no_path_keeps_the_cache_in_memory(self) -> None:
+        cache = MeterMetadataCache("")
+        cache.put("EML1", "C1.w")
+        self.assertEqual(cache.hardware("EML1"), "C1.w")
+        self.assertFalse(os.path.exists(self.path))
+
+
+@patch("simt_emlite.mediator.api_core.EmliteMediatorGrpcClient")
+class TestApiHardware(unittest.TestCase):
+    def test_hardware_read_once_for_all_clients(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.api_core import EmliteMediatorAPI
+
+        mock_grpc_instance = MagicMock()
+        mock_grpc_instance.read_element.return_value = MagicMock(hardware="6Cw")
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        cache = MeterMetadataCache("")
+        with patch(
+            "simt_emlite.mediator.api_core.meter_metadata_cache", return_value=cache
+        ):
+            first = EmliteMediatorAPI(mediator_address="test:50051")
+            second = EmliteMediatorAPI(mediator_address="test:50051")
+            self.assertEqual(first.hardware("EML1"), "C1.w")
+            self.assertEqual(second.hardware("EML1"), "C1.w")
+            mock_grpc_instance.read_element.assert_called_once()
+
+            self.assertEqual(second.hardware("EML1", refresh=True), "C1.w")
+            self.assertEqual(mock_grpc_instance.read_element.call_count, 2)
+
+    def test_registry_hardware_is_authoritative(
+        self, mock_grpc_client_class: MagicMock
+    ) -> None:
+        from simt_emlite.mediator.api_core import EmliteMediatorAPI
+
+        mock_grpc_instance = MagicMock()
+        mock_grpc_client_class.return_value = mock_grpc_instance
+
+        cache = MeterMetadataCache("")
+        # as seeded from the meter_registry hardware column
+        cache.put_many([{"id": "id-1", "serial": "EML1", "hardware": "P1.ax"}])
+        with patch(
+            "simt_emlite.mediator.api_core.meter_metadata_cache", return_value=cache
+        ):
+            api = EmliteMediatorAPI(mediator_address="test:50051")
+            self.assertEqual(api.hardware("EML1"), "P1.ax")
+            mock_grpc_instance.read_element.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import urllib.request
+
+from simt_emlite.util.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    start_http_server,
+)
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_render(self) -> None:
+        counter = Counter(
+            "retries_total", "Retries", ["exception"], registry=self.registry
+        )
+        counter.inc(exception="ProxyError")
+        counter.inc(2, exception="ProxyError")
+        gauge = Gauge("depth", "Depth", ["serial"], registry=self.registry)
+        gauge.set(3, serial='EML"1')
+
+        text = self.registry.render()
+        self.assertIn("# TYPE retries_total counter", text)
+        self.assertIn('retries_total{exception="ProxyError"} 3', text)
+        self.assertIn('depth{serial="EML\\"1"} 3', text)
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        histogram = Histogram(
+            "rpc_seconds",
+            "RPC time",
+            ["method"],
+            buckets=[0.1, 1.0],
+            registry=self.registry,
+        )
+        for value in [0.05, 0.5, 0.5, 5.0]:
+            histogram.observe(value, method="read")
+
+        text = self.registry.render()
+        self.assertIn('rpc_seconds_bucket{method="read",le="0.1"} 1', text)
+        self.assertIn('rpc_seconds_bucket{method="read",le="1"} 3', text)
+        self.assertIn('rpc_seconds_bucket{method="read",le="+Inf"} 4', text)
+        self.assertIn('rpc_seconds_sum{method="read"} 6.05', text)
+        self.assertIn('rpc_seconds_count{method="read"} 4', text)
+
+    def test_collectors_run_before_render(self) -> None:
+        gauge = Gauge("meters", "Meters", registry=self.registry)
+        self.registry.add_collector(lambda: gauge.set(42))
+        self.assertIn("meters 42", self.registry.render())
+
+    def test_duplicate_name_rejected(self) -> None:
+        Counter("requests_total", "Requests", registry=self.registry)
+        with self.assertRaises(ValueError):
+            Counter("requests_total", "Requests", registry=self.registry)
+
+    def test_http_endpoint(self) -> None:
+        Counter("up_total", "Up", registry=self.registry).inc()
+        server = start_http_server(0, "127.0.0.1", registry=self.registry)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        port = server.server_address[1]
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as rsp:
+            self.assertEqual(rsp.status, 200)
+            self.assertIn("up_total 1", rsp.read().decode())
+
+
+if __name__ == "__main__":
+    unittest.main()